@@ -0,0 +1,70 @@
+""" Memory and speed of the slotted models compared to the same models with an instance dictionary.
+
+    Run from the Benchmarks folder(like the Tests): python benchmark_BusinessModels_Slots.py
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Event, Order
+from BusinessModels.PortfolioResponse import PortfolioPosition
+from BusinessModels.Price import Price
+from BusinessModels.QuoteResponse import QuoteData
+
+Instances = 100000
+
+# Model and the arguments of one instance.
+Models = [(OrderInfo, (0, "AAA", Price(225500), 2, False, True)),
+            (Instrument, ()),
+            (OrderDetail, ()),
+            (Event, ()),
+            (Order, ()),
+            (PortfolioPosition, ("AAA",)),
+            (QuoteData, ("", "AAA", "EQ", "22.55", False))]
+
+
+def WithDictionary(modelClass):
+    """ Same model without __slots__. The attributes are stored in the instance dictionary.
+    """
+    return type(modelClass.__name__, (), {"__init__": modelClass.__init__})
+
+
+def Measure(modelClass, arguments:tuple):
+    """ Builds the instances. Returns the time in seconds and the memory in bytes used by the instances.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = [modelClass(*arguments) for _ in range(Instances)]
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return elapsed, memory
+
+
+def Run():
+    print(f"{Instances:,} instances   {'slots':>22} {'dict':>22}")
+    for modelClass, arguments in Models:
+        # Timing without tracemalloc, the memory with tracemalloc.
+        results = []
+        for measuredClass in [modelClass, WithDictionary(modelClass)]:
+            gc.collect()
+            start = time.perf_counter()
+            instances = [measuredClass(*arguments) for _ in range(Instances)]
+            elapsed = time.perf_counter() - start
+            del instances
+            results.append((elapsed, Measure(measuredClass, arguments)[1]))
+
+        print(f"{modelClass.__name__:<20} " + " ".join(f"{elapsed * 1000:7.1f} ms {memory / 2**20:7.2f} MiB" for elapsed, memory in results))
+
+
+if __name__ == "__main__":
+    Run()
@@ -0,0 +1,79 @@
+""" Microbenchmark of the Orders response to model mapping.
+
+    Run from the Benchmarks folder(like the Tests): python benchmark_ETradeOrder_ProcessOrdersPage.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessModels.OrdersResponse import OrdersResponse
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+OrdersPerPage = 100
+Pages = 200
+
+
+def GetOrdersPage(ordersPerPage:int) -> dict:
+    """ Orders page similar to the ETrade API response. Each order has one order detail with one instrument
+        and two events.
+    """
+    orders = []
+    for index in range(ordersPerPage):
+        instrument = {"Product": {"symbol": f"S{index % 20}", "securityType": "EQ"}, "orderAction": "BUY" if index % 2 == 0 else "SELL",
+                        "quantityType": "QUANTITY", "orderedQuantity": 2, "filledQuantity": 0, "averageExecutionPrice": 0,
+                        "estimatedCommission": 0, "estimatedFees": 0}
+        orders.append({"orderId": 1000 + index, "orderType": "EQ", "totalOrderValue": 45.1, "totalCommission": 0,
+            "OrderDetail": [{"orderNumber": 1, "placedTime": 1600000000000, "executedTime": 0, "orderValue": 45.1, "status": "OPEN",
+                "orderTerm": "GOOD_UNTIL_CANCEL", "priceType": "LIMIT", "limitPrice": 22.55, "allOrNone": False,
+                "estimatedTotalAmount": 45.1, "estimatedCommission": 0, "estimatedFees": 0, "Instrument": [instrument]}],
+            "Events": {"Event": [{"name": "ORDER_PLACED", "dateTime": 1600000000000, "orderNumber": 1, "instrument": [instrument]},
+                                {"name": "ORDER_OPEN", "dateTime": 1600000000001, "orderNumber": 1, "instrument": [instrument]}]}})
+    return {"OrdersResponse": {"marker": "", "Order": orders}}
+
+
+def Run():
+    appLogger = AppLogger(os.path.join(tempfile.gettempdir(), "benchmark_ETradeOrder.log"), "ETradeOrderBenchmarkLogger", "INFO")
+    order = ETradeOrder(ETradeInputModel("token", "tokenSecret", datetime.now()), ETradeSettings(), Context(appLogger), FormatStringsBase())
+
+    page = GetOrdersPage(OrdersPerPage)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(page).encode()
+    response.request = requests.Request("GET", "http://host/").prepare()
+
+    # Models per order - order, order detail, instrument, 2 events with an instrument each.
+    modelsPerOrder = 7
+    orderData = page["OrdersResponse"]["Order"]
+
+    start = time.perf_counter()
+    for _ in range(Pages):
+        order.OrderLoader.LoadList(orderData)
+    elapsed = time.perf_counter() - start
+    print(f"OrderLoader        - {Pages * OrdersPerPage / elapsed:12,.0f} orders/s {Pages * OrdersPerPage * modelsPerOrder / elapsed:12,.0f} objects/s")
+
+    start = time.perf_counter()
+    for _ in range(Pages):
+        ordersResponse = OrdersResponse()
+        ordersResponse.Orders = []
+        ordersResponse.Messages = []
+        order.ProcessOrdersPage(response, ordersResponse)
+    elapsed = time.perf_counter() - start
+    print(f"ProcessOrdersPage  - {Pages * OrdersPerPage / elapsed:12,.0f} orders/s {Pages * OrdersPerPage * modelsPerOrder / elapsed:12,.0f} objects/s"
+            f" (includes decoding the {len(response.content):,} bytes page)")
+
+
+if __name__ == "__main__":
+    Run()
@@ -35,7 +35,7 @@ class AccountListResponse:
         Error - API response error(if any).
 
     """
-    def __init__(self, error: Error = None, accountData: List[AccountData] = []):
-        self.AccountData: List[AccountData] = accountData
+    def __init__(self, error: Error = None, accountData: List[AccountData] = None):
+        self.AccountData: List[AccountData] = [] if accountData is None else accountData
         self.Error: Error = error
     
\ No newline at end of file
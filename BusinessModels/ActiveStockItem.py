@@ -1,4 +1,5 @@
 from BusinessModels.PriceCoordinate import PriceCoordinate
+from BusinessModels.PriceLadder import PriceLadder
 from BusinessModels.SellDeltaType import SellDeltaType
 
 from typing import List
@@ -18,7 +19,8 @@ class ActiveStockItem:
         If the stock is already in the portfolio and if you reduce the start price, you will end up selling
         the purchased stocks for a loss.
 
-        PriceCoordinates - Pricecoorinates used to calculate the buy prices and quantities.
+        PriceCoordinates - Pricecoorinates used to calculate the buy prices and quantities. Either a list of
+        PriceCoordinate or CompiledPriceCoordinates. GetActiveStockItem always sets the CompiledPriceCoordinates.
 
         SellStepType - The sell type used for this item. 
         when FIXED -> sellprice = (buyprice + SellStepSize).
@@ -34,6 +36,9 @@ class ActiveStockItem:
         QuantityMultiplier - Multiplies the quantity returned by the priceCoordinates with the QuantityMultiplier. This field
         is used to increase the quantity by QuantityMultiplier times.
 
+        PriceLadder - Materialized BUY prices and quantities of the stock item. Built by the ManageOrdersHelpers 
+        on first use and rebuilt when the StartPrice or PriceCoordinates change.
+
     """
     def __init__(self, symbol:str, startPrice: float = 0, 
                 priceCoordinates:List[PriceCoordinate] = None, 
@@ -46,4 +51,5 @@ class ActiveStockItem:
         self.SellStepType:SellDeltaType = sellStepType
         self.SellStepSize: float = sellStepSize
         self.MaxActiveBuy:int = maxActiveBuy
-        self.QuantityMultiplier:int = quantityMultiplier
\ No newline at end of file
+        self.QuantityMultiplier:int = quantityMultiplier
+        self.PriceLadder:PriceLadder = None
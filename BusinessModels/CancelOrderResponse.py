@@ -18,7 +18,7 @@ class CancelOrderResponse:
     """
 
     def __init__(self, orderId:int = 0, error: Error = None, 
-                        messages: List[Message] = []):
+                        messages: List[Message] = None):
         self.OrderId:int = orderId
-        self.Messages: List[Message] = messages
+        self.Messages: List[Message] = [] if messages is None else messages
         self.Error: Error = error
@@ -0,0 +1,223 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from BusinessModels.Price import Price
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from Exceptions.InvalidPriceCoordinatesException import \
+    InvalidPriceCoordinatesError
+
+
+class CompiledPriceCoordinate(NamedTuple):
+    """ Immutable copy of a PriceCoordinate. Attribute names are same as the PriceCoordinate.
+    """
+    StartPrice: Decimal
+    Quantity: int
+    BuyDeltaType: BuyDeltaType
+    FixedBuyDelta: Decimal
+
+
+class CompiledPriceCoordinates:
+    """ Immutable, validated and pre-sorted table of the price coordinates. Compiled once when the
+        stock item is built, so the price coordinates are never sorted in the hot path and the same
+        table can be safely shared between stock items and threads.
+
+        Please look at the documentation of the PriceCoordinate class for the meaning of the coordinates.
+
+        Attributes:
+
+        Coordinates - Price coordinates in the ascending order of the StartPrice.
+
+        StartPrices - StartPrice of the coordinates in the ascending order. Used for binary search.
+
+        Key - Values of the coordinates. Two tables with the same Key are same.
+
+        Methods:
+
+        Compile - Compiles the price coordinates. Already compiled table is returned as is.
+
+        GetKey - Gets the key for the given price coordinates.
+
+        Validate - Validates the price coordinates.
+
+        GetCoordinate - Gets the coordinate to which the given price belongs.
+
+        GetDelta - Gets the delta(backwards) at the given price.
+
+        GetQuantity - Gets the quantity at the given price.
+
+    """
+    __slots__ = ("Coordinates", "StartPrices", "Key")
+    Coordinates: Tuple[CompiledPriceCoordinate, ...]
+    StartPrices: Tuple[Decimal, ...]
+    Key: Tuple[CompiledPriceCoordinate, ...]
+
+    def __init__(self, priceCoordinates:List[PriceCoordinate]):
+        """ Initialization method. Validates, copies and sorts the price coordinates.
+
+            Parameters:
+
+            priceCoordinates:List[PriceCoordinate] - Price coordinates.
+
+            Exceptions:
+
+            InvalidPriceCoordinatesError.
+
+        """
+        CompiledPriceCoordinates.Validate(priceCoordinates)
+
+        coordinates:Tuple[CompiledPriceCoordinate, ...] = tuple(sorted(
+            (CompiledPriceCoordinate(coordinate.StartPrice, coordinate.Quantity, coordinate.BuyDeltaType,
+                coordinate.FixedBuyDelta) for coordinate in priceCoordinates),
+            key= lambda x:x.StartPrice))
+
+        object.__setattr__(self, "Coordinates", coordinates)
+        object.__setattr__(self, "StartPrices", tuple(coordinate.StartPrice for coordinate in coordinates))
+        object.__setattr__(self, "Key", coordinates)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledPriceCoordinates is immutable.")
+
+    def __iter__(self) -> Iterator[CompiledPriceCoordinate]:
+        return iter(self.Coordinates)
+
+    def __len__(self) -> int:
+        return len(self.Coordinates)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledPriceCoordinates):
+            # If unrelated types.
+            return NotImplemented
+        return self.Key == other.Key
+
+    def __hash__(self):
+        return hash(self.Key)
+
+    @staticmethod
+    def Compile(priceCoordinates) -> "CompiledPriceCoordinates":
+        """ Compiles the price coordinates.
+
+            Parameters:
+
+            priceCoordinates - List of the price coordinates or already compiled price coordinates.
+
+            Returns:
+
+            Compiled price coordinates. Same object if already compiled.
+
+        """
+        if isinstance(priceCoordinates, CompiledPriceCoordinates):
+            return priceCoordinates
+        return CompiledPriceCoordinates(priceCoordinates)
+
+    @staticmethod
+    def GetKey(priceCoordinates) -> tuple:
+        """ Gets the key for the given price coordinates without compiling them.
+
+            Parameters:
+
+            priceCoordinates - List of the price coordinates or compiled price coordinates.
+
+            Returns:
+
+            Key of the price coordinates.
+
+        """
+        if isinstance(priceCoordinates, CompiledPriceCoordinates):
+            return priceCoordinates.Key
+        return tuple(sorted(((coordinate.StartPrice, coordinate.Quantity, coordinate.BuyDeltaType, coordinate.FixedBuyDelta)
+                        for coordinate in priceCoordinates), key= lambda x:x[0]))
+
+    @staticmethod
+    def Validate(priceCoordinates:List[PriceCoordinate]):
+        """ Validates the price coordinates.
+
+            - At least one coordinate is required.
+            - Start prices should not overlap.
+            - Start price should not be negative.
+            - Quantity should not be negative.
+            - FixedBuyDelta should be greater than zero when BuyDeltaType is FIXED.
+            - Start price should be greater than zero when BuyDeltaType is MULTIPLIER.
+
+            Parameters:
+
+            priceCoordinates:List[PriceCoordinate] - Price coordinates.
+
+            Exceptions:
+
+            InvalidPriceCoordinatesError.
+
+        """
+        if priceCoordinates is None or len(priceCoordinates) == 0:
+            raise InvalidPriceCoordinatesError("Price coordinates are empty.", priceCoordinates)
+
+        startPrices = set()
+        for coordinate in priceCoordinates:
+            if coordinate.StartPrice in startPrices:
+                raise InvalidPriceCoordinatesError(f"Overlapping price coordinates with StartPrice {coordinate.StartPrice}.", priceCoordinates)
+            startPrices.add(coordinate.StartPrice)
+
+            if coordinate.StartPrice < 0:
+                raise InvalidPriceCoordinatesError(f"StartPrice {coordinate.StartPrice} is negative.", priceCoordinates)
+            if coordinate.Quantity < 0:
+                raise InvalidPriceCoordinatesError(f"Quantity {coordinate.Quantity} of the price coordinate with StartPrice {coordinate.StartPrice} is negative.",
+                                                    priceCoordinates)
+            if coordinate.BuyDeltaType == BuyDeltaType.FIXED and coordinate.FixedBuyDelta <= 0:
+                raise InvalidPriceCoordinatesError(f"FixedBuyDelta {coordinate.FixedBuyDelta} of the price coordinate with StartPrice {coordinate.StartPrice} should be greater than 0.",
+                                                    priceCoordinates)
+            if coordinate.BuyDeltaType == BuyDeltaType.MULTIPLIER and coordinate.StartPrice <= 0:
+                raise InvalidPriceCoordinatesError(f"StartPrice of the MULTIPLIER price coordinate should be greater than 0.", priceCoordinates)
+
+    def GetCoordinate(self, price:Decimal) -> Optional[CompiledPriceCoordinate]:
+        """ Gets the coordinate to which the price belongs. Coordinate with the highest StartPrice
+            less than or equal to the price.
+
+            Parameters:
+
+            price:Decimal - Price.
+
+            Returns:
+
+            Coordinate or None if the price is below all the coordinates.
+
+        """
+        index = bisect_right(self.StartPrices, price) - 1
+        if index < 0:
+            return None
+        return self.Coordinates[index]
+
+    def GetDelta(self, price:Decimal, coordinate:CompiledPriceCoordinate) -> Union[int, Decimal]:
+        """ Gets the delta(backwards) at the given price.
+
+            Parameters:
+
+            price - Price. Price, float, Decimal or int.
+
+            coordinate:CompiledPriceCoordinate - Coordinate to which the price belongs.
+
+            Returns:
+
+            Delta at the price. int for the MULTIPLIER coordinates.
+
+        """
+        if coordinate.BuyDeltaType == BuyDeltaType.MULTIPLIER:
+            # Exact ratio of the fixed-point prices.
+            return int(Price.From(price) / Price.From(coordinate.StartPrice)) + 1
+        return coordinate.FixedBuyDelta
+
+    def GetQuantity(self, price:Decimal) -> int:
+        """ Gets the quantity at the given price.
+
+            Parameters:
+
+            price:Decimal - Price.
+
+            Returns:
+
+            Quantity at the price, 0 if the price is below all the coordinates.
+
+        """
+        coordinate = self.GetCoordinate(price)
+        if coordinate is None:
+            return 0
+        return coordinate.Quantity
@@ -0,0 +1,18 @@
+from enum import Enum, unique
+
+
+@unique
+class ErrorAction(Enum):
+    """ What to do when a request fails with an error code(ETradeSettings.ErrorCodeActions).
+
+        RETRY - Transient error. Idempotent requests are sent again with backoff, if it still fails the
+        request is skipped like SKIP.
+
+        SKIP - The request is skipped(order of the stock item not placed/cancelled), the cycle goes on.
+
+        ABORT - The MoneyMaker can't continue(ResponseError/MessageError).
+
+    """
+    RETRY = 1
+    SKIP = 2
+    ABORT = 3
@@ -0,0 +1,85 @@
+from typing import Dict, List
+
+import numpy as np
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+
+
+class LimitOrdersBatch:
+    """ Possible limit orders of many stock items in columnar form. One row per order, orders of a
+        stock item are in consecutive rows in the same order as GeneratePossibleLimitOrders returns them.
+        OrderInfo objects are created only when requested.
+
+        Attributes:
+
+        Symbols - Symbols of the stock items. Position in the list is the symbol index.
+
+        Offsets - Rows of the symbol at index i are from Offsets[i] to Offsets[i + 1].
+
+        SymbolIndexes - Symbol index of each row.
+
+        LimitPrices - Limit price(Price units) of each row.
+
+        Quantities - Quantity of each row.
+
+        IsPartialFilled - Is partial order, for each row.
+
+        IsSell - Is SELL order, for each row.
+
+        Methods:
+
+        GetOrderInfos - Gets the orders of a symbol as OrderInfo objects.
+
+        ToOrderInfos - Gets the orders of all the symbols as OrderInfo objects.
+
+    """
+    def __init__(self, symbols:List[str], offsets:np.ndarray, symbolIndexes:np.ndarray, limitPrices:np.ndarray,
+                    quantities:np.ndarray, isPartialFilled:np.ndarray, isSell:np.ndarray):
+        self.Symbols:List[str] = symbols
+        self.Offsets:np.ndarray = offsets
+        self.SymbolIndexes:np.ndarray = symbolIndexes
+        self.LimitPrices:np.ndarray = limitPrices
+        self.Quantities:np.ndarray = quantities
+        self.IsPartialFilled:np.ndarray = isPartialFilled
+        self.IsSell:np.ndarray = isSell
+        self.SymbolPositions:Dict[str, int] = {symbol: index for index, symbol in enumerate(symbols)}
+
+    def __len__(self):
+        return len(self.LimitPrices)
+
+    def GetOrderInfos(self, symbol:str) -> List[OrderInfo]:
+        """ Gets the orders of the symbol as OrderInfo objects.
+
+            Parameters:
+
+            symbol:str - Symbol of the stock item.
+
+            Returns:
+
+            List[OrderInfo] - Limit orders of the symbol, empty if the symbol is not in the batch.
+
+        """
+        position = self.SymbolPositions.get(symbol)
+        if position is None:
+            return []
+
+        start = int(self.Offsets[position])
+        end = int(self.Offsets[position + 1])
+
+        # tolist converts to python int/bool.
+        return [OrderInfo(Settings.NewOrderId, symbol, Price(limitPrice), quantity, isPartialFilled, isSell)
+                    for limitPrice, quantity, isPartialFilled, isSell in zip(self.LimitPrices[start:end].tolist(),
+                        self.Quantities[start:end].tolist(), self.IsPartialFilled[start:end].tolist(),
+                        self.IsSell[start:end].tolist())]
+
+    def ToOrderInfos(self) -> Dict[str, List[OrderInfo]]:
+        """ Gets the orders of all the symbols as OrderInfo objects.
+
+            Returns:
+
+            Dict[str, List[OrderInfo]] - Limit orders by symbol.
+
+        """
+        return {symbol: self.GetOrderInfos(symbol) for symbol in self.Symbols}
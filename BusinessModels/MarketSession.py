@@ -0,0 +1,20 @@
+from enum import Enum, unique
+
+
+@unique
+class MarketSession(Enum):
+    """ Trading session of the US equity market.
+
+        CLOSED - No trading. Night, weekend or exchange holiday.
+
+        PREMARKET - Extended hours session before the regular session.
+
+        REGULAR - Regular session.
+
+        AFTERHOURS - Extended hours session after the regular session.
+
+    """
+    CLOSED = 0
+    PREMARKET = 1
+    REGULAR = 2
+    AFTERHOURS = 3
@@ -0,0 +1,97 @@
+from enum import Enum, unique
+from typing import List
+
+from BusinessModels.OrderInfo import OrderInfo
+
+
+@unique
+class OrderOutcomeStatus(Enum):
+    """ Outcome of one order of an OrderBatchResult.
+
+        PLACED - Previewed and placed.
+
+        PREVIEW_FAILED - Preview error or messages, not placed.
+
+        INVALID_PREVIEW - Preview response failed the validations, not placed.
+
+        PLACE_FAILED - Place error or messages. The order may be placed for a transient error(ClientOrderRegistry).
+
+        INVALID_PLACE - Placed, the place response failed the validations.
+
+        SKIPPED - Not placed, an earlier order of the batch failed with an exception.
+
+        ERROR - Preview or place failed with an exception.
+
+    """
+    PLACED = 1
+    PREVIEW_FAILED = 2
+    INVALID_PREVIEW = 3
+    PLACE_FAILED = 4
+    INVALID_PLACE = 5
+    SKIPPED = 6
+    ERROR = 7
+
+
+class OrderOutcome:
+    """ Outcome of one order of an OrderBatchResult.
+
+        Attributes:
+
+        LimitOrder:OrderInfo - Order to place.
+
+        Status:OrderOutcomeStatus - Outcome of the order.
+
+        ClientOrderId:str - ClientOrderId of the order. Empty if not previewed.
+
+        OrderId:int - OrderId of the placed order. 0 if not placed or not known.
+
+    """
+    def __init__(self, limitOrder:OrderInfo, status:OrderOutcomeStatus, clientOrderId:str = "", orderId:int = 0):
+        self.LimitOrder = limitOrder
+        self.Status = status
+        self.ClientOrderId = clientOrderId
+        self.OrderId = orderId
+
+    def __repr__(self):
+        action = "SELL" if self.LimitOrder.IsSell is True else "BUY"
+        return f"[{action} {self.LimitOrder.Quantity} at {self.LimitOrder.LimitPrice}, {self.Status.name}, {self.ClientOrderId}, {self.OrderId}]"
+
+
+class OrderBatchResult:
+    """ Outcomes of the orders of one stock item previewed and placed together(order pipeline), logged once.
+
+        Attributes:
+
+        Symbol:str - Symbol of the stock item.
+
+        Outcomes:List[OrderOutcome] - Outcome of each order, in the order they were submitted.
+
+        Error:Exception - First exception raised while previewing/placing the orders, raised again by the
+        caller after logging the result. None if no exception.
+
+        Methods:
+
+        Add - Adds the outcome of an order.
+
+        GetPlacedCount - Number of orders placed.
+
+        HasFailures - Is any order not placed?
+
+    """
+    def __init__(self, symbol:str):
+        self.Symbol = symbol
+        self.Outcomes:List[OrderOutcome] = []
+        self.Error:Exception = None
+
+    def Add(self, outcome:OrderOutcome) -> OrderOutcome:
+        self.Outcomes.append(outcome)
+        return outcome
+
+    def GetPlacedCount(self) -> int:
+        return sum(1 for outcome in self.Outcomes if outcome.Status is OrderOutcomeStatus.PLACED)
+
+    def HasFailures(self) -> bool:
+        return self.GetPlacedCount() != len(self.Outcomes)
+
+    def __str__(self):
+        return f"Placed {self.GetPlacedCount()} of {len(self.Outcomes)} orders of {self.Symbol} - {self.Outcomes}"
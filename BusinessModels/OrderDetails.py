@@ -1,8 +1,14 @@
 from typing import List
 
 from BusinessModels.Message import Message
+from BusinessModels.Price import Price
 from BusinessModels.Settings import Settings
 
+# Initial values of the fields expected to be populated by the API. Price is not changed in place,
+# so the models share these instances instead of converting the Settings values for every model.
+UnfilledCommissionOrFeePrice:Price = Price.From(Settings.UnfilledCommissionOrFee)
+UnfilledValuePrice:Price = Price.From(Settings.UnfilledValue)
+
 
 class Instrument:
     """ The data attributes involved with security trading is very broad. This class deals
@@ -39,13 +45,16 @@ class Instrument:
         Quantity - The number of shares to buy or sell.
 
     """
+    __slots__ = ("Symbol", "SecurityType", "OrderAction", "AverageExecutionPrice", "EstimatedCommission", "EstimatedFees",
+                    "FilledQuantity", "OrderedQuantity", "CancelQuantity", "QuantityType", "Quantity")
+
     def __init__(self):
-        self.Symbol = ""
-        self.SecurityType = ""
-        self.OrderAction = ""
-        self.AverageExecutionPrice = 0
-        self.EstimatedCommission:float = Settings.UnfilledCommissionOrFee
-        self.EstimatedFees:float = Settings.UnfilledCommissionOrFee
+        self.Symbol:str = ""
+        self.SecurityType:str = ""
+        self.OrderAction:str = ""
+        self.AverageExecutionPrice:Price = Price(0)
+        self.EstimatedCommission:Price = UnfilledCommissionOrFeePrice
+        self.EstimatedFees:Price = UnfilledCommissionOrFeePrice
         self.FilledQuantity = 0
         self.OrderedQuantity = 0
         self.CancelQuantity = 0
@@ -103,21 +112,25 @@ class OrderDetail:
         fetching/previewing/placing the order.
 
     """
+    __slots__ = ("OrderNumber", "PlacedTime", "ExecutedTime", "OrderValue", "MarketSession", "StopPrice", "Status",
+                    "PriceType", "OrderTerm", "OrderType", "AllOrNone", "LimitPrice", "EstimatedCommission",
+                    "EstimatedFees", "EstimatedTotalAmount", "Instruments", "Messages")
+
     def __init__(self):
         self.OrderNumber:int = 0
         self.PlacedTime:int = 0
         self.ExecutedTime:int = 0
-        self.OrderValue = 0
-        self.MarketSession = ""
+        self.OrderValue:Price = Price(0)
+        self.MarketSession:str = ""
         self.StopPrice = 0
-        self.Status = ""
-        self.PriceType = ""
-        self.OrderTerm = ""
-        self.OrderType = ""
-        self.AllOrNone = False
-        self.LimitPrice:float = 0
-        self.EstimatedCommission:float = Settings.UnfilledCommissionOrFee
-        self.EstimatedFees:float = Settings.UnfilledCommissionOrFee
-        self.EstimatedTotalAmount:float = Settings.UnfilledValue
-        self.Instruments:List[Instrument] = []     
+        self.Status:str = ""
+        self.PriceType:str = ""
+        self.OrderTerm:str = ""
+        self.OrderType:str = ""
+        self.AllOrNone:bool = False
+        self.LimitPrice:Price = Price(0)
+        self.EstimatedCommission:Price = UnfilledCommissionOrFeePrice
+        self.EstimatedFees:Price = UnfilledCommissionOrFeePrice
+        self.EstimatedTotalAmount:Price = UnfilledValuePrice
+        self.Instruments:List[Instrument] = []
         self.Messages:List[Message] = []
@@ -1,3 +1,6 @@
+from BusinessModels.Price import Price
+
+
 class OrderInfo:
     """ Used to manage the EQ orders to be placed or cancelled. A minimal internal representation of
         the EQ order.
@@ -8,7 +11,8 @@ class OrderInfo:
 
         Symbol - The Symbol of the Equity.
 
-        LimitPrice - Interested Limit Price.
+        LimitPrice - Interested Limit Price. Fixed-point Price, so the prices calculated by the application
+        and the prices received from the API are compared exactly.
 
         Quantity - Quantity.
 
@@ -16,15 +20,27 @@ class OrderInfo:
 
         IsSell - Is this a Sell Order? Application deals only with BUY/SELL Orders.
 
+        Equal orders are the same order, all the attributes including the OrderId are compared. Equal orders
+        have the same hash, so the orders can be kept in sets and dictionaries. Don't change the order while
+        it is in a set or used as a dictionary key.
+        An open order and the possible limit order of the same rung are not equal(OrderId, partial flag), they
+        are matched using GetKey.
+
+        Methods:
+
+        GetKey - Key used to match a possible limit order with an open order.
+
     """
-    def __init__(self, orderId:int, symbol:str, limitPrice:float, quantity:int, 
+    __slots__ = ("OrderId", "Symbol", "LimitPrice", "Quantity", "IsPartialFilled", "IsSell")
+
+    def __init__(self, orderId:int, symbol:str, limitPrice, quantity:int, 
                     isPartialFilled:bool, isSell:bool = False):
-        self.OrderId = orderId
-        self.Symbol = symbol
-        self.LimitPrice = limitPrice
-        self.Quantity = quantity
-        self.IsPartialFilled = isPartialFilled
-        self.IsSell = isSell
+        self.OrderId:int = orderId
+        self.Symbol:str = symbol
+        self.LimitPrice:Price = Price.From(limitPrice)
+        self.Quantity:int = quantity
+        self.IsPartialFilled:bool = isPartialFilled
+        self.IsSell:bool = isSell
 
     def __str__(self):
         """ String representation of the object.
@@ -44,6 +60,13 @@ class OrderInfo:
 
         return f"[{self.Symbol}, {self.LimitPrice}, {self.Quantity}, {self.OrderId}, {action}, {partial}]"
 
+    def GetKey(self) -> tuple:
+        """ Key used to match a possible limit order with an open order, (Symbol, IsSell, LimitPrice units, Quantity).
+            The OrderId and the partial flag are not part of the key, the Quantity of an open order is its remaining
+            quantity.
+        """
+        return (self.Symbol.upper(), self.IsSell, self.LimitPrice.Units, int(self.Quantity))
+
     def __eq__(self, other): 
         if not isinstance(other, OrderInfo):
             # If unrelated types.
@@ -56,3 +79,6 @@ class OrderInfo:
                 self.OrderId == other.OrderId and \
                 self.IsSell == other.IsSell and \
                 self.LimitPrice == other.LimitPrice
+
+    def __hash__(self):
+        return hash((self.OrderId, self.Symbol, self.LimitPrice, self.Quantity, self.IsPartialFilled, self.IsSell))
@@ -2,8 +2,9 @@ from typing import List
 
 from BusinessModels.Error import Error
 from BusinessModels.Message import Message
-from BusinessModels.OrderDetails import Instrument, OrderDetail
-from BusinessModels.Settings import Settings
+from BusinessModels.OrderDetails import (Instrument, OrderDetail, UnfilledCommissionOrFeePrice,
+                                            UnfilledValuePrice)
+from BusinessModels.Price import Price
 
 
 class Event:
@@ -22,10 +23,12 @@ class Event:
         Instruments - Instruments associated with the order detail with OrderNumber.
 
     """
+    __slots__ = ("Name", "DateTime", "OrderNumber", "Instruments")
+
     def __init__(self):
-        self.Name = ""
+        self.Name:str = ""
         self.DateTime = ""
-        self.OrderNumber = 0
+        self.OrderNumber:int = 0
         self.Instruments:List[Instrument] = []
 
 
@@ -49,17 +52,19 @@ class Order:
         Events - The events associated with the Order grouped by OrderNumber.
 
     """
+    __slots__ = ("OrderId", "OrderType", "TotalOrderValue", "TotalCommission", "OrderDetails", "Events")
+
     def __init__(self, orderId:int = 0, 
                     orderType: str = "",
-                    orderDetails: List[OrderDetail] = [],
-                    events: List[Event] = []
+                    orderDetails: List[OrderDetail] = None,
+                    events: List[Event] = None
                     ):
-        self.OrderId = orderId
-        self.OrderType = orderType
-        self.TotalOrderValue:float = Settings.UnfilledValue
-        self.TotalCommission:float = Settings.UnfilledCommissionOrFee
-        self.OrderDetails:List[OrderDetail] = orderDetails
-        self.Events:List[Event] = events
+        self.OrderId:int = orderId
+        self.OrderType:str = orderType
+        self.TotalOrderValue:Price = UnfilledValuePrice
+        self.TotalCommission:Price = UnfilledCommissionOrFeePrice
+        self.OrderDetails:List[OrderDetail] = [] if orderDetails is None else orderDetails
+        self.Events:List[Event] = [] if events is None else events
 
 
 class OrdersResponse:
@@ -81,10 +86,10 @@ class OrdersResponse:
 
     """
 
-    def __init__(self, error: Error = None, orders: List[Order] = [], 
-                    messages: List[Message] = []):
-        self.Orders: List[Order] = orders
-        self.Messages: List[Message] = messages
+    def __init__(self, error: Error = None, orders: List[Order] = None, 
+                    messages: List[Message] = None):
+        self.Orders: List[Order] = [] if orders is None else orders
+        self.Messages: List[Message] = [] if messages is None else messages
         self.Error: Error = error
         self.Next: str = ""
         self.Marker:str = ""        
@@ -2,9 +2,10 @@ from typing import List
 
 from BusinessModels.Error import Error
 from BusinessModels.Message import Message
-from BusinessModels.OrderDetails import OrderDetail
+from BusinessModels.OrderDetails import (OrderDetail, UnfilledCommissionOrFeePrice,
+                                            UnfilledValuePrice)
 from BusinessModels.PreviewOrderInput import PreviewOrderInput
-from BusinessModels.Settings import Settings
+from BusinessModels.Price import Price
 
 
 class OrderId:
@@ -52,8 +53,8 @@ class PlaceOrderResponseData:
         self.PreviewOrderInput:PreviewOrderInput = None
         self.OrderId:int = 0
         self.OrderIds: List[OrderId] = []
-        self.TotalCommission:float = Settings.UnfilledCommissionOrFee
-        self.TotalOrderValue:float = Settings.UnfilledValue
+        self.TotalCommission:Price = UnfilledCommissionOrFeePrice
+        self.TotalOrderValue:Price = UnfilledValuePrice
         self.ClientOrderId:str = ""
         self.OrderDetails:List[OrderDetail] = []
 
@@ -72,7 +73,7 @@ class PlaceOrderResponse:
     """
 
     def __init__(self, error: Error = None, placeOrderResponseData: PlaceOrderResponseData = None, 
-                        messages: List[Message] = []):
+                        messages: List[Message] = None):
         self.PlaceOrderResponseData:PlaceOrderResponseData = placeOrderResponseData
-        self.Messages: List[Message] = messages
+        self.Messages: List[Message] = [] if messages is None else messages
         self.Error: Error = error
@@ -23,9 +23,11 @@ class PortfolioPosition:
         MarketValue - Current value of this stock items.
 
     """
+    __slots__ = ("Symbol", "Quantity", "LastPrice", "PricePaid", "TotalGain", "MarketValue")
+
     def __init__(self, symbol:str = ""):
-        self.Symbol = symbol
-        self.Quantity = Settings.UnfilledValue
+        self.Symbol:str = symbol
+        self.Quantity:int = Settings.UnfilledValue
         self.LastPrice:float = 0
         self.PricePaid:float = 0
         self.TotalGain:float = 0
@@ -69,10 +71,10 @@ class AccountPortfolio:
     """
     def __init__(self, accountId:str = "", 
                     pagingInfo: PagingInfo = None,
-                    portfolioPositions: List[PortfolioPosition] = []
+                    portfolioPositions: List[PortfolioPosition] = None
                     ):
         self.AccountId = accountId
-        self.PortfolioPositions: List[PortfolioPosition] = portfolioPositions
+        self.PortfolioPositions: List[PortfolioPosition] = [] if portfolioPositions is None else portfolioPositions
         self.PagingInfo: PagingInfo = pagingInfo
 
 
@@ -87,7 +89,7 @@ class PortfolioResponse:
 
     """
     def __init__(self, error: Error = None,
-                    accountPortfolios: List[AccountPortfolio] = []
+                    accountPortfolios: List[AccountPortfolio] = None
                     ):        
-        self.AccountPortfolios = accountPortfolios
+        self.AccountPortfolios: List[AccountPortfolio] = [] if accountPortfolios is None else accountPortfolios
         self.Error: Error = error
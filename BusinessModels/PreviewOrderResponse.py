@@ -2,8 +2,9 @@ from typing import List
 
 from BusinessModels.Error import Error
 from BusinessModels.Message import Message
-from BusinessModels.OrderDetails import OrderDetail
-from BusinessModels.Settings import Settings
+from BusinessModels.OrderDetails import (OrderDetail, UnfilledCommissionOrFeePrice,
+                                            UnfilledValuePrice)
+from BusinessModels.Price import Price
 
 
 class PreviewId:
@@ -47,8 +48,8 @@ class PreviewOrderResponseData:
     def __init__(self):
         self.PreviewOrderInput = None
         self.PreviewIds: List[PreviewId] = []
-        self.TotalCommission = Settings.UnfilledCommissionOrFee
-        self.TotalOrderValue = Settings.UnfilledValue
+        self.TotalCommission:Price = UnfilledCommissionOrFeePrice
+        self.TotalOrderValue:Price = UnfilledValuePrice
         self.ClientOrderId = ""
         self.OrderDetails:List[OrderDetail] = []
 
@@ -65,7 +66,7 @@ class PreviewOrderResponse:
         Error - Error if any.
     """
     def __init__(self, error: Error = None, previewOrderResponseData: PreviewOrderResponseData = None, 
-                        messages: List[Message] = []):
+                        messages: List[Message] = None):
         self.PreviewOrderResponseData:PreviewOrderResponseData = previewOrderResponseData
-        self.Messages: List[Message] = messages
+        self.Messages: List[Message] = [] if messages is None else messages
         self.Error: Error = error
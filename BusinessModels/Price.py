@@ -0,0 +1,231 @@
+from decimal import ROUND_HALF_UP, Decimal
+from numbers import Number
+
+
+class Price:
+    """ Fixed-point price. The price is stored as an integer number of ten-thousandths of a dollar, so
+        cents and the sub-dollar tick sizes are represented exactly and two prices are equal only if
+        they are the same number of units. Prices read from the API and prices calculated by the
+        application can be compared without float representation differences.
+
+        Arithmetic with int is exact. Arithmetic and comparison with float/Decimal/str first convert the
+        value to Price(rounded to the nearest unit). Price / Price gives the Decimal ratio.
+
+        Attributes:
+
+        Units - Price in ten-thousandths of a dollar.
+
+        Scale - Number of decimal places stored.
+
+        UnitsPerDollar - Number of units in one dollar.
+
+        Methods:
+
+        From - Converts int/float/Decimal/str to Price. Price is returned as is.
+
+        Round - Rounds the price to the given number of decimal places(half up).
+
+        ToDecimal - Gets the exact Decimal value of the price.
+
+    """
+    __slots__ = ("Units",)
+
+    Scale = 4
+    UnitsPerDollar = 10 ** Scale
+
+    def __init__(self, units:int = 0):
+        """ Initialization method.
+
+            Parameters:
+
+            units:int - Price in ten-thousandths of a dollar. Use From to convert a dollar value.
+
+        """
+        self.Units:int = int(units)
+
+    @staticmethod
+    def From(value) -> "Price":
+        """ Converts the value to Price. Floats are converted using their shortest representation
+            so 22.55 is exactly 225500 units.
+
+            Parameters:
+
+            value - Price, int, float, Decimal or str(as received from the API, for example "22.55").
+
+            Returns:
+
+            Price.
+
+            Exceptions:
+
+            ValueError - When the value can't be converted.
+
+        """
+        if isinstance(value, Price):
+            return value
+        if isinstance(value, bool):
+            raise ValueError(f"Invalid price {value}.")
+        if isinstance(value, int):
+            return Price(value * Price.UnitsPerDollar)
+        if isinstance(value, float):
+            # Fast path - the scaled float rounds the same as its decimal representation unless it is
+            # close to a half unit, or too large for the float error to stay far below a unit.
+            units = value * Price.UnitsPerDollar
+            nearest = round(units) if -1e12 < units < 1e12 else None
+            if nearest is not None and abs(units - nearest) < 0.4999:
+                return Price(nearest)
+            value = repr(value)
+        elif not isinstance(value, (Decimal, str)):
+            raise ValueError(f"Invalid price {value}.")
+
+        try:
+            decimalValue = Decimal(value.strip()) if isinstance(value, str) else value
+            units = (decimalValue * Price.UnitsPerDollar).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+        except ArithmeticError:
+            raise ValueError(f"Invalid price {value}.")
+        return Price(int(units))
+
+    def Round(self, precision:int) -> "Price":
+        """ Rounds the price to the given number of decimal places. Half is rounded away from zero.
+
+            Parameters:
+
+            precision:int - Number of decimal places.
+
+            Returns:
+
+            Rounded price.
+
+        """
+        if precision >= Price.Scale:
+            return self
+        step = 10 ** (Price.Scale - precision)
+        units = (abs(self.Units) + step // 2) // step * step
+        return Price(units if self.Units >= 0 else -units)
+
+    def ToDecimal(self) -> Decimal:
+        """ Gets the exact Decimal value of the price.
+        """
+        return Decimal(self.Units).scaleb(-Price.Scale)
+
+    @staticmethod
+    def _Units(other):
+        """ Gets the units of the other operand, None if it is not a number.
+        """
+        if isinstance(other, Price):
+            return other.Units
+        if isinstance(other, (Number, str)) and not isinstance(other, bool):
+            return Price.From(other).Units
+        return None
+
+    def __round__(self, ndigits:int = None):
+        if ndigits is None:
+            return int(self.Round(0).Units // Price.UnitsPerDollar)
+        return self.Round(ndigits)
+
+    def __str__(self):
+        """ Plain decimal string, for example 22.55. Used in the API payloads.
+        """
+        text = format(self.ToDecimal(), "f")
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return text
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __float__(self):
+        return self.Units / Price.UnitsPerDollar
+
+    def __bool__(self):
+        return self.Units != 0
+
+    def __hash__(self):
+        """ Same hash as the equal int/Decimal(and float, if exactly representable) values, because __eq__
+            converts them. A str is equal but not hashed the same.
+        """
+        if self.Units % Price.UnitsPerDollar == 0:
+            return hash(self.Units // Price.UnitsPerDollar)
+        return hash(self.ToDecimal())
+
+    def __eq__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units == units
+
+    def __ne__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units != units
+
+    def __lt__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units < units
+
+    def __le__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units <= units
+
+    def __gt__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units > units
+
+    def __ge__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return self.Units >= units
+
+    def __neg__(self):
+        return Price(-self.Units)
+
+    def __abs__(self):
+        return Price(abs(self.Units))
+
+    def __add__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return Price(self.Units + units)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return Price(self.Units - units)
+
+    def __rsub__(self, other):
+        units = Price._Units(other)
+        if units is None:
+            return NotImplemented
+        return Price(units - self.Units)
+
+    def __mul__(self, other):
+        if isinstance(other, int) and not isinstance(other, bool):
+            return Price(self.Units * other)
+        if isinstance(other, float):
+            other = Decimal(repr(other))
+        if isinstance(other, Decimal):
+            return Price(int((self.Units * other).quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Price):
+            return Decimal(self.Units) / Decimal(other.Units)
+        if isinstance(other, float):
+            other = Decimal(repr(other))
+        if isinstance(other, (int, Decimal)) and not isinstance(other, bool):
+            return Price(int((Decimal(self.Units) / other).quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+        return NotImplemented
@@ -0,0 +1,229 @@
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from BusinessModels.CompiledPriceCoordinates import (CompiledPriceCoordinate,
+                                                     CompiledPriceCoordinates)
+from BusinessModels.Price import Price
+
+
+class PriceLadder:
+    """ Materialized BUY prices(rungs) and quantities of a stock item. The rungs are generated once
+        from the start price and the price coordinates by going backwards till the price reaches zero.
+        Next/Previous price and quantity lookups are done using binary search on the sorted rung prices
+        instead of traversing the price coordinates from the start price for every lookup.
+
+        Rung prices are fixed-point Price values, so the same rung always has exactly the same price.
+
+        Ladder is built once per start price and price coordinates. Use GetKey to find out if the ladder
+        needs to be rebuilt.
+
+        Attributes:
+
+        Key - The start price and price coordinate values used to build the ladder.
+
+        StartPrice - Start price of the stock.
+
+        FloatRoundPrecision - Floating point precision used while calculating the rung prices.
+
+        Tolerance - Two prices are considered same if the difference(in Price units) is within the tolerance.
+        Half of the smallest price unit based on FloatRoundPrecision.
+
+        PriceCoordinates - Compiled price coordinates used to build the ladder.
+
+        Prices - Rung prices in the ascending order. Last rung is the start price.
+
+        PriceUnits - Units of the rung prices, used for binary search.
+
+        Quantities - Quantity at each rung. Quantity multiplier is not applied.
+
+        Methods:
+
+        GetKey - Gets the key for the given start price and price coordinates.
+
+        GetSegment - Gets the price coordinate to which the given price belongs.
+
+        SnapToRung - Gets the index of the rung for the given price.
+
+        GetPreviousPrice - Gets the previous(backward) price.
+
+        GetNextPrice - Gets the next(forward) price.
+
+        GetQuantity - Gets the quantity at the given price.
+
+    """
+    def __init__(self, startPrice:Decimal, priceCoordinates:CompiledPriceCoordinates, floatRoundPrecision:int):
+        """ Initialization method. Builds the rungs from the start price.
+
+            Parameters:
+
+            startPrice:Decimal - Start price of the stock.
+
+            priceCoordinates:CompiledPriceCoordinates - Compiled price coordinates of the stock.
+
+            floatRoundPrecision:int - Floating point precision.
+
+            Exceptions:
+
+            ValueError - When the price coordinates doesn't move the price backwards.
+
+        """
+        self.Key:tuple = PriceLadder.GetKey(startPrice, priceCoordinates)
+        self.StartPrice:Price = Price.From(startPrice)
+        self.FloatRoundPrecision:int = floatRoundPrecision
+        self.Tolerance:int = (10 ** (Price.Scale - floatRoundPrecision)) // 2 if floatRoundPrecision < Price.Scale else 0
+
+        self.PriceCoordinates:CompiledPriceCoordinates = priceCoordinates
+
+        # Generate the rungs backwards from the start price.
+        prices:List[Price] = []
+        quantities:List[int] = []
+        price = self.StartPrice
+        while price > 0:
+            segment = self.GetSegment(price)
+            if segment is None:
+                break
+            prices.append(price)
+            quantities.append(segment.Quantity)
+            previousPrice = (price - priceCoordinates.GetDelta(price, segment)).Round(floatRoundPrecision)
+            if previousPrice >= price:
+                raise ValueError(f"Price coordinate with StartPrice {segment.StartPrice} does not move the price backwards from {price}.")
+            price = previousPrice
+
+        prices.reverse()
+        quantities.reverse()
+        self.Prices:List[Price] = prices
+        self.PriceUnits:List[int] = [price.Units for price in prices]
+        self.Quantities:List[int] = quantities
+
+    @staticmethod
+    def GetKey(startPrice:Decimal, priceCoordinates:CompiledPriceCoordinates) -> tuple:
+        """ Gets the key of the ladder for the given start price and price coordinates.
+            If the key changes the ladder has to be rebuilt.
+
+            Parameters:
+
+            startPrice:Decimal - Start price of the stock.
+
+            priceCoordinates:CompiledPriceCoordinates - Compiled price coordinates of the stock.
+
+            Returns:
+
+            Key for the given start price and price coordinates.
+
+        """
+        return (Price.From(startPrice), priceCoordinates.Key)
+
+    def GetSegment(self, price:Price) -> Optional[CompiledPriceCoordinate]:
+        """ Gets the price coordinate to which the price belongs.
+
+            Parameters:
+
+            price:Price - Price.
+
+            Returns:
+
+            Price coordinate or None if the price is below all the price coordinates.
+
+        """
+        return self.PriceCoordinates.GetCoordinate(price)
+
+    def SnapToRung(self, price:Decimal) -> int:
+        """ Gets the index of the rung for the given price. Price matches the rung if the difference
+            is within the tolerance.
+
+            Parameters:
+
+            price:Decimal - Price.
+
+            Returns:
+
+            Index of the rung in the Prices, -1 if the price is not on the ladder.
+
+        """
+        units = Price.From(price).Units
+        index = bisect_left(self.PriceUnits, units - self.Tolerance)
+        if index < len(self.PriceUnits) and abs(self.PriceUnits[index] - units) <= self.Tolerance:
+            return index
+        return -1
+
+    def GetRung(self, index:int) -> Tuple[Price, int]:
+        """ Gets the price and quantity of the rung at the given index.
+
+            Parameters:
+
+            index:int - Index of the rung.
+
+            Returns:
+
+            Tuple[Price, int] - [Price, Quantity]. [0, 0] if the index is outside the ladder.
+
+        """
+        if index < 0 or index >= len(self.Prices):
+            return Price(0), 0
+        return self.Prices[index], self.Quantities[index]
+
+    def GetPreviousPrice(self, price) -> Price:
+        """ Gets the previous(backward) price.
+
+            Parameters:
+
+            price - Price. Price, float, Decimal or int.
+
+            Returns:
+
+            Previous price, 0 if the price is below all the price coordinates.
+
+        """
+        index = self.SnapToRung(price)
+        if index > 0:
+            return self.Prices[index - 1]
+
+        # Lowest rung or not on the ladder. Calculate using the price coordinate.
+        price = Price.From(price)
+        segment = self.GetSegment(price)
+        if segment is None:
+            return Price(0)
+        return (price - self.PriceCoordinates.GetDelta(price, segment)).Round(self.FloatRoundPrecision)
+
+    def GetNextPrice(self, price) -> Price:
+        """ Gets the next(forward) price. For the start price and above, next price is calculated using the
+            price coordinate. For the price between the rungs the next higher rung is returned.
+
+            Parameters:
+
+            price - Price. Price, float, Decimal or int.
+
+            Returns:
+
+            Next price, 0 if the price is below all the price coordinates.
+
+        """
+        price = Price.From(price)
+        if len(self.PriceUnits) != 0 and price.Units < self.PriceUnits[-1] - self.Tolerance:
+            index = self.SnapToRung(price)
+            if index >= 0:
+                return self.Prices[index + 1]
+            return self.Prices[bisect_right(self.PriceUnits, price.Units)]
+
+        segment = self.GetSegment(price)
+        if segment is None:
+            return Price(0)
+        return (price + self.PriceCoordinates.GetDelta(price, segment)).Round(self.FloatRoundPrecision)
+
+    def GetQuantity(self, price) -> int:
+        """ Gets the quantity at the given price. Quantity multiplier is not applied.
+
+            Parameters:
+
+            price - Price. Price, float, Decimal or int.
+
+            Returns:
+
+            Quantity at the price, 0 if the price is below all the price coordinates.
+
+        """
+        index = self.SnapToRung(price)
+        if index >= 0:
+            return self.Quantities[index]
+        return self.PriceCoordinates.GetQuantity(price)
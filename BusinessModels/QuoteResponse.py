@@ -1,7 +1,8 @@
-from typing import List
+from typing import Dict, List
 
 from BusinessModels.Error import Error
 from BusinessModels.Message import Message
+from BusinessModels.Price import Price
 
 
 class QuoteData:
@@ -19,15 +20,30 @@ class QuoteData:
 
         AdjustedFlag - Indicates whether an option has been adjusted due to a corporate 
         action (for example, a dividend or stock split)	
+
+        Bid:Price - Latest bid price. None if not available.
+
+        Ask:Price - Latest ask price. None if not available.
+
+        Volume:int - Total number of shares traded in the day.
+
+        TimeStamp:int - Time of the quote, seconds since the epoch(UTC).
         
     """
+    __slots__ = ("DateTime", "Symbol", "SecurityType", "LastTradedPrice", "AdjustedFlag", "Bid", "Ask", "Volume", "TimeStamp")
+
     def __init__(self, dateTime:str = "", symbol:str = "", securityType:str = "", 
-                    lastTradedPrice:str = "", adjustedFlag:bool = False):
-        self.DateTime = dateTime
-        self.Symbol = symbol
-        self.SecurityType = securityType
-        self.LastTradedPrice = lastTradedPrice
-        self.AdjustedFlag = adjustedFlag
+                    lastTradedPrice:str = "", adjustedFlag:bool = False, bid:Price = None, ask:Price = None,
+                    volume:int = 0, timeStamp:int = 0):
+        self.DateTime:str = dateTime
+        self.Symbol:str = symbol
+        self.SecurityType:str = securityType
+        self.LastTradedPrice:str = lastTradedPrice
+        self.AdjustedFlag:bool = adjustedFlag
+        self.Bid:Price = bid
+        self.Ask:Price = ask
+        self.Volume:int = volume
+        self.TimeStamp:int = timeStamp
 
 
 class QuoteResponse:
@@ -37,12 +53,15 @@ class QuoteResponse:
 
         QuoteData - Data on successful response.
 
+        QuoteDataBySymbol:Dict[str, QuoteData] - QuoteData by Symbol(upper case).
+
         Messages - Message if any.
 
         Error - Error if any.
 
     """
-    def __init__(self, error: Error = None, quoteData: List[QuoteData] = [], messages: List[Message] = []):
-        self.QuoteData: List[QuoteData] = quoteData
-        self.Messages: List[Message] = messages
+    def __init__(self, error: Error = None, quoteData: List[QuoteData] = None, messages: List[Message] = None):
+        self.QuoteData: List[QuoteData] = [] if quoteData is None else quoteData
+        self.QuoteDataBySymbol: Dict[str, QuoteData] = {quoteData.Symbol.upper(): quoteData for quoteData in self.QuoteData}
+        self.Messages: List[Message] = [] if messages is None else messages
         self.Error: Error = error
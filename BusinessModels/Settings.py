@@ -11,6 +11,12 @@ class Settings:
 
         MoneyMakerLogFilePathWithName - Money maker log file path.
 
+        MarketCalendarFilePathWithName - Market calendar file path. Session hours, exchange holidays and early closes.
+        The default sessions(America/New_York) without holidays are used if None.
+
+        LogLevel - Level of the system wide logger. "DEBUG"(the level the logger always used) logs the request
+        headers and the response bodies, use "INFO" to skip them.
+
         IsAuthorizationManual - If True, Authorization is done manually. This is useful if for some
         reason chromedriver is not working.
 
@@ -29,6 +35,67 @@ class Settings:
         UnfilledValue - Some fields are initialized with this value and later verified if the fields 
         are populated by the API or not.
 
+        ProcessStockItemsConcurrently - If True, the stock items are processed concurrently in each cycle.
+
+        MaxConcurrentStockItems - Maximum number of stock items processed at the same time when 
+        ProcessStockItemsConcurrently is True or UseAsyncClient is True. Keep it low to stay within the API rate limits.
+
+        UseAsyncClient - If True, the MoneyMaker uses the asyncio ETrade services(DoMakeMoneyAsync).
+
+        UseAdaptivePolling - If True, each stock item is processed when it is due(PollingScheduler) instead of
+        every CycleWaitTimeInSeconds. Stock items close to a limit order are processed more often.
+
+        PollingMinIntervalInSeconds - Interval of a stock item with the last price within PollingNearTicks of
+        one of its limit orders, or with orders just cancelled or placed.
+
+        PollingMaxIntervalInSeconds - Maximum interval of a stock item far from all of its limit orders.
+
+        PollingNearTicks - Distance to a limit order, in ticks(10 ** -FloatRoundPrecision), considered close.
+
+        PollingIntervalGrowthFactor - Interval of a stock item far from all of its limit orders is multiplied by
+        this factor after each visit.
+
+        MaxRequestsPerMinute - Requests budget of the MoneyMaker per minute when UseAdaptivePolling is True.
+
+        UseMarketCalendar - If True, the MoneyMaker sleeps while the market is closed(MarketCalendar). The regular
+        session is used by EntryMoneyMaker, the pre-market, regular and after hours sessions by EntryMoneyMaker_Extended.
+
+        MarketWarmUpInSeconds - The MoneyMaker wakes up this many seconds before the session opens.
+
+        UseQuoteBands - If True, the quotes of the stock items are checked first in each cycle and only the stock
+        items whose last price crossed their highest BUY or lowest SELL order, or whose portfolio quantity changed,
+        are reconciled with their open orders(ReconciliationBands).
+
+        FullReconciliationIntervalInSeconds - All the stock items are reconciled this often when UseQuoteBands is True.
+
+        SkipUnchangedStockItems - If True, a stock item with the same portfolio quantity and open orders as its last
+        reconciliation with nothing to cancel or place is not processed again(PortfolioSnapshot).
+
+        UseOrderBookMirror - If True, the open orders are kept in memory from the place and cancel responses
+        (OrderBookMirror) and fetched from the API only every OrderBookReconciliationIntervalInSeconds, after a failed
+        cancel/place or when a portfolio quantity changed.
+
+        OrderBookReconciliationIntervalInSeconds - Open orders are fetched from the API at least this often when
+        UseOrderBookMirror is True.
+
+        UseClientOrderRegistryFile - If True, the ClientOrderRegistry(ClientOrderId -> Symbol, side, price, quantity
+        and state of the placed orders) is persisted to ClientOrderRegistryFilePathWithName and replayed on start.
+
+        ClientOrderRegistryFilePathWithName - JSON lines file of the ClientOrderRegistry. The registry is kept in
+        memory only if None.
+
+        ClientOrderRegistryRetentionInDays - Resolved orders older than this are dropped from the file on start.
+
+        ClientOrderLookupTimeoutInSeconds - An order with an unknown place outcome(timeout) not found in the orders
+        of the API for this long is considered not placed and can be placed again.
+
+        UseOrderPipeline - If True, the new orders of a stock item are previewed concurrently, validated as the
+        previews arrive and placed concurrently(SELL orders before BUY orders, closest to the market price first).
+        The outcomes of the orders are logged once per stock item.
+
+        OrderPipelineMaxConcurrentOrders - Maximum number of preview/place requests of all the stock items at the
+        same time when UseOrderPipeline is True.
+
     """
     
     ConfigFilePathWithName = "C://Users//Ravi//Desktop//current projects//ETrade-Trading//Entries//TradingConfig.ini"
@@ -36,6 +103,8 @@ class Settings:
     ChromeDriverPathWithName = "C://Users//Ravi//Desktop//current projects//ETrade-Trading//ChromeDriver//Windows//V86//chromedriver.exe"
     LogFilePathWithName = "C://Users//Ravi//Desktop//current projects//ETrade-Trading//Entries//trader_client.log"
     MoneyMakerLogFilePathWithName = "C://Users//Ravi//Desktop//current projects//ETrade-Trading//Entries//money_maker.log"
+    MarketCalendarFilePathWithName = None
+    LogLevel = "DEBUG"
     IsAuthorizationManual = False
     CycleWaitTimeInSeconds = 60
     NewOrderId = -9999
@@ -43,6 +112,28 @@ class Settings:
     MaxCommission = 0.1
     UnfilledCommissionOrFee = -99999999999999
     UnfilledValue = -99999999999999
+    ProcessStockItemsConcurrently = False
+    MaxConcurrentStockItems = 4
+    UseAsyncClient = False
+    UseAdaptivePolling = False
+    PollingMinIntervalInSeconds = 10
+    PollingMaxIntervalInSeconds = 300
+    PollingNearTicks = 3
+    PollingIntervalGrowthFactor = 2
+    MaxRequestsPerMinute = 60
+    UseMarketCalendar = False
+    MarketWarmUpInSeconds = 300
+    UseQuoteBands = False
+    FullReconciliationIntervalInSeconds = 600
+    SkipUnchangedStockItems = False
+    UseOrderBookMirror = False
+    OrderBookReconciliationIntervalInSeconds = 300
+    UseClientOrderRegistryFile = False
+    ClientOrderRegistryFilePathWithName = None
+    ClientOrderRegistryRetentionInDays = 7
+    ClientOrderLookupTimeoutInSeconds = 300
+    UseOrderPipeline = False
+    OrderPipelineMaxConcurrentOrders = 4
       
     def __init__(self):
         pass
@@ -11,7 +11,7 @@ class AppLogger:
         Logger - Logger from logging module.
 
     """
-    def __init__(self, logFilePathWithName:str, loggerName:str):
+    def __init__(self, logFilePathWithName:str, loggerName:str, logLevel = logging.DEBUG):
         """ Initialize the Logger with some predefined settings.
 
             Parameters:
@@ -20,10 +20,13 @@ class AppLogger:
 
             loggerName - logger name for internal purposes.
 
+            logLevel - logging level, for example logging.DEBUG or "INFO". Debug messages which are costly
+            to build(e.g. the response bodies) are built only when the level is DEBUG.
+
         """
 
         self.Logger: Logger = logging.getLogger(loggerName)
-        self.Logger.setLevel(logging.DEBUG)
+        self.Logger.setLevel(logLevel)
         
         handler = RotatingFileHandler(logFilePathWithName, maxBytes=100 * 1024 * 1024, backupCount=3)
         FORMAT = "%(asctime)-15s %(message)s"
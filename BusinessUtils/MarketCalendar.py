@@ -0,0 +1,184 @@
+import configparser
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from BusinessModels.MarketSession import MarketSession
+
+# zoneinfo is available from Python 3.9, pytz is used on older versions.
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+    import pytz
+
+
+class MarketCalendar:
+    """ Trading sessions of the US equity market. Session hours, exchange holidays and early closes are read
+        from an INI file(Entries/MarketCalendar.ini), missing values use the defaults below. Weekends are
+        always closed.
+
+        Attributes:
+
+        TimeZone - Time zone of the exchange.
+
+        PreMarketOpen, RegularOpen, RegularClose, AfterHoursClose - Session times in the exchange time zone.
+
+        Holidays:Dict[date, str] - Days the exchange is closed, with the name of the holiday.
+
+        EarlyCloses:Dict[date, time] - Close time of the regular session on the early close days. The after hours
+        session ends the same time after the early close as after the usual close.
+
+        Methods:
+
+        GetSessions(day) -> List[Tuple[MarketSession, datetime, datetime]]
+            Sessions of the day with their start and end times.
+
+        GetSession(now) -> MarketSession
+            Session at the given time.
+
+        GetNextOpen(now, extendedHours) -> datetime
+            Start of the current or the next session.
+
+        GetWaitTime(now, extendedHours, warmUpInSeconds) -> float
+            Seconds to wait till warmUpInSeconds before the next session. 0 if a session is open.
+
+    """
+    SessionsSectionString = "Sessions"
+    HolidaysSectionString = "Holidays"
+    EarlyClosesSectionString = "EarlyCloses"
+    DateFormat = "%Y-%m-%d"
+    TimeFormat = "%H:%M"
+
+    # Days checked for the next session. Longer than any exchange closure.
+    MaxClosedDays = 14
+
+    def __init__(self, calendarPath:str = None):
+        """ Initialization method.
+
+            Parameters:
+
+            calendarPath - Path to the calendar file with name. Defaults are used if None or the file doesn't exist.
+
+        """
+        config = configparser.ConfigParser()
+        if calendarPath is not None:
+            config.read(calendarPath)
+        sessions = config[self.SessionsSectionString] if config.has_section(self.SessionsSectionString) else {}
+
+        self.TimeZone = self.GetTimeZone(sessions.get("TimeZone", "America/New_York"))
+        self.PreMarketOpen:time = self.ParseTime(sessions.get("PreMarketOpen", "07:00"))
+        self.RegularOpen:time = self.ParseTime(sessions.get("RegularOpen", "09:30"))
+        self.RegularClose:time = self.ParseTime(sessions.get("RegularClose", "16:00"))
+        self.AfterHoursClose:time = self.ParseTime(sessions.get("AfterHoursClose", "20:00"))
+
+        self.Holidays:Dict[date, str] = {}
+        if config.has_section(self.HolidaysSectionString):
+            for day, name in config.items(self.HolidaysSectionString):
+                self.Holidays[datetime.strptime(day, self.DateFormat).date()] = name
+
+        self.EarlyCloses:Dict[date, time] = {}
+        if config.has_section(self.EarlyClosesSectionString):
+            for day, closeTime in config.items(self.EarlyClosesSectionString):
+                self.EarlyCloses[datetime.strptime(day, self.DateFormat).date()] = self.ParseTime(closeTime)
+
+    @staticmethod
+    def GetTimeZone(name:str):
+        return ZoneInfo(name) if ZoneInfo is not None else pytz.timezone(name)
+
+    @classmethod
+    def ParseTime(cls, value:str) -> time:
+        return datetime.strptime(value.strip(), cls.TimeFormat).time()
+
+    def Localize(self, day:date, dayTime:time) -> datetime:
+        """ Time of the day in the exchange time zone.
+        """
+        localDateTime = datetime.combine(day, dayTime)
+        if ZoneInfo is not None:
+            return localDateTime.replace(tzinfo=self.TimeZone)
+        return self.TimeZone.localize(localDateTime)
+
+    def GetSessions(self, day:date) -> List[Tuple[MarketSession, datetime, datetime]]:
+        """ Sessions of the day.
+
+            Parameters:
+
+            day:date - Day in the exchange time zone.
+
+            Returns:
+
+            List[Tuple[MarketSession, datetime, datetime]] - (session, start, end) in the order of the start.
+            Empty on the weekends and the holidays.
+
+        """
+        if day.weekday() >= 5 or day in self.Holidays:
+            return []
+
+        regularClose = self.RegularClose
+        afterHoursClose = self.AfterHoursClose
+        if day in self.EarlyCloses:
+            regularClose = self.EarlyCloses[day]
+            afterHoursClose = (datetime.combine(day, regularClose) + (datetime.combine(day, self.AfterHoursClose) -
+                                datetime.combine(day, self.RegularClose))).time()
+
+        return [(MarketSession.PREMARKET, self.Localize(day, self.PreMarketOpen), self.Localize(day, self.RegularOpen)),
+                (MarketSession.REGULAR, self.Localize(day, self.RegularOpen), self.Localize(day, regularClose)),
+                (MarketSession.AFTERHOURS, self.Localize(day, regularClose), self.Localize(day, afterHoursClose))]
+
+    def ToExchangeTime(self, now:datetime) -> datetime:
+        """ Time in the exchange time zone. Naive times are the local time of the computer.
+        """
+        return now.astimezone(self.TimeZone)
+
+    def GetSession(self, now:datetime) -> MarketSession:
+        """ Session at the given time. CLOSED if no session is open.
+        """
+        now = self.ToExchangeTime(now)
+        for session, start, end in self.GetSessions(now.date()):
+            if start <= now < end:
+                return session
+        return MarketSession.CLOSED
+
+    def GetNextOpen(self, now:datetime, extendedHours:bool = False) -> datetime:
+        """ Start of the session open at the given time, or of the next session.
+
+            Parameters:
+
+            now:datetime - Time. Naive times are the local time of the computer.
+
+            extendedHours:bool - If True, the pre-market and after hours sessions are included.
+
+            Returns:
+
+            datetime - Start of the session in the exchange time zone. None if there is no session in the next
+            MaxClosedDays days.
+
+        """
+        now = self.ToExchangeTime(now)
+        for dayOffset in range(self.MaxClosedDays):
+            for session, start, end in self.GetSessions(now.date() + timedelta(days=dayOffset)):
+                if extendedHours is False and session != MarketSession.REGULAR:
+                    continue
+                if now < end:
+                    return start
+        return None
+
+    def GetWaitTime(self, now:datetime, extendedHours:bool = False, warmUpInSeconds:float = 0) -> float:
+        """ Seconds to wait till warmUpInSeconds before the next session.
+
+            Parameters:
+
+            now:datetime - Time. Naive times are the local time of the computer.
+
+            extendedHours:bool - If True, the pre-market and after hours sessions are included.
+
+            warmUpInSeconds:float - Seconds before the session start to stop waiting.
+
+            Returns:
+
+            float - 0 if a session is open or starts within warmUpInSeconds.
+
+        """
+        nextOpen = self.GetNextOpen(now, extendedHours)
+        if nextOpen is None:
+            return 0.0
+        return max(0.0, (nextOpen - now.astimezone(timezone.utc)).total_seconds() - warmUpInSeconds)
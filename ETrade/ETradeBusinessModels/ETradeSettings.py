@@ -1,3 +1,6 @@
+from BusinessModels.ErrorAction import ErrorAction
+
+
 class ETradeSettings:
 
     """ ETrade Account related settings.
@@ -31,11 +34,49 @@ class ETradeSettings:
 
         SellCommission - static field. Sell commission value or percentage. Commission should also include Extended trading hours costs if any.
 
-        ExclusionErrorCodes - static field. These errors can be ignored and application can continue.
+        ErrorCodeActions - static field. Action(ErrorAction) by error/message code, used instead of separate
+        code lists. RETRY - transient, the idempotent requests are retried with backoff, SKIP - the request is
+        skipped and the application can continue, ABORT - System cannot continue when these errors occur.
+        Codes not in the table abort for response errors and for ERROR/FATAL messages.
         https://apisb.etrade.com/docs/api/order/api-order-v1.html#/definitions/ErrorCodes
 
-        DangerErrorCodes - static field. System cannot continue when these errors occur.
-        https://apisb.etrade.com/docs/api/order/api-order-v1.html#/definitions/ErrorCodes
+        RetryMaxAttempts - static field. Attempts of an idempotent request(GET, cancel PUT, preview POST) failing
+        with a connection error, a RetryStatusCodes response or a RETRY code. Place orders are never retried.
+
+        RetryBaseDelayInSeconds, RetryMaxDelayInSeconds - static field. Backoff before the next attempt is random
+        between 0 and RetryBaseDelayInSeconds * 2 ** retry, at most RetryMaxDelayInSeconds.
+
+        RetryStatusCodes - static field. HTTP status codes of transient failures.
+
+        QuotesMaxSymbols - static field. Maximum number of symbols in one Quotes request.
+
+        QuotesOverrideSymbolCount - static field. If True, the Quotes requests are sent with overrideSymbolCount
+        and up to QuotesOverrideMaxSymbols symbols each.
+        https://apisb.etrade.com/docs/api/market/api-quote-v1.html
+
+        QuotesOverrideMaxSymbols - static field. Maximum number of symbols in one Quotes request with overrideSymbolCount.
+
+        QuotesMaxConcurrentRequests - static field. Quotes requests of a large list of symbols sent at the same time.
+
+        QuoteCacheTTLInSeconds - static field. Age after which a quote of the ETradeQuoteCache is requested again.
+
+        QuoteCacheMaxSymbols - static field. Maximum number of quotes kept by the ETradeQuoteCache.
+
+        PortfolioMaxConcurrentPages - static field. Portfolio pages requested at the same time once the first
+        page reports the total number of pages.
+
+        UseRateLimiter - static field. If True, the requests are paced by the ETradeRateLimiter.
+
+        RateLimitMarketRequestsPerSecond, RateLimitAccountRequestsPerSecond, RateLimitOrderRequestsPerSecond -
+        static field. Requests per second of the market, account and order endpoints. 0, no limit.
+
+        RateLimitThrottleFactor - static field. Rate of an endpoint class is multiplied by it after an HTTP 429
+        or a throttling message.
+
+        RateLimitMinimumFactor - static field. Lowest rate after throttling, as a fraction of the configured rate.
+
+        RateLimitRecoveryFactor - static field. Fraction of the configured rate given back after each successful
+        response, until the configured rate is reached again.
 
     """
 
@@ -58,8 +99,28 @@ class ETradeSettings:
     BuyCommission = 0
     SellCommission = 0
 
-    ExclusionErrorCodes = [8400, 1021, 163, 5003, 5011, 612]
-    DangerErrorCodes = [9010]
+    ErrorCodeActions = {163: ErrorAction.RETRY, 8400: ErrorAction.SKIP, 1021: ErrorAction.SKIP, 5003: ErrorAction.SKIP,
+                        5011: ErrorAction.SKIP, 612: ErrorAction.SKIP, 9010: ErrorAction.ABORT}
+    RetryMaxAttempts = 4
+    RetryBaseDelayInSeconds = 0.5
+    RetryMaxDelayInSeconds = 8
+    RetryStatusCodes = [429, 500, 502, 503, 504]
+
+    QuotesMaxSymbols = 25
+    QuotesOverrideSymbolCount = True
+    QuotesOverrideMaxSymbols = 50
+    QuotesMaxConcurrentRequests = 4
+    QuoteCacheTTLInSeconds = 1
+    QuoteCacheMaxSymbols = 1000
+    PortfolioMaxConcurrentPages = 4
+
+    UseRateLimiter = True
+    RateLimitMarketRequestsPerSecond = 4
+    RateLimitAccountRequestsPerSecond = 2
+    RateLimitOrderRequestsPerSecond = 2
+    RateLimitThrottleFactor = 0.5
+    RateLimitMinimumFactor = 0.25
+    RateLimitRecoveryFactor = 0.05
 
     def __init__(self):
         pass
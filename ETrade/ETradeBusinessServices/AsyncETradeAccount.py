@@ -0,0 +1,113 @@
+import asyncio
+import sys
+
+from BusinessModels.Context import Context
+from BusinessModels.FilteringAndPagingParams import \
+    PortfolioFilteringAndPagingParams
+from BusinessModels.PortfolioResponse import AccountPortfolio, PortfolioResponse
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeAccount import ETradeAccount
+from ETrade.ETradeBusinessUtils.AsyncOAuth1Session import AsyncOAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class AsyncETradeAccount(ETradeAccount):
+    """ asyncio version of ETradeAccount. Requests are sent using AsyncOAuth1Session and the responses are
+        processed by the ETradeAccount methods, so the same BusinessModels responses are returned.
+
+        The session must be closed using Close, or the object used with async with. Requests are paced by
+        the rateLimiter and the transient failures retried by the retryPolicy, give the ones of the shared
+        ETradeSessionPool to share them with the sync services.
+
+    """
+    def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
+                    context: Context, strings: FormatStringsBase, maxConnections:int = 100,
+                    rateLimiter: ETradeRateLimiter = None, retryPolicy: ETradeRetryPolicy = None):
+        if strings is None:
+            raise ValueError(FormatStringsBase.InputStringsNone)
+        self.strings = strings
+
+        if inputModel is None:
+            raise ValueError(self.strings.InputNone.format("inputModel"))
+        if settings is None:
+            raise ValueError(self.strings.InputNone.format("settings"))
+        if context is None:
+            raise ValueError(self.strings.InputNone.format("context"))
+
+        self.inputModel: ETradeInputModel = inputModel
+        self.context: Context = context
+        self.settings: ETradeSettings = settings
+
+        self.session = AsyncOAuth1Session(self.settings.ConsumerKey,
+                        self.settings.ConsumerSecret,
+                        self.inputModel.AccessToken,
+                        self.inputModel.AccessTokenSecret,
+                        maxConnections = maxConnections,
+                        rateLimiter = ETradeRateLimiter(self.settings) if rateLimiter is None else rateLimiter,
+                        retryPolicy = ETradeRetryPolicy(self.settings) if retryPolicy is None else retryPolicy)
+
+    def __del__(self):
+        # The aiohttp session can only be closed within the event loop, using Close.
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.Close()
+
+    async def Close(self):
+        await self.session.Close()
+
+    async def Portfolio(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:PortfolioFilteringAndPagingParams = None
+            ) -> PortfolioResponse:
+
+        params, pageSize, accumulateAndReturnAll = self.GetPortfolioParams(filteringAndPagingParams)
+
+        # URL for the API endpoint
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/portfolio.json"
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        portfolioResponse = PortfolioResponse()
+        portfolioResponse.AccountPortfolios = []
+        portfolioResponse.AccountPortfolios.append(AccountPortfolio())
+        portfolioResponse.AccountPortfolios[0].PortfolioPositions = []
+
+        try:
+
+            while True:
+                response = await self.session.Get(url, params = params)
+                nextParams = self.ProcessPortfolioPage(response, portfolioResponse, pageSize)
+
+                if self.IsLastPortfolioPage(nextParams, portfolioResponse, accumulateAndReturnAll) is True:
+                    break
+
+                # Total number of pages is known, the remaining pages are requested at the same time.
+                pagesParams = self.GetRemainingPortfolioPagesParams(params, portfolioResponse)
+                if len(pagesParams) != 0:
+                    semaphore = asyncio.Semaphore(max(1, self.settings.PortfolioMaxConcurrentPages))
+
+                    async def GetPage(pageParams:dict):
+                        async with semaphore:
+                            return await self.session.Get(url, params = pageParams)
+
+                    responses = await asyncio.gather(*[GetPage(pageParams) for pageParams in pagesParams])
+                    self.ProcessPortfolioPages(responses, portfolioResponse, pageSize)
+                    break
+
+                params = nextParams
+
+        except:
+            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+                self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
+            raise
+
+        return portfolioResponse
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+from typing import List
+
+from BusinessModels.Context import Context
+from BusinessModels.QuoteResponse import QuoteResponse
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeMarket import ETradeMarket
+from ETrade.ETradeBusinessUtils.AsyncOAuth1Session import AsyncOAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class AsyncETradeMarket(ETradeMarket):
+    """ asyncio version of ETradeMarket. Requests are sent using AsyncOAuth1Session and the responses are
+        processed by the ETradeMarket methods, so the same BusinessModels responses are returned.
+
+        The session must be closed using Close, or the object used with async with. Requests are paced by
+        the rateLimiter and the transient failures retried by the retryPolicy, give the ones of the shared
+        ETradeSessionPool to share them with the sync services.
+
+    """
+    def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
+                    context: Context, strings: FormatStringsBase, maxConnections:int = 100,
+                    rateLimiter: ETradeRateLimiter = None, retryPolicy: ETradeRetryPolicy = None):
+        if strings is None:
+            raise ValueError(FormatStringsBase.InputStringsNone)
+        self.strings = strings
+
+        if inputModel is None:
+            raise ValueError(self.strings.InputNone.format("inputModel"))
+        if settings is None:
+            raise ValueError(self.strings.InputNone.format("settings"))
+        if context is None:
+            raise ValueError(self.strings.InputNone.format("context"))
+
+        self.inputModel: ETradeInputModel = inputModel
+        self.context: Context = context
+        self.settings: ETradeSettings = settings
+
+        self.session = AsyncOAuth1Session(self.settings.ConsumerKey,
+                        self.settings.ConsumerSecret,
+                        self.inputModel.AccessToken,
+                        self.inputModel.AccessTokenSecret,
+                        maxConnections = maxConnections,
+                        rateLimiter = ETradeRateLimiter(self.settings) if rateLimiter is None else rateLimiter,
+                        retryPolicy = ETradeRetryPolicy(self.settings) if retryPolicy is None else retryPolicy)
+
+    def __del__(self):
+        # The aiohttp session can only be closed within the event loop, using Close.
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.Close()
+
+    async def Close(self):
+        await self.session.Close()
+
+    async def Quotes(self, symbols: list, accessToken:str = None, accessTokenSecret: str = None) -> QuoteResponse:
+
+        chunks = self.GetQuoteChunks(symbols)
+
+        self.session.access_token = self.inputModel.AccessToken if accessToken is None else accessToken
+        self.session.access_token_secret = self.inputModel.AccessTokenSecret if accessTokenSecret is None else accessTokenSecret
+
+        semaphore = asyncio.Semaphore(max(1, self.settings.QuotesMaxConcurrentRequests))
+
+        async def GetChunk(chunk:List[str]) -> QuoteResponse:
+            async with semaphore:
+                return self.ProcessQuotesResponse(await self.session.Get(self.QuotesUrl(chunk)))
+
+        try:
+
+            responses = await asyncio.gather(*[GetChunk(chunk) for chunk in chunks])
+
+            return self.MergeQuoteResponses(responses)
+
+        except:
+            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+                self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
+            raise
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import sys
+from typing import AsyncIterator, List
+
+from BusinessModels.CancelOrderResponse import CancelOrderResponse
+from BusinessModels.Context import Context
+from BusinessModels.FilteringAndPagingParams import \
+    OrdersFilteringAndPagingParams
+from BusinessModels.OrdersResponse import OrdersResponse
+from BusinessModels.PlaceOrderResponse import PlaceOrderResponse
+from BusinessModels.PreviewOrderInput import PreviewOrderInput
+from BusinessModels.PreviewOrderResponse import PreviewId, PreviewOrderResponse
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from ETrade.ETradeBusinessUtils.AsyncOAuth1Session import AsyncOAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class AsyncETradeOrder(ETradeOrder):
+    """ asyncio version of ETradeOrder. Requests are sent using AsyncOAuth1Session and the responses are
+        processed by the ETradeOrder methods, so the same BusinessModels responses are returned.
+
+        The session must be closed using Close, or the object used with async with. Requests are paced by
+        the rateLimiter and the transient failures retried by the retryPolicy, give the ones of the shared
+        ETradeSessionPool to share them with the sync services.
+
+    """
+    def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
+                    context: Context, strings: FormatStringsBase, maxConnections:int = 100,
+                    rateLimiter: ETradeRateLimiter = None, retryPolicy: ETradeRetryPolicy = None):
+        if strings is None:
+            raise ValueError(FormatStringsBase.InputStringsNone)
+        self.strings = strings
+
+        if inputModel is None:
+            raise ValueError(self.strings.InputNone.format("inputModel"))
+        if settings is None:
+            raise ValueError(self.strings.InputNone.format("settings"))
+        if context is None:
+            raise ValueError(self.strings.InputNone.format("context"))
+
+        self.inputModel: ETradeInputModel = inputModel
+        self.context: Context = context
+        self.settings: ETradeSettings = settings
+
+        self.session = AsyncOAuth1Session(self.settings.ConsumerKey,
+                        self.settings.ConsumerSecret,
+                        self.inputModel.AccessToken,
+                        self.inputModel.AccessTokenSecret,
+                        maxConnections = maxConnections,
+                        rateLimiter = ETradeRateLimiter(self.settings) if rateLimiter is None else rateLimiter,
+                        retryPolicy = ETradeRetryPolicy(self.settings) if retryPolicy is None else retryPolicy)
+
+    def __del__(self):
+        # The aiohttp session can only be closed within the event loop, using Close.
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.Close()
+
+    async def Close(self):
+        await self.session.Close()
+
+    async def CancelOrder(self, accountIdKey:str, orderId:int, 
+                        accessToken:str = None, accessTokenSecret:str = None) -> CancelOrderResponse:
+
+        params:dict = {}
+        params["CancelOrderRequest"] = {}
+        params["CancelOrderRequest"]["orderId"] = orderId
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders/cancel.json"
+
+        headers = {"Content-Type": "application/json", "consumerKey": self.settings.ConsumerKey}
+        response = await self.session.Put(url, headers=headers, data=json.dumps(params))
+
+        return self.ProcessCancelOrderResponse(response)
+
+    async def PlaceOrderEQ(self, accountIdKey:str, previewOrderInput:PreviewOrderInput, 
+                        previewIds:List[PreviewId], accessToken:str = None, accessTokenSecret:str = None) -> PlaceOrderResponse:
+        payload = self.ConvertPlaceInputToPayload(previewOrderInput, previewIds)
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders/place.json"
+
+        headers = {"Content-Type": "application/json", "consumerKey": self.settings.ConsumerKey}
+        response = await self.session.Post(url, headers=headers, data=json.dumps(payload))
+
+        return self.ProcessPlaceOrderResponse(response)
+
+    async def PreviewOrderEQ(self, accountIdKey:str, previewOrderInput:PreviewOrderInput,
+            accessToken:str = None, accessTokenSecret:str = None) -> PreviewOrderResponse:
+
+        payload = self.ConvertPlacePreviewInputToPayload(previewOrderInput)
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders/preview.json"
+
+        headers = {"Content-Type": "application/json", "consumerKey": self.settings.ConsumerKey}
+        response = await self.session.Post(url, headers=headers, data=json.dumps(payload))
+
+        return self.ProcessPreviewOrderResponse(response)
+
+    async def Orders(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:OrdersFilteringAndPagingParams = None
+            ) -> OrdersResponse:
+
+        params, accumulateAndReturnAll = self.GetOrdersParams(filteringAndPagingParams)
+
+        # URL for the API endpoint
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders.json"
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        ordersResponse = OrdersResponse()
+        ordersResponse.Orders = []
+        ordersResponse.Messages = []
+
+        try:
+
+            # The next page is known only after the current page is received(marker).
+            while True:
+                response = await self.session.Get(url, params = params)
+                params = self.ProcessOrdersPage(response, ordersResponse)
+
+                if params is None or accumulateAndReturnAll is False:
+                    break                
+                if ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != "":
+                    break
+                elif ordersResponse.Marker == "":
+                    break
+
+        except:
+            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+                self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
+            raise
+
+        return ordersResponse
+
+    async def IterOrders(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:OrdersFilteringAndPagingParams = None
+            ) -> AsyncIterator[OrdersResponse]:
+
+        params, accumulateAndReturnAll = self.GetOrdersParams(filteringAndPagingParams)
+
+        # URL for the API endpoint
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders.json"
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        nextPage = asyncio.ensure_future(self.session.Get(url, params = params))
+
+        try:
+
+            while nextPage is not None:
+                ordersResponse = OrdersResponse()
+                params = self.ProcessOrdersPage(await nextPage, ordersResponse)
+                nextPage = None
+                if params is None:
+                    break
+
+                if accumulateAndReturnAll is True and ordersResponse.Marker != "" and \
+                        (ordersResponse.Error is None or ordersResponse.Error.ResponseStatusCode == ""):
+                    nextPage = asyncio.ensure_future(self.session.Get(url, params = params))
+
+                yield ordersResponse
+
+        except GeneratorExit:
+            raise
+        except:
+            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+                self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
+            raise
+        finally:
+            if nextPage is not None and not nextPage.done():
+                nextPage.cancel()
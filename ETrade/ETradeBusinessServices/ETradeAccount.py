@@ -1,10 +1,10 @@
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 from urllib import parse
 
 from BusinessModels.AccountListResponse import AccountData, AccountListResponse
 from BusinessModels.Context import Context
-from BusinessModels.Error import Error
 from BusinessModels.FilteringAndPagingParams import \
     PortfolioFilteringAndPagingParams
 from BusinessModels.PortfolioResponse import (AccountPortfolio, PagingInfo,
@@ -14,15 +14,32 @@ from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
 from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
 from ETrade.ETradeBusinessServices.ETradeBusinessService import \
     ETradeBusinessService
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+from ETrade.ETradeBusinessUtils.ModelLoader import Field, ModelLoader
 from Exceptions.InvalidFilteringAndPagingParamsException import \
     InvalidPortfolioFilteringAndPagingParamsError
-from rauth import OAuth1Session
 from Strings.FormatStringsBase import FormatStringsBase
 
 
 class ETradeAccount(ETradeBusinessService):
+    # Response to model mappings.
+    AccountDataLoader = ModelLoader(AccountData, [
+        Field("accountId", "AccountId"),
+        Field("accountDesc", "AccountDesc"),
+        Field("accountIdKey", "AccountIdKey")])
+
+    PortfolioPositionLoader = ModelLoader(PortfolioPosition, [
+        Field("symbolDescription", "Symbol", str),
+        Field("quantity", "Quantity", int),
+        Field("Quick.lastTrade", "LastPrice", float),
+        Field("pricePaid", "PricePaid", float),
+        Field("totalGain", "TotalGain", float),
+        Field("marketValue", "MarketValue", float)])
+
     def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
-                    context: Context, strings: FormatStringsBase):
+                    context: Context, strings: FormatStringsBase, sessionPool: ETradeSessionPool = None):
         if strings is None:
             raise ValueError(FormatStringsBase.InputStringsNone)
         self.strings = strings
@@ -38,14 +55,21 @@ class ETradeAccount(ETradeBusinessService):
         self.context: Context = context
         self.settings: ETradeSettings = settings
 
-        self.session = OAuth1Session(self.settings.ConsumerKey,
-                        self.settings.ConsumerSecret,
-                        self.inputModel.AccessToken,
-                        self.inputModel.AccessTokenSecret)
+        # Use the shared session pool if given, otherwise own one.
+        self.ownsSessionPool = sessionPool is None
+        if sessionPool is None:
+            sessionPool = ETradeSessionPool(self.settings.ConsumerKey,
+                            self.settings.ConsumerSecret,
+                            self.inputModel.AccessToken,
+                            self.inputModel.AccessTokenSecret,
+                            rateLimiter = ETradeRateLimiter(self.settings),
+                            retryPolicy = ETradeRetryPolicy(self.settings))
+        self.sessionPool: ETradeSessionPool = sessionPool
+        self.session = self.sessionPool.Session
 
     def __del__(self): 
-        if self.session is not None:
-            self.session.close()
+        if self.ownsSessionPool is True:
+            self.sessionPool.Close()
 
     def AccountList(self, accessToken:str = None, accessTokenSecret: str = None):
         # URL for the API endpoint
@@ -64,73 +88,20 @@ class ETradeAccount(ETradeBusinessService):
 
             response = self.session.get(url, header_auth=True)
 
-            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                self.context.AppLogger.Logger.debug(self.strings.RequestHeader.format(response.request.headers))
+            self.LogRequestHeader(response)
 
             # Handle and parse response
+            data = self.ParseResponse(response)
             if response is not None and response.status_code == 200:
-                parsed = json.loads(response.text)
-                if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-
-                data = response.json()
                 if data is not None and "AccountListResponse" in data and "Accounts" in data["AccountListResponse"] \
                         and "Account" in data["AccountListResponse"]["Accounts"]:
-                    accounts = data["AccountListResponse"]["Accounts"]["Account"]
-                    for account in accounts:
-                        accountData = AccountData()
-                        if account is not None and "accountId" in account:
-                            accountData.AccountId = account["accountId"]
-                        if account is not None and "accountDesc" in account:
-                            accountData.AccountDesc = account["accountDesc"]
-                        if account is not None and "accountIdKey" in account:
-                            accountData.AccountIdKey = account["accountIdKey"]
-                        accountListResponse.AccountData.append(accountData)
+                    accountListResponse.AccountData.extend(self.AccountDataLoader.LoadList(data["AccountListResponse"]["Accounts"]["Account"]))
                 else:
                     # Handle errors
-                    if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                        self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                    if response is not None and response.headers['Content-Type'] == 'application/json' \
-                            and "Error" in response.json() and "message" in response.json()["Error"] \
-                            and response.json()["Error"]["message"] is not None:
-                        errorCode = ""
-                        if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                            errorCode = response.json()["Error"]["code"]
-                        accountListResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                    else:
-                        errorCode = ""
-                        accountListResponse.Error = Error(response.status_code, errorCode, response.text)
-                        try:
-                            error = json.loads(response.text)
-                            if("Error" in error and "message" in error["Error"]):
-                                accountListResponse.Error.Message = error["Error"]["message"]
-                            if("Error" in error and "code" in error["Error"]):
-                                accountListResponse.Error.Code = error["Error"]["code"]
-                        except:
-                            pass
-                        
+                    accountListResponse.Error = self.ParseResponseError(response, data)
             else:
                 # Handle errors
-                if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                if response is not None and response.headers['Content-Type'] == 'application/json' \
-                        and "Error" in response.json() and "message" in response.json()["Error"] \
-                        and response.json()["Error"]["message"] is not None:
-                    errorCode = ""
-                    if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                        errorCode = response.json()["Error"]["code"]
-                    accountListResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                else:
-                    errorCode = ""
-                    accountListResponse.Error = Error(response.status_code, errorCode, response.text)
-                    try:
-                        error = json.loads(response.text)
-                        if("Error" in error and "message" in error["Error"]):
-                            accountListResponse.Error.Message = error["Error"]["message"]
-                        if("Error" in error and "code" in error["Error"]):
-                            accountListResponse.Error.Code = error["Error"]["code"]
-                    except:
-                        pass
+                accountListResponse.Error = self.ParseResponseError(response, data)
         except:
             if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
                 self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
@@ -138,10 +109,9 @@ class ETradeAccount(ETradeBusinessService):
 
         return accountListResponse
 
-    def Portfolio(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
-                filteringAndPagingParams:PortfolioFilteringAndPagingParams = None
-            ):
-
+    def GetPortfolioParams(self, filteringAndPagingParams:PortfolioFilteringAndPagingParams):
+        """ Query params of the first page, page size and if all the pages should be accumulated and returned.
+        """
         pageSize = 50
         pageNumber = 1
         params = {}
@@ -172,6 +142,14 @@ class ETradeAccount(ETradeBusinessService):
         if "pageNumber" not in params:
             params["pageNumber"] = pageNumber
 
+        return params, pageSize, accumulateAndReturnAll
+
+    def Portfolio(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:PortfolioFilteringAndPagingParams = None
+            ):
+
+        params, pageSize, accumulateAndReturnAll = self.GetPortfolioParams(filteringAndPagingParams)
+
         # URL for the API endpoint
         url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/portfolio.json"
 
@@ -191,105 +169,22 @@ class ETradeAccount(ETradeBusinessService):
             while True:
                 response = self.session.get(url, header_auth=True, 
                             params = params)
-                # response = self.session.get(url, header_auth=True)
-                self.context.AppLogger.Logger.debug(self.strings.RequestHeader.format(response.request.headers))
-
-                # Handle and parse response
-                if response is not None and response.status_code == 200:
-                    parsed = json.loads(response.text)
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-                    data = response.json()
-
-                    if data is not None and "PortfolioResponse" in data and "AccountPortfolio" in data["PortfolioResponse"]:
-                        for acctPortfolio in data["PortfolioResponse"]["AccountPortfolio"]:
-                            accountPortfolio = portfolioResponse.AccountPortfolios[0]
-                            accountPortfolio.PagingInfo = PagingInfo()
-                            accountPortfolio.PagingInfo.PageSize = pageSize
-                            accountPortfolio.PagingInfo.NextPageNumber = 0
-                            if "accountId" in acctPortfolio:
-                                accountPortfolio.AccountId = acctPortfolio["accountId"]
-                            if "totalNoOfPages" in acctPortfolio:
-                                accountPortfolio.PagingInfo.TotalNumberOfPages = acctPortfolio["totalNoOfPages"]
-                            if "nextPageNo" in acctPortfolio:
-                                accountPortfolio.PagingInfo.NextPageNumber = acctPortfolio["nextPageNo"]
-                            if "next" in acctPortfolio:
-                                accountPortfolio.PagingInfo.Next = str(acctPortfolio["next"])
-                                    
-                            if acctPortfolio is not None and "Position" in acctPortfolio:                        
-                                # accountPortfolio.PortfolioPositions = []
-                                for position in acctPortfolio["Position"]:
-                                    portfolioPosition = PortfolioPosition()
-                                    if position is not None and "symbolDescription" in position:
-                                        portfolioPosition.Symbol = str(position["symbolDescription"])
-                                    if position is not None and "quantity" in position:
-                                        portfolioPosition.Quantity = int(position["quantity"])
-                                    if position is not None and "Quick" in position and "lastTrade" in position["Quick"]:
-                                        portfolioPosition.LastPrice = float(position["Quick"]["lastTrade"])
-                                    if position is not None and "pricePaid" in position:
-                                        portfolioPosition.PricePaid = float(position["pricePaid"])
-                                    if position is not None and "totalGain" in position:
-                                        portfolioPosition.TotalGain = float(position["totalGain"])
-                                    if position is not None and "marketValue" in position:
-                                        portfolioPosition.MarketValue = float(position["marketValue"])
-                                    # accountPortfolio.PortfolioPositions.append(portfolioPosition)
-                                    portfolioResponse.AccountPortfolios[0].PortfolioPositions.append(portfolioPosition)
-                            # portfolioResponse.AccountPortfolios.append(accountPortfolio)
-                    else:
-                        # Handle errors
-                        self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                        if response is not None and "headers" in response and "Content-Type" in response.headers \
-                                and response.headers['Content-Type'] == 'application/json' \
-                                and "Error" in response.json() and "message" in response.json()["Error"] \
-                                and response.json()["Error"]["message"] is not None:
-                            errorCode = ""
-                            if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                                errorCode = response.json()["Error"]["code"]
-                            portfolioResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                        else:
-                            errorCode = ""
-                            portfolioResponse.Error = Error(response.status_code, errorCode, response.text)
-                            try:
-                                error = json.loads(response.text)
-                                if("Error" in error and "message" in error["Error"]):
-                                    portfolioResponse.Error.Message = error["Error"]["message"]
-                                if("Error" in error and "code" in error["Error"]):
-                                    portfolioResponse.Error.Code = error["Error"]["code"]
-                            except:
-                                pass
-                elif response is not None and response.status_code == 204:
-                    break
-                else:
-                    # Handle errors
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                    if response is not None and "headers" in response and "Content-Type" in response.headers \
-                            and response.headers['Content-Type'] == 'application/json' \
-                            and "Error" in response.json() and "message" in response.json()["Error"] \
-                            and response.json()["Error"]["message"] is not None:
-                        errorCode = ""
-                        if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                            errorCode = response.json()["Error"]["code"]
-                        portfolioResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                    else:
-                        errorCode = ""
-                        portfolioResponse.Error = Error(response.status_code, errorCode, response.text)
-                        try:
-                            error = json.loads(response.text)
-                            if("Error" in error and "message" in error["Error"]):
-                                portfolioResponse.Error.Message = error["Error"]["message"]
-                            if("Error" in error and "code" in error["Error"]):
-                                portfolioResponse.Error.Code = error["Error"]["code"]
-                        except:
-                            pass
-
-                if accumulateAndReturnAll is False:
-                    break                
-                if portfolioResponse.Error is not None and portfolioResponse.Error.ResponseStatusCode != "":
+                nextParams = self.ProcessPortfolioPage(response, portfolioResponse, pageSize)
+
+                if self.IsLastPortfolioPage(nextParams, portfolioResponse, accumulateAndReturnAll) is True:
                     break
-                elif portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1].PagingInfo.NextPageNumber == 0:
+
+                # Total number of pages is known, the remaining pages are requested at the same time.
+                pagesParams = self.GetRemainingPortfolioPagesParams(params, portfolioResponse)
+                if len(pagesParams) != 0:
+                    maxWorkers = max(1, min(self.settings.PortfolioMaxConcurrentPages, len(pagesParams)))
+                    with ThreadPoolExecutor(max_workers= maxWorkers, thread_name_prefix= "Portfolio") as executor:
+                        responses = list(executor.map(lambda pageParams: self.session.get(url, header_auth=True, 
+                                            params = pageParams), pagesParams))
+                    self.ProcessPortfolioPages(responses, portfolioResponse, pageSize)
                     break
-                else:
-                    params = dict(parse.parse_qsl(parse.urlsplit(portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1].PagingInfo.Next).query))
-                    pageNumber = portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1].PagingInfo.NextPageNumber
+
+                params = nextParams
 
         except:
             if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
@@ -297,3 +192,96 @@ class ETradeAccount(ETradeBusinessService):
             raise
 
         return portfolioResponse
+
+    def IsLastPortfolioPage(self, nextParams:dict, portfolioResponse:PortfolioResponse, accumulateAndReturnAll:bool) -> bool:
+        """ Is the processed page the last page to request? No positions, only one page is requested, an error or
+            no next page. Used by the sync and async clients.
+        """
+        if nextParams is None or accumulateAndReturnAll is False:
+            return True
+        if portfolioResponse.Error is not None and portfolioResponse.Error.ResponseStatusCode != "":
+            return True
+        return portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1].PagingInfo.NextPageNumber == 0
+
+    def GetRemainingPortfolioPagesParams(self, params:dict, portfolioResponse:PortfolioResponse) -> List[dict]:
+        """ Query params of the pages after the processed page, from its next page number up to the total 
+            number of pages. Empty if the total number of pages is not known, the pages are then followed 
+            using the next links.
+        """
+        pagingInfo = portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1].PagingInfo
+        if pagingInfo is None or pagingInfo.NextPageNumber is None or pagingInfo.TotalNumberOfPages is None:
+            return []
+        nextPageNumber = int(pagingInfo.NextPageNumber)
+        totalNumberOfPages = int(pagingInfo.TotalNumberOfPages)
+        if nextPageNumber <= 0 or totalNumberOfPages < nextPageNumber:
+            return []
+        return [dict(params, pageNumber = pageNumber) for pageNumber in range(nextPageNumber, totalNumberOfPages + 1)]
+
+    def ProcessPortfolioPages(self, responses:list, portfolioResponse:PortfolioResponse, pageSize:int):
+        """ Adds the positions of the pages to the portfolioResponse in page order, up to the first error or 
+            page without positions. Used by the sync and async clients.
+        """
+        for response in responses:
+            if self.ProcessPortfolioPage(response, portfolioResponse, pageSize) is None:
+                break
+            if portfolioResponse.Error is not None and portfolioResponse.Error.ResponseStatusCode != "":
+                break
+
+    def ProcessPortfolioPage(self, response, portfolioResponse:PortfolioResponse, pageSize:int):
+        """ Adds the positions of one page of the Portfolio API response to the portfolioResponse. Used by 
+            the sync and async clients.
+
+            Returns:
+
+            Query params of the next page. None if there are no positions(204).
+        """
+        self.LogRequestHeader(response)
+
+        # Handle and parse response
+        data = self.ParseResponse(response)
+        if response is not None and response.status_code == 200:
+
+            if data is not None and "PortfolioResponse" in data and "AccountPortfolio" in data["PortfolioResponse"]:
+                for acctPortfolio in data["PortfolioResponse"]["AccountPortfolio"]:
+                    accountPortfolio = portfolioResponse.AccountPortfolios[0]
+                    self.LoadPortfolioPagingInfo(accountPortfolio, acctPortfolio, pageSize)
+
+                    if acctPortfolio is not None and "Position" in acctPortfolio:
+                        portfolioResponse.AccountPortfolios[0].PortfolioPositions.extend(self.PortfolioPositionLoader.LoadList(acctPortfolio["Position"]))
+                    # portfolioResponse.AccountPortfolios.append(accountPortfolio)
+            else:
+                # Handle errors
+                portfolioResponse.Error = self.ParseResponseError(response, data)
+        elif response is not None and response.status_code == 204:
+            return None
+        else:
+            # Handle errors
+            portfolioResponse.Error = self.ParseResponseError(response, data)
+
+        return self.GetNextPortfolioPageParams(portfolioResponse)
+
+    def LoadPortfolioPagingInfo(self, accountPortfolio:AccountPortfolio, acctPortfolio:dict, pageSize:int):
+        """ Sets the AccountId and the PagingInfo of the accountPortfolio from an AccountPortfolio of a page.
+        """
+        accountPortfolio.PagingInfo = PagingInfo()
+        accountPortfolio.PagingInfo.PageSize = pageSize
+        accountPortfolio.PagingInfo.NextPageNumber = 0
+        if "accountId" in acctPortfolio:
+            accountPortfolio.AccountId = acctPortfolio["accountId"]
+        if "totalNoOfPages" in acctPortfolio:
+            accountPortfolio.PagingInfo.TotalNumberOfPages = acctPortfolio["totalNoOfPages"]
+        if "nextPageNo" in acctPortfolio:
+            accountPortfolio.PagingInfo.NextPageNumber = acctPortfolio["nextPageNo"]
+        if "next" in acctPortfolio:
+            accountPortfolio.PagingInfo.Next = str(acctPortfolio["next"])
+
+    def GetNextPortfolioPageParams(self, portfolioResponse:PortfolioResponse) -> dict:
+        """ Query params of the next page from the next link of the processed page. Empty if there is no next
+            page or after an error.
+        """
+        params = {}
+        accountPortfolio = portfolioResponse.AccountPortfolios[len(portfolioResponse.AccountPortfolios) - 1]
+        if (portfolioResponse.Error is None or portfolioResponse.Error.ResponseStatusCode == "") and \
+                accountPortfolio.PagingInfo is not None and accountPortfolio.PagingInfo.NextPageNumber != 0:
+            params = dict(parse.parse_qsl(parse.urlsplit(accountPortfolio.PagingInfo.Next).query))
+        return params
@@ -5,7 +5,8 @@ from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
 from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
 from ETrade.ETradeBusinessServices.ETradeBusinessService import \
     ETradeBusinessService
-from rauth import OAuth1Service, OAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+from rauth import OAuth1Service
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
@@ -15,7 +16,7 @@ from Strings.FormatStringsBase import FormatStringsBase
 
 class ETradeAuthorization(ETradeBusinessService):
     def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
-                    context: Context, strings: FormatStringsBase):
+                    context: Context, strings: FormatStringsBase, sessionPool: ETradeSessionPool = None):
         if strings is None:
             raise ValueError(FormatStringsBase.InputStringsNone)
         self.strings = strings
@@ -31,6 +32,19 @@ class ETradeAuthorization(ETradeBusinessService):
         self.context: Context = context
         self.settings: ETradeSettings = settings
 
+        # Use the shared session pool if given, otherwise own one.
+        self.ownsSessionPool = sessionPool is None
+        if sessionPool is None:
+            sessionPool = ETradeSessionPool(self.settings.ConsumerKey,
+                            self.settings.ConsumerSecret,
+                            self.inputModel.AccessToken,
+                            self.inputModel.AccessTokenSecret)
+        self.sessionPool: ETradeSessionPool = sessionPool
+
+    def __del__(self): 
+        if self.ownsSessionPool is True:
+            self.sessionPool.Close()
+
     def Authorize(self, isCodeEntryManual:bool = True, chromeDriverExecutablePath:str = ""):
         if isCodeEntryManual is False and chromeDriverExecutablePath == "":
             raise ValueError(self.strings.InputNone.format("chromeDriverExecutablePath"))
@@ -128,13 +142,9 @@ class ETradeAuthorization(ETradeBusinessService):
         return text_code
 
     def RenewAccessToken(self, accessToken:str = None, accessTokenSecret:str = None):              
-        refreshSession = OAuth1Session(
-            self.settings.ConsumerKey,
-            self.settings.ConsumerSecret,
-            access_token = self.inputModel.AccessToken if accessToken is None else accessToken,
-            access_token_secret = self.inputModel.AccessTokenSecret if accessTokenSecret is None else accessTokenSecret
-        )
+        # Renewed token is the token used by all the services, so the shared session is updated in place.
+        self.sessionPool.UpdateAccessKeys(self.inputModel.AccessToken if accessToken is None else accessToken,
+            self.inputModel.AccessTokenSecret if accessTokenSecret is None else accessTokenSecret)
 
-        resp = refreshSession.get(self.settings.AccessTokenRenewUrl, header_auth=True)
-        refreshSession.close()
+        resp = self.sessionPool.Session.get(self.settings.AccessTokenRenewUrl, header_auth=True)
         return resp.status_code
@@ -1,21 +1,156 @@
-from BusinessModels.Message import MessageType
+import json
+import logging
+from typing import List
+
+from BusinessModels.Error import Error
+from BusinessModels.Message import Message, MessageType
+from ETrade.ETradeBusinessUtils.ModelLoader import Field, ModelLoader
+
+# orjson is optional. It's much faster than json, if it's not installed json is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def LoadJson(content):
+    """ Decodes the JSON content(bytes or str) using orjson if installed, otherwise json.
+
+        Exceptions:
+
+        ValueError - When the content is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+MessageTypes = {"INFO": MessageType.INFO, "WARNING": MessageType.WARNING, "ERROR": MessageType.ERROR,
+                "INFO_HOLD": MessageType.INFO_HOLD, "FATAL": MessageType.FATAL}
+
+
+def ToMessageType(messageTypeString:str) -> MessageType:
+    """ Converts the ETrade message type string to MessageType.
+    """
+    messageType = MessageTypes.get(messageTypeString)
+    if messageType is None:
+        raise Exception(f"Unsupported ETrade Message Type.")
+    return messageType
+
+
+def GetValue(data, path:str):
+    """ Value of the path("PreviewOrderResponse.MessageList.Message") in the decoded JSON object. None if
+        any key of the path is missing.
+    """
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
 
 
 class ETradeBusinessService:
+    """ Base class of the ETrade services. Response body is decoded only once and the decoded data is
+        used for the parsing, the debug logging and the errors.
+
+        Methods:
+
+        GetLogger() -> logging.Logger
+            Logger of the context, None if there is no logger.
+
+        IsDebugEnabled() -> bool
+            True if the debug messages are actually logged.
+
+        LogRequestHeader(response) -> None
+            Logs the request headers of the response.
+
+        ParseResponse(response) -> object
+            Decodes the response body once. Returns None if the body is not JSON.
+
+        ParseResponseError(response, data) -> Error
+            Error from the already decoded response body.
+
+        LoadMessages(data, path) -> List[Message]
+            Messages at the path of the decoded body.
+
+        ParseMessageType(messageTypeString) -> MessageType
+            Converts the ETrade message type.
+
+    """
+    # Response to model mappings shared by all the services. The services add their own model mappings.
+    MessageLoader = ModelLoader(Message, [
+        Field("code", "Code"),
+        Field("description", "Description"),
+        Field("type", "Type", ToMessageType)])
+
     def __init__():
         pass
 
-    def ParseMessageType(self, messageTypeString:str):
+    def GetLogger(self) -> logging.Logger:
+        if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+            return self.context.AppLogger.Logger
+        return None
 
-        if(messageTypeString == "INFO"):
-            return MessageType.INFO
-        elif(messageTypeString == "WARNING"):
-            return MessageType.WARNING
-        elif(messageTypeString == "ERROR"):
-            return MessageType.ERROR
-        elif(messageTypeString == "INFO_HOLD"):
-            return MessageType.INFO_HOLD
-        elif(messageTypeString == "FATAL"):
-            return MessageType.FATAL
-        
-        raise Exception(f"Unsupported ETrade Message Type.")
+    def IsDebugEnabled(self) -> bool:
+        logger = self.GetLogger()
+        return logger is not None and logger.isEnabledFor(logging.DEBUG)
+
+    def LogRequestHeader(self, response) -> None:
+        if response is not None and self.IsDebugEnabled():
+            self.GetLogger().debug(self.strings.RequestHeader.format(response.request.headers))
+
+    def ParseResponse(self, response):
+        """ Decodes the response body once. The pretty printed body is logged only when debug
+            logging is enabled.
+
+            Parameters:
+
+            response - requests.Response.
+
+            Returns:
+
+            Decoded body. None if the body is empty or not JSON.
+        """
+        data = None
+        if response is not None and len(response.content) != 0:
+            try:
+                data = LoadJson(response.content)
+            except ValueError:
+                data = None
+
+        if response is not None and self.IsDebugEnabled():
+            if data is not None:
+                self.GetLogger().debug(self.strings.ResponseBody.format(json.dumps(data, indent=4, sort_keys=True, default=str)))
+            else:
+                self.GetLogger().debug(self.strings.ResponseBody.format(response.text))
+                self.GetLogger().debug(self.strings.ResponseCode.format(response.status_code))
+
+        return data
+
+    def ParseResponseError(self, response, data) -> Error:
+        """ Error of the response. Message and code are taken from the decoded body if present,
+            otherwise the message is the response text.
+
+            Parameters:
+
+            response - requests.Response.
+
+            data - Body decoded by ParseResponse.
+
+            Returns:
+
+            Error.
+        """
+        error = Error(response.status_code, "", response.text)
+        if isinstance(data, dict) and isinstance(data.get("Error"), dict):
+            if "message" in data["Error"]:
+                error.Message = data["Error"]["message"]
+            if "code" in data["Error"]:
+                error.Code = data["Error"]["code"]
+        return error
+
+    def LoadMessages(self, data, path:str) -> List[Message]:
+        return self.MessageLoader.LoadList(GetValue(data, path))
+
+    def ParseMessageType(self, messageTypeString:str):
+        return ToMessageType(messageTypeString)
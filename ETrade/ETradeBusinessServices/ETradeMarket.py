@@ -1,21 +1,37 @@
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 from BusinessModels.Context import Context
-from BusinessModels.Error import Error
 from BusinessModels.Message import Message
+from BusinessModels.Price import Price
 from BusinessModels.QuoteResponse import QuoteData, QuoteResponse
 from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
 from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
 from ETrade.ETradeBusinessServices.ETradeBusinessService import \
     ETradeBusinessService
-from rauth import OAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+from ETrade.ETradeBusinessUtils.ModelLoader import Field, ModelLoader
 from Strings.FormatStringsBase import FormatStringsBase
 
 
 class ETradeMarket(ETradeBusinessService):
+    # Response to model mappings.
+    QuoteDataLoader = ModelLoader(QuoteData, [
+        Field("dateTime", "DateTime"),
+        Field("dateTimeUTC", "TimeStamp", int),
+        Field("Product.symbol", "Symbol"),
+        Field("Product.securityType", "SecurityType"),
+        Field("All.lastTrade", "LastTradedPrice", str),
+        Field("All.adjustedFlag", "AdjustedFlag", bool),
+        Field("All.bid", "Bid", Price.From),
+        Field("All.ask", "Ask", Price.From),
+        Field("All.totalVolume", "Volume", int)])
+
     def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
-                    context: Context, strings: FormatStringsBase):
+                    context: Context, strings: FormatStringsBase, sessionPool: ETradeSessionPool = None):
         if strings is None:
             raise ValueError(FormatStringsBase.InputStringsNone)
         self.strings = strings
@@ -31,93 +47,116 @@ class ETradeMarket(ETradeBusinessService):
         self.context: Context = context
         self.settings: ETradeSettings = settings
 
-    def Quotes(self, symbols: list, accessToken:str = None, accessTokenSecret: str = None):
+        # Use the shared session pool if given, otherwise own one.
+        self.ownsSessionPool = sessionPool is None
+        if sessionPool is None:
+            sessionPool = ETradeSessionPool(self.settings.ConsumerKey,
+                            self.settings.ConsumerSecret,
+                            self.inputModel.AccessToken,
+                            self.inputModel.AccessTokenSecret,
+                            rateLimiter = ETradeRateLimiter(self.settings),
+                            retryPolicy = ETradeRetryPolicy(self.settings))
+        self.sessionPool: ETradeSessionPool = sessionPool
+        self.session = self.sessionPool.Session
 
-        # URL for the API endpoint
-        url = self.settings.BaseUrl + "/v1/market/quote/" + ','.join(symbols) + ".json"
+    def __del__(self): 
+        if self.ownsSessionPool is True:
+            self.sessionPool.Close()
 
-        session = OAuth1Session(self.settings.ConsumerKey,
-            self.settings.ConsumerSecret,
-            access_token = self.inputModel.AccessToken if accessToken is None else accessToken,
-            access_token_secret = self.inputModel.AccessTokenSecret if accessTokenSecret is None else accessTokenSecret)
+    def Quotes(self, symbols: list, accessToken:str = None, accessTokenSecret: str = None) -> QuoteResponse:
+        """ Quotes of the symbols, any number of symbols.
 
-        quoteResponse = QuoteResponse()
-        quoteResponse.QuoteData = []
-        quoteResponse.Messages = []
+            Returns:
 
-        try:
+            QuoteResponse - QuoteData of all the chunks, also by Symbol in QuoteDataBySymbol. Messages of all the
+            chunks and the first Error if any.
 
+        """
+        chunks = self.GetQuoteChunks(symbols)
+
+        self.session.access_token = self.inputModel.AccessToken if accessToken is None else accessToken
+        self.session.access_token_secret = self.inputModel.AccessTokenSecret if accessTokenSecret is None else accessTokenSecret
+
+        def GetChunk(chunk:List[str]) -> QuoteResponse:
             # Make API call for GET request
-            response = session.get(url)
+            return self.ProcessQuotesResponse(self.session.get(self.QuotesUrl(chunk)))
 
-            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                self.context.AppLogger.Logger.debug(self.strings.RequestHeader.format(response.request.headers))
-            
-            if response is not None and response.status_code == 200:
-
-                parsed = json.loads(response.text)
-                if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-
-                # Handle and parse response
-                data = response.json()
-                responseProcessed = False
-                if data is not None and "QuoteResponse" in data and "QuoteData" in data["QuoteResponse"]:
-                    for quote in data["QuoteResponse"]["QuoteData"]:
-                        quoteData = QuoteData()
-                        if quote is not None and "dateTime" in quote:
-                            quoteData.DateTime = quote["dateTime"]
-                        if quote is not None and "Product" in quote and "symbol" in quote["Product"]:
-                            quoteData.Symbol = quote["Product"]["symbol"]
-                        if quote is not None and "Product" in quote and "securityType" in quote["Product"]:
-                            quoteData.SecurityType = quote["Product"]["securityType"]
-                        if quote is not None and "All" in quote and "lastTrade" in quote["All"]:
-                            quoteData.LastTradedPrice = str(quote["All"]["lastTrade"])
-                        if quote is not None and "All" in quote and "adjustedFlag" in quote["All"]:
-                            quoteData.AdjustedFlag = bool(quote["All"]["adjustedFlag"])
-                        quoteResponse.QuoteData.append(quoteData)
-                        responseProcessed = True
-                if data is not None and 'QuoteResponse' in data and 'Messages' in data["QuoteResponse"] \
-                            and 'Message' in data["QuoteResponse"]["Messages"] \
-                            and data["QuoteResponse"]["Messages"]["Message"] is not None:
-                    for error_message in data["QuoteResponse"]["Messages"]["Message"]:
-                        message = Message()
-                        message.Description = error_message["description"]
-                        message.Code = error_message["code"]
-                        message.Type = self.ParseMessageType(error_message["type"])
-                        quoteResponse.Messages.append(message)
-                        responseProcessed = True
-
-                if responseProcessed is False:
-                    message = Message()
-                    message.Description = self.strings.FatalUnhandledData.format(data)
-                    message.Code = self.strings.FatalErrorCode
-                    message.Type = self.ParseMessageType(self.strings.FatalType)
-                    quoteResponse.Messages.append(message)
+        try:
 
+            if len(chunks) <= 1:
+                responses = [GetChunk(chunk) for chunk in chunks]
             else:
+                maxWorkers = max(1, min(self.settings.QuotesMaxConcurrentRequests, len(chunks)))
+                with ThreadPoolExecutor(max_workers= maxWorkers, thread_name_prefix= "Quotes") as executor:
+                    responses = list(executor.map(GetChunk, chunks))
+
+            return self.MergeQuoteResponses(responses)
 
-                if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response))
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseContent.format(response.content))
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseCode.format(response.status_code))
-                errorCode = ""
-                quoteResponse.Error = Error(response.status_code, errorCode, response.text)
-                try:
-                    error = json.loads(response.text)
-                    if("Error" in error and "message" in error["Error"]):
-                        quoteResponse.Error.Message = error["Error"]["message"]
-                    if("Error" in error and "code" in error["Error"]):
-                        quoteResponse.Error.Code = error["Error"]["code"]
-                except:
-                    pass
-        
         except:
             if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
                 self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
             raise
-        finally:
-            if session is not None:
-                session.close()
+
+    def GetQuoteChunks(self, symbols: list) -> List[List[str]]:
+        """ Splits the symbols into chunks of the API symbol limit. Symbols are upper cased and the duplicates removed.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        chunkSize = self.settings.QuotesOverrideMaxSymbols if self.settings.QuotesOverrideSymbolCount is True \
+                        else self.settings.QuotesMaxSymbols
+        return [symbols[index:index + chunkSize] for index in range(0, len(symbols), chunkSize)]
+
+    def QuotesUrl(self, symbols: List[str]) -> str:
+        """ URL of the Quotes request of one chunk, with overrideSymbolCount if the chunk is above QuotesMaxSymbols.
+        """
+        url = self.settings.BaseUrl + "/v1/market/quote/" + ','.join(symbols) + ".json"
+        if len(symbols) > self.settings.QuotesMaxSymbols:
+            url += "?overrideSymbolCount=true"
+        return url
+
+    def MergeQuoteResponses(self, responses: List[QuoteResponse]) -> QuoteResponse:
+        """ Merges the responses of the chunks. Used by the sync and async clients.
+        """
+        quoteResponse = QuoteResponse()
+        for response in responses:
+            quoteResponse.QuoteData.extend(response.QuoteData)
+            quoteResponse.Messages.extend(response.Messages)
+            if quoteResponse.Error is None and response.Error is not None:
+                quoteResponse.Error = response.Error
+        quoteResponse.QuoteDataBySymbol = {quoteData.Symbol.upper(): quoteData for quoteData in quoteResponse.QuoteData}
+        return quoteResponse
+
+    def ProcessQuotesResponse(self, response) -> QuoteResponse:
+        """ Converts the Quotes API response to QuoteResponse. Used by the sync and async clients.
+        """
+        quoteResponse = QuoteResponse()
+        quoteResponse.QuoteData = []
+        quoteResponse.Messages = []
+
+        self.LogRequestHeader(response)
+
+        data = self.ParseResponse(response)
+        if response is not None and response.status_code == 200:
+            responseProcessed = False
+            if data is not None and "QuoteResponse" in data and "QuoteData" in data["QuoteResponse"]:
+                quotes = self.QuoteDataLoader.LoadList(data["QuoteResponse"]["QuoteData"])
+                quoteResponse.QuoteData.extend(quotes)
+                if len(quotes) != 0:
+                    responseProcessed = True
+
+            messages = self.LoadMessages(data, "QuoteResponse.Messages.Message")
+            if len(messages) != 0:
+                quoteResponse.Messages.extend(messages)
+                responseProcessed = True
+
+            if responseProcessed is False:
+                message = Message()
+                message.Description = self.strings.FatalUnhandledData.format(data)
+                message.Code = self.strings.FatalErrorCode
+                message.Type = self.ParseMessageType(self.strings.FatalType)
+                quoteResponse.Messages.append(message)
+
+        else:
+            # Handle errors
+            quoteResponse.Error = self.ParseResponseError(response, data)
 
         return quoteResponse
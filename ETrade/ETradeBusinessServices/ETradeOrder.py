@@ -1,11 +1,11 @@
 import json
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 from urllib import parse
 
 from BusinessModels.CancelOrderResponse import CancelOrderResponse
 from BusinessModels.Context import Context
-from BusinessModels.Error import Error
 from BusinessModels.FilteringAndPagingParams import \
     OrdersFilteringAndPagingParams
 from BusinessModels.Message import Message
@@ -14,6 +14,7 @@ from BusinessModels.OrdersResponse import Event, Order, OrdersResponse
 from BusinessModels.PlaceOrderResponse import (OrderId, PlaceOrderResponse,
                                                PlaceOrderResponseData)
 from BusinessModels.PreviewOrderInput import PreviewOrderInput
+from BusinessModels.Price import Price
 from BusinessModels.PreviewOrderResponse import (PreviewId,
                                                  PreviewOrderResponse,
                                                  PreviewOrderResponseData)
@@ -21,13 +22,84 @@ from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
 from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
 from ETrade.ETradeBusinessServices.ETradeBusinessService import \
     ETradeBusinessService
-from rauth import OAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+from ETrade.ETradeBusinessUtils.ModelLoader import Field, ListOf, ModelLoader
 from Strings.FormatStringsBase import FormatStringsBase
 
 
 class ETradeOrder(ETradeBusinessService):
+    # Response to model mappings.
+    InstrumentLoader = ModelLoader(Instrument, [
+        Field("Product.symbol", "Symbol", str),
+        Field("Product.securityType", "SecurityType", str),
+        Field("orderAction", "OrderAction", str),
+        Field("averageExecutionPrice", "AverageExecutionPrice", Price.From),
+        Field("estimatedCommission", "EstimatedCommission", Price.From),
+        Field("estimatedFees", "EstimatedFees", Price.From),
+        Field("cancelQuantity", "CancelQuantity", float),
+        Field("orderedQuantity", "OrderedQuantity", float),
+        Field("filledQuantity", "FilledQuantity", float),
+        Field("quantityType", "QuantityType", str),
+        Field("quantity", "Quantity", str)], requiredKey = "Product")
+
+    OrderDetailLoader = ModelLoader(OrderDetail, [
+        Field("orderNumber", "OrderNumber", int),
+        Field("placedTime", "PlacedTime", int),
+        Field("executedTime", "ExecutedTime", int),
+        Field("orderValue", "OrderValue", Price.From),
+        Field("status", "Status", str),
+        Field("orderTerm", "OrderTerm", str),
+        Field("orderType", "OrderType", str),
+        Field("priceType", "PriceType", str),
+        Field("allOrNone", "AllOrNone", bool),
+        Field("estimatedTotalAmount", "EstimatedTotalAmount", Price.From),
+        Field("estimatedCommission", "EstimatedCommission", Price.From),
+        Field("estimatedFees", "EstimatedFees", Price.From),
+        Field("limitPrice", "LimitPrice", Price.From),
+        Field("Instrument", "Instruments", ListOf(InstrumentLoader)),
+        Field("messages.Message", "Messages", ListOf(ETradeBusinessService.MessageLoader))])
+
+    EventLoader = ModelLoader(Event, [
+        Field("name", "Name", str),
+        Field("dateTime", "DateTime", int),
+        Field("orderNumber", "OrderNumber", int),
+        Field("instrument", "Instruments", ListOf(InstrumentLoader))])
+
+    OrderLoader = ModelLoader(Order, [
+        Field("orderId", "OrderId", int),
+        Field("orderType", "OrderType", str),
+        Field("totalOrderValue", "TotalOrderValue", Price.From),
+        Field("totalCommission", "TotalCommission", Price.From),
+        Field("OrderDetail", "OrderDetails", ListOf(OrderDetailLoader)),
+        Field("Events.Event", "Events", ListOf(EventLoader))])
+
+    PreviewIdLoader = ModelLoader(PreviewId, [
+        Field("previewId", "PreviewId", int),
+        Field("cashMargin", "CashMargin", str)])
+
+    PreviewOrderResponseDataLoader = ModelLoader(PreviewOrderResponseData, [
+        Field("PreviewIds", "PreviewIds", ListOf(PreviewIdLoader)),
+        Field("totalOrderValue", "TotalOrderValue", Price.From),
+        Field("totalCommission", "TotalCommission", Price.From),
+        Field("clientOrderId", "ClientOrderId", str),
+        Field("Order", "OrderDetails", ListOf(OrderDetailLoader))])
+
+    OrderIdLoader = ModelLoader(OrderId, [
+        Field("orderId", "OrderId", int),
+        Field("cashMargin", "CashMargin", str)])
+
+    PlaceOrderResponseDataLoader = ModelLoader(PlaceOrderResponseData, [
+        Field("OrderIds", "OrderIds", ListOf(OrderIdLoader)),
+        Field("totalOrderValue", "TotalOrderValue", Price.From),
+        Field("totalCommission", "TotalCommission", Price.From),
+        Field("clientOrderId", "ClientOrderId", str),
+        Field("orderId", "OrderId", int),
+        Field("Order", "OrderDetails", ListOf(OrderDetailLoader))])
+
     def __init__(self, inputModel: ETradeInputModel, settings: ETradeSettings, 
-                    context: Context, strings: FormatStringsBase):
+                    context: Context, strings: FormatStringsBase, sessionPool: ETradeSessionPool = None):
         if strings is None:
             raise ValueError(FormatStringsBase.InputStringsNone)
         self.strings = strings
@@ -43,14 +115,21 @@ class ETradeOrder(ETradeBusinessService):
         self.context: Context = context
         self.settings: ETradeSettings = settings
 
-        self.session = OAuth1Session(self.settings.ConsumerKey,
-                        self.settings.ConsumerSecret,
-                        self.inputModel.AccessToken,
-                        self.inputModel.AccessTokenSecret)
+        # Use the shared session pool if given, otherwise own one.
+        self.ownsSessionPool = sessionPool is None
+        if sessionPool is None:
+            sessionPool = ETradeSessionPool(self.settings.ConsumerKey,
+                            self.settings.ConsumerSecret,
+                            self.inputModel.AccessToken,
+                            self.inputModel.AccessTokenSecret,
+                            rateLimiter = ETradeRateLimiter(self.settings),
+                            retryPolicy = ETradeRetryPolicy(self.settings))
+        self.sessionPool: ETradeSessionPool = sessionPool
+        self.session = self.sessionPool.Session
     
     def __del__(self): 
-        if self.session is not None:
-            self.session.close()
+        if self.ownsSessionPool is True:
+            self.sessionPool.Close()
 
     def ConvertPlacePreviewInputToPayload(self, previewOrderInput:PreviewOrderInput, isPlaceOrder = False):
         requestType = "PreviewOrderRequest"
@@ -70,7 +149,7 @@ class ETradeOrder(ETradeBusinessService):
         orderdetail["orderTerm"] = orderDetailList[0].OrderTerm
         orderdetail["marketSession"] = orderDetailList[0].MarketSession
         orderdetail["stopPrice"] = orderDetailList[0].StopPrice
-        orderdetail["limitPrice"] = orderDetailList[0].LimitPrice
+        orderdetail["limitPrice"] = str(orderDetailList[0].LimitPrice)
         orderdetail["Instrument"] = []
 
         instruments:List[Instrument] = orderDetailList[0].Instruments
@@ -138,12 +217,15 @@ class ETradeOrder(ETradeBusinessService):
         # json.dumps(payload)
         response = self.session.put(url, header_auth=True, headers=headers, data=json.dumps(params))
 
+        return self.ProcessCancelOrderResponse(response)
+
+    def ProcessCancelOrderResponse(self, response) -> CancelOrderResponse:
+        """ Converts the CancelOrder API response to CancelOrderResponse. Used by the sync and async clients.
+        """
         cancelOrderResponse = CancelOrderResponse()
 
+        data = self.ParseResponse(response)
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-            data = response.json()
             responseProcessed = False
 
             if data is not None and "CancelOrderResponse" in data:
@@ -151,16 +233,10 @@ class ETradeOrder(ETradeBusinessService):
                 if 'orderId' in data["CancelOrderResponse"]:
                     cancelOrderResponse.OrderId = int(data["CancelOrderResponse"]['orderId'])
 
-            if data is not None and 'CancelOrderResponse' in data and 'Messages' in data["CancelOrderResponse"] \
-                    and 'Message' in data["CancelOrderResponse"]["Messages"] \
-                    and data["CancelOrderResponse"]["Messages"]["Message"] is not None:
-                for error_message in data["CancelOrderResponse"]["Messages"]["Message"]:
-                    message = Message()
-                    message.Description = error_message["description"]
-                    message.Code = error_message["code"]
-                    message.Type = self.ParseMessageType(error_message["type"])
-                    cancelOrderResponse.Messages.append(message)
-                    responseProcessed = True
+            messages = self.LoadMessages(data, "CancelOrderResponse.Messages.Message")
+            if len(messages) != 0:
+                cancelOrderResponse.Messages.extend(messages)
+                responseProcessed = True
 
             if responseProcessed is False:
                 message = Message()
@@ -170,31 +246,11 @@ class ETradeOrder(ETradeBusinessService):
                 cancelOrderResponse.Messages.append(message)           
         else:
             # Handle errors
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-            if response is not None and "headers" in response and "Content-Type" in response.headers \
-                and response.headers['Content-Type'] == 'application/json' \
-                and "Error" in response.json() and "message" in response.json()["Error"] \
-                and response.json()["Error"]["message"] is not None:
-                errorCode = ""
-                if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                    errorCode = response.json()["Error"]["code"]
-                cancelOrderResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-            else:
-                errorCode = ""
-                cancelOrderResponse.Error = Error(response.status_code, errorCode, response.text)
-                try:
-                    error = json.loads(response.text)
-                    if("Error" in error and "message" in error["Error"]):
-                        cancelOrderResponse.Error.Message = error["Error"]["message"]
-                    if("Error" in error and "code" in error["Error"]):
-                        cancelOrderResponse.Error.Code = error["Error"]["code"]
-                except:
-                    pass
+            cancelOrderResponse.Error = self.ParseResponseError(response, data)
 
         return cancelOrderResponse
 
-    def PlaceOrderEQ(self, accountIdKey:str, previewOrderInput:PreviewOrderInput, 
-                        previewIds:List[PreviewId], accessToken:str = None, accessTokenSecret:str = None):
+    def ConvertPlaceInputToPayload(self, previewOrderInput:PreviewOrderInput, previewIds:List[PreviewId]):
         payload = self.ConvertPlacePreviewInputToPayload(previewOrderInput, isPlaceOrder=True)
         payload["PlaceOrderRequest"]["PreviewIds"] = []
 
@@ -203,6 +259,12 @@ class ETradeOrder(ETradeBusinessService):
             previewIdDict["previewId"] = previewId.PreviewId
             payload["PlaceOrderRequest"]["PreviewIds"].append(previewIdDict)
 
+        return payload
+
+    def PlaceOrderEQ(self, accountIdKey:str, previewOrderInput:PreviewOrderInput, 
+                        previewIds:List[PreviewId], accessToken:str = None, accessTokenSecret:str = None):
+        payload = self.ConvertPlaceInputToPayload(previewOrderInput, previewIds)
+
         if accessToken is not None:
             self.session.access_token = accessToken
         if accessTokenSecret is not None:
@@ -214,51 +276,31 @@ class ETradeOrder(ETradeBusinessService):
         headers = {"Content-Type": "application/json", "consumerKey": self.settings.ConsumerKey}
         # json.dumps(payload)
         response = self.session.post(url, header_auth=True, headers=headers, data=json.dumps(payload))
-        
+
+        return self.ProcessPlaceOrderResponse(response)
+
+    def ProcessPlaceOrderResponse(self, response) -> PlaceOrderResponse:
+        """ Converts the PlaceOrder API response to PlaceOrderResponse. Used by the sync and async clients.
+        """
         placeOrderResponse = PlaceOrderResponse()
         placeOrderResponse.PlaceOrderResponseData = PlaceOrderResponseData()
         placeOrderResponse.PlaceOrderResponseData.OrderIds = []
         placeOrderResponse.PlaceOrderResponseData.OrderDetails = []
 
+        data = self.ParseResponse(response)
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-            data = response.json()
             responseProcessed = False
 
             if data is not None and "PlaceOrderResponse" in data:
                 responseProcessed = True
-                if 'OrderIds' in data["PlaceOrderResponse"]:
-                    for orderId in data["PlaceOrderResponse"]["OrderIds"]:
-                        orderIdData = OrderId()
-                        if 'orderId' in orderId:
-                            orderIdData.OrderId = int(orderId["orderId"])
-                        if 'cashMargin' in orderId:
-                            orderIdData.CashMargin = str(orderId["cashMargin"])
-                        placeOrderResponse.PlaceOrderResponseData.OrderIds.append(orderIdData)
-                if 'totalOrderValue' in data["PlaceOrderResponse"]:
-                    placeOrderResponse.PlaceOrderResponseData.TotalOrderValue = float(data["PlaceOrderResponse"]['totalOrderValue'])
-                if 'totalCommission' in data["PlaceOrderResponse"]:
-                    placeOrderResponse.PlaceOrderResponseData.TotalCommission = float(data["PlaceOrderResponse"]['totalCommission'])
-                if 'clientOrderId' in data["PlaceOrderResponse"]:
-                    placeOrderResponse.PlaceOrderResponseData.ClientOrderId = str(data["PlaceOrderResponse"]['clientOrderId'])
-                if 'orderId' in data["PlaceOrderResponse"]:
-                    placeOrderResponse.PlaceOrderResponseData.OrderId = str(data["PlaceOrderResponse"]['orderId'])
-                if 'Order' in data["PlaceOrderResponse"]:
-                    for orderDetail in data["PlaceOrderResponse"]["Order"]:
-                        orderDetailData = self.ParseOrderDetail(orderDetail)
-                        placeOrderResponse.PlaceOrderResponseData.OrderDetails.append(orderDetailData)
-
-            if data is not None and 'PlaceOrderResponse' in data and 'MessageList' in data["PlaceOrderResponse"] \
-                    and 'Message' in data["PlaceOrderResponse"]["MessageList"] \
-                    and data["PlaceOrderResponse"]["MessageList"]["Message"] is not None:
-                for error_message in data["PlaceOrderResponse"]["MessageList"]["Message"]:
-                    message = Message()
-                    message.Description = error_message["description"]
-                    message.Code = error_message["code"]
-                    message.Type = self.ParseMessageType(error_message["type"])
-                    placeOrderResponse.Messages.append(message)
-                    responseProcessed = True
+                placeOrderResponseData = self.PlaceOrderResponseDataLoader.Load(data["PlaceOrderResponse"])
+                if placeOrderResponseData is not None:
+                    placeOrderResponse.PlaceOrderResponseData = placeOrderResponseData
+
+            messages = self.LoadMessages(data, "PlaceOrderResponse.MessageList.Message")
+            if len(messages) != 0:
+                placeOrderResponse.Messages.extend(messages)
+                responseProcessed = True
 
             if responseProcessed is False:
                 message = Message()
@@ -268,26 +310,7 @@ class ETradeOrder(ETradeBusinessService):
                 placeOrderResponse.Messages.append(message)           
         else:
             # Handle errors
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-            if response is not None and "headers" in response and "Content-Type" in response.headers \
-                and response.headers['Content-Type'] == 'application/json' \
-                and "Error" in response.json() and "message" in response.json()["Error"] \
-                and response.json()["Error"]["message"] is not None:
-                errorCode = ""
-                if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                    errorCode = response.json()["Error"]["code"]
-                placeOrderResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-            else:
-                errorCode = ""
-                placeOrderResponse.Error = Error(response.status_code, errorCode, response.text)
-                try:
-                    error = json.loads(response.text)
-                    if("Error" in error and "message" in error["Error"]):
-                        placeOrderResponse.Error.Message = error["Error"]["message"]
-                    if("Error" in error and "code" in error["Error"]):
-                        placeOrderResponse.Error.Code = error["Error"]["code"]
-                except:
-                    pass
+            placeOrderResponse.Error = self.ParseResponseError(response, data)
 
         return placeOrderResponse
         
@@ -308,48 +331,30 @@ class ETradeOrder(ETradeBusinessService):
         # json.dumps(payload)
         response = self.session.post(url, header_auth=True, headers=headers, data=json.dumps(payload))
 
+        return self.ProcessPreviewOrderResponse(response)
+
+    def ProcessPreviewOrderResponse(self, response) -> PreviewOrderResponse:
+        """ Converts the PreviewOrder API response to PreviewOrderResponse. Used by the sync and async clients.
+        """
         previewOrderResponse = PreviewOrderResponse()
         previewOrderResponse.PreviewOrderResponseData = PreviewOrderResponseData()
         previewOrderResponse.PreviewOrderResponseData.PreviewIds = []
         previewOrderResponse.PreviewOrderResponseData.OrderDetails = []
 
+        data = self.ParseResponse(response)
         if response is not None and response.status_code == 200:
-            parsed = json.loads(response.text)
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-            data = response.json()
             responseProcessed = False
 
             if data is not None and "PreviewOrderResponse" in data:
                 responseProcessed = True
-                if 'PreviewIds' in data["PreviewOrderResponse"]:
-                    for previwId in data["PreviewOrderResponse"]["PreviewIds"]:
-                        previwIdData = PreviewId()
-                        if 'previewId' in previwId:
-                            previwIdData.PreviewId = int(previwId["previewId"])
-                        if 'cashMargin' in previwId:
-                            previwIdData.CashMargin = str(previwId["cashMargin"])
-                        previewOrderResponse.PreviewOrderResponseData.PreviewIds.append(previwIdData)
-                if 'totalOrderValue' in data["PreviewOrderResponse"]:
-                    previewOrderResponse.PreviewOrderResponseData.TotalOrderValue = float(data["PreviewOrderResponse"]['totalOrderValue'])
-                if 'totalCommission' in data["PreviewOrderResponse"]:
-                    previewOrderResponse.PreviewOrderResponseData.TotalCommission = float(data["PreviewOrderResponse"]['totalCommission'])
-                if 'clientOrderId' in data["PreviewOrderResponse"]:
-                    previewOrderResponse.PreviewOrderResponseData.ClientOrderId = str(data["PreviewOrderResponse"]['clientOrderId'])
-                if 'Order' in data["PreviewOrderResponse"]:
-                    for orderDetail in data["PreviewOrderResponse"]["Order"]:
-                        orderDetailData = self.ParseOrderDetail(orderDetail)
-                        previewOrderResponse.PreviewOrderResponseData.OrderDetails.append(orderDetailData)
-
-            if data is not None and 'PreviewOrderResponse' in data and 'MessageList' in data["PreviewOrderResponse"] \
-                    and 'message' in data["PreviewOrderResponse"]["MessageList"] \
-                    and data["PreviewOrderResponse"]["MessageList"]["Message"] is not None:
-                for error_message in data["PreviewOrderResponse"]["MessageList"]["Message"]:
-                    message = Message()
-                    message.Description = error_message["description"]
-                    message.Code = error_message["code"]
-                    message.Type = self.ParseMessageType(error_message["type"])
-                    previewOrderResponse.Messages.append(message)
-                    responseProcessed = True
+                previewOrderResponseData = self.PreviewOrderResponseDataLoader.Load(data["PreviewOrderResponse"])
+                if previewOrderResponseData is not None:
+                    previewOrderResponse.PreviewOrderResponseData = previewOrderResponseData
+
+            messages = self.LoadMessages(data, "PreviewOrderResponse.MessageList.Message")
+            if len(messages) != 0:
+                previewOrderResponse.Messages.extend(messages)
+                responseProcessed = True
 
             if responseProcessed is False:
                 message = Message()
@@ -359,33 +364,13 @@ class ETradeOrder(ETradeBusinessService):
                 previewOrderResponse.Messages.append(message)           
         else:
             # Handle errors
-            self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-            if response is not None and "headers" in response and "Content-Type" in response.headers \
-                and response.headers['Content-Type'] == 'application/json' \
-                and "Error" in response.json() and "message" in response.json()["Error"] \
-                and response.json()["Error"]["message"] is not None:
-                errorCode = ""
-                if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                    errorCode = response.json()["Error"]["code"]
-                previewOrderResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-            else:
-                errorCode = ""
-                previewOrderResponse.Error = Error(response.status_code, errorCode, response.text)
-                try:
-                    error = json.loads(response.text)
-                    if("Error" in error and "message" in error["Error"]):
-                        previewOrderResponse.Error.Message = error["Error"]["message"]
-                    if("Error" in error and "code" in error["Error"]):
-                        previewOrderResponse.Error.Code = error["Error"]["code"]
-                except:
-                    pass
+            previewOrderResponse.Error = self.ParseResponseError(response, data)
 
         return previewOrderResponse
 
-    def Orders(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
-                filteringAndPagingParams:OrdersFilteringAndPagingParams = None
-            ):
-
+    def GetOrdersParams(self, filteringAndPagingParams:OrdersFilteringAndPagingParams):
+        """ Query params of the first page and if all the pages should be accumulated and returned.
+        """
         pageSize = 50
         params = {}
         accumulateAndReturnAll:bool = False
@@ -403,6 +388,14 @@ class ETradeOrder(ETradeBusinessService):
         if "count" not in params:      
             params["count"] = pageSize
 
+        return params, accumulateAndReturnAll
+
+    def Orders(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:OrdersFilteringAndPagingParams = None
+            ):
+
+        params, accumulateAndReturnAll = self.GetOrdersParams(filteringAndPagingParams)
+
         # URL for the API endpoint
         url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders.json"
 
@@ -421,131 +414,9 @@ class ETradeOrder(ETradeBusinessService):
             while True:
                 response = self.session.get(url, header_auth=True, 
                             params = params)
-                self.context.AppLogger.Logger.debug(self.strings.RequestHeader.format(response.request.headers))
-
-                # Handle and parse response
-                if response is not None and response.status_code == 200:
-                    parsed = json.loads(response.text)
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(json.dumps(parsed, indent=4, sort_keys=True)))
-                    data = response.json()
-                    responseProcessed = False
-
-                    if data is not None and "OrdersResponse" in data:
-                        ordersResponseData = data["OrdersResponse"]
-                        params = {}
-                        ordersResponse.Next = ""
-                        ordersResponse.Marker = ""
-                        if ordersResponseData is not None and "next" in ordersResponseData:
-                            ordersResponse.Next = str(ordersResponseData["next"])
-                            params = dict(parse.parse_qsl(parse.urlsplit(ordersResponse.Next).query))
-                        if ordersResponseData is not None and "marker" in ordersResponseData:
-                            ordersResponse.Marker = str(ordersResponseData["marker"])
-                        if ordersResponseData is not None and "Order" in ordersResponseData:
-                            if ordersResponse.Orders is None:
-                                ordersResponse.Orders = []
-                            for order in ordersResponseData["Order"]:
-                                orderData = Order()
-                                if order is not None and "orderId" in order:
-                                    orderData.OrderId = int(order["orderId"])
-                                if order is not None and "orderType" in order:
-                                    orderData.OrderType = str(order["orderType"])
-                                if order is not None and "totalOrderValue" in order:
-                                    orderData.TotalOrderValue = float(order["totalOrderValue"])
-                                if order is not None and "totalCommission" in order:
-                                    orderData.TotalCommission = float(order["totalCommission"])
-                                if order is not None and "OrderDetail" in order:
-                                    orderData.OrderDetails = []
-                                    for orderDetail in order["OrderDetail"]:
-                                        orderDetailData = self.ParseOrderDetail(orderDetail)
-                                        orderData.OrderDetails.append(orderDetailData)
-                                if order is not None and "Events" in order and "Event" in order["events"]:
-                                    orderData.Events = []
-                                    for event in order["Events"]["Event"]:
-                                        eventData = Event()
-                                        if event is not None and "name" in event:
-                                            eventData.Name = str(event["name"])
-                                        if event is not None and "dateTime" in event:
-                                            eventData.DateTime = int(event["dateTime"])
-                                        if event is not None and "orderNumber" in event:
-                                            eventData.OrderNumber = int(event["orderNumber"])
-                                        if event is not None and "instrument" in event:
-                                            eventData.Instruments = []
-                                            for instrument in event["instrument"]:
-                                                instrumentData = self.ParseInstrument(instrument)
-                                                if instrumentData is not None:
-                                                    orderDetailData.Instruments.append(instrumentData)
-                                        orderData.Events.append(eventData)   
-
-                                ordersResponse.Orders.append(orderData)
-                                responseProcessed = True
-                    else:
-                        # Handle errors
-                        responseProcessed = True
-                        self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                        if response is not None and "headers" in response and "Content-Type" in response.headers \
-                                and response.headers['Content-Type'] == 'application/json' \
-                                and "Error" in response.json() and "message" in response.json()["Error"] \
-                                and response.json()["Error"]["message"] is not None:
-                            errorCode = ""
-                            if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                                errorCode = response.json()["Error"]["code"]
-                            ordersResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                        else:
-                            ordersResponse.Error = Error(response.status_code, errorCode, response.text)
-                            errorCode = ""
-                            try:
-                                error = json.loads(response.text)
-                                if("Error" in error and "message" in error["Error"]):
-                                    ordersResponse.Error.Message = error["Error"]["message"]
-                                if("Error" in error and "code" in error["Error"]):
-                                    ordersResponse.Error.Code = error["Error"]["code"]
-                            except:
-                                pass
-
-                    if data is not None and 'OrdersResponse' in data and 'Messages' in data["OrdersResponse"] \
-                                and 'Message' in data["OrdersResponse"]["Messages"] \
-                                and data["OrdersResponse"]["Messages"]["Message"] is not None:
-                        for error_message in data["OrdersResponse"]["Messages"]["Message"]:
-                            message = Message()
-                            message.Description = error_message["description"]
-                            message.Code = error_message["code"]
-                            message.Type = self.ParseMessageType(error_message["type"])
-                            ordersResponse.Messages.append(message)
-                            responseProcessed = True
-
-                    if responseProcessed is False:
-                        message = Message()
-                        message.Description = self.strings.FatalUnhandledData.format(data)
-                        message.Code = self.strings.FatalErrorCode
-                        message.Type = self.ParseMessageType(self.strings.FatalType)
-                        ordersResponse.Messages.append(message)           
-                                                
-                elif response is not None and response.status_code == 204:
-                    break
-                else:
-                    # Handle errors
-                    self.context.AppLogger.Logger.debug(self.strings.ResponseBody.format(response.text))
-                    if response is not None and "headers" in response and "Content-Type" in response.headers \
-                            and response.headers['Content-Type'] == 'application/json' \
-                            and "Error" in response.json() and "message" in response.json()["Error"] \
-                            and response.json()["Error"]["message"] is not None:
-                        errorCode = ""
-                        if "code" in response.json()["Error"] and response.json()["Error"]["code"] is not None:
-                            errorCode = response.json()["Error"]["code"]
-                        ordersResponse.Error = Error(response.status_code, errorCode, response.json()["Error"]["message"])
-                    else:
-                        errorCode = ""
-                        ordersResponse.Error = Error(response.status_code, errorCode, response.text)
-                        try:
-                            error = json.loads(response.text)
-                            if("Error" in error and "message" in error["Error"]):
-                                ordersResponse.Error.Message = error["Error"]["message"]
-                            if("Error" in error and "code" in error["Error"]):
-                                ordersResponse.Error.Code = error["Error"]["code"]
-                        except:
-                            pass
-                
-                if accumulateAndReturnAll is False:
+                params = self.ProcessOrdersPage(response, ordersResponse)
+
+                if params is None or accumulateAndReturnAll is False:
                     break                
                 if ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != "":
                     break
@@ -559,82 +430,123 @@ class ETradeOrder(ETradeBusinessService):
 
         return ordersResponse
 
-    def ParseOrderDetail(self, orderDetail):
-        orderDetailData = OrderDetail()
-        if orderDetail is not None and "orderNumber" in orderDetail:
-            orderDetailData.OrderNumber = int(orderDetail["orderNumber"])
-        if orderDetail is not None and "placedTime" in orderDetail:
-            orderDetailData.PlacedTime = int(orderDetail["placedTime"])
-        if orderDetail is not None and "executedTime" in orderDetail:
-            orderDetailData.ExecutedTime = int(orderDetail["executedTime"])
-        if orderDetail is not None and "orderValue" in orderDetail:
-            orderDetailData.OrderValue = float(orderDetail["orderValue"])
-        if orderDetail is not None and "status" in orderDetail:
-            orderDetailData.Status = str(orderDetail["status"])
-        if orderDetail is not None and "orderTerm" in orderDetail:
-            orderDetailData.OrderTerm = str(orderDetail["orderTerm"])
-        if orderDetail is not None and "orderType" in orderDetail:
-            orderDetailData.OrderType = str(orderDetail["orderType"])
-        if orderDetail is not None and "priceType" in orderDetail:
-            orderDetailData.PriceType = str(orderDetail["priceType"])
-        if orderDetail is not None and "allOrNone" in orderDetail:
-            orderDetailData.AllOrNone = bool(orderDetail["allOrNone"])
-        if orderDetail is not None and "estimatedTotalAmount" in orderDetail:
-            orderDetailData.EstimatedTotalAmount = float(orderDetail["estimatedTotalAmount"])
-        if orderDetail is not None and "estimatedCommission" in orderDetail:
-            orderDetailData.EstimatedCommission = float(orderDetail["estimatedCommission"])
-        if orderDetail is not None and "estimatedFees" in orderDetail:
-            orderDetailData.EstimatedFees = float(orderDetail["estimatedFees"])
-        if orderDetail is not None and "limitPrice" in orderDetail:
-            orderDetailData.LimitPrice = float(orderDetail["limitPrice"])
-        if orderDetail is not None and "Instrument" in orderDetail:
-            orderDetailData.Instruments = []
-            for instrument in orderDetail["Instrument"]:
-                instrumentData = self.ParseInstrument(instrument)
-                if instrumentData is not None:
-                    orderDetailData.Instruments.append(instrumentData)
-
-        if orderDetail is not None and "messages" in orderDetail and "Message" in orderDetail["messages"]:
-            orderDetailData.Messages = []
-            for message in orderDetail["messages"]["Message"]:
-                messageData = Message()
-                if "description" in message:
-                    messageData.Description = message["description"]
-                if "code" in message:
-                    messageData.Code = message["code"]
-                if "type" in message:
-                    messageData.Type = self.ParseMessageType(message["type"])
-                orderDetailData.Messages.append(messageData)
-
-        return orderDetailData
-
-    def ParseInstrument(self, instrument):
-        if instrument is None or "Product" not in instrument:
+    def IterOrders(self, accountIdKey:str, accessToken:str = None, accessTokenSecret:str = None,
+                filteringAndPagingParams:OrdersFilteringAndPagingParams = None
+            ) -> Iterator[OrdersResponse]:
+        """ Orders page by page. The next page is downloaded while the caller processes the current page, and
+            the caller can stop early(break), the pages after the next page are then not downloaded. Pages are
+            followed the same as Orders, only the first page unless ApplyFilterAndReturnAll.
+
+            Returns:
+
+            Iterator[OrdersResponse] - Orders, Messages and Error of each page. Nothing if there are no orders(204).
+
+        """
+        params, accumulateAndReturnAll = self.GetOrdersParams(filteringAndPagingParams)
+
+        # URL for the API endpoint
+        url = self.settings.BaseUrl + "/v1/accounts/" + accountIdKey + "/orders.json"
+
+        if accessToken is not None:
+            self.session.access_token = accessToken
+        if accessTokenSecret is not None:
+            self.session.access_token_secret = accessTokenSecret
+
+        executor = ThreadPoolExecutor(max_workers= 1, thread_name_prefix= "Orders")
+        nextPage = None
+
+        try:
+
+            nextPage = executor.submit(self.session.get, url, header_auth=True, params = params)
+            while nextPage is not None:
+                ordersResponse = OrdersResponse()
+                params = self.ProcessOrdersPage(nextPage.result(), ordersResponse)
+                if params is None:
+                    break
+
+                nextPage = None
+                if accumulateAndReturnAll is True and ordersResponse.Marker != "" and \
+                        (ordersResponse.Error is None or ordersResponse.Error.ResponseStatusCode == ""):
+                    nextPage = executor.submit(self.session.get, url, header_auth=True, params = params)
+
+                yield ordersResponse
+
+        except GeneratorExit:
+            raise
+        except:
+            if self.context.AppLogger is not None and self.context.AppLogger.Logger is not None:
+                self.context.AppLogger.Logger.critical(self.strings.UnexpectedError.format(sys.exc_info()))
+            raise
+        finally:
+            # Page requested ahead and not consumed(generator closed), not needed.
+            if nextPage is not None:
+                nextPage.cancel()
+            executor.shutdown(wait= False)
+
+    def LoadOrdersPagingInfo(self, ordersResponse:OrdersResponse, ordersResponseData:dict) -> dict:
+        """ Sets the Next link and the Marker of the ordersResponse from a page of the Orders API response.
+
+            Returns:
+
+            Query params of the next page, from the next link. Empty if there is no next page.
+        """
+        params = {}
+        ordersResponse.Next = ""
+        ordersResponse.Marker = ""
+        if ordersResponseData is not None and "next" in ordersResponseData:
+            ordersResponse.Next = str(ordersResponseData["next"])
+            params = dict(parse.parse_qsl(parse.urlsplit(ordersResponse.Next).query))
+        if ordersResponseData is not None and "marker" in ordersResponseData:
+            ordersResponse.Marker = str(ordersResponseData["marker"])
+        return params
+
+    def ProcessOrdersPage(self, response, ordersResponse:OrdersResponse):
+        """ Adds the Orders of one page of the Orders API response to the ordersResponse. Used by the sync 
+            and async clients.
+
+            Returns:
+
+            Query params of the next page. None if there are no orders(204).
+        """
+        self.LogRequestHeader(response)
+        params = {}
+
+        # Handle and parse response
+        data = self.ParseResponse(response)
+        if response is not None and response.status_code == 200:
+            responseProcessed = False
+
+            if data is not None and "OrdersResponse" in data:
+                ordersResponseData = data["OrdersResponse"]
+                params = self.LoadOrdersPagingInfo(ordersResponse, ordersResponseData)
+                if ordersResponseData is not None and "Order" in ordersResponseData:
+                    if ordersResponse.Orders is None:
+                        ordersResponse.Orders = []
+                    orders = self.OrderLoader.LoadList(ordersResponseData["Order"])
+                    ordersResponse.Orders.extend(orders)
+                    if len(orders) != 0:
+                        responseProcessed = True
+            else:
+                # Handle errors
+                responseProcessed = True
+                ordersResponse.Error = self.ParseResponseError(response, data)
+
+            messages = self.LoadMessages(data, "OrdersResponse.Messages.Message")
+            if len(messages) != 0:
+                ordersResponse.Messages.extend(messages)
+                responseProcessed = True
+
+            if responseProcessed is False:
+                message = Message()
+                message.Description = self.strings.FatalUnhandledData.format(data)
+                message.Code = self.strings.FatalErrorCode
+                message.Type = self.ParseMessageType(self.strings.FatalType)
+                ordersResponse.Messages.append(message)           
+
+        elif response is not None and response.status_code == 204:
             return None
+        else:
+            # Handle errors
+            ordersResponse.Error = self.ParseResponseError(response, data)
 
-        instrumentData = Instrument()
-
-        if "symbol" in instrument["Product"]:
-            instrumentData.Symbol = str(instrument["Product"]["symbol"])
-        if "securityType" in instrument["Product"]:
-            instrumentData.SecurityType = str(instrument["Product"]["securityType"])
-        if "orderAction" in instrument:
-            instrumentData.OrderAction = str(instrument["orderAction"])
-        if "averageExecutionPrice" in instrument:
-            instrumentData.AverageExecutionPrice = float(instrument["averageExecutionPrice"])
-        if "estimatedCommission" in instrument:
-            instrumentData.EstimatedCommission = float(instrument["estimatedCommission"])
-        if "estimatedFees" in instrument:
-            instrumentData.EstimatedFees = float(instrument["estimatedFees"])
-        if "cancelQuantity" in instrument:
-            instrumentData.CancelQuantity = float(instrument["cancelQuantity"])
-        if "orderedQuantity" in instrument:
-            instrumentData.OrderedQuantity = float(instrument["orderedQuantity"])
-        if "filledQuantity" in instrument:
-            instrumentData.FilledQuantity = float(instrument["filledQuantity"])
-        if "quantityType" in instrument:
-            instrumentData.QuantityType = str(instrument["quantityType"])
-        if "quantity" in instrument:
-            instrumentData.Quantity = str(instrument["quantity"])
-        
-        return instrumentData
+        return params
@@ -0,0 +1,174 @@
+from copy import deepcopy
+
+import aiohttp
+import requests
+from rauth import OAuth1Session
+from rauth.utils import OAuth1Auth
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from yarl import URL
+
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+
+
+class AsyncOAuth1Session:
+    """ OAuth 1.0a signed HTTP session for asyncio. Requests are signed exactly like the rauth OAuth1Session
+        used by the sync services and sent with aiohttp, so many requests can be in flight on one thread.
+        Responses are returned as requests.Response objects, so the sync and async services share
+        the same response processing.
+
+        The aiohttp session is created on the first request, inside the running event loop, and
+        must be closed using Close.
+
+        Attributes:
+
+        Signer:OAuth1Session - rauth session used only to sign the requests. Holds the consumer key/secret
+        and the access token/secret.
+
+        MaxConnections:int - Maximum number of simultaneous connections.
+
+        Timeout:float - Total timeout of a request in seconds.
+
+        Requests:int - Number of requests sent.
+
+        RateLimiter:ETradeRateLimiter - Rate limiter of the requests, usually shared with the sync session.
+        None, no limit.
+
+        RetryPolicy:ETradeRetryPolicy - Retry of the transient failures of the idempotent requests. None, no retry.
+
+        Methods:
+
+        Get - Sends a signed GET request.
+
+        Post - Sends a signed POST request.
+
+        Put - Sends a signed PUT request.
+
+        Close - Closes the aiohttp session.
+
+    """
+    def __init__(self, consumerKey:str, consumerSecret:str, accessToken:str = None, accessTokenSecret:str = None,
+                    maxConnections:int = 100, timeout:float = 300, rateLimiter:ETradeRateLimiter = None,
+                    retryPolicy:ETradeRetryPolicy = None):
+        self.Signer = OAuth1Session(consumerKey, consumerSecret, accessToken, accessTokenSecret)
+        self.MaxConnections = maxConnections
+        self.Timeout = timeout
+        self.Session:aiohttp.ClientSession = None
+        self.Requests:int = 0
+        self.RateLimiter:ETradeRateLimiter = rateLimiter
+        self.RetryPolicy:ETradeRetryPolicy = retryPolicy
+
+    @property
+    def access_token(self):
+        return self.Signer.access_token
+
+    @access_token.setter
+    def access_token(self, value:str):
+        self.Signer.access_token = value
+
+    @property
+    def access_token_secret(self):
+        return self.Signer.access_token_secret
+
+    @access_token_secret.setter
+    def access_token_secret(self, value:str):
+        self.Signer.access_token_secret = value
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.Close()
+
+    def Prepare(self, method:str, url:str, headers:dict = None, params:dict = None, data = None) -> requests.PreparedRequest:
+        """ Signs the request and prepares it using the OAuth Authorization header.
+
+            Parameters:
+
+            method:str - HTTP method.
+
+            url:str - Url without the query string.
+
+            headers:dict - Request headers.
+
+            params:dict - Query params.
+
+            data - Request body.
+
+            Returns:
+
+            Prepared request with the final url, headers and body.
+        """
+        reqKwargs = {"headers": CaseInsensitiveDict(headers or {}), "params": deepcopy(params or {}), "data": data}
+        oauthParams = self.Signer._get_oauth_params(reqKwargs)
+        oauthParams["oauth_signature"] = self.Signer.signature.sign(self.Signer.consumer_secret, self.Signer.access_token_secret,
+                                            method, url, oauthParams, reqKwargs)
+
+        return requests.Request(method, url, headers=reqKwargs["headers"], params=reqKwargs["params"], data=data,
+                    auth=OAuth1Auth(oauthParams, "")).prepare()
+
+    def GetSession(self) -> aiohttp.ClientSession:
+        if self.Session is None or self.Session.closed:
+            self.Session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.MaxConnections),
+                                timeout=aiohttp.ClientTimeout(total=self.Timeout))
+        return self.Session
+
+    async def Request(self, method:str, url:str, headers:dict = None, params:dict = None, data = None) -> requests.Response:
+        """ Sends the signed request. Transient failures of the idempotent requests are retried by the RetryPolicy.
+
+            Returns:
+
+            Response converted to requests.Response.
+
+            Exceptions:
+
+            ConnectionError - When the server can't be reached.
+        """
+        if self.RetryPolicy is None:
+            return await self.SendRequest(method, url, headers, params, data)
+        return await self.RetryPolicy.SendAsync(method, url, lambda: self.SendRequest(method, url, headers, params, data))
+
+    async def SendRequest(self, method:str, url:str, headers:dict = None, params:dict = None, data = None) -> requests.Response:
+        """ Sends the signed request once.
+        """
+        if self.RateLimiter is not None:
+            await self.RateLimiter.AcquireAsync(url)
+
+        # Signed after the wait, the OAuth timestamp is of the sending time.
+        preparedRequest = self.Prepare(method, url, headers, params, data)
+        self.Requests += 1
+
+        try:
+            async with self.GetSession().request(method, URL(preparedRequest.url, encoded=True),
+                            headers=dict(preparedRequest.headers), data=preparedRequest.body) as clientResponse:
+                content = await clientResponse.read()
+        except aiohttp.ClientConnectionError as error:
+            raise ConnectionError(error)
+
+        response = requests.Response()
+        response.status_code = clientResponse.status
+        response.headers = CaseInsensitiveDict(clientResponse.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(clientResponse.url)
+        response.reason = clientResponse.reason
+        response.request = preparedRequest
+        response._content = content
+
+        if self.RateLimiter is not None:
+            self.RateLimiter.Update(url, response)
+        return response
+
+    async def Get(self, url:str, headers:dict = None, params:dict = None) -> requests.Response:
+        return await self.Request("GET", url, headers=headers, params=params)
+
+    async def Post(self, url:str, headers:dict = None, data = None) -> requests.Response:
+        return await self.Request("POST", url, headers=headers, data=data)
+
+    async def Put(self, url:str, headers:dict = None, data = None) -> requests.Response:
+        return await self.Request("PUT", url, headers=headers, data=data)
+
+    async def Close(self):
+        if self.Session is not None and not self.Session.closed:
+            await self.Session.close()
+        self.Session = None
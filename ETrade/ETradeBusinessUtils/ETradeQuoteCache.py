@@ -0,0 +1,220 @@
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from BusinessModels.QuoteResponse import QuoteData, QuoteResponse
+from ETrade.ETradeBusinessServices.AsyncETradeMarket import AsyncETradeMarket
+from ETrade.ETradeBusinessServices.ETradeMarket import ETradeMarket
+
+
+class QuoteCacheCounters:
+    """ Counters of the ETradeQuoteCache. Updated under the lock of the cache.
+
+        Attributes:
+
+        Hits:int - Symbols returned from the cache.
+
+        Misses:int - Symbols requested from the Quotes API.
+
+        Coalesced:int - Symbols returned by a Quotes request already in flight for another caller.
+
+    """
+    def __init__(self):
+        self.Hits = 0
+        self.Misses = 0
+        self.Coalesced = 0
+
+    def __str__(self):
+        return f"Hits - {self.Hits}, Misses - {self.Misses}, Coalesced - {self.Coalesced}"
+
+
+class ETradeQuoteCache:
+    """ Quote cache in front of ETradeMarket, shared by the callers wanting the current price of a symbol.
+        Quotes are kept for TTLInSeconds, least recently used quotes are evicted above MaxSymbols.
+        Concurrent requests of the same symbol are sent as one Quotes request, all the callers wait for it.
+        Thread safe.
+
+        Attributes:
+
+        Market:ETradeMarket - Market service used for the symbols not in the cache.
+
+        AsyncMarket:AsyncETradeMarket - Market service used by GetQuotesAsync. None if not used.
+
+        TTLInSeconds:float - Age of a quote after which it is requested again.
+
+        MaxSymbols:int - Maximum number of quotes kept.
+
+        Quotes:OrderedDict[str, Tuple[QuoteData, float]] - (QuoteData, time received) by Symbol(upper case),
+        least recently used first.
+
+        InFlight:Dict[str, Future] - Quotes requests in flight by Symbol(upper case). Result is the QuoteResponse
+        of the request.
+
+        Counters:QuoteCacheCounters - Hit, miss and coalesced counters.
+
+        Methods:
+
+        GetQuotes(symbols, maxStalenessInSeconds, accessToken, accessTokenSecret) -> QuoteResponse
+            Quotes of the symbols, from the cache if not older than maxStalenessInSeconds.
+
+        GetQuotesAsync(symbols, maxStalenessInSeconds, accessToken, accessTokenSecret) -> QuoteResponse
+            asyncio version of GetQuotes using the AsyncMarket. Shares the cache with GetQuotes.
+
+        Clear() -> None
+            Removes all the cached quotes.
+
+    """
+    def __init__(self, market:ETradeMarket, ttlInSeconds:float = None, maxSymbols:int = None,
+                    asyncMarket:AsyncETradeMarket = None):
+        """ Initialization method.
+
+            Parameters:
+
+            ttlInSeconds, maxSymbols - ETradeSettings.QuoteCacheTTLInSeconds/QuoteCacheMaxSymbols of the market if None.
+
+            asyncMarket:AsyncETradeMarket - Market service used by GetQuotesAsync.
+
+        """
+        self.Market:ETradeMarket = market
+        self.AsyncMarket:AsyncETradeMarket = asyncMarket
+        self.TTLInSeconds:float = market.settings.QuoteCacheTTLInSeconds if ttlInSeconds is None else ttlInSeconds
+        self.MaxSymbols:int = market.settings.QuoteCacheMaxSymbols if maxSymbols is None else maxSymbols
+        self.Quotes:"OrderedDict[str, Tuple[QuoteData, float]]" = OrderedDict()
+        self.InFlight:Dict[str, Future] = {}
+        self.Counters = QuoteCacheCounters()
+        self.Lock = Lock()
+
+    def GetQuotes(self, symbols:list, maxStalenessInSeconds:float = None, accessToken:str = None,
+                    accessTokenSecret:str = None) -> QuoteResponse:
+        """ Quotes of the symbols. Symbols not in the cache, or with a quote older than the allowed staleness,
+            are requested in one Quotes request, unless a request of the symbol is already in flight.
+
+            Parameters:
+
+            symbols:list - Symbols.
+
+            maxStalenessInSeconds:float - Maximum age of the cached quotes. TTLInSeconds if None, 0 to request
+            all the symbols again. A request in flight is at least as fresh as the call, so it is always shared.
+
+            accessToken, accessTokenSecret - Access keys of the Quotes request.
+
+            Returns:
+
+            QuoteResponse - QuoteData of the symbols in the order of the symbols, also by Symbol in QuoteDataBySymbol.
+            Messages and the first Error of the Quotes requests waited for.
+
+        """
+        symbols, quotes, waitFor, missingSymbols, future = self.Reserve(symbols, maxStalenessInSeconds)
+        if future is not None:
+            try:
+                quoteResponse = self.Market.Quotes(missingSymbols, accessToken, accessTokenSecret)
+            except BaseException as error:
+                self.Fail(missingSymbols, future, error)
+                raise
+            self.Store(missingSymbols, future, quoteResponse)
+
+        return self.GetResponse(symbols, quotes, {symbol: symbolFuture.result() for symbol, symbolFuture in waitFor.items()})
+
+    async def GetQuotesAsync(self, symbols:list, maxStalenessInSeconds:float = None, accessToken:str = None,
+                                accessTokenSecret:str = None) -> QuoteResponse:
+        """ asyncio version of GetQuotes. The missing symbols are requested using the AsyncMarket, requests in
+            flight of the sync and async callers are shared.
+        """
+        symbols, quotes, waitFor, missingSymbols, future = self.Reserve(symbols, maxStalenessInSeconds)
+        if future is not None:
+            try:
+                quoteResponse = await self.AsyncMarket.Quotes(missingSymbols, accessToken, accessTokenSecret)
+            except BaseException as error:
+                self.Fail(missingSymbols, future, error)
+                raise
+            self.Store(missingSymbols, future, quoteResponse)
+
+        return self.GetResponse(symbols, quotes, {symbol: await asyncio.wrap_future(symbolFuture) for symbol, symbolFuture in waitFor.items()})
+
+    def Reserve(self, symbols:list, maxStalenessInSeconds:float) -> Tuple[List[str], Dict[str, QuoteData], Dict[str, Future], List[str], Future]:
+        """ Finds the cached quotes of the symbols and the requests in flight to wait for. The missing symbols are
+            marked in flight with a new future, which the caller completes with Store or Fail.
+
+            Returns:
+
+            Symbols(upper case, unique), cached QuoteData by Symbol, futures to wait for by Symbol, missing symbols
+            and the future of the missing symbols. Future is None if nothing is missing.
+
+        """
+        staleness = self.TTLInSeconds if maxStalenessInSeconds is None else min(maxStalenessInSeconds, self.TTLInSeconds)
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+        quotes:Dict[str, QuoteData] = {}
+        waitFor:Dict[str, Future] = {}
+        missingSymbols:List[str] = []
+        future:Future = None
+        with self.Lock:
+            now = time.monotonic()
+            for symbol in symbols:
+                cached = self.Quotes.get(symbol)
+                if cached is not None and now - cached[1] <= staleness:
+                    self.Quotes.move_to_end(symbol)
+                    quotes[symbol] = cached[0]
+                    self.Counters.Hits += 1
+                elif symbol in self.InFlight:
+                    waitFor[symbol] = self.InFlight[symbol]
+                    self.Counters.Coalesced += 1
+                else:
+                    missingSymbols.append(symbol)
+                    self.Counters.Misses += 1
+            if len(missingSymbols) != 0:
+                future = Future()
+                for symbol in missingSymbols:
+                    self.InFlight[symbol] = future
+                    waitFor[symbol] = future
+        return symbols, quotes, waitFor, missingSymbols, future
+
+    def GetResponse(self, symbols:List[str], quotes:Dict[str, QuoteData], responses:Dict[str, QuoteResponse]) -> QuoteResponse:
+        """ QuoteResponse of GetQuotes from the cached quotes and the responses waited for by Symbol.
+        """
+        quoteResponse = QuoteResponse()
+        combined:List[QuoteResponse] = []
+        for symbol, response in responses.items():
+            if all(response is not other for other in combined):
+                combined.append(response)
+                quoteResponse.Messages.extend(response.Messages)
+                if quoteResponse.Error is None and response.Error is not None:
+                    quoteResponse.Error = response.Error
+            if symbol in response.QuoteDataBySymbol:
+                quotes[symbol] = response.QuoteDataBySymbol[symbol]
+
+        quoteResponse.QuoteData = [quotes[symbol] for symbol in symbols if symbol in quotes]
+        quoteResponse.QuoteDataBySymbol = {symbol: quotes[symbol] for symbol in symbols if symbol in quotes}
+        return quoteResponse
+
+    def Store(self, symbols:List[str], future:Future, quoteResponse:QuoteResponse):
+        """ Caches the quotes of the requested symbols and completes the in flight future of the symbols.
+        """
+        with self.Lock:
+            now = time.monotonic()
+            for symbol, quoteData in quoteResponse.QuoteDataBySymbol.items():
+                self.Quotes[symbol] = (quoteData, now)
+                self.Quotes.move_to_end(symbol)
+            while len(self.Quotes) > self.MaxSymbols:
+                self.Quotes.popitem(last=False)
+            self.RemoveInFlight(symbols, future)
+        future.set_result(quoteResponse)
+
+    def Fail(self, symbols:List[str], future:Future, error:BaseException):
+        """ Completes the in flight future of the requested symbols with the error of the request.
+        """
+        with self.Lock:
+            self.RemoveInFlight(symbols, future)
+        future.set_exception(error)
+
+    def RemoveInFlight(self, symbols:List[str], future:Future):
+        for symbol in symbols:
+            if self.InFlight.get(symbol) is future:
+                del self.InFlight[symbol]
+
+    def Clear(self) -> None:
+        with self.Lock:
+            self.Quotes.clear()
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from threading import Lock
+from typing import Dict
+from urllib import parse
+
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+
+
+class RateLimiterCounters:
+    """ Counters of one TokenBucket. Updated under the lock of the bucket.
+
+        Attributes:
+
+        Requests:int - Number of requests which took a token.
+
+        Waits:int - Number of requests which waited for a token.
+
+        WaitTimeInSeconds:float - Total time the requests waited for a token.
+
+        MaxWaitInSeconds:float - Longest wait for a token.
+
+        Throttles:int - Number of throttled responses(HTTP 429 or throttling message).
+
+    """
+    def __init__(self):
+        self.Requests = 0
+        self.Waits = 0
+        self.WaitTimeInSeconds = 0.0
+        self.MaxWaitInSeconds = 0.0
+        self.Throttles = 0
+
+    def __str__(self):
+        return f"Requests - {self.Requests}, Waits - {self.Waits}, Wait time - {self.WaitTimeInSeconds:.2f}s, " \
+            f"Max wait - {self.MaxWaitInSeconds:.2f}s, Throttles - {self.Throttles}"
+
+
+class TokenBucket:
+    """ Token bucket of one endpoint class. A request takes a token, tokens are added at Rate per second up to
+        Capacity. A request without a token reserves the next one and waits for it, so the requests are paced
+        instead of failing. A throttled response lowers the Rate down to MinRate, successful responses raise
+        it back to MaxRate. Thread safe, the lock is held only to compute the wait.
+
+        Attributes:
+
+        MaxRate:float - Configured requests per second. 0 or less, no limit.
+
+        Rate:float - Current requests per second.
+
+        MinRate:float - Lowest requests per second after throttled responses.
+
+        Capacity:float - Maximum number of tokens, the burst. At least one token.
+
+        Tokens:float - Available tokens. Negative when tokens are reserved by waiting requests.
+
+        Counters:RateLimiterCounters - Request, wait and throttle counters.
+
+    """
+    def __init__(self, requestsPerSecond:float, minimumFactor:float = 0.25, throttleFactor:float = 0.5,
+                    recoveryFactor:float = 0.05):
+        """ Initialization method.
+
+            Parameters:
+
+            requestsPerSecond:float - Configured requests per second. 0 or less, no limit.
+
+            minimumFactor:float - MinRate as a fraction of requestsPerSecond.
+
+            throttleFactor:float - Rate is multiplied by it on a throttled response.
+
+            recoveryFactor:float - Fraction of requestsPerSecond added to the Rate on a successful response.
+
+        """
+        self.MaxRate = requestsPerSecond
+        self.Rate = requestsPerSecond
+        self.MinRate = requestsPerSecond * minimumFactor
+        self.ThrottleFactor = throttleFactor
+        self.RecoveryFactor = recoveryFactor
+        self.Capacity = max(1.0, requestsPerSecond)
+        self.Tokens = self.Capacity
+        self.LastRefill = time.monotonic()
+        self.Counters = RateLimiterCounters()
+        self.Lock = Lock()
+
+    def Refill(self, now:float):
+        self.Tokens = min(self.Capacity, self.Tokens + (now - self.LastRefill) * self.Rate)
+        self.LastRefill = now
+
+    def Reserve(self) -> float:
+        """ Takes a token.
+
+            Returns:
+
+            float - Seconds to wait before sending the request. 0 if a token was available.
+
+        """
+        with self.Lock:
+            self.Counters.Requests += 1
+            if self.MaxRate <= 0:
+                return 0.0
+            self.Refill(time.monotonic())
+            self.Tokens -= 1
+            wait = 0.0 if self.Tokens >= 0 else -self.Tokens / self.Rate
+            if wait > 0:
+                self.Counters.Waits += 1
+                self.Counters.WaitTimeInSeconds += wait
+                self.Counters.MaxWaitInSeconds = max(self.Counters.MaxWaitInSeconds, wait)
+            return wait
+
+    def Throttle(self):
+        """ Lowers the Rate after a throttled response. Tokens left are dropped.
+        """
+        with self.Lock:
+            self.Counters.Throttles += 1
+            if self.MaxRate <= 0:
+                return
+            self.Refill(time.monotonic())
+            self.Rate = max(self.MinRate, self.Rate * self.ThrottleFactor)
+            self.Capacity = max(1.0, self.Rate)
+            self.Tokens = min(self.Tokens, 0.0)
+
+    def Recover(self):
+        """ Raises the Rate back towards MaxRate after a successful response.
+        """
+        with self.Lock:
+            if self.MaxRate <= 0 or self.Rate >= self.MaxRate:
+                return
+            self.Refill(time.monotonic())
+            self.Rate = min(self.MaxRate, self.Rate + self.MaxRate * self.RecoveryFactor)
+            self.Capacity = max(1.0, self.Rate)
+
+
+class ETradeRateLimiter:
+    """ Rate limiter of the ETrade requests, shared by the sync and async sessions. Separate token buckets for
+        the market, account and order endpoints, configured in ETradeSettings. Requests of other urls
+        (OAuth) are not limited. Callers wait for a token(time.sleep or asyncio.sleep), the wait is counted.
+
+        Attributes:
+
+        Buckets:Dict[str, TokenBucket] - Token buckets by endpoint class(Market, Account, Order).
+
+        Methods:
+
+        GetEndpointClass - Endpoint class of a url.
+
+        Acquire, AcquireAsync - Waits for a token of the endpoint class of the url.
+
+        Update - Adapts the rate of the endpoint class to the response.
+
+        IsThrottled - Is the response a throttled response?
+
+    """
+    Market = "Market"
+    Account = "Account"
+    Order = "Order"
+
+    ThrottlingMessages = ["throttl", "rate limit", "too many requests"]
+
+    def __init__(self, settings:ETradeSettings):
+        """ Initialization method.
+        """
+        def Bucket(requestsPerSecond:float) -> TokenBucket:
+            return TokenBucket(requestsPerSecond if settings.UseRateLimiter is True else 0, settings.RateLimitMinimumFactor,
+                        settings.RateLimitThrottleFactor, settings.RateLimitRecoveryFactor)
+
+        self.Buckets:Dict[str, TokenBucket] = {
+            self.Market: Bucket(settings.RateLimitMarketRequestsPerSecond),
+            self.Account: Bucket(settings.RateLimitAccountRequestsPerSecond),
+            self.Order: Bucket(settings.RateLimitOrderRequestsPerSecond)}
+
+    @classmethod
+    def GetEndpointClass(cls, url:str) -> str:
+        """ Market for /v1/market, Order for /v1/accounts/{accountIdKey}/orders, Account for the other
+            /v1/accounts urls. None for the other urls.
+        """
+        path = parse.urlsplit(str(url)).path
+        if path.startswith("/v1/market/"):
+            return cls.Market
+        if path.startswith("/v1/accounts"):
+            return cls.Order if "/orders" in path else cls.Account
+        return None
+
+    def Acquire(self, url:str) -> float:
+        """ Waits for a token of the endpoint class of the url.
+
+            Returns:
+
+            float - Seconds waited.
+
+        """
+        bucket = self.Buckets.get(self.GetEndpointClass(url))
+        wait = 0.0 if bucket is None else bucket.Reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def AcquireAsync(self, url:str) -> float:
+        """ Same as Acquire, without blocking the event loop.
+        """
+        bucket = self.Buckets.get(self.GetEndpointClass(url))
+        wait = 0.0 if bucket is None else bucket.Reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @classmethod
+    def IsThrottled(cls, response) -> bool:
+        """ True for HTTP 429, or an error response with a throttling message.
+        """
+        if response is None:
+            return False
+        if response.status_code == 429:
+            return True
+        if response.status_code < 400:
+            return False
+        text = (response.text or "").lower()
+        return any(message in text for message in cls.ThrottlingMessages)
+
+    def Update(self, url:str, response):
+        """ Lowers the rate of the endpoint class of the url after a throttled response, raises it back
+            after a successful one.
+        """
+        bucket = self.Buckets.get(self.GetEndpointClass(url))
+        if bucket is None or response is None:
+            return
+        if self.IsThrottled(response):
+            bucket.Throttle()
+        elif response.status_code < 400:
+            bucket.Recover()
+
+    def __str__(self):
+        return ", ".join(f"{endpointClass}: {bucket.Counters}" for endpointClass, bucket in self.Buckets.items())
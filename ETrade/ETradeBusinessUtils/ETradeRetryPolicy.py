@@ -0,0 +1,181 @@
+import asyncio
+import random
+import time
+from threading import Lock
+from typing import Awaitable, Callable
+from urllib import parse
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout as RequestsTimeout
+
+from BusinessModels.ErrorAction import ErrorAction
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeBusinessService import GetValue, LoadJson
+
+# Connection errors of the sync(requests) and async(AsyncOAuth1Session) sessions.
+TransientErrors = (RequestsConnectionError, RequestsTimeout, ConnectionError, asyncio.TimeoutError)
+
+
+class RetryCounters:
+    """ Counters of the ETradeRetryPolicy. Thread safe.
+
+        Attributes:
+
+        Retries:int - Number of requests sent again.
+
+        Recovered:int - Number of requests which succeeded after at least one retry.
+
+        GaveUp:int - Number of requests which still failed after RetryMaxAttempts.
+
+        BackoffInSeconds:float - Total time waited before the retries.
+
+    """
+    def __init__(self):
+        self.Lock = Lock()
+        self.Retries = 0
+        self.Recovered = 0
+        self.GaveUp = 0
+        self.BackoffInSeconds = 0.0
+
+    def AddRetry(self, delay:float):
+        with self.Lock:
+            self.Retries += 1
+            self.BackoffInSeconds += delay
+
+    def AddResult(self, attempts:int, failed:bool):
+        if attempts <= 1:
+            return
+        with self.Lock:
+            if failed is True:
+                self.GaveUp += 1
+            else:
+                self.Recovered += 1
+
+    def __str__(self):
+        return f"Retries - {self.Retries}, Recovered - {self.Recovered}, Gave up - {self.GaveUp}, " \
+            f"Backoff - {self.BackoffInSeconds:.2f}s"
+
+
+class ETradeRetryPolicy:
+    """ Retry of the transient failures of the idempotent ETrade requests with jittered exponential backoff,
+        so a network blip costs seconds instead of a whole cycle. Used by the sync and async sessions.
+
+        A request is retried if it is idempotent(GET, cancel PUT, preview POST, never place) and it failed
+        with a connection error, a RetryStatusCodes response or an error code with the RETRY action
+        (ETradeSettings.ErrorCodeActions). The last response is returned, the last connection error raised.
+
+        Attributes:
+
+        Settings:ETradeSettings - Retry settings and the ErrorCodeActions table.
+
+        Counters:RetryCounters - Retry counters.
+
+        Methods:
+
+        GetErrorAction - Action of an error code, from the ErrorCodeActions table.
+
+        IsIdempotent - Can the request be sent again without side effects?
+
+        IsTransient - Is the response a transient failure?
+
+        GetRetryDelay - Backoff before the next attempt.
+
+        Send, SendAsync - Sends the request, retrying the transient failures.
+
+    """
+    def __init__(self, settings:ETradeSettings):
+        """ Initialization method.
+        """
+        self.Settings = settings
+        self.Counters = RetryCounters()
+
+    @staticmethod
+    def GetErrorAction(settings:ETradeSettings, code, statusCode = None) -> ErrorAction:
+        """ Action of the error code from ETradeSettings.ErrorCodeActions. Codes not in the table of a
+            RetryStatusCodes response are transient(RETRY). None if not found.
+        """
+        try:
+            action = settings.ErrorCodeActions.get(int(code))
+        except (TypeError, ValueError):
+            action = None
+        if action is None and statusCode in settings.RetryStatusCodes:
+            action = ErrorAction.RETRY
+        return action
+
+    @staticmethod
+    def IsIdempotent(method:str, url:str) -> bool:
+        """ GET and PUT(cancel order) requests, and the preview order POST. Place order is never idempotent.
+        """
+        method = method.upper()
+        if method in ("GET", "PUT"):
+            return True
+        return method == "POST" and parse.urlsplit(str(url)).path.endswith("/orders/preview.json")
+
+    def IsTransient(self, response) -> bool:
+        """ True for a RetryStatusCodes response, or an error response with a RETRY code.
+        """
+        if response is None or response.status_code < 400:
+            return False
+        if response.status_code in self.Settings.RetryStatusCodes:
+            return True
+        try:
+            code = GetValue(LoadJson(response.content), "Error.code")
+        except ValueError:
+            return False
+        return self.GetErrorAction(self.Settings, code) is ErrorAction.RETRY
+
+    def GetRetryDelay(self, retry:int) -> float:
+        """ Full jitter backoff, random between 0 and RetryBaseDelayInSeconds * 2 ** retry, at most RetryMaxDelayInSeconds.
+        """
+        return random.uniform(0, min(self.Settings.RetryMaxDelayInSeconds, self.Settings.RetryBaseDelayInSeconds * 2 ** retry))
+
+    def Send(self, method:str, url:str, send:Callable[[], object]):
+        """ Sends the request using send, retrying the transient failures of the idempotent requests.
+
+            Parameters:
+
+            method:str - HTTP method.
+
+            url:str - Url of the request.
+
+            send:Callable - Sends the request once(signed again for each attempt) and returns the response.
+
+            Returns:
+
+            Response of the last attempt.
+
+        """
+        maxAttempts = max(1, self.Settings.RetryMaxAttempts) if self.IsIdempotent(method, url) else 1
+        for attempt in range(1, maxAttempts + 1):
+            try:
+                response = send()
+            except TransientErrors:
+                if attempt == maxAttempts:
+                    self.Counters.AddResult(attempt, True)
+                    raise
+            else:
+                if attempt == maxAttempts or not self.IsTransient(response):
+                    self.Counters.AddResult(attempt, self.IsTransient(response))
+                    return response
+            delay = self.GetRetryDelay(attempt - 1)
+            self.Counters.AddRetry(delay)
+            time.sleep(delay)
+
+    async def SendAsync(self, method:str, url:str, send:Callable[[], Awaitable]):
+        """ Same as Send, send is a coroutine function and the backoff doesn't block the event loop.
+        """
+        maxAttempts = max(1, self.Settings.RetryMaxAttempts) if self.IsIdempotent(method, url) else 1
+        for attempt in range(1, maxAttempts + 1):
+            try:
+                response = await send()
+            except TransientErrors:
+                if attempt == maxAttempts:
+                    self.Counters.AddResult(attempt, True)
+                    raise
+            else:
+                if attempt == maxAttempts or not self.IsTransient(response):
+                    self.Counters.AddResult(attempt, self.IsTransient(response))
+                    return response
+            delay = self.GetRetryDelay(attempt - 1)
+            self.Counters.AddRetry(delay)
+            await asyncio.sleep(delay)
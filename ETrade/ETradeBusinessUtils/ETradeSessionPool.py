@@ -0,0 +1,171 @@
+from threading import Lock
+
+from rauth import OAuth1Session
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+
+
+class ConnectionCounters:
+    """ Connection reuse counters of the ETradeSessionPool. Thread safe.
+
+        Attributes:
+
+        Requests:int - Number of requests sent.
+
+        NewConnections:int - Number of connections opened(TCP + TLS handshake).
+
+        ReusedConnections:int - Number of requests sent on an already open keep-alive connection.
+
+    """
+    def __init__(self):
+        self.Lock = Lock()
+        self.Requests = 0
+        self.NewConnections = 0
+
+    @property
+    def ReusedConnections(self) -> int:
+        return self.Requests - self.NewConnections
+
+    def AddRequest(self):
+        with self.Lock:
+            self.Requests += 1
+
+    def AddNewConnection(self):
+        with self.Lock:
+            self.NewConnections += 1
+
+    def __str__(self):
+        return f"Requests - {self.Requests}, New connections - {self.NewConnections}, Reused connections - {self.ReusedConnections}"
+
+
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+    Counters:ConnectionCounters = None
+
+    def _new_conn(self):
+        if self.Counters is not None:
+            self.Counters.AddNewConnection()
+        return super()._new_conn()
+
+
+class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    Counters:ConnectionCounters = None
+
+    def _new_conn(self):
+        if self.Counters is not None:
+            self.Counters.AddNewConnection()
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter which keeps the connections alive and counts the new and the reused connections.
+        A connection is reused as long as the server keeps it alive, so the TCP and TLS handshakes
+        are done only for the new connections.
+    """
+    def __init__(self, counters:ConnectionCounters, maxConnections:int):
+        self.Counters = counters
+        super().__init__(pool_connections=2, pool_maxsize=maxConnections)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        counters = self.Counters
+
+        def HTTPPool(*args, **kwargs):
+            pool = CountingHTTPConnectionPool(*args, **kwargs)
+            pool.Counters = counters
+            return pool
+
+        def HTTPSPool(*args, **kwargs):
+            pool = CountingHTTPSConnectionPool(*args, **kwargs)
+            pool.Counters = counters
+            return pool
+
+        self.poolmanager.pool_classes_by_scheme = {"http": HTTPPool, "https": HTTPSPool}
+
+    def send(self, request, **kwargs):
+        self.Counters.AddRequest()
+        return super().send(request, **kwargs)
+
+
+class ETradeOAuth1Session(OAuth1Session):
+    """ rauth OAuth1Session which also works with the newer requests versions, where get passes params=None.
+        Requests are paced by the RateLimiter and the transient failures retried by the RetryPolicy, if any.
+    """
+    RateLimiter:ETradeRateLimiter = None
+    RetryPolicy:ETradeRetryPolicy = None
+
+    def request(self, method, url, header_auth=False, realm='', **req_kwargs):
+        if "params" in req_kwargs and req_kwargs["params"] is None:
+            del req_kwargs["params"]
+        if self.RetryPolicy is None:
+            return self.SendRequest(method, url, header_auth, realm, **req_kwargs)
+        return self.RetryPolicy.Send(method, url, lambda: self.SendRequest(method, url, header_auth, realm, **req_kwargs))
+
+    def SendRequest(self, method, url, header_auth=False, realm='', **req_kwargs):
+        """ Sends the request once, signed with a new nonce and timestamp.
+        """
+        if self.RateLimiter is not None:
+            self.RateLimiter.Acquire(url)
+        response = super().request(method, url, header_auth, realm, **req_kwargs)
+        if self.RateLimiter is not None:
+            self.RateLimiter.Update(url, response)
+        return response
+
+
+class ETradeSessionPool:
+    """ Single OAuth1 session shared by all the ETrade services. Connections to the ETrade hosts
+        are pooled and kept alive, so the services don't pay a new TCP + TLS handshake on every call.
+
+        Attributes:
+
+        Session:ETradeOAuth1Session - rauth session used by the services. Holds the consumer key/secret
+        and the access token/secret.
+
+        Counters:ConnectionCounters - Connection reuse counters.
+
+        RateLimiter:ETradeRateLimiter - Rate limiter of the requests of the session. None, no limit.
+
+        RetryPolicy:ETradeRetryPolicy - Retry of the transient failures of the idempotent requests. None, no retry.
+
+        Methods:
+
+        UpdateAccessKeys(accessToken, accessTokenSecret) -> None
+            Updates the access keys of the session in place.
+
+        Close() -> None
+            Closes all the pooled connections.
+
+    """
+    def __init__(self, consumerKey:str, consumerSecret:str, accessToken:str = None, accessTokenSecret:str = None,
+                    maxConnections:int = 10, rateLimiter:ETradeRateLimiter = None, retryPolicy:ETradeRetryPolicy = None):
+        """ Initialization method.
+
+            Parameters:
+
+            maxConnections - Maximum number of connections kept alive per host. Should be at least
+            the number of workers sending requests at the same time.
+
+            rateLimiter - Rate limiter of the requests, also given to the async services to share the limits.
+
+            retryPolicy - Retry policy of the requests, also given to the async services.
+
+        """
+        self.Counters = ConnectionCounters()
+        self.RateLimiter = rateLimiter
+        self.RetryPolicy = retryPolicy
+        self.Session = ETradeOAuth1Session(consumerKey, consumerSecret, accessToken, accessTokenSecret)
+        self.Session.RateLimiter = rateLimiter
+        self.Session.RetryPolicy = retryPolicy
+        self.Session.headers["Connection"] = "keep-alive"
+        adapter = PooledHTTPAdapter(self.Counters, maxConnections)
+        self.Session.mount("https://", adapter)
+        self.Session.mount("http://", adapter)
+
+    def UpdateAccessKeys(self, accessToken:str, accessTokenSecret:str) -> None:
+        self.Session.access_token = accessToken
+        self.Session.access_token_secret = accessTokenSecret
+
+    def Close(self) -> None:
+        self.Session.close()
@@ -0,0 +1,108 @@
+from typing import Callable, List
+
+
+class Field:
+    """ Mapping of one JSON value to one model attribute.
+
+        Attributes:
+
+        Path:List[str] - Keys of the value in the JSON object. "Product.symbol" is data["Product"]["symbol"].
+
+        Attribute:str - Model attribute name.
+
+        Converter:Callable - Converts the JSON value to the attribute value, e.g. int, str, Price.From.
+        None to use the JSON value as is.
+
+    """
+    def __init__(self, path:str, attribute:str, converter:Callable = None):
+        self.Path:List[str] = path.split(".")
+        self.Attribute:str = attribute
+        self.Converter:Callable = converter
+
+
+class ModelLoader:
+    """ Loads a model from a decoded JSON object using a list of Fields. The fields are compiled once
+        into a single function, so each object costs one dictionary lookup per key present in the mapping.
+        Attribute is set only when the value is present in the JSON object, otherwise the model default is kept.
+
+        Attributes:
+
+        ModelClass - Class of the model. Created without arguments.
+
+        Fields:List[Field] - Field mappings.
+
+        RequiredKey:str - If given, JSON objects without this key are not loaded.
+
+        Methods:
+
+        Load(data) -> object
+            Loads the model from the JSON object. None if data is None or the RequiredKey is missing.
+
+        LoadList(items) -> list
+            Loads the models from the JSON array, objects which are not loaded are skipped.
+
+    """
+    def __init__(self, modelClass, fields:List[Field], requiredKey:str = None):
+        self.ModelClass = modelClass
+        self.Fields:List[Field] = fields
+        self.RequiredKey:str = requiredKey
+        self.Load = self.Compile()
+
+    def Compile(self) -> Callable:
+        """ Generates the loader function of the fields. Fields sharing a parent key read the parent only once.
+            The model class and the converters are bound as default arguments, so they are local variables
+            of the generated function.
+        """
+        namespace = {"Model": self.ModelClass, "RequiredKey": self.RequiredKey}
+
+        # Group the fields by their paths, so the nested objects are read once.
+        tree = {}
+        for index, field in enumerate(self.Fields):
+            converter = None
+            if field.Converter is not None:
+                converter = f"c{index}"
+                namespace[converter] = field.Converter
+            node = tree
+            for key in field.Path[:-1]:
+                node = node.setdefault(("object", key), {})
+            node.setdefault(("value", field.Path[-1]), []).append((field.Attribute, converter))
+
+        arguments = "".join(f", {name}={name}" for name in namespace)
+        lines = [f"def Load(data{arguments}):"]
+        if self.RequiredKey is None:
+            lines.append("    if data is None: return None")
+        else:
+            lines.append("    if data is None or RequiredKey not in data: return None")
+        lines.append("    model = Model()")
+        self.EmitNode(tree, "data", 1, lines, [0])
+        lines.append("    return model")
+
+        exec("\n".join(lines), namespace)
+        return namespace["Load"]
+
+    def EmitNode(self, node:dict, source:str, depth:int, lines:List[str], counter:List[int]):
+        indent = "    " * depth
+        for (kind, key), child in node.items():
+            if kind == "value":
+                lines.append(f"{indent}if {key!r} in {source}:")
+                for attribute, converter in child:
+                    value = f"{source}[{key!r}]"
+                    lines.append(f"{indent}    model.{attribute} = {value if converter is None else f'{converter}({value})'}")
+            else:
+                counter[0] += 1
+                parent = f"parent{counter[0]}"
+                lines.append(f"{indent}{parent} = {source}.get({key!r})")
+                lines.append(f"{indent}if {parent}.__class__ is dict:")
+                self.EmitNode(child, parent, depth + 1, lines, counter)
+
+    def LoadList(self, items) -> list:
+        if items is None:
+            return []
+        load = self.Load
+        return [model for model in map(load, items) if model is not None]
+
+
+def ListOf(loader:ModelLoader) -> Callable:
+    """ Converter which loads a JSON array using the loader.
+    """
+    return loader.LoadList
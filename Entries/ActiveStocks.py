@@ -1,6 +1,7 @@
 from typing import List
 
 from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.CompiledPriceCoordinates import CompiledPriceCoordinates
 from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
 from BusinessModels.SellDeltaType import SellDeltaType
 
@@ -21,6 +22,10 @@ def GetActiveStockItem(activeItem:ActiveItem) -> ActiveStockItem:
 
         ActiveStockItem object.
 
+        Exceptions:
+
+        InvalidPriceCoordinatesError - If the price coordinates are not valid.
+
 
     """
     activeStockItem = ActiveStockItem(activeItem.Symbol)
@@ -44,7 +49,10 @@ def GetActiveStockItem(activeItem:ActiveItem) -> ActiveStockItem:
                             buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=activeItem.BuyStepSize))
     else:
         raise Exception("Fatal - Unsupported Quantity.")
-    activeStockItem.PriceCoordinates = priceCoordinates
+
+    # Validate and compile the price coordinates once. Compiled price coordinates are immutable
+    # so the shared price coordinates like PriceCoordinates0 are never modified by the stock items.
+    activeStockItem.PriceCoordinates = CompiledPriceCoordinates.Compile(priceCoordinates)
     return activeStockItem
 
 
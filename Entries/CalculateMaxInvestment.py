@@ -2,7 +2,7 @@ import os
 import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 sys.path.append(str(Path(os.getcwd()).parent))
 
@@ -14,6 +14,36 @@ from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
 from Entries.PriceCoordinates import PriceCoordinates0
 
 
+def GetMaxInvestmentReport(manageOrdersHelpers:ManageOrdersHelpers, 
+                            activeStockItems:List[ActiveStockItem]) -> Tuple[List[Tuple[str, Decimal]], Decimal]:
+    """ Calculates the maximum investment of each of the given stock items and the total maximum investment.
+        Maximum investment is calculated in closed form, so this is fast enough for hundreds of 
+        candidate configurations.
+
+        Parameters:
+
+        manageOrdersHelpers:ManageOrdersHelpers - Manage order helpers object containing the helper 
+        methods to calculate the maximum investment.
+
+        activeStockItems:List[ActiveStockItem] - List of active stock items.
+
+        Returns:
+
+        Tuple[List[Tuple[str, Decimal]], Decimal] - [[Symbol, Max Investment], Total Max Investment]
+
+    """
+    report:List[Tuple[str, Decimal]] = []
+    totalMaxInvestment:Decimal = Decimal(0)
+
+    for activeStockItem in activeStockItems:
+        maxInvestment:Decimal = manageOrdersHelpers.CalculateMaxInvestment(activeStockItem.StartPrice, activeStockItem.PriceCoordinates, 
+                                        activeStockItem.QuantityMultiplier)
+        report.append((activeStockItem.Symbol, maxInvestment))
+        totalMaxInvestment = totalMaxInvestment + maxInvestment
+
+    return report, totalMaxInvestment
+
+
 def MaxInvestmentTest(manageOrdersHelpers:ManageOrdersHelpers, activeStockItems:List[ActiveStockItem]):
     """ function to calculate and display the maximum investment of the given stock items.
 
@@ -26,10 +56,11 @@ def MaxInvestmentTest(manageOrdersHelpers:ManageOrdersHelpers, activeStockItems:
 
     """
 
-    # For each stock item, calculate and print the maximum investment.
-    for activeStockItem in activeStockItems:
-        maxInvestment:Decimal = manageOrdersHelpers.CalculateMaxInvestment(activeStockItem.StartPrice, activeStockItem.PriceCoordinates, activeStockItem.QuantityMultiplier)
-        print(f"Symbol  -> {activeStockItem.Symbol}, Max Investment ->{maxInvestment}")
+    # Calculate the report and print the maximum investment of each stock item.
+    report, totalMaxInvestment = GetMaxInvestmentReport(manageOrdersHelpers, activeStockItems)
+    for symbol, maxInvestment in report:
+        print(f"Symbol  -> {symbol}, Max Investment ->{maxInvestment}")
+    print(f"Total Max Investment ->{totalMaxInvestment}")
 
 
 def GeneratePossibleLimitOrdersTest(manageOrdersHelpers:ManageOrdersHelpers):
@@ -0,0 +1,328 @@
+import itertools
+import json
+import os
+import time
+from threading import Lock
+from typing import Dict, List
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+
+Base36Digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def ToBase36(value:int, width:int = 0) -> str:
+    """ Upper case base 36 string of a non negative int, zero padded to width.
+    """
+    digits = ""
+    while value > 0:
+        value, digit = divmod(value, 36)
+        digits = Base36Digits[digit] + digits
+    return (digits or "0").rjust(width, "0")
+
+
+class ClientOrderIdGenerator:
+    """ Generates the ClientOrderIds of the orders. A process prefix(start time and process id) and a counter,
+        so the ids are unique across the threads and processes, and within the 20 alphanumeric characters
+        accepted by ETrade. Thread safe.
+
+        Attributes:
+
+        Prefix:str - "O" + start time(seconds, 6 base 36 digits) + process id(4 base 36 digits).
+
+        Methods:
+
+        Next - Next ClientOrderId, e.g. O5F3K2A00RS000001.
+
+    """
+    MaxLength = 20
+    CounterWidth = 6
+
+    def __init__(self, prefix:str = None):
+        """ Initialization method.
+
+            Parameters:
+
+            prefix:str - Process prefix. If None, created from the current time and the process id.
+
+        """
+        if prefix is None:
+            prefix = "O" + ToBase36(int(time.time()), 6) + ToBase36(os.getpid() % 36 ** 4, 4)
+        if len(prefix) + self.CounterWidth > self.MaxLength or not prefix.isalnum():
+            raise ValueError(f"Invalid ClientOrderId prefix - {prefix}")
+        self.Prefix = prefix
+        # next() of itertools.count is atomic.
+        self.Counter = itertools.count(1)
+
+    def Next(self) -> str:
+        return self.Prefix + ToBase36(next(self.Counter), self.CounterWidth)
+
+
+class ClientOrderEntry:
+    """ An order placed by the MoneyMaker, by ClientOrderId.
+
+        Attributes:
+
+        ClientOrderId:str - ClientOrderId of the order.
+
+        Symbol:str - Symbol(upper case).
+
+        OrderAction:str - BUY or SELL.
+
+        LimitPrice:Price - Limit price.
+
+        Quantity:int - Order quantity.
+
+        State:str - PENDING, PLACED, REJECTED, UNKNOWN or NOT_PLACED. See ClientOrderRegistry.
+
+        OrderId:int - OrderId of the placed order. 0 if not known.
+
+        CreatedTime:float - Epoch time the order was registered, before the place order request.
+
+        UpdatedTime:float - Epoch time of the last state change.
+
+    """
+    def __init__(self, clientOrderId:str, symbol:str, orderAction:str, limitPrice, quantity:int, state:str,
+                    orderId:int = 0, createdTime:float = 0.0, updatedTime:float = 0.0):
+        self.ClientOrderId = clientOrderId
+        self.Symbol = symbol.upper()
+        self.OrderAction = orderAction
+        self.LimitPrice:Price = Price.From(limitPrice)
+        self.Quantity = int(quantity)
+        self.State = state
+        self.OrderId = int(orderId)
+        self.CreatedTime = createdTime
+        self.UpdatedTime = updatedTime
+
+    def ToDict(self) -> dict:
+        return {"clientOrderId": self.ClientOrderId, "symbol": self.Symbol, "orderAction": self.OrderAction,
+                "limitPrice": str(self.LimitPrice), "quantity": self.Quantity, "state": self.State,
+                "orderId": self.OrderId, "createdTime": self.CreatedTime, "updatedTime": self.UpdatedTime}
+
+    @staticmethod
+    def FromDict(data:dict) -> "ClientOrderEntry":
+        return ClientOrderEntry(data["clientOrderId"], data["symbol"], data["orderAction"], data["limitPrice"],
+                                data["quantity"], data["state"], data.get("orderId", 0), data.get("createdTime", 0.0),
+                                data.get("updatedTime", 0.0))
+
+    def __repr__(self):
+        return f"[{self.ClientOrderId}, {self.Symbol}, {self.OrderAction}, {self.LimitPrice}, {self.Quantity}, " \
+            f"{self.State}, {self.OrderId}]"
+
+
+class ClientOrderRegistry:
+    """ Registry of the orders placed by the MoneyMaker, ClientOrderId -> (Symbol, OrderAction, LimitPrice,
+        Quantity, State). An order is registered(PENDING) before the place order request and updated from the
+        response. A place order request without a usable response(timeout, connection error) leaves the order
+        UNKNOWN, the orders of the Symbol are then looked up(Resolve) instead of placing the order again.
+
+        If Settings.UseClientOrderRegistryFile is True, every change is appended(JSON lines) to
+        Settings.ClientOrderRegistryFilePathWithName and replayed on start, so the orders in flight when the
+        process stopped are also looked up. The file is compacted on start, resolved orders older than
+        Settings.ClientOrderRegistryRetentionInDays are dropped. In memory, resolved orders are dropped once they
+        are older than the lookup window(Prune), so the lookups don't scan the whole run. Thread safe.
+
+        States:
+
+        PENDING - Place order request sent. UNKNOWN after a restart.
+
+        PLACED - Placed, OrderId from the place response or the lookup.
+
+        REJECTED - Place order failed with an error or message.
+
+        UNKNOWN - Outcome of the place order request not known, looked up before placing orders of the Symbol.
+
+        NOT_PLACED - Not found by the lookups for Settings.ClientOrderLookupTimeoutInSeconds.
+
+        Attributes:
+
+        Settings - The settings of the system.
+
+        FilePathWithName:str - File of the registry. None if not persisted.
+
+        Entries:Dict[str, ClientOrderEntry] - Orders by ClientOrderId.
+
+        LastPrune:float - Epoch time of the last Prune.
+
+        Methods:
+
+        Register - Registers an order before the place order request.
+
+        SetState - Updates the state(and OrderId) of an order.
+
+        GetUnknown - UNKNOWN orders of a Symbol.
+
+        Resolve - Resolves the UNKNOWN orders of a Symbol using the orders of the API.
+
+        Prune - Drops the resolved orders older than the lookup window.
+
+    """
+    Pending = "PENDING"
+    Placed = "PLACED"
+    Rejected = "REJECTED"
+    Unknown = "UNKNOWN"
+    NotPlaced = "NOT_PLACED"
+
+    # Difference allowed between the local clock and the PlacedTime of the API.
+    ClockSlackInSeconds = 60
+
+    def __init__(self, settings:Settings):
+        """ Initialization method. Loads and compacts the registry file.
+        """
+        self.Settings = settings
+        self.FilePathWithName:str = settings.ClientOrderRegistryFilePathWithName if settings.UseClientOrderRegistryFile is True else None
+        self.Entries:Dict[str, ClientOrderEntry] = {}
+        self.Lock = Lock()
+        self.LastPrune = 0.0
+        if self.FilePathWithName is not None:
+            self.Load(time.time())
+
+    def Load(self, now:float):
+        """ Replays the registry file and writes back the entries kept. PENDING entries are UNKNOWN, the
+            process stopped before the place order response.
+        """
+        if os.path.exists(self.FilePathWithName):
+            with open(self.FilePathWithName, "r") as registryFile:
+                for line in registryFile:
+                    line = line.strip()
+                    if line == "":
+                        continue
+                    try:
+                        entry = ClientOrderEntry.FromDict(json.loads(line))
+                    except (ValueError, KeyError):
+                        # Partly written last line.
+                        continue
+                    self.Entries[entry.ClientOrderId] = entry
+
+        retentionInSeconds = self.Settings.ClientOrderRegistryRetentionInDays * 24 * 60 * 60
+        for clientOrderId, entry in list(self.Entries.items()):
+            if entry.State == self.Pending:
+                entry.State = self.Unknown
+            if entry.State != self.Unknown and now - entry.UpdatedTime > retentionInSeconds:
+                del self.Entries[clientOrderId]
+
+        temporaryFilePathWithName = self.FilePathWithName + ".tmp"
+        with open(temporaryFilePathWithName, "w") as registryFile:
+            for entry in self.Entries.values():
+                registryFile.write(json.dumps(entry.ToDict()) + "\n")
+        os.replace(temporaryFilePathWithName, self.FilePathWithName)
+
+    def Save(self, entry:ClientOrderEntry):
+        """ Appends the entry to the registry file. Called under the lock.
+        """
+        if self.FilePathWithName is None:
+            return
+        with open(self.FilePathWithName, "a") as registryFile:
+            registryFile.write(json.dumps(entry.ToDict()) + "\n")
+
+    def Register(self, clientOrderId:str, limitOrder:OrderInfo, now:float = None) -> ClientOrderEntry:
+        """ Registers the order as PENDING before the place order request.
+
+            Parameters:
+
+            clientOrderId:str - ClientOrderId of the order. Must not be registered already.
+
+            limitOrder:OrderInfo - Order to place.
+
+            now:float - Current epoch time. If None, time.time().
+
+        """
+        now = time.time() if now is None else now
+        entry = ClientOrderEntry(clientOrderId, limitOrder.Symbol, "SELL" if limitOrder.IsSell is True else "BUY",
+                    limitOrder.LimitPrice, limitOrder.Quantity, self.Pending, 0, now, now)
+        with self.Lock:
+            self.Prune(now)
+            if clientOrderId in self.Entries:
+                raise ValueError(f"ClientOrderId {clientOrderId} is already registered.")
+            self.Entries[clientOrderId] = entry
+            self.Save(entry)
+        return entry
+
+    def SetState(self, clientOrderId:str, state:str, orderId:int = 0, now:float = None):
+        """ Updates the state of the order. The OrderId is kept if orderId is 0.
+        """
+        now = time.time() if now is None else now
+        with self.Lock:
+            entry = self.Entries.get(clientOrderId)
+            if entry is None:
+                return
+            entry.State = state
+            if orderId != 0:
+                entry.OrderId = orderId
+            entry.UpdatedTime = now
+            self.Save(entry)
+
+    def Prune(self, now:float):
+        """ Drops the PLACED, REJECTED and NOT_PLACED orders not updated within the lookup window
+            (ClientOrderLookupTimeoutInSeconds and the clock slack). An UNKNOWN order can't match the orders
+            placed before the window, so their OrderIds don't need to be claimed. Called under the lock, at
+            most once per ClockSlackInSeconds. The registry file keeps them till the next start.
+        """
+        if now - self.LastPrune < self.ClockSlackInSeconds:
+            return
+        self.LastPrune = now
+        window = self.Settings.ClientOrderLookupTimeoutInSeconds + self.ClockSlackInSeconds
+        for clientOrderId in [clientOrderId for clientOrderId, entry in self.Entries.items()
+                                if entry.State in (self.Placed, self.Rejected, self.NotPlaced) and now - entry.UpdatedTime > window]:
+            del self.Entries[clientOrderId]
+
+    def GetUnknown(self, symbol:str) -> List[ClientOrderEntry]:
+        """ UNKNOWN orders of the Symbol, oldest first.
+        """
+        symbol = symbol.upper()
+        with self.Lock:
+            return sorted((entry for entry in self.Entries.values() if entry.Symbol == symbol and entry.State == self.Unknown),
+                            key= lambda entry: entry.CreatedTime)
+
+    def Resolve(self, symbol:str, orders:List[Order], now:float = None) -> List[ClientOrderEntry]:
+        """ Resolves the UNKNOWN orders of the Symbol using the orders of the API(any status). An UNKNOWN order
+            is PLACED if an order with the same OrderAction, LimitPrice and Quantity, placed after it was
+            registered, is not already claimed by another entry. Orders not found for
+            Settings.ClientOrderLookupTimeoutInSeconds are NOT_PLACED, the others stay UNKNOWN.
+
+            Parameters:
+
+            symbol:str - Symbol.
+
+            orders:List[Order] - Orders of the Symbol from the API.
+
+            now:float - Current epoch time. If None, time.time().
+
+            Returns:
+
+            List[ClientOrderEntry] - Orders resolved, PLACED or NOT_PLACED.
+
+        """
+        now = time.time() if now is None else now
+        symbol = symbol.upper()
+        resolved:List[ClientOrderEntry] = []
+        with self.Lock:
+            self.Prune(now)
+            claimedOrderIds = {entry.OrderId for entry in self.Entries.values() if entry.OrderId != 0}
+            unknownEntries = sorted((entry for entry in self.Entries.values() if entry.Symbol == symbol and entry.State == self.Unknown),
+                                    key= lambda entry: entry.CreatedTime)
+            for entry in unknownEntries:
+                for order in orders or []:
+                    if order.OrderId in claimedOrderIds or len(order.OrderDetails) == 0 or len(order.OrderDetails[0].Instruments) == 0:
+                        continue
+                    orderDetail = order.OrderDetails[0]
+                    instrument = orderDetail.Instruments[0]
+                    # PlacedTime is epoch milliseconds, the clocks may differ a little.
+                    if instrument.Symbol.upper() != symbol or instrument.OrderAction != entry.OrderAction or \
+                            orderDetail.LimitPrice != entry.LimitPrice or int(instrument.OrderedQuantity) != entry.Quantity or \
+                            (orderDetail.PlacedTime != 0 and orderDetail.PlacedTime < (entry.CreatedTime - self.ClockSlackInSeconds) * 1000):
+                        continue
+                    entry.State = self.Placed
+                    entry.OrderId = order.OrderId
+                    claimedOrderIds.add(order.OrderId)
+                    break
+                else:
+                    if now - entry.CreatedTime < self.Settings.ClientOrderLookupTimeoutInSeconds:
+                        continue
+                    entry.State = self.NotPlaced
+                entry.UpdatedTime = now
+                self.Save(entry)
+                resolved.append(entry)
+        return resolved
@@ -2,8 +2,10 @@ from datetime import datetime
 from typing import List
 
 from BusinessModels.Error import Error
+from BusinessModels.ErrorAction import ErrorAction
 from BusinessModels.Message import Message, MessageType
 from Entries.EntryInputs.EntryInput import EntryInput
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
 from Exceptions.MessageError import MessageError
 from Exceptions.ResponseError import ResponseError
 
@@ -13,8 +15,9 @@ def ProcessResponseError(error:Error, entryInput:EntryInput):
 
         If error is 401 - Try to Renew the token or authorize and get new token and also 
         stores the latest tokens.
-        If error code is one present in the Exclusions then this is a safe error.
-        If the error code is not something unexpected then raise ResponseError exception.
+        If the action of the error code(ETradeSettings.ErrorCodeActions) is SKIP then this is a safe error.
+        If it is RETRY, or the status code is transient, the session already retried the request, so it is skipped.
+        Otherwise raise ResponseError exception.
 
         Parameters:
 
@@ -35,8 +38,9 @@ def ProcessResponseError(error:Error, entryInput:EntryInput):
     entryInput.LogMessage(entryInput.Logger, f"Error message - {error.Message}", True, True)
 
     # If error is 401 - Try to Renew the token or authorize and get new token. Store the latest token.
-    # If error code is one present in the Exclusions then this is a safe error.
-    # If the error code is not something unexpected then raise ResponseError exception.
+    # If the error code is SKIP/RETRY then this is a safe error, the request is skipped.
+    # Otherwise raise ResponseError exception.
+    action = ETradeRetryPolicy.GetErrorAction(entryInput.ETradeSettings, error.Code, error.ResponseStatusCode)
     if(error.ResponseStatusCode == 401):
         accessToken, accessTokenSecret, dateTimeObj = entryInput.Configuration.GetLatestETradeAccessKeyDetails()
         if entryInput.Strings.TokenExpired in str(error.Message) or entryInput.Strings.SignatureInvalid in str(error.Message) or entryInput.Strings.InvalidTokenUsed in str(error.Message):
@@ -57,7 +61,7 @@ def ProcessResponseError(error:Error, entryInput:EntryInput):
                 raise Exception(entryInput.Strings.UnexpectedValue.format(status, "Status Code"))        
         else:
             raise Exception(entryInput.Strings.UnexpectedValue.format(error.Message, "Error Message"))
-    elif(error.Code in entryInput.ETradeSettings.ExclusionErrorCodes):
+    elif(action is ErrorAction.SKIP or action is ErrorAction.RETRY):
         return True
     else:        
         raise ResponseError(error)     
@@ -68,7 +72,7 @@ def ProcessResponseError(error:Error, entryInput:EntryInput):
 def ProcessMessageError(messages:List[Message], entryInput:EntryInput):
     """ Processes the API Messages.
         We are only concerned about the messages with MessageType ERROR, FATAL and Message codes
-        in the DangerErrorCodes.
+        with the ABORT action(ETradeSettings.ErrorCodeActions).
 
         Parameters:
         
@@ -77,23 +81,31 @@ def ProcessMessageError(messages:List[Message], entryInput:EntryInput):
         entryInput:EntryInput - The base entryInput object. It contains most of the
         objects the Entry script has access to.
 
+        Returns:
+
+        False if the request should be skipped(ERROR/FATAL message with a SKIP/RETRY code), True otherwise.
+
         Exceptions:
 
         MessageError        
 
     """
-
-    # If Message Type is ERROR or FATAL raise MessageError.
+    skip = False
     for message in messages:
-        if((message.Type == MessageType.ERROR) or (message.Type == MessageType.FATAL)):
-            raise MessageError(message, messages)
-    
-    # If the Message Code is in DangerErrorCodes raise MessageError.
-    for message in messages:        
-        if(message.Code in entryInput.ETradeSettings.DangerErrorCodes):
+        action = ETradeRetryPolicy.GetErrorAction(entryInput.ETradeSettings, message.Code)
+
+        # If the Message Code is ABORT raise MessageError.
+        if(action is ErrorAction.ABORT):
             entryInput.LogMessage(entryInput.Logger, f"Message type - {message.Type.name}", True, True)
             entryInput.LogMessage(entryInput.Logger, f"Message Code - {message.Code}", True, True)
             entryInput.LogMessage(entryInput.Logger, f"Message Description - {message.Description}", True, True)
             raise MessageError(message, messages)
 
-    return True
+        # If Message Type is ERROR or FATAL skip the request for the SKIP/RETRY codes, otherwise raise MessageError.
+        if((message.Type == MessageType.ERROR) or (message.Type == MessageType.FATAL)):
+            if(action is ErrorAction.SKIP or action is ErrorAction.RETRY):
+                skip = True
+            else:
+                raise MessageError(message, messages)
+
+    return not skip
@@ -1,9 +1,16 @@
-from decimal import Decimal
-from typing import List
+from decimal import ROUND_HALF_UP, Decimal
+from collections import defaultdict
+from typing import Dict, List, Tuple
 
+import numpy as np
 from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.CompiledPriceCoordinates import CompiledPriceCoordinates
+from BusinessModels.LimitOrdersBatch import LimitOrdersBatch
 from BusinessModels.OrderInfo import OrderInfo
-from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.Price import Price
+from BusinessModels.PriceCoordinate import BuyDeltaType
+from BusinessModels.PriceLadder import PriceLadder
 from BusinessModels.SellDeltaType import SellDeltaType
 from BusinessModels.Settings import Settings
 
@@ -17,12 +24,29 @@ class ManageOrdersHelpers:
 
         Settings - The settings of the system.
 
+        PriceLadders - Price ladders built so far by the key of the ladder.
+
+        CompiledPriceCoordinates - Price coordinates compiled so far by the key of the price coordinates.
+
+        PriceLadderArrays - Rung prices and quantities of the price ladders as arrays in the descending order 
+        of the price, by the key of the ladder.
+
         Methods:
 
+        GetCompiledPriceCoordinates - Gets the compiled price coordinates. The price coordinates of the stock items
+        built by GetActiveStockItem are already compiled.
+
+        GetPriceLadder - Gets the price ladder of a stock item. Ladder is rebuilt only when the
+        StartPrice or PriceCoordinates of the stock item change.
+
+        GetPriceLadderFor - Gets the price ladder for a given startprice and pricecoordinates.
+
         GetBuyPriceFromSellPrice - Gets the buy price of a given sell price for a stock item.
 
         GetSellPrice - Gets the sell price from a given buy price and stock item.
 
+        GetSellStepFactor - Gets the exact sell price to buy price ratio of a PERCENTAGE stock item.
+
         GetNextLimitPrice - Gets the next limit price(backwards or forwards) from the current price using
         the startprice and pricecoordinates.
 
@@ -34,6 +58,19 @@ class ManageOrdersHelpers:
         GeneratePossibleLimitOrders - Generates the possible limit orders(both BUY and SELL) for a given stock item 
         and portfolio quantity of the stock item.
 
+        GetPriceLadderArrays - Gets the rung prices and quantities of a price ladder as arrays.
+
+        RoundPrices - Rounds an array of price units to FloatRoundPrecision.
+
+        GenerateAllPossibleLimitOrders - Generates the possible limit orders of many stock items in one pass using
+        array operations.
+
+        GetOrderKey - Gets the key used to match a possible limit order with an open order.
+
+        DiffLimitOrders - Finds the possible limit orders which are not open and the open orders which are not possible.
+
+        IndexOrdersBySymbol - Groups the orders by the Symbol of their instruments.
+
 
     """
 
@@ -41,8 +78,80 @@ class ManageOrdersHelpers:
         """ Initialization method.
         """
         self.Settings = settings        
+        self.PriceLadders:Dict[tuple, PriceLadder] = {}
+        self.CompiledPriceCoordinates:Dict[tuple, CompiledPriceCoordinates] = {}
+        self.PriceLadderArrays:Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def GetCompiledPriceCoordinates(self, priceCoordinates) -> CompiledPriceCoordinates:
+        """ Gets the compiled price coordinates. Already compiled price coordinates are returned as is, 
+            lists are compiled once and cached by their key.
+
+            Parameters:
+
+            priceCoordinates - List of the price coordinates or compiled price coordinates.
+
+            Returns:
+
+            Compiled price coordinates.
+
+            Exceptions:
+
+            InvalidPriceCoordinatesError.
+
+        """
+        if isinstance(priceCoordinates, CompiledPriceCoordinates):
+            return priceCoordinates
+        key = CompiledPriceCoordinates.GetKey(priceCoordinates)
+        compiledPriceCoordinates = self.CompiledPriceCoordinates.get(key)
+        if compiledPriceCoordinates is None:
+            compiledPriceCoordinates = CompiledPriceCoordinates(priceCoordinates)
+            self.CompiledPriceCoordinates[key] = compiledPriceCoordinates
+        return compiledPriceCoordinates
+
+    def GetPriceLadderFor(self, startPrice:Decimal, priceCoordinates) -> PriceLadder:
+        """ Gets the price ladder for the given start price and price coordinates. Ladders are 
+            cached by their key, so the ladder is built only once.
+
+            Parameters:
+
+            startPrice:Decimal - Start price of the stock.
+
+            priceCoordinates - List of the price coordinates or compiled price coordinates.
+
+            Returns:
 
-    def GetBuyPriceFromSellPrice(self, activeStockItem:ActiveStockItem, sellPrice:float) -> float:
+            Price ladder.
+
+        """
+        compiledPriceCoordinates = self.GetCompiledPriceCoordinates(priceCoordinates)
+        key = PriceLadder.GetKey(startPrice, compiledPriceCoordinates)
+        priceLadder = self.PriceLadders.get(key)
+        if priceLadder is None:
+            priceLadder = PriceLadder(startPrice, compiledPriceCoordinates, self.Settings.FloatRoundPrecision)
+            self.PriceLadders[key] = priceLadder
+        return priceLadder
+
+    def GetPriceLadder(self, activeStockItem:ActiveStockItem) -> PriceLadder:
+        """ Gets the price ladder of the stock item. The ladder is stored in the stock item and
+            rebuilt only when the StartPrice or PriceCoordinates change.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Stock item details.
+
+            Returns:
+
+            Price ladder of the stock item.
+
+        """
+        priceLadder = activeStockItem.PriceLadder
+        if priceLadder is None or priceLadder.Key != PriceLadder.GetKey(activeStockItem.StartPrice, 
+                                    self.GetCompiledPriceCoordinates(activeStockItem.PriceCoordinates)):
+            priceLadder = self.GetPriceLadderFor(activeStockItem.StartPrice, activeStockItem.PriceCoordinates)
+            activeStockItem.PriceLadder = priceLadder
+        return priceLadder
+
+    def GetBuyPriceFromSellPrice(self, activeStockItem:ActiveStockItem, sellPrice) -> Price:
         """ Gets a buy price from sell price using the stock item.
             The buy price is calculated using the SellStepType of the stock item.
 
@@ -58,7 +167,7 @@ class ManageOrdersHelpers:
 
             activeStockItem:ActiveStockItem - Stock item details.
 
-            sellPrice:float - The sell price for which we need the buy price.
+            sellPrice - The sell price for which we need the buy price. Price, float, Decimal or int.
 
             Returns:
 
@@ -67,18 +176,17 @@ class ManageOrdersHelpers:
 
         if(activeStockItem.SellStepType == SellDeltaType.NEXTBUYPRICE):
             # Return the next(backward) buy price.
-            return self.GetNextLimitPrice(activeStockItem.StartPrice, sellPrice, 
-                                                activeStockItem.PriceCoordinates, True) 
+            return self.GetPriceLadder(activeStockItem).GetPreviousPrice(sellPrice)
         elif(activeStockItem.SellStepType == SellDeltaType.FIXED):
             # return (sellPrice - SellStepSize).
-            return round(sellPrice - activeStockItem.SellStepSize, self.Settings.FloatRoundPrecision)
+            return (Price.From(sellPrice) - activeStockItem.SellStepSize).Round(self.Settings.FloatRoundPrecision)
         elif(activeStockItem.SellStepType == SellDeltaType.PERCENTAGE):
             # return sellPrice / (1 + (activeStockItem.SellStepSize * 0.01)).
-            return round(sellPrice / (1 + (activeStockItem.SellStepSize * 0.01)), self.Settings.FloatRoundPrecision)
+            return (Price.From(sellPrice) / self.GetSellStepFactor(activeStockItem)).Round(self.Settings.FloatRoundPrecision)
         else:
             raise Exception(f"UnSupported SellStepType - {activeStockItem.SellStepType}")
 
-    def GetSellPrice(self, activeStockItem:ActiveStockItem, currentBuyPrice:float) -> float:
+    def GetSellPrice(self, activeStockItem:ActiveStockItem, currentBuyPrice) -> Price:
         """ Returns the Sell Price for a given Buy Price.
 
             If SellStepType is NEXTBUYPRICE return next limit price(forward).
@@ -93,7 +201,7 @@ class ManageOrdersHelpers:
 
             activeStockItem:ActiveStockItem - The stock item information.
 
-            currentBuyPrice:float - The Buy price for which we need Sell Price.
+            currentBuyPrice - The Buy price for which we need Sell Price. Price, float, Decimal or int.
 
             Returns:
 
@@ -102,19 +210,33 @@ class ManageOrdersHelpers:
         """    
         if(activeStockItem.SellStepType == SellDeltaType.NEXTBUYPRICE):
             # Return the next(forward) buy price.
-            return self.GetNextLimitPrice(activeStockItem.StartPrice, currentBuyPrice, 
-                                                activeStockItem.PriceCoordinates, False) 
+            return self.GetPriceLadder(activeStockItem).GetNextPrice(currentBuyPrice)
         elif(activeStockItem.SellStepType == SellDeltaType.FIXED):
             # return (BuyPrice + SellStepSize).
-            return round(currentBuyPrice + activeStockItem.SellStepSize, self.Settings.FloatRoundPrecision)
+            return (Price.From(currentBuyPrice) + activeStockItem.SellStepSize).Round(self.Settings.FloatRoundPrecision)
         elif(activeStockItem.SellStepType == SellDeltaType.PERCENTAGE):
             # return BuyPrice + (SellStepSize percentage of BuyPrice).
-            return round(currentBuyPrice * (1 + (activeStockItem.SellStepSize * 0.01)), self.Settings.FloatRoundPrecision)
+            return (Price.From(currentBuyPrice) * self.GetSellStepFactor(activeStockItem)).Round(self.Settings.FloatRoundPrecision)
         else:
             raise Exception(f"UnSupported SellStepType - {activeStockItem.SellStepType}")
 
-    def GetNextLimitPrice(self, startPrice:Decimal, currentPrice:Decimal, priceCoordinates:List[PriceCoordinate], 
-                                isPrevious:bool = True) -> float:
+    def GetSellStepFactor(self, activeStockItem:ActiveStockItem) -> Decimal:
+        """ Gets the sell price to buy price ratio (1 + (SellStepSize * 0.01)) of a PERCENTAGE stock item
+            as an exact Decimal.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - The stock item information.
+
+            Returns:
+
+            Decimal - Sell price to buy price ratio.
+
+        """
+        return 1 + Price.From(activeStockItem.SellStepSize).ToDecimal() / 100
+
+    def GetNextLimitPrice(self, startPrice:Decimal, currentPrice:Decimal, priceCoordinates, 
+                                isPrevious:bool = True) -> Price:
         """ Returns the next limit price. If isPrevious is True backward price is returned else 
             forward price is returned.
 
@@ -124,7 +246,7 @@ class ManageOrdersHelpers:
 
             currentPrice:Decimal - The price from which you need the next price.
 
-            priceCoordinates:List[PriceCoordinate] - Price coordinates.
+            priceCoordinates - Price coordinates. List or compiled price coordinates.
 
             isPrevious:bool - If True backward price is returned else 
             forward price is returned.
@@ -132,57 +254,23 @@ class ManageOrdersHelpers:
             Returns:
 
             Next limit price. Backwards or Forward based on isPrevious parameter.
+            If the current price is not on the ladder, forward price is the next higher rung.
 
         """
 
-        # Sort the price coordinates in the descending order of StartPrice.
-        priceCoordinates.sort(key= lambda x:x.StartPrice, reverse=True)
-
+        priceLadder = self.GetPriceLadderFor(startPrice, priceCoordinates)
         if isPrevious is True:
-            for coordinate in priceCoordinates:
-                # Find the coordinate to which the price belongs.
-                if(currentPrice >= coordinate.StartPrice): 
-                    # calculate the delta.
-                    delta:Decimal = coordinate.FixedBuyDelta          
-                    if(coordinate.BuyDeltaType == BuyDeltaType.MULTIPLIER):
-                        delta = int(currentPrice / coordinate.StartPrice) + 1      
-                    # calculate and return the next price(backwards).              
-                    previousPrice = round(currentPrice - delta, self.Settings.FloatRoundPrecision)
-                    return previousPrice
-        else:
-            # If current price is start price.
-            if(currentPrice == startPrice):
-                # Find the right coordinate, calculate detla and add it to currentBuyPrice.
-                for coordinate in priceCoordinates:
-                    if(currentPrice >= coordinate.StartPrice): 
-                        delta = coordinate.FixedBuyDelta
-                        if(coordinate.BuyDeltaType == BuyDeltaType.MULTIPLIER):
-                            delta = int(currentPrice / coordinate.StartPrice) + 1
-                        nextPrice = round(currentPrice + delta, self.Settings.FloatRoundPrecision)
-                        return nextPrice
-
-            # Current price cannot be greater than start price.
-            price = startPrice  
-            while True:
-                # We traverse backwards from the start price.
-                # Get the previous price.
-                previousPrice = self.GetNextLimitPrice(startPrice, price, priceCoordinates, True)
-                # If the previous price is current price. We found our next price(forward) which is
-                # avaiable in price variable.
-                if(previousPrice == currentPrice):
-                    return price
-                price = previousPrice
-
-        return 0
+            return priceLadder.GetPreviousPrice(currentPrice)
+        return priceLadder.GetNextPrice(currentPrice)
         
-    def GetQuantity(self, currentPrice:Decimal, priceCoordinates:List[PriceCoordinate]) -> int:
+    def GetQuantity(self, currentPrice:Decimal, priceCoordinates) -> int:
         """ Gets the quantity for a given price using the price coordinates.
 
             Parameters:
 
             currentPrice:Decimal - Price.
 
-            priceCoordinates:List[PriceCoordinate] - Price coordinates of the stock item.
+            priceCoordinates - Price coordinates of the stock item. List or compiled price coordinates.
 
             Returns:
 
@@ -190,54 +278,85 @@ class ManageOrdersHelpers:
 
         """
 
-        # Sort the price coordinates in the descending order of StartPrice.
-        priceCoordinates.sort(key= lambda x:x.StartPrice, reverse=True)
+        # Find the coordinate using the binary search on the compiled price coordinates.
+        return self.GetCompiledPriceCoordinates(priceCoordinates).GetQuantity(currentPrice)
 
-        # Find the coordinate and return its quantity.
-        for coordinate in priceCoordinates:
-            if(currentPrice >= coordinate.StartPrice):
-                return coordinate.Quantity
-        return 0
-
-    def CalculateMaxInvestment(self, startPrice:Decimal, priceCoordinates:List[PriceCoordinate], 
-                                    quantityMultiplier:int) -> float:
+    def CalculateMaxInvestment(self, startPrice:Decimal, priceCoordinates, 
+                                    quantityMultiplier:int) -> Decimal:
         """ Calculates the maximum investment for a given start price, pricecoordinates and 
             quantity multiplier. Starts from the start price, goes backwards and at each buy price
             calculates the investment and adds to the total investment.
 
+            The BUY prices are not visited one by one. Prices are converted to integer units of the
+            FloatRoundPrecision(cents) and the ladder is summed in blocks where the delta is constant.
+            Within a FIXED coordinate the prices are an arithmetic series. Within a MULTIPLIER coordinate
+            the delta int(price / StartPrice) + 1 is constant between multiples of the StartPrice.
+            Sum of the arithmetic series of n prices from price p with delta d is n * p - d * n * (n - 1) / 2.
+
             Parameters:
 
             startPrice:Decimal - The start price of the stock.
 
-            priceCoordinates:List[PriceCoordinate] - Price coordinates associated with the stock.
+            priceCoordinates - Price coordinates associated with the stock. List or compiled price coordinates.
 
             quantityMultiplier:int - Quantity multiplier.
 
             Returns:
 
-            Float - Maximum investment.
+            Decimal - Maximum investment.
 
         """
+        compiledPriceCoordinates = self.GetCompiledPriceCoordinates(priceCoordinates)
+
+        # Work in integer units of the smallest price(cents).
+        scale = 10 ** self.Settings.FloatRoundPrecision
+        price:Decimal = Decimal(str(startPrice)) * scale
+        totalUnits:Decimal = Decimal(0)
+
+        # Start price may be more precise than the smallest price. Add it and continue from the
+        # rounded previous price, same as GetNextLimitPrice. Half is rounded up, same as Price.Round.
+        if price > 0 and price != price.to_integral_value():
+            coordinate = compiledPriceCoordinates.GetCoordinate(price / scale)
+            if coordinate is None:
+                return Decimal(0)
+            totalUnits = price * coordinate.Quantity
+            price = (price - Decimal(str(compiledPriceCoordinates.GetDelta(price / scale, coordinate))) * scale).to_integral_value(rounding=ROUND_HALF_UP)
+
+        price = int(price)
+        while price > 0:
+            coordinate = compiledPriceCoordinates.GetCoordinate(Decimal(price) / scale)
+            if coordinate is None:
+                break
+            coordinateStartPrice = Decimal(str(coordinate.StartPrice)) * scale
+
+            # Delta and the lowest price of the block where the delta is constant.
+            if coordinate.BuyDeltaType == BuyDeltaType.MULTIPLIER:
+                multiple = int(price / coordinateStartPrice)
+                delta = Decimal(multiple + 1) * scale
+                blockStartPrice = multiple * coordinateStartPrice
+            else:
+                delta = Decimal(str(coordinate.FixedBuyDelta)) * scale
+                blockStartPrice = coordinateStartPrice
+
+            # Delta is not whole number of units. Prices are rounded at each step, so go one price at a time.
+            if delta != delta.to_integral_value():
+                previousPrice = int((price - delta).to_integral_value(rounding=ROUND_HALF_UP))
+                if previousPrice >= price:
+                    raise ValueError(f"Price coordinate with StartPrice {coordinate.StartPrice} does not move the price backwards from {Decimal(price) / scale}.")
+                totalUnits = totalUnits + price * coordinate.Quantity
+                price = previousPrice
+                continue
 
-        currentPrice:Decimal = startPrice
-        nextPrice:Decimal = 0
-        currentTotal:Decimal = 0
-        
-        while True:  
-            # At each price, get quantity      
-            quantity = self.GetQuantity(currentPrice, priceCoordinates)
-            # Get the next(backwards) price.
-            nextPrice = self.GetNextLimitPrice(startPrice, currentPrice, priceCoordinates, True)
-            if(currentPrice <= 0):
-                break        
-
-            # Add to the tracking total.
-            currentTotal = round(currentTotal + currentPrice * quantity * quantityMultiplier, self.Settings.FloatRoundPrecision)
-
-            # Set the price to next(backwards) price and continue the loop.
-            currentPrice = nextPrice
-        
-        return currentTotal
+            # Number of prices in the block, prices should be greater than zero.
+            delta = int(delta)
+            lowestPrice = max(blockStartPrice, Decimal(1))
+            count = int((price - lowestPrice) // delta) + 1
+
+            # Sum of the arithmetic series.
+            totalUnits = totalUnits + (count * price - delta * count * (count - 1) // 2) * coordinate.Quantity
+            price = price - count * delta
+
+        return totalUnits * quantityMultiplier / scale
 
     def GeneratePossibleLimitOrders(self, activeStockItem:ActiveStockItem, portfolioPositionQuantity:int) -> List[OrderInfo]:
         """ Generates the possible limit orders for the given stock item and portfolio quantity.
@@ -260,24 +379,21 @@ class ManageOrdersHelpers:
         orderIdNew = Settings.NewOrderId
         limitOrders:List[OrderInfo] = []
 
-        # Initialize to start price.
-        limitPrice = activeStockItem.StartPrice
+        # Ladder of the BUY prices and quantities of the stock item.
+        priceLadder = self.GetPriceLadder(activeStockItem)
 
-        # Local price coordinates variable sorted by startprice.
-        priceCoordinates:List[PriceCoordinate] = activeStockItem.PriceCoordinates
-        priceCoordinates.sort(key= lambda x:x.StartPrice, reverse=True)
+        # Initialize to start price, which is the highest rung of the ladder.
+        rungIndex = len(priceLadder.Prices) - 1
+        limitPrice, quantity = priceLadder.GetRung(rungIndex)
+        quantity = quantity * activeStockItem.QuantityMultiplier
 
-        quantity:int = 0 
         totalQuantity:int = 0
-
-        # Get the quantity at the startprice.
-        quantity = self.GetQuantity(limitPrice, priceCoordinates) * activeStockItem.QuantityMultiplier
         
         # Track if first BUY order is partial.
         isFirstBuyOrderPartial = False
 
         # Generate SELL orders.
-        while True:
+        while rungIndex >= 0:
             totalQuantity = totalQuantity + quantity
 
             # Total quantity exceeds portfolio quantity.
@@ -309,12 +425,14 @@ class ManageOrdersHelpers:
                     price, quantity, False, True)) 
 
             # Get next limit price(backwards) and it's quantity.
-            limitPrice = self.GetNextLimitPrice(activeStockItem.StartPrice, limitPrice, 
-                                            priceCoordinates, True)
-            quantity = self.GetQuantity(limitPrice, priceCoordinates) * activeStockItem.QuantityMultiplier
+            rungIndex = rungIndex - 1
+            limitPrice, quantity = priceLadder.GetRung(rungIndex)
+            quantity = quantity * activeStockItem.QuantityMultiplier
 
-        # Generate BUY orders.
+        # Generate BUY orders. No BUY orders below the lowest rung of the ladder.
         for i in range(activeStockItem.MaxActiveBuy):
+            if rungIndex < 0:
+                break
             
             # Add BUY order. isFirstBuyOrderPartial = True => Partial Order
             limitOrders.append(OrderInfo(orderIdNew, activeStockItem.Symbol, 
@@ -324,9 +442,251 @@ class ManageOrdersHelpers:
             isFirstBuyOrderPartial = False
 
             # Get next price(backwards) and quantity.
-            limitPrice = self.GetNextLimitPrice(activeStockItem.StartPrice, limitPrice, 
-                                            priceCoordinates, True)
-            quantity = self.GetQuantity(limitPrice, priceCoordinates) * activeStockItem.QuantityMultiplier
+            rungIndex = rungIndex - 1
+            limitPrice, quantity = priceLadder.GetRung(rungIndex)
+            quantity = quantity * activeStockItem.QuantityMultiplier
 
         return limitOrders
 
+    def GetPriceLadderArrays(self, priceLadder:PriceLadder) -> Tuple[np.ndarray, np.ndarray]:
+        """ Gets the rung prices and quantities of the ladder as arrays in the descending order of the price.
+            Arrays are created once per ladder.
+
+            Parameters:
+
+            priceLadder:PriceLadder - Price ladder.
+
+            Returns:
+
+            Tuple[np.ndarray, np.ndarray] - [Price units, Quantities]
+
+        """
+        priceLadderArrays = self.PriceLadderArrays.get(priceLadder.Key)
+        if priceLadderArrays is None:
+            priceLadderArrays = (np.array(priceLadder.PriceUnits[::-1], dtype=np.int64), 
+                                    np.array(priceLadder.Quantities[::-1], dtype=np.int64))
+            self.PriceLadderArrays[priceLadder.Key] = priceLadderArrays
+        return priceLadderArrays
+
+    def RoundPrices(self, priceUnits:np.ndarray) -> np.ndarray:
+        """ Rounds the price units(positive) to FloatRoundPrecision, same as Price.Round.
+
+            Parameters:
+
+            priceUnits:np.ndarray - Price units.
+
+            Returns:
+
+            np.ndarray - Rounded price units.
+
+        """
+        if self.Settings.FloatRoundPrecision >= Price.Scale:
+            return priceUnits
+        step = 10 ** (Price.Scale - self.Settings.FloatRoundPrecision)
+        return (priceUnits + step // 2) // step * step
+
+    def GenerateAllPossibleLimitOrders(self, activeStockItems:List[ActiveStockItem], 
+                                        portfolioPositionQuantities:Dict[str, int]) -> LimitOrdersBatch:
+        """ Generates the possible limit orders for all the given stock items in one pass. Orders are
+            exactly same as the orders generated by GeneratePossibleLimitOrders for each stock item.
+
+            The rungs of all the stock items are concatenated(highest price first). Cumulative sum of the
+            quantities is used to find the partial SELL of each stock item and the SELL prices are
+            calculated for all the rungs at once. Prices are Price units(int64), so the SELL prices are
+            rounded exactly like GetSellPrice.
+
+            Parameters:
+
+            activeStockItems:List[ActiveStockItem] - The stock items.
+
+            portfolioPositionQuantities:Dict[str, int] - Number of stocks in the portfolio by Symbol. 
+            Quantity is 0 if the Symbol is not present.
+
+            Return:
+
+            LimitOrdersBatch - Limit orders of all the stock items.
+
+        """
+        symbols:List[str] = []
+        prices:List[np.ndarray] = []
+        quantities:List[np.ndarray] = []
+        sellStepTypes:List[int] = []
+        nextStartPrices:List[int] = []
+
+        for activeStockItem in activeStockItems:
+            priceLadder = self.GetPriceLadder(activeStockItem)
+            ladderPrices, ladderQuantities = self.GetPriceLadderArrays(priceLadder)
+            symbols.append(activeStockItem.Symbol)
+            prices.append(ladderPrices)
+            quantities.append(ladderQuantities * activeStockItem.QuantityMultiplier)
+            sellStepTypes.append(activeStockItem.SellStepType.value)
+            # SELL price of the start price when the SellStepType is NEXTBUYPRICE.
+            nextStartPrices.append(priceLadder.GetNextPrice(activeStockItem.StartPrice).Units 
+                                    if activeStockItem.SellStepType == SellDeltaType.NEXTBUYPRICE else 0)
+
+        symbolCount = len(symbols)
+        counts = np.array([len(ladderPrices) for ladderPrices in prices], dtype=np.int64)
+        portfolioQuantities = np.array([portfolioPositionQuantities.get(symbol, 0) for symbol in symbols], dtype=np.int64)
+        maxActiveBuys = np.array([activeStockItem.MaxActiveBuy for activeStockItem in activeStockItems], dtype=np.int64)
+        sellStepSizes = np.array([Price.From(activeStockItem.SellStepSize).Units for activeStockItem in activeStockItems], dtype=np.int64)
+
+        # Rungs of all the stock items. starts/ends are the rung ranges of each stock item.
+        allPrices = np.concatenate(prices) if symbolCount != 0 else np.zeros(0, dtype=np.int64)
+        allQuantities = np.concatenate(quantities) if symbolCount != 0 else np.zeros(0, dtype=np.int64)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        rungIndexes = np.arange(len(allPrices))
+
+        # Cumulative quantities, first value 0 so that cumulative quantity before rung i is at i.
+        cumulativeQuantities = np.concatenate(([0], np.cumsum(allQuantities)))
+        baseQuantities = cumulativeQuantities[starts]
+
+        # First rung where the cumulative quantity exceeds the portfolio quantity. This is where the
+        # BUY orders start. Rungs above are SELL orders.
+        firstBuyIndexes = np.searchsorted(cumulativeQuantities[1:], baseQuantities + portfolioQuantities, side="right")
+        firstBuyIndexes = np.minimum(np.maximum(firstBuyIndexes, starts), ends)
+
+        # Partial order if the portfolio quantity ends in the middle of the first BUY rung.
+        soldQuantities = cumulativeQuantities[firstBuyIndexes] - baseQuantities
+        isPartial = (firstBuyIndexes < ends) & (soldQuantities != portfolioQuantities)
+        partialSellQuantities = portfolioQuantities - soldQuantities
+
+        # Stock item values for each rung.
+        rungFirstBuyIndexes = np.repeat(firstBuyIndexes, counts)
+        rungIsPartial = np.repeat(isPartial, counts)
+        rungMaxActiveBuys = np.repeat(maxActiveBuys, counts)
+        rungSellStepTypes = np.repeat(np.array(sellStepTypes, dtype=np.int64), counts)
+        rungSellStepSizes = np.repeat(sellStepSizes, counts)
+
+        isFullSell = rungIndexes < rungFirstBuyIndexes
+        isPartialRung = (rungIndexes == rungFirstBuyIndexes) & rungIsPartial
+        isBuy = (rungIndexes >= rungFirstBuyIndexes) & (rungIndexes < rungFirstBuyIndexes + rungMaxActiveBuys)
+
+        # SELL price of each rung. NEXTBUYPRICE is the previous(higher) rung or next price of the start price.
+        nextBuyPrices = np.empty_like(allPrices)
+        nextBuyPrices[1:] = allPrices[:-1]
+        nonEmpty = counts != 0
+        nextBuyPrices[starts[nonEmpty]] = np.array(nextStartPrices, dtype=np.int64)[nonEmpty]
+        # PERCENTAGE is P * (1 + SellStepSize / 100), SellStepSize is in units. Rounded to units first same as Price.
+        percentageDenominator = 100 * Price.UnitsPerDollar
+        percentagePrices = (allPrices * (percentageDenominator + rungSellStepSizes) + percentageDenominator // 2) // percentageDenominator
+        sellPrices = np.select(
+            [rungSellStepTypes == SellDeltaType.FIXED.value, rungSellStepTypes == SellDeltaType.PERCENTAGE.value],
+            [self.RoundPrices(allPrices + rungSellStepSizes), self.RoundPrices(percentagePrices)],
+            nextBuyPrices)
+
+        # SELL rows followed by BUY rows. Partial rung is part of both.
+        rungPartialSellQuantities = np.repeat(partialSellQuantities, counts)
+        sellRows = np.nonzero(isFullSell | isPartialRung)[0]
+        buyRows = np.nonzero(isBuy)[0]
+        sellQuantities = np.where(isPartialRung, rungPartialSellQuantities, allQuantities)
+        buyQuantities = np.where(isPartialRung, allQuantities - rungPartialSellQuantities, allQuantities)
+
+        rungSymbolIndexes = np.repeat(np.arange(symbolCount), counts)
+        symbolIndexes = np.concatenate((rungSymbolIndexes[sellRows], rungSymbolIndexes[buyRows]))
+        sections = np.concatenate((np.zeros(len(sellRows), dtype=np.int64), np.ones(len(buyRows), dtype=np.int64)))
+        order = np.lexsort((np.concatenate((sellRows, buyRows)), sections, symbolIndexes))
+
+        limitPrices = np.concatenate((sellPrices[sellRows], allPrices[buyRows]))[order]
+        orderQuantities = np.concatenate((sellQuantities[sellRows], buyQuantities[buyRows]))[order]
+        isPartialFilled = np.concatenate((isPartialRung[sellRows], isPartialRung[buyRows]))[order]
+        isSell = np.concatenate((np.ones(len(sellRows), dtype=bool), np.zeros(len(buyRows), dtype=bool)))[order]
+        symbolIndexes = symbolIndexes[order]
+
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(symbolIndexes, minlength=symbolCount))))
+
+        return LimitOrdersBatch(symbols, offsets, symbolIndexes, limitPrices, orderQuantities, isPartialFilled, isSell)
+
+    @staticmethod
+    def GetOrderKey(orderInfo:OrderInfo) -> tuple:
+        """ Gets the key used to match a possible limit order with an open order. Two orders
+            with the same key are same orders, the OrderId and the partial flag are not part of the key.
+            The quantity of an open order is its remaining quantity, so an order placed for a partial
+            rung(not filled yet) and a partially filled order match the partial possible limit order.
+
+            Parameters:
+
+            orderInfo:OrderInfo - Order.
+
+            Returns:
+
+            tuple - (Symbol, IsSell, LimitPrice, Quantity)
+
+        """
+        return orderInfo.GetKey()
+
+    def DiffLimitOrders(self, limitOrders:List[OrderInfo], 
+                            openLimitOrders:List[OrderInfo]) -> Tuple[List[OrderInfo], List[OrderInfo]]:
+        """ Compares the possible limit orders with the open orders as multisets using GetOrderKey.
+            Open orders matching a possible limit order(including partially filled orders) are left
+            as they are. Same order can be present more than once, each open order matches only one
+            possible limit order.
+
+            Parameters:
+
+            limitOrders:List[OrderInfo] - Possible limit orders.
+
+            openLimitOrders:List[OrderInfo] - Open orders.
+
+            Returns:
+
+            Tuple[List[OrderInfo], List[OrderInfo]] - [Orders to Place, Orders to Cancel]. 
+            Orders are in the same order as the input.
+
+        """
+        # Number of open orders by key, reduced as they are matched.
+        openCounts:Dict[tuple, int] = defaultdict(int)
+        for openLimitOrder in openLimitOrders:
+            openCounts[ManageOrdersHelpers.GetOrderKey(openLimitOrder)] += 1
+
+        placeOrders:List[OrderInfo] = []
+        matchedCounts:Dict[tuple, int] = defaultdict(int)
+        for limitOrder in limitOrders:
+            key = ManageOrdersHelpers.GetOrderKey(limitOrder)
+            if openCounts[key] > 0:
+                openCounts[key] -= 1
+                matchedCounts[key] += 1
+            else:
+                placeOrders.append(limitOrder)
+
+        # Open orders which did not match any possible limit order are stale.
+        cancelOrders:List[OrderInfo] = []
+        for openLimitOrder in openLimitOrders:
+            key = ManageOrdersHelpers.GetOrderKey(openLimitOrder)
+            if matchedCounts[key] > 0:
+                matchedCounts[key] -= 1
+            else:
+                cancelOrders.append(openLimitOrder)
+
+        return placeOrders, cancelOrders
+
+    @staticmethod
+    def IndexOrdersBySymbol(orders:List[Order]) -> Dict[str, List[Order]]:
+        """ Groups the orders by the Symbol of their instruments. Symbols of the instruments are changed 
+            to upper case once here, so the orders can be compared using the upper case Symbol without
+            converting it again. An order with instruments of more than one Symbol is present under each Symbol.
+
+            Parameters:
+
+            orders:List[Order] - Orders, for example all the OPEN orders of the account.
+
+            Returns:
+
+            Dict[str, List[Order]] - Orders by Symbol(upper case).
+
+        """
+        ordersBySymbol:Dict[str, List[Order]] = {}
+        if orders is None:
+            return ordersBySymbol
+
+        for order in orders:
+            symbols = []
+            for orderDetail in order.OrderDetails:
+                for instrument in orderDetail.Instruments:
+                    instrument.Symbol = instrument.Symbol.upper()
+                    if instrument.Symbol not in symbols:
+                        symbols.append(instrument.Symbol)
+            for symbol in symbols:
+                ordersBySymbol.setdefault(symbol, []).append(order)
+
+        return ordersBySymbol
@@ -0,0 +1,189 @@
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.Settings import Settings
+
+
+class OrderBookDrift:
+    """ Differences found between the OrderBookMirror and the open orders of the API.
+
+        Attributes:
+
+        Reconciliations:int - Number of reconciliations with the API.
+
+        Missing:int - Open orders of the API which were not in the mirror, e.g. placed outside the MoneyMaker.
+
+        Stale:int - Orders of the mirror which were not open in the API anymore, e.g. filled orders.
+
+        Changed:int - Orders present in both with different details, e.g. partially filled orders.
+
+        LastDrift:int - Missing + Stale + Changed of the last reconciliation.
+
+    """
+    def __init__(self):
+        self.Reconciliations = 0
+        self.Missing = 0
+        self.Stale = 0
+        self.Changed = 0
+        self.LastDrift = 0
+
+    def __str__(self):
+        return f"Reconciliations - {self.Reconciliations}, Missing - {self.Missing}, Stale - {self.Stale}, " \
+            f"Changed - {self.Changed}, Last drift - {self.LastDrift}"
+
+
+class OrderBookMirror:
+    """ In memory mirror of the open orders of the account. Updated right away from the place and cancel
+        responses, and replaced with the open orders of the API every OrderBookReconciliationIntervalInSeconds
+        or after a mismatch(failed cancel, uncertain place, portfolio quantity change). Thread safe.
+
+        Attributes:
+
+        Settings - The settings of the system.
+
+        Orders:Dict[int, Order] - Open orders by OrderId.
+
+        Index:Dict[Tuple[str, str], Dict[int, Order]] - Open orders by (Symbol(upper case), OrderAction) and OrderId.
+
+        LastReconciliation:float - Time of the last reconciliation. None if not reconciled yet.
+
+        Mismatch:str - Reason of the mismatch detected since the last reconciliation. None if no mismatch.
+
+        Drift:OrderBookDrift - Differences found by the reconciliations.
+
+        Methods:
+
+        IsReconciliationDue - Should the open orders be fetched from the API?
+
+        Reconcile - Replaces the mirror with the open orders of the API and counts the drift.
+
+        GetOrdersBySymbol, GetOrders - Open orders by Symbol, of one Symbol and side.
+
+        AddOrder, RemoveOrder - Updates the mirror from the place and cancel responses.
+
+        MarkMismatch - The mirror may be wrong, reconcile in the next cycle.
+
+    """
+    def __init__(self, settings:Settings):
+        """ Initialization method.
+        """
+        self.Settings = settings
+        self.Orders:Dict[int, Order] = {}
+        self.Index:Dict[Tuple[str, str], Dict[int, Order]] = {}
+        self.LastReconciliation:float = None
+        self.Mismatch:str = None
+        self.Drift = OrderBookDrift()
+        self.Lock = Lock()
+
+    @staticmethod
+    def GetOrderKey(order:Order) -> Tuple[str, str]:
+        instrument:Instrument = order.OrderDetails[0].Instruments[0]
+        return (instrument.Symbol.upper(), instrument.OrderAction)
+
+    @staticmethod
+    def GetOrderState(order:Order) -> tuple:
+        return tuple((orderDetail.Status, orderDetail.LimitPrice, instrument.Symbol.upper(), instrument.OrderAction,
+                        instrument.OrderedQuantity, instrument.FilledQuantity)
+                        for orderDetail in order.OrderDetails for instrument in orderDetail.Instruments)
+
+    def IsReconciliationDue(self, now:float) -> bool:
+        """ True if the mirror was never reconciled, a mismatch was detected or the reconciliation interval passed.
+        """
+        with self.Lock:
+            return self.LastReconciliation is None or self.Mismatch is not None or \
+                now - self.LastReconciliation >= self.Settings.OrderBookReconciliationIntervalInSeconds
+
+    def Reconcile(self, orders:List[Order], now:float) -> int:
+        """ Replaces the mirror with the open orders of the API.
+
+            Parameters:
+
+            orders:List[Order] - Open orders of the account. Orders without instruments are ignored.
+
+            now:float - Current time, usually time.monotonic().
+
+            Returns:
+
+            int - Drift, number of orders missing, stale or changed in the mirror. Not counted for the first reconciliation.
+
+        """
+        orders = [order for order in (orders or []) if len(order.OrderDetails) != 0 and len(order.OrderDetails[0].Instruments) != 0]
+        with self.Lock:
+            apiOrders = {order.OrderId: order for order in orders}
+            missing = sum(1 for orderId in apiOrders if orderId not in self.Orders)
+            stale = sum(1 for orderId in self.Orders if orderId not in apiOrders)
+            changed = sum(1 for orderId, order in apiOrders.items()
+                            if orderId in self.Orders and self.GetOrderState(self.Orders[orderId]) != self.GetOrderState(order))
+            drift = missing + stale + changed if self.LastReconciliation is not None else 0
+            if self.LastReconciliation is not None:
+                self.Drift.Missing += missing
+                self.Drift.Stale += stale
+                self.Drift.Changed += changed
+            self.Drift.Reconciliations += 1
+            self.Drift.LastDrift = drift
+
+            self.Orders = apiOrders
+            self.Index = {}
+            for orderId, order in apiOrders.items():
+                self.Index.setdefault(self.GetOrderKey(order), {})[orderId] = order
+            self.LastReconciliation = now
+            self.Mismatch = None
+            return drift
+
+    def GetOrdersBySymbol(self) -> Dict[str, List[Order]]:
+        """ Open orders by Symbol(upper case), same as ManageOrdersHelpers.IndexOrdersBySymbol of the open orders.
+        """
+        with self.Lock:
+            ordersBySymbol:Dict[str, List[Order]] = {}
+            for (symbol, orderAction), orders in self.Index.items():
+                ordersBySymbol.setdefault(symbol, []).extend(orders.values())
+            return ordersBySymbol
+
+    def GetOrders(self, symbol:str, orderAction:str) -> List[Order]:
+        """ Open orders of the Symbol and side(BUY/SELL).
+        """
+        with self.Lock:
+            return list(self.Index.get((symbol.upper(), orderAction), {}).values())
+
+    def AddOrder(self, orderId:int, orderInfo:OrderInfo):
+        """ Adds the placed order.
+
+            Parameters:
+
+            orderId:int - OrderId from the place order response.
+
+            orderInfo:OrderInfo - Placed limit order.
+
+        """
+        instrument = Instrument()
+        instrument.Symbol = orderInfo.Symbol.upper()
+        instrument.SecurityType = "EQ"
+        instrument.OrderAction = "SELL" if orderInfo.IsSell else "BUY"
+        instrument.OrderedQuantity = orderInfo.Quantity
+        instrument.FilledQuantity = 0
+        orderDetail = OrderDetail()
+        orderDetail.Status = "OPEN"
+        orderDetail.LimitPrice = orderInfo.LimitPrice
+        orderDetail.Instruments = [instrument]
+        order = Order(orderId, "EQ", [orderDetail])
+        with self.Lock:
+            self.Orders[orderId] = order
+            self.Index.setdefault(self.GetOrderKey(order), {})[orderId] = order
+
+    def RemoveOrder(self, orderId:int):
+        """ Removes the cancelled order.
+        """
+        with self.Lock:
+            order = self.Orders.pop(orderId, None)
+            if order is not None:
+                self.Index.get(self.GetOrderKey(order), {}).pop(orderId, None)
+
+    def MarkMismatch(self, reason:str):
+        """ The mirror may be different from the API, it is reconciled in the next cycle.
+        """
+        with self.Lock:
+            if self.Mismatch is None:
+                self.Mismatch = reason
@@ -0,0 +1,204 @@
+import heapq
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Tuple
+
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+
+
+class PollingScheduler:
+    """ Decides when each stock item is processed again. Stock items are kept in a priority queue by the
+        time they are due. A stock item with the last traded price close to one of its limit orders is
+        processed again after PollingMinIntervalInSeconds. The interval of a stock item far from all of
+        its limit orders grows up to PollingMaxIntervalInSeconds. The requests of the last minute are
+        limited to MaxRequestsPerMinute by delaying the next cycle.
+
+        Times are in seconds, usually time.monotonic(). They are passed to the methods, so the scheduler
+        doesn't depend on the clock.
+
+        Attributes:
+
+        Settings - The settings of the system.
+
+        DueTimes:Dict[str, float] - Due time by Symbol(upper case).
+
+        Intervals:Dict[str, float] - Last interval by Symbol(upper case).
+
+        Queue:List[Tuple[float, str]] - Heap of (due time, Symbol). Entries with a due time different
+        from DueTimes are stale and skipped.
+
+        Requests:Deque[Tuple[float, int]] - (time, number of requests) of the cycles in the last minute.
+
+        LastCycleRequests:int - Number of requests of the last cycle. Expected number of requests of the next cycle.
+
+        Methods:
+
+        Schedule - Sets the due time of a symbol.
+
+        SetSymbols - Sets the symbols to schedule. New symbols are due right away.
+
+        GetDueSymbols - Gets the symbols due to be processed.
+
+        GetInterval - Calculates the next interval of a symbol from the distance to its limit orders.
+
+        Reschedule - Schedules a processed symbol again.
+
+        RecordRequests - Records the number of requests sent by a cycle.
+
+        GetWaitTime - Gets the time to wait before the next cycle.
+
+    """
+    BudgetWindowInSeconds = 60
+
+    def __init__(self, settings:Settings):
+        """ Initialization method.
+        """
+        self.Settings = settings
+        self.DueTimes:Dict[str, float] = {}
+        self.Intervals:Dict[str, float] = {}
+        self.Queue:List[Tuple[float, str]] = []
+        self.Requests:Deque[Tuple[float, int]] = deque()
+        self.LastCycleRequests:int = 0
+
+    def Schedule(self, symbol:str, dueTime:float):
+        self.DueTimes[symbol] = dueTime
+        heapq.heappush(self.Queue, (dueTime, symbol))
+
+    def SetSymbols(self, symbols:Iterable[str], now:float):
+        """ Sets the symbols to schedule. New symbols are due right away, symbols not in the list
+            are not scheduled anymore.
+        """
+        symbols = {symbol.upper() for symbol in symbols}
+        for symbol in list(self.DueTimes):
+            if symbol not in symbols:
+                del self.DueTimes[symbol]
+                self.Intervals.pop(symbol, None)
+        for symbol in symbols:
+            if symbol not in self.DueTimes:
+                self.Intervals[symbol] = self.Settings.PollingMinIntervalInSeconds
+                self.Schedule(symbol, now)
+
+    def GetDueSymbols(self, now:float) -> List[str]:
+        """ Gets the symbols due to be processed, the earliest first. The symbols are scheduled again
+            after PollingMinIntervalInSeconds, so a symbol is not lost if the cycle fails. Use Reschedule
+            after processing the symbol.
+
+            Parameters:
+
+            now:float - Current time.
+
+            Returns:
+
+            List[str] - Due symbols(upper case).
+
+        """
+        dueSymbols:List[str] = []
+        while len(self.Queue) != 0 and self.Queue[0][0] <= now:
+            dueTime, symbol = heapq.heappop(self.Queue)
+            if self.DueTimes.get(symbol) == dueTime and symbol not in dueSymbols:
+                dueSymbols.append(symbol)
+        for symbol in dueSymbols:
+            self.Schedule(symbol, now + self.Settings.PollingMinIntervalInSeconds)
+        return dueSymbols
+
+    def GetInterval(self, previousInterval:float, lastPrice:Price, limitPrices:List[Price]) -> float:
+        """ Calculates the next interval of a symbol.
+
+            Parameters:
+
+            previousInterval:float - Previous interval of the symbol.
+
+            lastPrice:Price - Last traded price. None if not known.
+
+            limitPrices:List[Price] - Limit prices of the BUY and SELL orders of the symbol.
+
+            Returns:
+
+            float - PollingMinIntervalInSeconds if the last price is within PollingNearTicks of a limit price.
+            Otherwise the previous interval multiplied by PollingIntervalGrowthFactor, limited by the distance
+            to the nearest limit price(in PollingNearTicks steps of PollingMinIntervalInSeconds) and
+            PollingMaxIntervalInSeconds.
+
+        """
+        minInterval = self.Settings.PollingMinIntervalInSeconds
+        maxInterval = self.Settings.PollingMaxIntervalInSeconds
+        interval = previousInterval * self.Settings.PollingIntervalGrowthFactor
+
+        if lastPrice is not None and lastPrice.Units > 0 and len(limitPrices) != 0:
+            tickUnits = Price.UnitsPerDollar // 10 ** self.Settings.FloatRoundPrecision
+            distanceInTicks = min(abs(lastPrice.Units - limitPrice.Units) for limitPrice in limitPrices) / tickUnits
+            if distanceInTicks <= self.Settings.PollingNearTicks:
+                return minInterval
+            interval = min(interval, minInterval * distanceInTicks / max(self.Settings.PollingNearTicks, 1))
+
+        return min(max(interval, minInterval), maxInterval)
+
+    def Reschedule(self, symbol:str, now:float, lastPrice:Price, limitPrices:List[Price], isSettled:bool = True) -> float:
+        """ Schedules a processed symbol again.
+
+            Parameters:
+
+            symbol:str - Symbol.
+
+            now:float - Current time.
+
+            lastPrice:Price - Last traded price. None if not known.
+
+            limitPrices:List[Price] - Limit prices of the BUY and SELL orders of the symbol.
+
+            isSettled:bool - False if orders were cancelled or placed, the symbol is processed again
+            after PollingMinIntervalInSeconds.
+
+            Returns:
+
+            float - Interval of the symbol.
+
+        """
+        symbol = symbol.upper()
+        if isSettled is False:
+            interval = self.Settings.PollingMinIntervalInSeconds
+        else:
+            interval = self.GetInterval(self.Intervals.get(symbol, self.Settings.PollingMinIntervalInSeconds), lastPrice, limitPrices)
+        self.Intervals[symbol] = interval
+        self.Schedule(symbol, now + interval)
+        return interval
+
+    def RecordRequests(self, now:float, count:int):
+        """ Records the number of requests sent by a cycle. Cycles without requests(nothing due) are not recorded.
+        """
+        if count <= 0:
+            return
+        self.Requests.append((now, count))
+        self.LastCycleRequests = count
+
+    def GetWaitTime(self, now:float) -> float:
+        """ Gets the time to wait before the next cycle. The next cycle starts when the earliest symbol is
+            due and the requests of the last minute and the next cycle are within MaxRequestsPerMinute.
+
+            Parameters:
+
+            now:float - Current time.
+
+            Returns:
+
+            float - Seconds to wait.
+
+        """
+        while len(self.Requests) != 0 and self.Requests[0][0] <= now - self.BudgetWindowInSeconds:
+            self.Requests.popleft()
+
+        while len(self.Queue) != 0 and self.DueTimes.get(self.Queue[0][1]) != self.Queue[0][0]:
+            heapq.heappop(self.Queue)
+        waitTime = float(self.Settings.PollingMaxIntervalInSeconds)
+        if len(self.Queue) != 0:
+            waitTime = min(waitTime, max(0.0, self.Queue[0][0] - now))
+
+        # Wait till enough requests are out of the window for the next cycle.
+        usedRequests = sum(count for _, count in self.Requests)
+        for requestTime, count in self.Requests:
+            if usedRequests + self.LastCycleRequests <= self.Settings.MaxRequestsPerMinute:
+                break
+            usedRequests -= count
+            waitTime = max(waitTime, requestTime + self.BudgetWindowInSeconds - now)
+
+        return waitTime
@@ -0,0 +1,103 @@
+from typing import Dict, FrozenSet, List, Tuple
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.PortfolioResponse import PortfolioPosition
+
+
+class PortfolioSnapshot:
+    """ Portfolio quantities of the last cycle and the state each stock item was last reconciled with.
+        A stock item reconciled with nothing to cancel or place gets a marker of its portfolio quantity and
+        the fingerprint of its open orders. While both stay the same, the possible limit orders and the
+        orders to cancel or place can't change, so the stock item is not processed again.
+
+        Attributes:
+
+        Quantities:Dict[str, int] - Portfolio quantities of the last cycle by Symbol(upper case).
+
+        QuantityDeltas:Dict[str, int] - Change of the portfolio quantities since the previous cycle by
+        Symbol(upper case). Only the changed symbols.
+
+        Markers:Dict[str, Tuple[int, FrozenSet[tuple], List[OrderInfo]]] - (quantity, fingerprint of the
+        open orders, possible limit orders) of the last reconciliation with nothing to do, by Symbol(upper case).
+
+        Methods:
+
+        Update - Sets the portfolio of the cycle and the quantity deltas.
+
+        GetOrdersFingerprint - Fingerprint of the open orders of a stock item.
+
+        SetMarker, ClearMarker - Sets/removes the marker of a stock item.
+
+        GetUnchangedLimitOrders - Possible limit orders of a stock item whose quantity and open orders are
+        the same as in its marker.
+
+    """
+    def __init__(self):
+        """ Initialization method.
+        """
+        self.Quantities:Dict[str, int] = {}
+        self.QuantityDeltas:Dict[str, int] = {}
+        self.Markers:Dict[str, Tuple[int, FrozenSet[tuple], List[OrderInfo]]] = {}
+
+    def Update(self, portfolioPositionsBySymbol:Dict[str, PortfolioPosition]) -> Dict[str, int]:
+        """ Sets the portfolio of the cycle.
+
+            Parameters:
+
+            portfolioPositionsBySymbol:Dict[str, PortfolioPosition] - Portfolio positions by Symbol(upper case).
+
+            Returns:
+
+            Dict[str, int] - Changed quantities since the previous cycle by Symbol(upper case). Symbols which
+            left the portfolio have a negative delta of their previous quantity.
+
+        """
+        quantities = {symbol: portfolioPosition.Quantity for symbol, portfolioPosition in portfolioPositionsBySymbol.items()}
+        quantityDeltas:Dict[str, int] = {}
+        for symbol in quantities.keys() | self.Quantities.keys():
+            delta = quantities.get(symbol, 0) - self.Quantities.get(symbol, 0)
+            if delta != 0:
+                quantityDeltas[symbol] = delta
+        self.Quantities = quantities
+        self.QuantityDeltas = quantityDeltas
+        return quantityDeltas
+
+    @staticmethod
+    def GetOrdersFingerprint(openOrders:List[Order]) -> FrozenSet[tuple]:
+        """ Fingerprint of the open orders of a stock item. Same for the same orders in any order, different if
+            an order is added, removed, replaced or (partially) filled.
+        """
+        return frozenset((order.OrderId, orderDetail.Status, orderDetail.LimitPrice, instrument.Symbol,
+                            instrument.OrderAction, instrument.OrderedQuantity, instrument.FilledQuantity)
+                            for order in openOrders for orderDetail in order.OrderDetails
+                            for instrument in orderDetail.Instruments)
+
+    def SetMarker(self, symbol:str, quantity:int, fingerprint:FrozenSet[tuple], limitOrders:List[OrderInfo]):
+        """ Sets the marker of a stock item reconciled with nothing to cancel or place.
+
+            Parameters:
+
+            symbol:str - Symbol.
+
+            quantity:int - Portfolio quantity of the stock item.
+
+            fingerprint:FrozenSet[tuple] - Fingerprint of the open orders(GetOrdersFingerprint).
+
+            limitOrders:List[OrderInfo] - Possible limit orders of the stock item.
+
+        """
+        self.Markers[symbol.upper()] = (quantity, fingerprint, limitOrders)
+
+    def ClearMarker(self, symbol:str):
+        """ Removes the marker of a stock item, it is processed in the next reconciliation.
+        """
+        self.Markers.pop(symbol.upper(), None)
+
+    def GetUnchangedLimitOrders(self, symbol:str, quantity:int, fingerprint:FrozenSet[tuple]) -> List[OrderInfo]:
+        """ Possible limit orders of the marker if the quantity and the fingerprint are the same. None otherwise.
+        """
+        marker = self.Markers.get(symbol.upper())
+        if marker is None or marker[0] != quantity or marker[1] != fingerprint:
+            return None
+        return marker[2]
@@ -0,0 +1,109 @@
+from typing import Dict, List, Tuple
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+
+
+class ReconciliationBands:
+    """ Decides which stock items are reconciled(open orders fetched and compared with the possible limit orders)
+        in a cycle. After a stock item is reconciled with nothing to cancel or place, its band is the price interval
+        between the highest BUY and the lowest SELL limit order. The open orders of the stock item can't change
+        while the last price stays inside the band and the portfolio quantity stays the same, so the stock item
+        is skipped. All the stock items are reconciled every FullReconciliationIntervalInSeconds.
+
+        Attributes:
+
+        Settings - The settings of the system.
+
+        Bands:Dict[str, Tuple[Price, Price]] - (highest BUY, lowest SELL) by Symbol(upper case). None if there is
+        no BUY/SELL order.
+
+        Quantities:Dict[str, int] - Portfolio quantity at the time of the reconciliation by Symbol(upper case).
+
+        LastFullReconciliation:float - Time of the last full reconciliation. None if not done yet.
+
+        Methods:
+
+        SetBand - Sets the band of a reconciled stock item.
+
+        ClearBand - Removes the band, the stock item is reconciled in the next cycle.
+
+        GetLimitPrices - Limit prices at the edges of the band.
+
+        NeedsReconciliation - Is the last price outside the band or the quantity changed?
+
+        GetSymbolsToReconcile - Symbols to reconcile in the cycle.
+
+    """
+    def __init__(self, settings:Settings):
+        """ Initialization method.
+        """
+        self.Settings = settings
+        self.Bands:Dict[str, Tuple[Price, Price]] = {}
+        self.Quantities:Dict[str, int] = {}
+        self.LastFullReconciliation:float = None
+
+    def SetBand(self, symbol:str, limitOrders:List[OrderInfo], quantity:int):
+        """ Sets the band of a reconciled stock item with nothing to cancel or place.
+
+            Parameters:
+
+            symbol:str - Symbol.
+
+            limitOrders:List[OrderInfo] - Open limit orders of the stock item.
+
+            quantity:int - Portfolio quantity of the stock item.
+
+        """
+        symbol = symbol.upper()
+        buyPrices = [limitOrder.LimitPrice for limitOrder in limitOrders if limitOrder.IsSell is False]
+        sellPrices = [limitOrder.LimitPrice for limitOrder in limitOrders if limitOrder.IsSell is True]
+        self.Bands[symbol] = (max(buyPrices) if len(buyPrices) != 0 else None, min(sellPrices) if len(sellPrices) != 0 else None)
+        self.Quantities[symbol] = quantity
+
+    def ClearBand(self, symbol:str):
+        """ Removes the band of the stock item, it is reconciled in the next cycle.
+        """
+        self.Bands.pop(symbol.upper(), None)
+        self.Quantities.pop(symbol.upper(), None)
+
+    def GetLimitPrices(self, symbol:str) -> List[Price]:
+        """ Highest BUY and lowest SELL limit prices of the stock item, the limit orders closest to the last price.
+        """
+        return [limitPrice for limitPrice in self.Bands.get(symbol.upper(), ()) if limitPrice is not None]
+
+    def NeedsReconciliation(self, symbol:str, lastPrice:Price, quantity:int) -> bool:
+        """ True if the stock item has no band, the last price is not known or not strictly inside the band,
+            or the portfolio quantity changed since the reconciliation.
+        """
+        symbol = symbol.upper()
+        band = self.Bands.get(symbol)
+        if band is None or lastPrice is None or self.Quantities.get(symbol) != quantity:
+            return True
+        highestBuy, lowestSell = band
+        return (highestBuy is not None and lastPrice <= highestBuy) or (lowestSell is not None and lastPrice >= lowestSell)
+
+    def GetSymbolsToReconcile(self, symbols:List[str], lastPrices:Dict[str, Price], quantities:Dict[str, int], now:float) -> List[str]:
+        """ Symbols to reconcile in the cycle. All the symbols if the full reconciliation is due.
+
+            Parameters:
+
+            symbols:List[str] - Symbols of the cycle.
+
+            lastPrices:Dict[str, Price] - Last prices by Symbol(upper case).
+
+            quantities:Dict[str, int] - Portfolio quantities by Symbol(upper case). Missing symbols have 0 quantity.
+
+            now:float - Current time, usually time.monotonic().
+
+            Returns:
+
+            List[str] - Symbols to reconcile, in the order of the symbols.
+
+        """
+        if self.LastFullReconciliation is None or now - self.LastFullReconciliation >= self.Settings.FullReconciliationIntervalInSeconds:
+            self.LastFullReconciliation = now
+            return list(symbols)
+        return [symbol for symbol in symbols
+                    if self.NeedsReconciliation(symbol, lastPrices.get(symbol.upper()), quantities.get(symbol.upper(), 0))]
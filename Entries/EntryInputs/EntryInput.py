@@ -7,6 +7,9 @@ from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
 from ETrade.ETradeBusinessServices.ETradeAuthorization import \
     ETradeAuthorization
 from ETrade.ETradeBusinessUtils.ETradeConfiguration import ETradeConfiguration
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
 from Strings.FormatStringsBase import FormatStringsBase
 
 
@@ -33,6 +36,10 @@ class EntryInput:
 
         InputModel:ETradeInputModel - ETrade input.
 
+        SessionPool:ETradeSessionPool - Keep-alive OAuth1 session shared by all the ETrade services.
+        Sized to the number of stock items processed at the same time. Its RateLimiter paces the requests
+        of the sync and async services and its RetryPolicy retries their transient failures.
+
         Auth:ETradeAuthorization - Authorization service object.
 
         LogMessage - Log message method. All the entry level logging goes through this method.
@@ -46,9 +53,12 @@ class EntryInput:
         self.Configuration:ETradeConfiguration = ETradeConfiguration(self.Settings.ConfigFilePathWithName)
 
         self.Strings:FormatStringsBase = FormatStringsBase()
-        self.Logger:AppLogger = AppLogger(self.Settings.LogFilePathWithName, "AppLogger")
+        self.Logger:AppLogger = AppLogger(self.Settings.LogFilePathWithName, "AppLogger", self.Settings.LogLevel)
         self.Context:Context = Context(logger = self.Logger)
         accessToken, accessTokenSecret, dateTimeObj = self.Configuration.GetLatestETradeAccessKeyDetails()
         self.InputModel:ETradeInputModel = ETradeInputModel(accessToken, accessTokenSecret, dateTimeObj) 
-        self.Auth:ETradeAuthorization = ETradeAuthorization(self.InputModel, self.ETradeSettings, self.Context, self.Strings)
+        self.SessionPool:ETradeSessionPool = ETradeSessionPool(self.ETradeSettings.ConsumerKey, self.ETradeSettings.ConsumerSecret,
+                                                accessToken, accessTokenSecret, max(self.Settings.MaxConcurrentStockItems, 1),
+                                                ETradeRateLimiter(self.ETradeSettings), ETradeRetryPolicy(self.ETradeSettings))
+        self.Auth:ETradeAuthorization = ETradeAuthorization(self.InputModel, self.ETradeSettings, self.Context, self.Strings, self.SessionPool)
         self.LogMessage = LogMessage                
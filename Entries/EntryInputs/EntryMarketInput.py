@@ -14,5 +14,5 @@ class EntryMarketInput(EntryInput):
     def __init__(self):
         super().__init__()
         self.Market:ETradeMarket = ETradeMarket(inputModel = self.InputModel, settings = self.ETradeSettings, 
-                                context = self.Context, strings = self.Strings)   
+                                context = self.Context, strings = self.Strings, sessionPool = self.SessionPool)   
 
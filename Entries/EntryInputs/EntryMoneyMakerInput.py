@@ -2,10 +2,17 @@ from typing import List
 
 from BusinessModels.ActiveStockItem import ActiveStockItem
 from BusinessUtils.AppLogger import AppLogger
+from BusinessUtils.MarketCalendar import MarketCalendar
 from Entries.ActiveStocks import ActiveStockItems
 from Entries.EntryInputs.EntryInput import EntryInput
+from ETrade.ETradeBusinessServices.AsyncETradeAccount import \
+    AsyncETradeAccount
+from ETrade.ETradeBusinessServices.AsyncETradeMarket import AsyncETradeMarket
+from ETrade.ETradeBusinessServices.AsyncETradeOrder import AsyncETradeOrder
 from ETrade.ETradeBusinessServices.ETradeAccount import ETradeAccount
+from ETrade.ETradeBusinessServices.ETradeMarket import ETradeMarket
 from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from ETrade.ETradeBusinessUtils.ETradeQuoteCache import ETradeQuoteCache
 
 
 class EntryMoneyMakerInput(EntryInput):
@@ -17,19 +24,44 @@ class EntryMoneyMakerInput(EntryInput):
         ActiveStockItems:List[ActiveStockItem] - Active stock items in the system.
 
         MoneyMakerLogger:AppLogger - Separate logger for the MoneyMaker.
+
+        MarketCalendar:MarketCalendar - Trading sessions, the MoneyMaker sleeps while the market is closed.
         
         Order:ETradeOrder - ETrade Order object.
 
         Account:ETradeAccount - ETrage Account object.
 
+        AsyncOrder:AsyncETradeOrder - asyncio ETrade Order object. Used by DoMakeMoneyAsync.
+
+        AsyncAccount:AsyncETradeAccount - asyncio ETrade Account object. Used by DoMakeMoneyAsync.
+
+        Market:ETradeMarket - ETrade Market object.
+
+        AsyncMarket:AsyncETradeMarket - asyncio ETrade Market object. Used by DoMakeMoneyAsync.
+
+        QuoteCache:ETradeQuoteCache - Quote cache in front of the Market and the AsyncMarket. Quotes of the stock items.
+
     """
     def __init__(self):
         super().__init__()
 
         self.ActiveStockItems:List[ActiveStockItem] = ActiveStockItems
         self.MoneyMakerLogger:AppLogger = AppLogger(self.Settings.MoneyMakerLogFilePathWithName, "MoneyMakerLogger")
+        self.MarketCalendar:MarketCalendar = MarketCalendar(self.Settings.MarketCalendarFilePathWithName)
         self.Order:ETradeOrder = ETradeOrder(inputModel = self.InputModel, settings = self.ETradeSettings, 
-                                context = self.Context, strings = self.Strings)
+                                context = self.Context, strings = self.Strings, sessionPool = self.SessionPool)
         self.Account:ETradeAccount = ETradeAccount(inputModel = self.InputModel, settings = self.ETradeSettings, 
-                                        context = self.Context, strings = self.Strings) 
+                                        context = self.Context, strings = self.Strings, sessionPool = self.SessionPool) 
+        self.AsyncOrder:AsyncETradeOrder = AsyncETradeOrder(inputModel = self.InputModel, settings = self.ETradeSettings, 
+                                context = self.Context, strings = self.Strings, rateLimiter = self.SessionPool.RateLimiter,
+                                retryPolicy = self.SessionPool.RetryPolicy)
+        self.AsyncAccount:AsyncETradeAccount = AsyncETradeAccount(inputModel = self.InputModel, settings = self.ETradeSettings, 
+                                        context = self.Context, strings = self.Strings, rateLimiter = self.SessionPool.RateLimiter,
+                                        retryPolicy = self.SessionPool.RetryPolicy)
+        self.Market:ETradeMarket = ETradeMarket(inputModel = self.InputModel, settings = self.ETradeSettings, 
+                                context = self.Context, strings = self.Strings, sessionPool = self.SessionPool)
+        self.AsyncMarket:AsyncETradeMarket = AsyncETradeMarket(inputModel = self.InputModel, settings = self.ETradeSettings, 
+                                context = self.Context, strings = self.Strings, rateLimiter = self.SessionPool.RateLimiter,
+                                retryPolicy = self.SessionPool.RetryPolicy)
+        self.QuoteCache:ETradeQuoteCache = ETradeQuoteCache(self.Market, asyncMarket = self.AsyncMarket)
 
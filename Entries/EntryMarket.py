@@ -17,8 +17,7 @@ from Entries.EntryInputs.EntryMarketInput import EntryMarketInput
 
 def DoMarket(entryInput:EntryMarketInput, symbols:List[str]):
     """ Get the latest Quote of the list of the stocks.
-        There are certian API limitations on the number of Symbols in the list.
-        We are not considering those limitations.
+        Symbols above the API limit are requested in chunks by ETradeMarket.Quotes.
 
         Parameters:
 
@@ -42,7 +41,7 @@ def DoMarket(entryInput:EntryMarketInput, symbols:List[str]):
         entryInput.Market.inputModel = entryInput.InputModel
                         
         try:            
-            # Get the Quotes. I think there is a limit of maximum 20 symbols in the list.
+            # Get the Quotes.
             quoteResponse = entryInput.Market.Quotes(symbols, accessToken, accessTokenSecret)
 
             # If error, process error and try again.
@@ -66,6 +65,9 @@ def DoMarket(entryInput:EntryMarketInput, symbols:List[str]):
                     print("Symbol ->", i, " -> ", quoteResponse.QuoteData[i].Symbol)
                     print("Last Price ->", i, " -> ", quoteResponse.QuoteData[i].LastTradedPrice)
                     print("Adjusted Flag ->", i, " -> ", quoteResponse.QuoteData[i].AdjustedFlag)
+                    print("Bid ->", i, " -> ", quoteResponse.QuoteData[i].Bid)
+                    print("Ask ->", i, " -> ", quoteResponse.QuoteData[i].Ask)
+                    print("Volume ->", i, " -> ", quoteResponse.QuoteData[i].Volume)
 
             return
         
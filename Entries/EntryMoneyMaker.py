@@ -1,9 +1,13 @@
+import asyncio
 import os
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import ContextVar, copy_context
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add the Parent path of the Entries folder to the system path.
 # Need to find out if there is a better way of doing this.
@@ -12,24 +16,39 @@ sys.path.append(str(Path(os.getcwd()).parent))
 from BusinessModels.ActiveStockItem import ActiveStockItem
 from BusinessModels.CancelOrderResponse import CancelOrderResponse
 from BusinessModels.Error import Error
+from BusinessModels.ErrorAction import ErrorAction
 from BusinessModels.FilteringAndPagingParams import (
     OrdersFilteringAndPagingParams, PortfolioFilteringAndPagingParams)
+from BusinessModels.LimitOrdersBatch import LimitOrdersBatch
 from BusinessModels.Message import Message
+from BusinessModels.OrderBatchResult import (OrderBatchResult, OrderOutcome,
+                                             OrderOutcomeStatus)
 from BusinessModels.OrderDetails import Instrument, OrderDetail
 from BusinessModels.OrderInfo import OrderInfo
-from BusinessModels.OrdersResponse import Order
-from BusinessModels.PortfolioResponse import PortfolioPosition
+from BusinessModels.OrdersResponse import Order, OrdersResponse
+from BusinessModels.PlaceOrderResponse import PlaceOrderResponse
+from BusinessModels.PortfolioResponse import PortfolioPosition, PortfolioResponse
 from BusinessModels.PreviewOrderInput import PreviewOrderInput
+from BusinessModels.PreviewOrderResponse import PreviewOrderResponse
+from BusinessModels.Price import Price
+from BusinessModels.QuoteResponse import QuoteResponse
 from Exceptions.MessageError import MessageError
 from Exceptions.ResponseError import ResponseError
-from requests.exceptions import ConnectionError
 
+from Entries.EntryHelpers.ClientOrderRegistry import (ClientOrderIdGenerator,
+                                                     ClientOrderRegistry)
 from Entries.EntryHelpers.ErrorHandlingHelpers import \
     ProcessMessageError as ProcessMessageError
 from Entries.EntryHelpers.ErrorHandlingHelpers import \
     ProcessResponseError as ProcessResponseError
 from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryHelpers.OrderBookMirror import OrderBookMirror
+from Entries.EntryHelpers.PollingScheduler import PollingScheduler
+from Entries.EntryHelpers.PortfolioSnapshot import PortfolioSnapshot
+from Entries.EntryHelpers.ReconciliationBands import ReconciliationBands
 from Entries.EntryInputs.EntryMoneyMakerInput import EntryMoneyMakerInput
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import (ETradeRetryPolicy,
+                                                          TransientErrors)
 
 
 class MoneyMaker:
@@ -43,6 +62,34 @@ class MoneyMaker:
         ManageOrdersHelpers:ManageOrdersHelpers - Methods related to the trading algorithm are available
         in this class.
 
+        TokenLock:RLock - Serializes reading and renewing the access tokens when the stock items are 
+        processed concurrently.
+
+        LogContext:ContextVar - Symbol of the stock item processed by the current thread or asyncio task.
+
+        PollingScheduler:PollingScheduler - Decides which stock items are processed in a cycle and when the 
+        next cycle starts, if Settings.UseAdaptivePolling is True.
+
+        ReconciliationBands:ReconciliationBands - Decides which stock items are reconciled with their open
+        orders in a cycle, if Settings.UseQuoteBands is True.
+
+        PortfolioSnapshot:PortfolioSnapshot - Portfolio quantity deltas and the state each stock item was last
+        reconciled with. Unchanged stock items are not processed if Settings.SkipUnchangedStockItems is True.
+
+        OrderBookMirror:OrderBookMirror - Open orders of the account updated from the place and cancel responses.
+        Used instead of the Orders API between the reconciliations if Settings.UseOrderBookMirror is True.
+
+        ClientOrderIds:ClientOrderIdGenerator - Generates the ClientOrderIds of the orders.
+
+        ClientOrderRegistry:ClientOrderRegistry - Placed orders by ClientOrderId. Orders with an unknown place
+        outcome are looked up instead of placed again.
+
+        OrderPipelineExecutor:ThreadPoolExecutor - Sends the preview/place requests of the order pipeline of all
+        the stock items, at most Settings.OrderPipelineMaxConcurrentOrders at a time.
+
+        OrderPipelineSemaphore:asyncio.Semaphore - Same as the OrderPipelineExecutor for the async order pipeline.
+        Created in the running event loop(GetOrderPipelineSemaphore).
+
         Methods:
 
         LogMessage - Logs the message passed using the Logger present in the Entry input.
@@ -55,8 +102,87 @@ class MoneyMaker:
 
         AddCommissionToSellOrder - Calculates the commission and updates the sell price accordingly.
 
+        GetLatestAccessKeyDetails - Gets the latest access token details under the TokenLock.
+
         CalculateStockItemOrders - Calculates and generates the final orders to place.
 
+        GetOpenLimitOrders - Gets the open orders of a stock item matched with the possible limit orders.
+
+        GetStockItemOrders - Gets the sorted orders to place and cancel of one stock item.
+
+        ValidatePreviewOrderResponse, ValidatePlaceOrderResponse - Validates the preview/place order responses.
+
+        ValidatePreviewOrderDetail, ValidatePlaceOrderDetail - Validates an order detail of the preview/place order responses.
+
+        GetPlacedOrderId, AddPlacedOrderToMirror - Gets the OrderId of the placed order and adds the order to
+        the OrderBookMirror.
+
+        VerifyCancelResponses - Verifies the cancelled orders using the cancel responses(OrderBookMirror).
+
+        GetPlaceOrderErrorState, GetClientOrderLookupParams, ProcessClientOrderLookup - Tracks the place outcome
+        in the ClientOrderRegistry and looks up the orders with an unknown place outcome.
+
+        IsOrdersFetchRequired, ReconcileOrderBookMirror - Decides if the open orders are fetched from the API
+        and reconciles the OrderBookMirror with them.
+
+        GetPipelineOrders, PlaceOrdersPipeline, PlaceOrdersPipelineAsync - Previews and places the new orders
+        of one stock item concurrently(order pipeline), if Settings.UseOrderPipeline is True.
+
+        GetOrderPipelineSemaphore - Gets the OrderPipelineSemaphore of the running event loop.
+
+        SubmitOrderPipelineRequest, GetOrderPipelineResult, RunOrderPipelineRequest - Sends the preview/place
+        requests of the sync/async order pipeline.
+
+        StartOrdersPipeline, ProcessPipelinePreview, ProcessPipelinePlace, ProcessOrderBatchResult - Steps of the
+        order pipeline shared by PlaceOrdersPipeline and PlaceOrdersPipelineAsync.
+
+        GetLimitOrderInput, PreviewLimitOrder, PreviewLimitOrderAsync, PlaceLimitOrder, PlaceLimitOrderAsync,
+        SetPlaceOrderUnknown - Order input, preview and place order of a new order.
+
+        ProcessPreviewOrderResponse, ProcessPlaceOrderResponse, LogPlaceOrderOutcome - Handles the preview/place
+        responses of a new order.
+
+        ProcessCancelOrderResponse, VerifyCancels - Handles the cancel responses and verifies the cancelled orders.
+
+        GetAccessKeysAfter - Gets the access keys to use after a response, renewed after a response error.
+
+        IsClientOrderLookupRequired - Are the orders with an unknown place outcome looked up before placing?
+
+        ProcessStockItem, ProcessStockItemAsync - Cancels or places the orders of one stock item.
+
+        CancelStockItemOrders, CancelStockItemOrdersAsync, PlaceStockItemOrders, PlaceStockItemOrdersAsync - Cancels
+        the stale orders or places the new orders of one stock item, only the requests differ.
+
+        MakeMoneyCycle, MakeMoneyCycleAsync - One cycle of DoMakeMoney/DoMakeMoneyAsync.
+
+        IsCycleIdle, GetPortfolioParams, ProcessCyclePortfolio, GetCycleOpenOrders, GetCycleStockItemsToProcess,
+        UpdateCycleStockItems - Steps of a cycle shared by MakeMoneyCycle and MakeMoneyCycleAsync.
+
+        ProcessStockItems, ProcessStockItemsAsync - Processes the stock items of a cycle, concurrently if enabled.
+
+        GetCycleQuotesAsync - Gets the quotes of a cycle from the QuoteCache using the async Market.
+
+        GetCycleStockItems - Gets the stock items to process in the cycle.
+
+        GetQuoteSymbols, GetLastPrices - Gets the last traded prices of the processed stock items.
+
+        GetStockItemsToReconcile - Gets the stock items whose open orders are fetched and compared in the cycle.
+
+        UpdateReconciliationBands - Updates the price bands of the reconciled stock items.
+
+        UpdatePortfolioSnapshot - Sets the portfolio of the cycle and logs the quantity changes.
+
+        SkipUnchangedStockItems, UpdatePortfolioMarkers - Skips the stock items with the same portfolio quantity
+        and open orders as their last reconciliation with nothing to do.
+
+        RescheduleStockItems - Schedules the processed stock items again.
+
+        GetRequestCount - Gets the number of requests sent so far.
+
+        GetCycleWaitTime - Gets the time to wait before the next cycle.
+
+        GetMarketWaitTime - Gets the time to wait till the regular session opens.
+
         DoMakeMoney - Tries to make money following the below process.
             General steps are:
             - Gets the portfolio items.
@@ -66,16 +192,36 @@ class MoneyMaker:
                 - Calculate possible orders using the portfolio quantity and algorithm.
                 - Compare available orders with calculated possible orders.
                     - If both orders are same then move to next stock item.
-                    - If orders are different. Cancel all existing orders and place the possible caculated orders.
+                    - If orders are different. Cancel the stale open orders and place the missing caculated orders.
                     - Thats it - Sweet and Simple.
                 - Move to next stock item.
-            Repeat the above process after a fixed interval.
+            Repeat the above process after a fixed interval, or when the next stock item is due if
+            Settings.UseAdaptivePolling is True. If Settings.UseQuoteBands is True, the quotes are checked
+            first and only the stock items whose price crossed one of their limit orders are reconciled. While the market is closed, sleep till the regular session opens.
+
+        DoMakeMoneyAsync - Same as DoMakeMoney using the async ETrade services. Stock items are processed
+        concurrently using asyncio.gather.
         
     """
 
     def __init__(self, entryInput:EntryMoneyMakerInput, manageOrdersHelpers:ManageOrdersHelpers):
         self.MoneyMakerInput = entryInput
         self.ManageOrdersHelpers = manageOrdersHelpers
+        # Serializes reading and renewing the access tokens when the stock items are processed concurrently.
+        self.TokenLock = threading.RLock()
+        # Symbol of the stock item processed by the current thread/task, added to the log messages.
+        self.LogContext:ContextVar = ContextVar("MoneyMakerSymbol", default="")
+        self.PollingScheduler = PollingScheduler(self.MoneyMakerInput.Settings)
+        self.ReconciliationBands = ReconciliationBands(self.MoneyMakerInput.Settings)
+        self.PortfolioSnapshot = PortfolioSnapshot()
+        self.OrderBookMirror = OrderBookMirror(self.MoneyMakerInput.Settings)
+        self.ClientOrderIds = ClientOrderIdGenerator()
+        self.ClientOrderRegistry = ClientOrderRegistry(self.MoneyMakerInput.Settings)
+        # Requests of the order pipeline are limited for all the stock items together, not per stock item.
+        self.OrderPipelineExecutor = ThreadPoolExecutor(max_workers= max(1, self.MoneyMakerInput.Settings.OrderPipelineMaxConcurrentOrders),
+                                        thread_name_prefix= "OrderPipeline")
+        self.OrderPipelineSemaphore:asyncio.Semaphore = None
+        self.OrderPipelineLoop:asyncio.AbstractEventLoop = None
 
     def LogMessage(self, message:str, isError:bool = False, isUser:bool = False): 
         """ Logs and/or prints the message using the MoneyMakerInput.LogMessage method.
@@ -88,8 +234,22 @@ class MoneyMaker:
 
             isUser:bool - Should we present the message to the User.
         """   
+        symbol = self.LogContext.get()
+        if symbol != "":
+            message = f"[{symbol}] {message}"
         self.MoneyMakerInput.LogMessage(self.MoneyMakerInput.MoneyMakerLogger, message, isError, isUser)
 
+    def GetLatestAccessKeyDetails(self):
+        """ Gets the latest access token details from the configuration. Waits if the tokens are being
+            renewed by another stock item.
+
+            Returns:
+
+            Access token, access token secret and the access token date time.
+        """
+        with self.TokenLock:
+            return self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
+
     def MoneyMakerProcessResponseError(self, error:Error):
         """ Process the response error.
             Uses the ProcessResponseError method to process the Error.
@@ -99,22 +259,28 @@ class MoneyMaker:
         self.LogMessage(f"Error status code - {error.ResponseStatusCode}", True, True)
         self.LogMessage(f"Error code - {error.Code}", True, True)
         self.LogMessage(f"Error message - {error.Message}", True, True)
-        ProcessResponseError(error, self.MoneyMakerInput)
+        # Only one stock item renews the access tokens at a time.
+        with self.TokenLock:
+            ProcessResponseError(error, self.MoneyMakerInput)
 
     def MoneyMakerProcessMessageError(self, messages:List[Message]):
         """ Process the response messages.
             Uses the ProcessMessageError method to process the Error.
 
             messages:List[Message] - List of response messages.
+
+            Returns:
+
+            False if the order should be skipped, True otherwise.
         """
         for message in messages:   
-            if(message.Code in self.MoneyMakerInput.ETradeSettings.DangerErrorCodes):
+            if(ETradeRetryPolicy.GetErrorAction(self.MoneyMakerInput.ETradeSettings, message.Code) is ErrorAction.ABORT):
                 self.LogMessage(f"Message type - {message.Type.name}", True, True)
                 self.LogMessage(f"Message Code - {message.Code}", True, True)
                 self.LogMessage(f"Message Description - {message.Description}", True, True)
-        ProcessMessageError(messages, self.MoneyMakerInput)
+        return ProcessMessageError(messages, self.MoneyMakerInput)
 
-    def OrderInput(self, symbol:str, orderAction:str, limitPrice:float, quantity:int) -> PreviewOrderInput:
+    def OrderInput(self, symbol:str, orderAction:str, limitPrice, quantity:int) -> PreviewOrderInput:
         """ Creates the input for the preview order.
             OrderType is fixed to "EQ"
             PriceType is fixed to "LIMIT"
@@ -128,15 +294,15 @@ class MoneyMaker:
 
             orderAction:str - BUY or SELL
 
-            limitPrice:float - Price at which to place the limit order.
+            limitPrice - Price at which to place the limit order. Price, float, Decimal or str.
 
             quantity:int - Order quantity.
 
         """
         previewOrderInput = PreviewOrderInput()
 
-        # Unique ClientOrderId
-        previewOrderInput.ClientOrderId = "O" + str(time.time()).replace(".", "") 
+        # Unique ClientOrderId across the threads and processes.
+        previewOrderInput.ClientOrderId = self.ClientOrderIds.Next()
         previewOrderInput.OrderType = "EQ"
         previewOrderInput.Order = []
 
@@ -152,7 +318,7 @@ class MoneyMaker:
         # EXTENDED
         orderDetail.MarketSession = "REGULAR"
         orderDetail.StopPrice = ""
-        orderDetail.LimitPrice = limitPrice
+        orderDetail.LimitPrice = Price.From(limitPrice)
         orderDetail.Instruments = []
 
         # Build the Instrument.
@@ -190,42 +356,76 @@ class MoneyMaker:
         if(self.MoneyMakerInput.ETradeSettings.CommissionType == 1):
             # Add the share of Buy commission to the LimitPrice.
             if(self.MoneyMakerInput.ETradeSettings.BuyCommission > 0):
-                orderInfo.LimitPrice = round(orderInfo.LimitPrice + (self.MoneyMakerInput.ETradeSettings.BuyCommission / orderInfo.Quantity), self.MoneyMakerInput.Settings.FloatRoundPrecision)
+                orderInfo.LimitPrice = (orderInfo.LimitPrice + (self.MoneyMakerInput.ETradeSettings.BuyCommission / orderInfo.Quantity)).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
 
             # Add the share of Sell commission to the LimitPrice.
             if(self.MoneyMakerInput.ETradeSettings.SellCommission > 0):
-                orderInfo.LimitPrice = round(orderInfo.LimitPrice + (self.MoneyMakerInput.ETradeSettings.SellCommission / orderInfo.Quantity), self.MoneyMakerInput.Settings.FloatRoundPrecision)
+                orderInfo.LimitPrice = (orderInfo.LimitPrice + (self.MoneyMakerInput.ETradeSettings.SellCommission / orderInfo.Quantity)).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
 
         # If the commission type is PERCENTAGE.
         if(self.MoneyMakerInput.ETradeSettings.CommissionType == 2):
-            tempCommission = 0
+            tempCommission:Price = Price(0)
             # Add Buy commission percentage to the tempCommission.
             if(self.MoneyMakerInput.ETradeSettings.BuyCommission > 0):
                 buyPrice = self.ManageOrdersHelpers.GetBuyPriceFromSellPrice(activeStockItem, orderInfo.LimitPrice)
-                tempCommission = tempCommission + round((buyPrice * self.MoneyMakerInput.ETradeSettings.BuyCommission * 0.01) / orderInfo.Quantity, self.MoneyMakerInput.Settings.FloatRoundPrecision)
+                tempCommission = tempCommission + ((buyPrice * self.MoneyMakerInput.ETradeSettings.BuyCommission * 0.01) / orderInfo.Quantity).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
 
             # Add Sell commission percentage to the tempCommission.
             if(self.MoneyMakerInput.ETradeSettings.SellCommission > 0):
-                tempCommission = tempCommission + round((orderInfo.LimitPrice * self.MoneyMakerInput.ETradeSettings.SellCommission * 0.01) / orderInfo.Quantity, self.MoneyMakerInput.Settings.FloatRoundPrecision)
+                tempCommission = tempCommission + ((orderInfo.LimitPrice * self.MoneyMakerInput.ETradeSettings.SellCommission * 0.01) / orderInfo.Quantity).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
 
             # Add commission to the LimitPrice.
             orderInfo.LimitPrice = orderInfo.LimitPrice + tempCommission
 
+    def GetOpenLimitOrders(self, symbol:str, openOrders:List[Order]) -> List[OrderInfo]:
+        """ Open BUY/SELL orders of the symbol as OrderInfos, matched with the possible limit orders by
+            ManageOrdersHelpers.GetOrderKey. Quantity is the remaining quantity(OrderedQuantity - FilledQuantity),
+            same as the quantity of a partial order calculated from the portfolio quantity.
+            Only one instrument is present for an Order in our application.
+
+            Parameters:
+
+            symbol:str - Symbol of the stock item(upper case).
+
+            openOrders:List[Order] - Open orders of the stock item(IndexOrdersBySymbol).
+
+            Returns:
+
+            List[OrderInfo] - Open limit orders of the symbol.
+
+        """
+        openLimitOrders:List[OrderInfo] = []
+        for orderObj in openOrders:
+            for orderDetail in orderObj.OrderDetails:
+                if orderDetail.Status != "OPEN":
+                    continue
+                for inst in orderDetail.Instruments:
+                    if inst.Symbol == symbol and inst.OrderAction in ("BUY", "SELL"):
+                        openLimitOrders.append(OrderInfo(orderObj.OrderId, inst.Symbol, orderDetail.LimitPrice,
+                            inst.OrderedQuantity - inst.FilledQuantity, inst.FilledQuantity != 0, inst.OrderAction == "SELL"))
+        return openLimitOrders
+
     def CalculateStockItemOrders(self, activeStockItem:ActiveStockItem,  
-                                openOrders:List[Order], portfolioPosition:PortfolioPosition) -> Tuple[List[OrderInfo], List[OrderInfo]]:
+                                openOrders:List[Order], portfolioPosition:PortfolioPosition,
+                                limitOrders:List[OrderInfo] = None) -> Tuple[List[OrderInfo], List[OrderInfo]]:
         """ Calculate the possible Orders for a stock item based on the current orders and portfolio quantity.
 
             Parameters:
 
             activeStockItem:ActiveStockItem - Active stock item.
 
-            openOrders:List[Order] - Open orders of the stock item.
+            openOrders:List[Order] - Open orders of the stock item. Orders indexed by IndexOrdersBySymbol,
+            instrument symbols are upper case.
 
             portfolioPosition:PortfolioPosition - Portfolio details of the stock item.
 
+            limitOrders:List[OrderInfo] - Possible limit orders of the stock item if already generated
+            (GenerateAllPossibleLimitOrders), generated from the portfolio quantity if None.
+
             Returns:
 
-            Tuple[List[OrderInfo], List[OrderInfo]] - [Orders to Place, Orders to Cancel]
+            Tuple[List[OrderInfo], List[OrderInfo]] - [Orders to Place, Orders to Cancel]. Only the possible orders
+            which are not open and the open orders which are not possible.
 
         """
 
@@ -233,49 +433,14 @@ class MoneyMaker:
         portfolioPositionQuantity:int = portfolioPosition.Quantity
 
         # Get possible limit orders.
-        limitOrders = self.ManageOrdersHelpers.GeneratePossibleLimitOrders(activeStockItem, portfolioPositionQuantity)
+        if limitOrders is None:
+            limitOrders = self.ManageOrdersHelpers.GeneratePossibleLimitOrders(activeStockItem, portfolioPositionQuantity)
 
         # Add commission.
         for orderInfo in limitOrders:
             self.AddCommissionToSellOrder(orderInfo, activeStockItem)
 
-        # Calculated quantity from open orders.
-        calculatedQuantity:int = 0
-
-        skipOrder:bool = False
-
-        openLimitOrders:List[OrderInfo] = []
-        # For each open Order.
-        for orderObj in openOrders:
-            for orderDetail in orderObj.OrderDetails:
-                # Get the instruments.
-                for instrument in orderDetail.Instruments:                    
-                    inst:Instrument = instrument     
-                    # If OPEN and BUY
-                    if inst.Symbol.upper() == activeStockItem.Symbol.upper() and orderDetail.Status == "OPEN" and \
-                        inst.OrderAction == "BUY":
-                        # There is a chance of partial fill.
-                        calculatedQuantity = calculatedQuantity + inst.FilledQuantity
-                        openLimitOrders.append(OrderInfo(orderObj.OrderId, inst.Symbol, orderDetail.LimitPrice, 
-                        inst.OrderedQuantity, inst.FilledQuantity != 0, False))
-                        # In case of ONE_TRIGGERS_OTHER orders. First BUY needs to be completed before
-                        # SELL is started. We are not dealing with ONE_TRIGGERS_OTHER type orders.
-                        # Only one instrument will be present for Order in our application.
-                        # So the skipOrder is not required actually. No harm.
-                        skipOrder = True 
-                        break      
-                    # If OPEN and SELL.            
-                    elif inst.Symbol.upper() == activeStockItem.Symbol.upper() and orderDetail.Status == "OPEN" and \
-                        inst.OrderAction == "SELL":
-                        # There is a chance of partial fill.
-                        calculatedQuantity = calculatedQuantity + inst.OrderedQuantity - inst.FilledQuantity
-                        openLimitOrders.append(OrderInfo(orderObj.OrderId, inst.Symbol, orderDetail.LimitPrice, 
-                        inst.OrderedQuantity, inst.FilledQuantity != 0, True))
-
-                # This is not required. No harm.
-                if skipOrder is True:
-                    skipOrder = False
-                    break
+        openLimitOrders = self.GetOpenLimitOrders(activeStockItem.Symbol.upper(), openOrders)
 
         if(len(openLimitOrders) != len(openOrders)):
             self.LogMessage(f"Number of open limit orders should be same as that of open orders.", True, True)
@@ -285,78 +450,1536 @@ class MoneyMaker:
         # If no open orders. 
         if len(openLimitOrders) == 0:
             return limitOrders, []
-        
-        # If open orders length is not same as possible orders.
-        if(len(openLimitOrders) != len(limitOrders)):
-            return limitOrders, openLimitOrders
-        
+
+        # Place only the missing orders and cancel only the stale orders. Matching open orders,
+        # including the partially filled orders, are left as they are.
+        return self.ManageOrdersHelpers.DiffLimitOrders(limitOrders, openLimitOrders)
+
+    def GetStockItemOrders(self, activeStockItem:ActiveStockItem, openOrders:List[Order],
+                            portfolioPositionsBySymbol:Dict[str, PortfolioPosition],
+                            possibleLimitOrders:List[OrderInfo]) -> Tuple[List[OrderInfo], List[OrderInfo]]:
+        """ Gets the orders to place and the orders to cancel of the stock item, sorted in the order they
+            are processed.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Active stock item.
+
+            openOrders:List[Order] - Open orders of the stock item(IndexOrdersBySymbol).
+
+            portfolioPositionsBySymbol:Dict[str, PortfolioPosition] - Portfolio positions by Symbol(upper case).
+
+            possibleLimitOrders:List[OrderInfo] - Possible limit orders of the stock item.
+
+            Returns:
+
+            Tuple[List[OrderInfo], List[OrderInfo]] - [Orders to Place, Orders to Cancel].
+
+        """
+        symbol = activeStockItem.Symbol.upper()
+
+        # Get the portfolio position for the given active stock.
+        # It may not be present in the portfolio.
+        dummySymbol = "XXXXABCD"
+        portfolioPosition:PortfolioPosition = portfolioPositionsBySymbol.get(symbol, PortfolioPosition(symbol=dummySymbol))
+
+        # If not present.
+        if(portfolioPosition.Symbol == dummySymbol):
+            # Set the Symbol
+            portfolioPosition.Symbol = activeStockItem.Symbol
+            # Set the Quantity to 0 because quantity is initialized to Settings.UnfilledValue in the constructor.
+            portfolioPosition.Quantity = 0
+        # If present in the portfolio. Make sure quantity is set by the API.
+        elif(portfolioPosition.Quantity == self.MoneyMakerInput.Settings.UnfilledValue) or (portfolioPosition.Quantity <= 0):
+            self.LogMessage(f"Something changed - Portfolio Quantity for {activeStockItem.Symbol} received from API is not suppossed to be {portfolioPosition.Quantity}", True, True)
+            self.LogMessage("Aborting the application.", True, True)
+            raise Exception("Fatal Error.")
+
+        limitOrders:List[OrderInfo]
+        cancelOrders:List[OrderInfo]
+
+        # Get the orders to Place and orders to Cancel.
+        limitOrders, cancelOrders = self.CalculateStockItemOrders(activeStockItem, openOrders, portfolioPosition, possibleLimitOrders)
+
+        # Sort the LimitOrders. High price orders are placed first.
         limitOrders.sort(key= lambda x:x.LimitPrice, reverse=True)
 
-        # Check if the orders match exactly or not.
-        for limitOrder in limitOrders:
-            found = False
-            for openLimitOrder in openLimitOrders:
-                if limitOrder.Symbol.upper() == openLimitOrder.Symbol.upper() and \
-                    limitOrder.LimitPrice == openLimitOrder.LimitPrice and \
-                    limitOrder.Quantity == openLimitOrder.Quantity and \
-                    limitOrder.IsPartialFilled == openLimitOrder.IsPartialFilled and \
-                    limitOrder.IsSell == openLimitOrder.IsSell:
-                    found = True
-                    break
-            # If any order does not match.
-            if found is False:
-                return limitOrders, openLimitOrders
+        # Low price orders are cancelled first.
+        cancelOrders.sort(key= lambda x:x.LimitPrice)
+
+        self.LogMessage(f"StartPrice -> {activeStockItem.StartPrice}", False, False)
+        self.LogMessage(f"Limit Orders -> {limitOrders}", False, False)
+        self.LogMessage(f"Cancel Orders -> {cancelOrders}", False, False)
+
+        return limitOrders, cancelOrders
+
+    def GetOpenOrdersParams(self, symbol:str = None) -> OrdersFilteringAndPagingParams:
+        """ Filtering and paging params to get all the OPEN EQ orders.
+
+            Parameters:
 
-        # Everything matches so no change to the orders of the stock item.
-        return [],[]
+            symbol:str - If not None, only the orders of the symbol.
 
         """
-        for orderObj in openOrders:
-            for orderDetail in orderObj.OrderDetails:
-                if(orderDetail.AllOrNone == False):
-                    return limitOrders, openLimitOrders
-        
-        openBuyCount = 0
-        for openLimitOrder in openLimitOrders:
-            if openLimitOrder.IsSell == False:
-                openBuyCount = openBuyCount + 1
-
-        if openBuyCount != buyOpenCountConst:
-            calculatedQuantity = calculatedQuantity + activeStockItem.Quantity * (buyOpenCountConst-openBuyCount)
-
-        # If calculated quantity is not same as portfolio quality. We shall
-        # take care of this in the next cycle.
-        if calculatedQuantity != portfolioPosition.Quantity:
-            return [],[]
-        
-        finalLimitOrders:List[OrderStatusInfo] = []
-        found:bool = False
+        orderFilteringAndPagingParams = OrdersFilteringAndPagingParams()
+        orderFilteringAndPagingParams.PageSize = 100
+        if symbol is not None:
+            orderFilteringAndPagingParams.Params["symbol"] = symbol
+        orderFilteringAndPagingParams.Params["status"] = "OPEN"
+        orderFilteringAndPagingParams.Params["securityType"] = "EQ"
+        orderFilteringAndPagingParams.ApplyFilterAndReturnAll = True
+        return orderFilteringAndPagingParams
+
+    def VerifyCancelledOrders(self, activeStockItem:ActiveStockItem, cancelOrders:List[OrderInfo], ordersResponse:OrdersResponse):
+        """ Verifies if the cancelled orders are not open anymore.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Active stock item.
+
+            cancelOrders:List[OrderInfo] - Cancelled orders of the stock item.
+
+            ordersResponse:OrdersResponse - Open orders of the stock item received after cancelling the orders.
+
+        """
+        # Process orders response error.
+        if(ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != ""):
+            self.MoneyMakerProcessResponseError(ordersResponse.Error)
+            return
+
+        # Process orders response messages.
+        if(ordersResponse.Messages is not None and len(ordersResponse.Messages) != 0):
+            if(self.MoneyMakerProcessMessageError(ordersResponse.Messages) is False):
+                return
+
+        # Are all the stale orders cancelled? Matching orders are still open.
+        symbol = activeStockItem.Symbol.upper()
+        if(ordersResponse.Orders is not None and
+            {cancelOrder.OrderId for cancelOrder in cancelOrders}.isdisjoint(
+                order.OrderId for order in self.ManageOrdersHelpers.IndexOrdersBySymbol(ordersResponse.Orders).get(symbol, []))):
+            logMessage = f"Stale orders of {activeStockItem.Symbol} are cancelled successfully."
+            self.LogMessage(logMessage, False, True)
+        else:
+            logMessage = f"Unable to cancel the stale orders of {activeStockItem.Symbol}."
+            self.LogMessage(logMessage, True, True)
+
+    def VerifyCancelResponses(self, activeStockItem:ActiveStockItem, cancelOrders:List[OrderInfo], cancelledOrderIds:List[int]):
+        """ Verifies the cancelled orders using the cancel responses, without fetching the orders again. If an order
+            was not cancelled, the OrderBookMirror is reconciled in the next cycle.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Active stock item.
+
+            cancelOrders:List[OrderInfo] - Orders of the stock item to cancel.
+
+            cancelledOrderIds:List[int] - OrderIds with a successful cancel response.
+
+        """
+        if len(cancelledOrderIds) == len(cancelOrders):
+            self.LogMessage(f"Stale orders of {activeStockItem.Symbol} are cancelled successfully.", False, True)
+        else:
+            self.LogMessage(f"Unable to cancel the stale orders of {activeStockItem.Symbol}.", True, True)
+            self.OrderBookMirror.MarkMismatch(f"Cancel failed for {activeStockItem.Symbol}.")
+
+    def ValidatePreviewOrderResponse(self, previewOrderResponse:PreviewOrderResponse, orderAction:str, totalValue:Price) -> bool:
+        """ Validates the preview order response before the order is placed.
+
+            The process to validate the Preview and Place order responses is, there are some
+            data fields which should to be populated by the API. I am verifying if these
+            fields are populated by the API or not.
+            I am also verifying some values like total order value.
+            Commission should not be more than maxCommission.
+            In future if something changes with the API we have to change the validations done on
+            the Preview and Place responses.
+            The reason, I am doing it this way is to make sure that nothing goes wrong.
+            It is OK if we are not able to place the Order. I am trying to avoid placing a bad order.
+
+            Parameters:
+
+            previewOrderResponse:PreviewOrderResponse - Preview order response.
+
+            orderAction:str - BUY or SELL.
+
+            totalValue:Price - Total value of the order.
+
+            Returns:
+
+            True if the order can be placed.
+
+            Exceptions:
+
+            Exception - When something changed with the API. Application can't continue.
+
+        """
+        isValid = False
+        unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
+        maxCommission = self.MoneyMakerInput.Settings.MaxCommission
+
+        if previewOrderResponse is not None and previewOrderResponse.PreviewOrderResponseData is not None:
+            self.LogMessage(f"Total Commission -> {previewOrderResponse.PreviewOrderResponseData.TotalCommission}", False, False)
+            self.LogMessage(f"Total Order Value -> {previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}", False, False)
+            # TotalCommission is not suppossed to be filled by the API.
+            if previewOrderResponse.PreviewOrderResponseData.TotalCommission != unfilledCommissionFee:
+                logMessage = f"Something changed - TotalCommission is suppossed to be {unfilledCommissionFee}"
+                self.LogMessage(logMessage, True, True)
+                logMessage = f"Aborting place order."
+                self.LogMessage(logMessage, True, True)                                
+                raise Exception("Fatal Error.")
+            # TotalOrderValue should be same as totalValue.
+            if orderAction == "BUY" and \
+                (totalValue - previewOrderResponse.PreviewOrderResponseData.TotalOrderValue != 0):
+                self.LogMessage(f"Something changed - TotalOrderValue is suppossed to be {totalValue}, received value is {previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}", True, True)
+                self.LogMessage("Aborting place order.", True, True)
+                raise Exception("Fatal Error.")
+            # In case of SELL TotalOrderValue is negative. Commision charged should not be greater than maxCommission.
+            if orderAction == "SELL" and \
+                (totalValue + previewOrderResponse.PreviewOrderResponseData.TotalOrderValue > maxCommission):
+                self.LogMessage(f"Something changed - Too much commission - {totalValue + previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}.", True, True)
+                self.LogMessage(f"Aborting place order.", True, True)
+                raise Exception("Fatal Error.")
+            orderDetails:List[OrderDetail] = previewOrderResponse.PreviewOrderResponseData.OrderDetails
+            for orderDetail in orderDetails:
+                self.ValidatePreviewOrderDetail(orderDetail, orderAction, totalValue)
+
+                # Handle orderDetail messages.
+                if(orderDetail.Messages is not None and len(orderDetail.Messages) != 0):
+                    if(self.MoneyMakerProcessMessageError(orderDetail.Messages) is False):
+                        continue
+                isValid = True
+
+        return isValid
+
+    def ValidatePreviewOrderDetail(self, orderDetail:OrderDetail, orderAction:str, totalValue:Price):
+        """ Validates an order detail and its instruments of the preview order response(ValidatePreviewOrderResponse).
+
+            Exceptions:
+
+            Exception - When something changed with the API. Application can't continue.
+
+        """
+        unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
+        maxCommission = self.MoneyMakerInput.Settings.MaxCommission
+
+        self.LogMessage(f"Estimated commission -> {orderDetail.EstimatedCommission}")
+        self.LogMessage(f"Estimated Fees -> {orderDetail.EstimatedFees}")
+        self.LogMessage(f"Estimated Total Amount -> {orderDetail.EstimatedTotalAmount}")
+        # EstimatedCommission should be 0. This may change in future.
+        if(orderDetail.EstimatedCommission != 0):
+            self.LogMessage(f"Something changed, commission is suppossed to be 0, received commission {orderDetail.EstimatedCommission}", True, True)
+            self.LogMessage(f"Aborting place order.", True, True)
+            raise Exception("Fatal Error.")
+        # EstimatedFees is not supposed to be set by the API.
+        if(orderDetail.EstimatedFees != unfilledCommissionFee):
+            self.LogMessage(f"Something changed, fees is suppossed to be {unfilledCommissionFee}, received fees value is {orderDetail.EstimatedFees}", True, True)
+            self.LogMessage(f"Aborting place order.", True, True)
+            raise Exception("Fatal Error.")
+        # When BUY EstimatedTotalAmount should be same as totalValue.
+        if orderAction == "BUY" and \
+            (totalValue - orderDetail.EstimatedTotalAmount != 0):
+            self.LogMessage(f"Something changed - EstimatedTotalAmount is suppossed to be {totalValue}, received total amount is {orderDetail.EstimatedTotalAmount}", True, True)
+            self.LogMessage(f"Aborting place order.", True, True)
+            raise Exception("Fatal Error.")
+        # When SELL EstimatedTotalAmount is negative. Commission charged cannot be more than maxCommission.
+        if orderAction == "SELL" and \
+            (totalValue + orderDetail.EstimatedTotalAmount > maxCommission):
+            self.LogMessage(f"Something changed - Too much commission - {totalValue + orderDetail.EstimatedTotalAmount}", True, True)
+            self.LogMessage(f"Aborting place order.", True, True)
+            raise Exception("Fatal Error.")
+        instruments:List[Instrument] = orderDetail.Instruments
+        for instrument in instruments:
+            self.LogMessage(f"Symbol - Quantity -> {instrument.Symbol}, {instrument.Quantity}")
+            self.LogMessage(f"EstimatedCommission -> {instrument.EstimatedCommission}")
+            self.LogMessage(f"EstimatedFees -> {instrument.EstimatedFees}")
+            # EstimatedCommission is not suppossed to be set by the API.
+            if(instrument.EstimatedCommission != unfilledCommissionFee):
+                self.LogMessage(f"Something changed, estimated commission is suppossed to be {unfilledCommissionFee}, received commission is {instrument.EstimatedCommission}", True, True)
+                self.LogMessage(f"Aborting place order.", True, True)
+                raise Exception("Fatal Error.")
+            # EstimatedFees is not suppossed to be set by the API.
+            if(instrument.EstimatedFees != unfilledCommissionFee):
+                self.LogMessage(f"Something changed, estimated fees is suppossed to be {unfilledCommissionFee}, received fees is {instrument.EstimatedFees}", True, True)
+                self.LogMessage(f"Aborting place order.", True, True)
+                raise Exception("Fatal Error.")
+
+    def GetPlacedOrderId(self, placeOrderResponse:PlaceOrderResponse) -> int:
+        """ OrderId of the placed order, from OrderId or the first of the OrderIds. 0 if not present.
+            Always an int, same as the OrderIds of the open orders(OrderBookMirror, ClientOrderRegistry).
+        """
+        placeOrderResponseData = placeOrderResponse.PlaceOrderResponseData
+        if placeOrderResponseData is None:
+            return 0
+        if not placeOrderResponseData.OrderId and placeOrderResponseData.OrderIds is not None and \
+                len(placeOrderResponseData.OrderIds) != 0:
+            return int(placeOrderResponseData.OrderIds[0].OrderId)
+        return int(placeOrderResponseData.OrderId or 0)
+
+    def AddPlacedOrderToMirror(self, placeOrderResponse:PlaceOrderResponse, limitOrder:OrderInfo):
+        """ Adds the placed order to the OrderBookMirror. Reconciled in the next cycle if the OrderId is missing.
+        """
+        placedOrderId = self.GetPlacedOrderId(placeOrderResponse)
+        if placedOrderId == 0:
+            self.OrderBookMirror.MarkMismatch(f"OrderId of the placed order missing for {limitOrder.Symbol}.")
+        else:
+            self.OrderBookMirror.AddOrder(placedOrderId, limitOrder)
+
+    def GetPlaceOrderErrorState(self, error:Error) -> str:
+        """ State of the order after a place order error response. UNKNOWN for a transient error(the order may
+            be placed), REJECTED otherwise.
+        """
+        if ETradeRetryPolicy.GetErrorAction(self.MoneyMakerInput.ETradeSettings, error.Code, error.ResponseStatusCode) is ErrorAction.RETRY:
+            return ClientOrderRegistry.Unknown
+        return ClientOrderRegistry.Rejected
+
+    def GetClientOrderLookupParams(self, symbol:str) -> OrdersFilteringAndPagingParams:
+        """ Filtering and paging params to get the EQ orders of the symbol with any status, an order with an
+            unknown place outcome may already be executed.
+        """
+        orderFilteringAndPagingParams = OrdersFilteringAndPagingParams()
+        orderFilteringAndPagingParams.PageSize = 100
+        orderFilteringAndPagingParams.Params["symbol"] = symbol.upper()
+        orderFilteringAndPagingParams.Params["securityType"] = "EQ"
+        orderFilteringAndPagingParams.ApplyFilterAndReturnAll = True
+        return orderFilteringAndPagingParams
+
+    def ProcessClientOrderLookup(self, symbol:str, ordersResponse:OrdersResponse):
+        """ Resolves the orders of the symbol with an unknown place outcome using the orders of the lookup.
+            The orders of the stock item are placed in the next cycle, with the open orders of the API.
+        """
+        self.OrderBookMirror.MarkMismatch(f"Orders with unknown place outcome for {symbol}.")
+        if(ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != ""):
+            self.MoneyMakerProcessResponseError(ordersResponse.Error)
+            return
+        for entry in self.ClientOrderRegistry.Resolve(symbol, ordersResponse.Orders):
+            self.LogMessage(f"Resolved order with unknown place outcome - {entry}", True, True)
+        unknownEntries = self.ClientOrderRegistry.GetUnknown(symbol)
+        if len(unknownEntries) != 0:
+            self.LogMessage(f"Orders with unknown place outcome, not placed again - {unknownEntries}", True, True)
+
+    def ValidatePlaceOrderResponse(self, placeOrderResponse:PlaceOrderResponse, orderAction:str, totalValue:Price) -> bool:
+        """ Validates the place order response. Same validations as ValidatePreviewOrderResponse, the order is
+            already placed.
+
+            Parameters:
+
+            placeOrderResponse:PlaceOrderResponse - Place order response.
+
+            orderAction:str - BUY or SELL.
+
+            totalValue:Price - Total value of the order.
+
+            Returns:
+
+            True if the placed order is valid.
+
+            Exceptions:
+
+            Exception - When something changed with the API. Application can't continue.
+
+        """
+        isValid = False
+        unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
+        unfilledValue = self.MoneyMakerInput.Settings.UnfilledValue
+
+        if placeOrderResponse is not None and placeOrderResponse.PlaceOrderResponseData is not None:  
+            self.LogMessage(f"Total Commission -> {placeOrderResponse.PlaceOrderResponseData.TotalCommission}")
+            self.LogMessage(f"Total Order Value -> {placeOrderResponse.PlaceOrderResponseData.TotalOrderValue}")
+
+            # Get the OrderId of the placed Order.
+            placedOrderId = self.GetPlacedOrderId(placeOrderResponse)
+
+            # TotalCommission is not suppossed to be filled by API.
+            if placeOrderResponse.PlaceOrderResponseData.TotalCommission != unfilledCommissionFee:
+                self.LogMessage(f"Something changed - TotalCommission is suppossed to be {unfilledCommissionFee}, received commission is {placeOrderResponse.PlaceOrderResponseData.TotalCommission}", True, True)
+                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+                raise Exception("Fatal Error.")
+            # TotalOrderValue is not suppossed to be filled by API.
+            if placeOrderResponse.PlaceOrderResponseData.TotalOrderValue != unfilledValue:
+                self.LogMessage(f"Something changed - TotalOrderValue is suppossed to be {unfilledValue}, received value is {placeOrderResponse.PlaceOrderResponseData.TotalOrderValue}", True, True)
+                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+                raise Exception("Fatal Error.")
+            orderDetails:List[OrderDetail] = placeOrderResponse.PlaceOrderResponseData.OrderDetails
+            for orderDetail in orderDetails:
+                self.ValidatePlaceOrderDetail(orderDetail, orderAction, totalValue, placedOrderId)
+
+                # Handle orderDetail messages.
+                if(orderDetail.Messages is not None and len(orderDetail.Messages) != 0):
+                    if(self.MoneyMakerProcessMessageError(orderDetail.Messages) is False):
+                        continue
+
+                isValid = True
+
+        return isValid
+
+    def ValidatePlaceOrderDetail(self, orderDetail:OrderDetail, orderAction:str, totalValue:Price, placedOrderId:int):
+        """ Validates an order detail and its instruments of the place order response(ValidatePlaceOrderResponse).
+            The order is already placed.
+
+            Exceptions:
+
+            Exception - When something changed with the API. Application can't continue.
+
+        """
+        unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
+        maxCommission = self.MoneyMakerInput.Settings.MaxCommission
+
+        self.LogMessage(f"Estimated commission -> {orderDetail.EstimatedCommission}")
+        self.LogMessage(f"Estimated Fees -> {orderDetail.EstimatedFees}")
+        self.LogMessage(f"Estimated Total Amount -> {orderDetail.EstimatedTotalAmount}")
+        # EstimatedCommission is suppossed to be zero.
+        if(orderDetail.EstimatedCommission != 0):
+            self.LogMessage(f"Something changed, commission is suppossed to be 0, received value is {orderDetail.EstimatedCommission}", True, True)
+            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+            raise Exception("Fatal Error.")
+        # EstimatedFees is not suppossed to be filled by the API.
+        if(orderDetail.EstimatedFees != unfilledCommissionFee):
+            self.LogMessage(f"Something changed, fees is suppossed to be {unfilledCommissionFee}, received value is {orderDetail.EstimatedFees}", True, True)
+            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+            raise Exception("Fatal Error.")
+        # If BUY totalValue should be same as EstimatedTotalAmount.
+        if orderAction == "BUY" and \
+            (totalValue - orderDetail.EstimatedTotalAmount != 0):
+            self.LogMessage(f"Something changed - EstimatedTotalAmount is suppossed to be {totalValue}, received value is {orderDetail.EstimatedTotalAmount}", True, True)
+            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+            raise Exception("Fatal Error.")
+        # If SELL EstimatedTotalAmount is negative. Commission charged cannot be more than maxCommission.
+        if orderAction == "SELL" and \
+            (totalValue + orderDetail.EstimatedTotalAmount > maxCommission):
+            self.LogMessage(f"Something changed - Too much commission - {totalValue + orderDetail.EstimatedTotalAmount}", True, True)
+            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.",True, True)
+            raise Exception("Fatal Error.")
+        instruments:List[Instrument] = orderDetail.Instruments
+        for instrument in instruments:
+            self.LogMessage(f"Symbol - Quantity -> {instrument.Symbol}, {instrument.Quantity}")
+            self.LogMessage(f"EstimatedCommission -> {instrument.EstimatedCommission}")
+            self.LogMessage(f"EstimatedFees -> {instrument.EstimatedFees}")
+            # EstimatedCommission is not suppossed to be filled by the API.
+            if(instrument.EstimatedCommission != unfilledCommissionFee):
+                self.LogMessage(f"Something changed, estimated commission is suppossed to be {unfilledCommissionFee}, received value is {instrument.EstimatedCommission}", True, True)
+                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+                raise Exception("Fatal Error.")
+            # EstimatedFees is not suppossed to be filled by the API.
+            if(instrument.EstimatedFees != unfilledCommissionFee):
+                self.LogMessage(f"Something changed, estimated fees is suppossed to be {unfilledCommissionFee}, received value is {instrument.EstimatedFees}", True, True)
+                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
+                raise Exception("Fatal Error.")
+
+    def GetPipelineOrders(self, limitOrders:List[OrderInfo]) -> List[OrderInfo]:
+        """ New orders of the stock item in the order they are submitted to the order pipeline. SELL orders
+            before BUY orders. The SELL orders are above and the BUY orders below the market price, so each side
+            starts closest to the market price, the lowest SELL and the highest BUY.
+        """
+        newOrders = [limitOrder for limitOrder in limitOrders if limitOrder.OrderId <= 0]
+        sellOrders = sorted((limitOrder for limitOrder in newOrders if limitOrder.IsSell is True), key= lambda x:x.LimitPrice)
+        buyOrders = sorted((limitOrder for limitOrder in newOrders if limitOrder.IsSell is False), key= lambda x:x.LimitPrice, reverse=True)
+        return sellOrders + buyOrders
+
+    def GetLimitOrderInput(self, limitOrder:OrderInfo) -> Tuple[PreviewOrderInput, str, Price]:
+        """ Order input, OrderAction and total value of a new order. Fixed-point total value, compared exactly
+            with the values from the API.
+        """
+        orderAction = "SELL" if limitOrder.IsSell is True else "BUY"
+        orderData = self.OrderInput(limitOrder.Symbol, orderAction, limitOrder.LimitPrice, limitOrder.Quantity)
+        totalValue:Price = (limitOrder.LimitPrice * int(limitOrder.Quantity)).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
+        return orderData, orderAction, totalValue
+
+    def GetAccessKeysAfter(self, response, accessToken:str, accessTokenSecret:str) -> Tuple[str, str]:
+        """ Access keys to use after a response. The latest access keys after a response error(the tokens may
+            be renewed by MoneyMakerProcessResponseError), the same access keys otherwise.
+        """
+        if(response is not None and response.Error is not None and response.Error.ResponseStatusCode != ""):
+            accessToken, accessTokenSecret, dateTimeObj = self.GetLatestAccessKeyDetails()
+        return accessToken, accessTokenSecret
+
+    def ProcessCancelOrderResponse(self, cancelOrder:OrderInfo, cancelOrderResponse:CancelOrderResponse) -> bool:
+        """ Handles the cancel response of an order. The cancelled order is removed from the OrderBookMirror.
+
+            Returns:
+
+            True if the order is cancelled.
+
+        """
+        # Process cancel response error.
+        if(cancelOrderResponse.Error is not None and cancelOrderResponse.Error.ResponseStatusCode != ""):
+            self.MoneyMakerProcessResponseError(cancelOrderResponse.Error)
+            return False
+
+        # Process cancel response message.
+        if(cancelOrderResponse.Messages is not None and len(cancelOrderResponse.Messages) != 0):
+            if(self.MoneyMakerProcessMessageError(cancelOrderResponse.Messages) is False):
+                return False
+
+        self.OrderBookMirror.RemoveOrder(cancelOrder.OrderId)
+        return True
+
+    def VerifyCancels(self, activeStockItem:ActiveStockItem, cancelOrders:List[OrderInfo], cancelledOrderIds:List[int],
+                        ordersResponse:OrdersResponse):
+        """ Verifies the cancelled orders of the stock item. Using the cancel responses if the orders are not
+            fetched again(ordersResponse is None, OrderBookMirror), the OrderBookMirror is reconciled if
+            something failed.
+        """
+        if ordersResponse is None:
+            self.VerifyCancelResponses(activeStockItem, cancelOrders, cancelledOrderIds)
+        else:
+            self.VerifyCancelledOrders(activeStockItem, cancelOrders, ordersResponse)
+
+    def IsClientOrderLookupRequired(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo]) -> bool:
+        """ Are there new orders to place and orders with an unknown place outcome of the stock item? The orders
+            with an unknown place outcome are looked up instead of placed again.
+        """
+        return (any(limitOrder.OrderId <= 0 for limitOrder in limitOrders) and
+                    len(self.ClientOrderRegistry.GetUnknown(activeStockItem.Symbol)) != 0)
+
+    def ProcessOrderBatchResult(self, batchResult:OrderBatchResult):
+        """ Logs the outcomes of the orders of the order pipeline once, raises the exception of the batch if any.
+        """
+        self.LogMessage(str(batchResult), batchResult.HasFailures(), True)
+        if batchResult.Error is not None:
+            raise batchResult.Error
 
+    def ProcessPreviewOrderResponse(self, limitOrder:OrderInfo, orderAction:str, totalValue:Price,
+                                    previewOrderResponse:PreviewOrderResponse) -> OrderOutcomeStatus:
+        """ Handles the preview response of a new order.
+
+            Returns:
+
+            OrderOutcomeStatus - PREVIEW_FAILED or INVALID_PREVIEW. None if the order can be placed.
+
+        """
+        if(previewOrderResponse.Error is not None and previewOrderResponse.Error.ResponseStatusCode != ""):
+            self.MoneyMakerProcessResponseError(previewOrderResponse.Error)
+            return OrderOutcomeStatus.PREVIEW_FAILED
+
+        if(previewOrderResponse.Messages is not None and len(previewOrderResponse.Messages) != 0):
+            if(self.MoneyMakerProcessMessageError(previewOrderResponse.Messages) is False):
+                return OrderOutcomeStatus.PREVIEW_FAILED
+
+        if self.ValidatePreviewOrderResponse(previewOrderResponse, orderAction, totalValue) is False:
+            return OrderOutcomeStatus.INVALID_PREVIEW
+        return None
+
+    def ProcessPlaceOrderResponse(self, limitOrder:OrderInfo, clientOrderId:str, orderAction:str, totalValue:Price,
+                                    placeOrderResponse:PlaceOrderResponse) -> Tuple[OrderOutcomeStatus, int]:
+        """ Handles the place response of a new order. Updates the ClientOrderRegistry and the OrderBookMirror.
+
+            Returns:
+
+            Tuple[OrderOutcomeStatus, int] - Outcome and OrderId of the order.
+
+        """
+        # The order may or may not be placed.
+        if(placeOrderResponse.Error is not None and placeOrderResponse.Error.ResponseStatusCode != ""):
+            self.ClientOrderRegistry.SetState(clientOrderId, self.GetPlaceOrderErrorState(placeOrderResponse.Error))
+            self.OrderBookMirror.MarkMismatch(f"Place order error for {limitOrder.Symbol}.")
+            self.MoneyMakerProcessResponseError(placeOrderResponse.Error)
+            return OrderOutcomeStatus.PLACE_FAILED, 0
+
+        if(placeOrderResponse.Messages is not None and len(placeOrderResponse.Messages) != 0):
+            if(self.MoneyMakerProcessMessageError(placeOrderResponse.Messages) is False):
+                self.ClientOrderRegistry.SetState(clientOrderId, ClientOrderRegistry.Rejected)
+                self.OrderBookMirror.MarkMismatch(f"Place order message for {limitOrder.Symbol}.")
+                return OrderOutcomeStatus.PLACE_FAILED, 0
+
+        # Placed, looked up later if the OrderId is missing.
+        placedOrderId = self.GetPlacedOrderId(placeOrderResponse)
+        self.ClientOrderRegistry.SetState(clientOrderId,
+            ClientOrderRegistry.Placed if placedOrderId != 0 else ClientOrderRegistry.Unknown, placedOrderId)
+
+        if self.ValidatePlaceOrderResponse(placeOrderResponse, orderAction, totalValue) is False:
+            self.OrderBookMirror.MarkMismatch(f"Invalid place order response for {limitOrder.Symbol}.")
+            return OrderOutcomeStatus.INVALID_PLACE, placedOrderId
+
+        self.AddPlacedOrderToMirror(placeOrderResponse, limitOrder)
+        return OrderOutcomeStatus.PLACED, placedOrderId
+
+    def LogPlaceOrderOutcome(self, limitOrder:OrderInfo, orderAction:str, status:OrderOutcomeStatus):
+        """ Logs the outcome of a new order placed one after the other. The errors and messages of the
+            responses are already logged.
+        """
+        if status is OrderOutcomeStatus.PLACED:
+            self.LogMessage(f"Placed {orderAction} Order {limitOrder.Symbol} at {limitOrder.LimitPrice}", True, True)
+        elif status in (OrderOutcomeStatus.INVALID_PREVIEW, OrderOutcomeStatus.INVALID_PLACE):
+            self.LogMessage(f"Failed to place {orderAction} Order {limitOrder.Symbol} at {limitOrder.LimitPrice}", True, True)
+
+    def SetPlaceOrderUnknown(self, limitOrder:OrderInfo, clientOrderId:str):
+        """ The order may or may not be placed without a place response, looked up before placing the orders of
+            the symbol again.
+        """
+        self.ClientOrderRegistry.SetState(clientOrderId, ClientOrderRegistry.Unknown)
+        self.OrderBookMirror.MarkMismatch(f"No place order response for {limitOrder.Symbol}.")
+
+    def PreviewLimitOrder(self, orderData:PreviewOrderInput, accessToken:str, accessTokenSecret:str) -> PreviewOrderResponse:
+        """ Previews a new order.
+        """
+        return self.MoneyMakerInput.Order.PreviewOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    previewOrderInput = orderData, accessToken= accessToken, accessTokenSecret= accessTokenSecret)
+
+    async def PreviewLimitOrderAsync(self, orderData:PreviewOrderInput, accessToken:str, accessTokenSecret:str) -> PreviewOrderResponse:
+        """ asyncio version of PreviewLimitOrder.
+        """
+        return await self.MoneyMakerInput.AsyncOrder.PreviewOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    previewOrderInput = orderData, accessToken= accessToken, accessTokenSecret= accessTokenSecret)
+
+    def PlaceLimitOrder(self, limitOrder:OrderInfo, orderData:PreviewOrderInput, previewIds,
+                        accessToken:str, accessTokenSecret:str) -> PlaceOrderResponse:
+        """ Places a previewed order. Registered before placing, UNKNOWN without a response.
+        """
+        self.ClientOrderRegistry.Register(orderData.ClientOrderId, limitOrder)
+        try:
+            return self.MoneyMakerInput.Order.PlaceOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                        previewOrderInput = orderData, previewIds = previewIds,
+                        accessToken= accessToken, accessTokenSecret= accessTokenSecret)
+        except TransientErrors:
+            self.SetPlaceOrderUnknown(limitOrder, orderData.ClientOrderId)
+            raise
+
+    async def PlaceLimitOrderAsync(self, limitOrder:OrderInfo, orderData:PreviewOrderInput, previewIds,
+                                    accessToken:str, accessTokenSecret:str) -> PlaceOrderResponse:
+        """ asyncio version of PlaceLimitOrder.
+        """
+        self.ClientOrderRegistry.Register(orderData.ClientOrderId, limitOrder)
+        try:
+            return await self.MoneyMakerInput.AsyncOrder.PlaceOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                        previewOrderInput = orderData, previewIds = previewIds,
+                        accessToken= accessToken, accessTokenSecret= accessTokenSecret)
+        except TransientErrors:
+            self.SetPlaceOrderUnknown(limitOrder, orderData.ClientOrderId)
+            raise
+
+    def StartOrdersPipeline(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo]) -> Tuple[OrderBatchResult, List[tuple]]:
+        """ Batch result of the order pipeline with the new orders SKIPPED, in the order of GetPipelineOrders, and
+            the order input, OrderAction and total value of each order(GetLimitOrderInput).
+        """
+        batchResult = OrderBatchResult(activeStockItem.Symbol)
+        orderInputs:List[tuple] = []
+        for limitOrder in self.GetPipelineOrders(limitOrders):
+            orderData, orderAction, totalValue = self.GetLimitOrderInput(limitOrder)
+            batchResult.Add(OrderOutcome(limitOrder, OrderOutcomeStatus.SKIPPED, orderData.ClientOrderId))
+            orderInputs.append((orderData, orderAction, totalValue))
+        return batchResult, orderInputs
+
+    def ProcessPipelinePreview(self, batchResult:OrderBatchResult, orderInputs:List[tuple], index:int,
+                                previewOrderResponse:PreviewOrderResponse, error:Exception) -> Optional[list]:
+        """ Handles the preview response, or the exception, of an order of the order pipeline.
+
+            Returns:
+
+            PreviewIds to place the order. None if the order is not placed, also after an exception in the batch.
+
+        """
+        outcome = batchResult.Outcomes[index]
+        orderData, orderAction, totalValue = orderInputs[index]
+        if error is None:
+            try:
+                status = self.ProcessPreviewOrderResponse(outcome.LimitOrder, orderAction, totalValue, previewOrderResponse)
+            except Exception as exception:
+                error = exception
+        if error is not None:
+            outcome.Status = OrderOutcomeStatus.ERROR
+            batchResult.Error = batchResult.Error or error
+            return None
+        if status is not None:
+            outcome.Status = status
+            return None
+        if batchResult.Error is not None:
+            return None
+        return previewOrderResponse.PreviewOrderResponseData.PreviewIds
+
+    def ProcessPipelinePlace(self, batchResult:OrderBatchResult, orderInputs:List[tuple], index:int,
+                                placeOrderResponse:PlaceOrderResponse, error:Exception):
+        """ Handles the place response, or the exception, of an order of the order pipeline.
+        """
+        outcome = batchResult.Outcomes[index]
+        orderData, orderAction, totalValue = orderInputs[index]
+        if error is None:
+            try:
+                outcome.Status, outcome.OrderId = self.ProcessPlaceOrderResponse(outcome.LimitOrder, orderData.ClientOrderId,
+                                                    orderAction, totalValue, placeOrderResponse)
+                return
+            except Exception as exception:
+                error = exception
+        outcome.Status = OrderOutcomeStatus.ERROR
+        batchResult.Error = batchResult.Error or error
+
+    def PlaceOrdersPipeline(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo],
+                            accessToken:str, accessTokenSecret:str) -> OrderBatchResult:
+        """ Order pipeline of one stock item. The new orders are previewed concurrently, each preview is
+            validated as it arrives and the valid orders are placed concurrently, at most
+            Settings.OrderPipelineMaxConcurrentOrders requests of all the stock items at a time(OrderPipelineExecutor),
+            in the order of GetPipelineOrders.
+            All the SELL orders are placed before the BUY orders are placed. After an exception no more
+            orders are placed, the exception is returned in the OrderBatchResult.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Active stock item.
+
+            limitOrders:List[OrderInfo] - Orders to place of the stock item(GetStockItemOrders).
+
+            accessToken:str - Access token.
+
+            accessTokenSecret:str - Access token secret.
+
+            Returns:
+
+            OrderBatchResult - Outcome of each new order.
+
+        """
+        batchResult, orderInputs = self.StartOrdersPipeline(activeStockItem, limitOrders)
+
+        def Place(index:int, previewIds):
+            return self.SubmitOrderPipelineRequest(self.PlaceLimitOrder, batchResult.Outcomes[index].LimitOrder,
+                        orderInputs[index][0], previewIds, accessToken, accessTokenSecret)
+
+        previews = {self.SubmitOrderPipelineRequest(self.PreviewLimitOrder, orderInput[0], accessToken, accessTokenSecret): index
+                    for index, orderInput in enumerate(orderInputs)}
+        sellPlaces = {}
+        buyPreviewIds:Dict[int, list] = {}
+        for future in as_completed(previews):
+            index = previews[future]
+            previewOrderResponse, error = self.GetOrderPipelineResult(future)
+            previewIds = self.ProcessPipelinePreview(batchResult, orderInputs, index, previewOrderResponse, error)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(previewOrderResponse, accessToken, accessTokenSecret)
+            if previewIds is None:
+                continue
+            if batchResult.Outcomes[index].LimitOrder.IsSell is True:
+                sellPlaces[Place(index, previewIds)] = index
+            else:
+                buyPreviewIds[index] = previewIds
+
+        # SELL orders first.
+        for future in as_completed(sellPlaces):
+            self.ProcessPipelinePlace(batchResult, orderInputs, sellPlaces[future], *self.GetOrderPipelineResult(future))
+        if batchResult.Error is None:
+            buyPlaces = {Place(index, buyPreviewIds[index]): index for index in sorted(buyPreviewIds)}
+            for future in as_completed(buyPlaces):
+                self.ProcessPipelinePlace(batchResult, orderInputs, buyPlaces[future], *self.GetOrderPipelineResult(future))
+
+        return batchResult
+
+    def SubmitOrderPipelineRequest(self, function, *args) -> Future:
+        """ Submits a preview/place request of the order pipeline to the OrderPipelineExecutor. Log messages of
+            the workers keep the Symbol of the stock item.
+        """
+        return self.OrderPipelineExecutor.submit(copy_context().run, function, *args)
+
+    @staticmethod
+    def GetOrderPipelineResult(future:Future) -> tuple:
+        """ Response and exception of a preview/place request of the order pipeline, the other one is None.
+        """
+        error = future.exception()
+        return (future.result() if error is None else None), error
+
+    def GetOrderPipelineSemaphore(self) -> asyncio.Semaphore:
+        """ Gets the OrderPipelineSemaphore, shared by the async order pipelines of all the stock items. A semaphore
+            is bound to its event loop, so a new one is created when the running event loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self.OrderPipelineLoop is not loop:
+            self.OrderPipelineSemaphore = asyncio.Semaphore(max(1, self.MoneyMakerInput.Settings.OrderPipelineMaxConcurrentOrders))
+            self.OrderPipelineLoop = loop
+        return self.OrderPipelineSemaphore
+
+    async def PlaceOrdersPipelineAsync(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo],
+                                        accessToken:str, accessTokenSecret:str) -> OrderBatchResult:
+        """ asyncio version of PlaceOrdersPipeline. The previews and places are asyncio tasks, at most
+            Settings.OrderPipelineMaxConcurrentOrders of all the stock items at a time(OrderPipelineSemaphore).
+        """
+        batchResult, orderInputs = self.StartOrdersPipeline(activeStockItem, limitOrders)
+        semaphore = self.GetOrderPipelineSemaphore()
+
+        def Place(index:int, previewIds):
+            return asyncio.ensure_future(self.RunOrderPipelineRequest(semaphore, index,
+                        self.PlaceLimitOrderAsync(batchResult.Outcomes[index].LimitOrder, orderInputs[index][0], previewIds,
+                                                    accessToken, accessTokenSecret)))
+
+        def Preview(index:int, orderData:PreviewOrderInput):
+            return asyncio.ensure_future(self.RunOrderPipelineRequest(semaphore, index,
+                        self.PreviewLimitOrderAsync(orderData, accessToken, accessTokenSecret)))
+
+        previews = [Preview(index, orderInput[0]) for index, orderInput in enumerate(orderInputs)]
+        sellPlaces = []
+        buyPreviewIds:Dict[int, list] = {}
+        for completed in asyncio.as_completed(previews):
+            index, previewOrderResponse, error = await completed
+            previewIds = self.ProcessPipelinePreview(batchResult, orderInputs, index, previewOrderResponse, error)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(previewOrderResponse, accessToken, accessTokenSecret)
+            if previewIds is None:
+                continue
+            if batchResult.Outcomes[index].LimitOrder.IsSell is True:
+                sellPlaces.append(Place(index, previewIds))
+            else:
+                buyPreviewIds[index] = previewIds
+
+        # SELL orders first.
+        for completed in asyncio.as_completed(sellPlaces):
+            self.ProcessPipelinePlace(batchResult, orderInputs, *await completed)
+        if batchResult.Error is None:
+            for completed in asyncio.as_completed([Place(index, buyPreviewIds[index]) for index in sorted(buyPreviewIds)]):
+                self.ProcessPipelinePlace(batchResult, orderInputs, *await completed)
+
+        return batchResult
+
+    async def RunOrderPipelineRequest(self, semaphore:asyncio.Semaphore, index:int, coroutine) -> tuple:
+        """ Runs a preview/place request of the async order pipeline, at most OrderPipelineMaxConcurrentOrders at
+            a time. Tasks are started in the order of GetPipelineOrders.
+
+            Returns:
+
+            tuple - Index of the order, response and exception of the request, the other one is None.
+
+        """
+        async with semaphore:
+            try:
+                return index, await coroutine, None
+            except Exception as error:
+                return index, None, error
+
+    def ProcessStockItem(self, activeStockItem:ActiveStockItem, openOrders:List[Order],
+                            portfolioPositionsBySymbol:Dict[str, PortfolioPosition], possibleLimitOrders:List[OrderInfo],
+                            accessToken:str, accessTokenSecret:str):
+        """ Processes one stock item of the cycle. Cancels the stale orders of the stock item or places the
+            missing orders of the stock item. All the state of the stock item is local to this method, so the
+            stock items can be processed concurrently. Messages are logged with the Symbol of the stock item.
+
+            Parameters:
+
+            activeStockItem:ActiveStockItem - Active stock item.
+
+            openOrders:List[Order] - Open orders of the stock item(IndexOrdersBySymbol).
+
+            portfolioPositionsBySymbol:Dict[str, PortfolioPosition] - Portfolio positions by Symbol(upper case).
+
+            possibleLimitOrders:List[OrderInfo] - Possible limit orders of the stock item.
+
+            accessToken:str - Access token.
+
+            accessTokenSecret:str - Access token secret.
+
+            Returns:
+
+            Tuple[List[OrderInfo], List[OrderInfo]] - [Orders to Place, Orders to Cancel] of the stock item.
+
+        """
+        logContextToken = self.LogContext.set(activeStockItem.Symbol)
+        try:
+            limitOrders, cancelOrders = self.GetStockItemOrders(activeStockItem, openOrders, portfolioPositionsBySymbol, possibleLimitOrders)
+
+            # In one cycle cancel the orders and in the next cycle place the orders.
+            # Reason for this approach is, there is a delay when orders are cancelled.
+            if(len(cancelOrders) != 0):
+                self.CancelStockItemOrders(activeStockItem, cancelOrders, accessToken, accessTokenSecret)
+                # In either case we will place orders in the next cycle.
+                # We are not in a hurry :)
+            else:
+                self.PlaceStockItemOrders(activeStockItem, limitOrders, accessToken, accessTokenSecret)
+
+            return limitOrders, cancelOrders
+        finally:
+            self.LogContext.reset(logContextToken)
+
+    async def ProcessStockItemAsync(self, activeStockItem:ActiveStockItem, openOrders:List[Order],
+                            portfolioPositionsBySymbol:Dict[str, PortfolioPosition], possibleLimitOrders:List[OrderInfo],
+                            accessToken:str, accessTokenSecret:str):
+        """ asyncio version of ProcessStockItem. Uses the AsyncOrder of the MoneyMakerInput. The orders of the
+            stock item are still cancelled/previewed/placed one after the other.
+        """
+        logContextToken = self.LogContext.set(activeStockItem.Symbol)
+        try:
+            limitOrders, cancelOrders = self.GetStockItemOrders(activeStockItem, openOrders, portfolioPositionsBySymbol, possibleLimitOrders)
+
+            # In one cycle cancel the orders and in the next cycle place the orders.
+            if(len(cancelOrders) != 0):
+                await self.CancelStockItemOrdersAsync(activeStockItem, cancelOrders, accessToken, accessTokenSecret)
+            else:
+                await self.PlaceStockItemOrdersAsync(activeStockItem, limitOrders, accessToken, accessTokenSecret)
+
+            return limitOrders, cancelOrders
+        finally:
+            self.LogContext.reset(logContextToken)
+
+    def CancelStockItemOrders(self, activeStockItem:ActiveStockItem, cancelOrders:List[OrderInfo],
+                                accessToken:str, accessTokenSecret:str):
+        """ Cancels the stale orders of the stock item one after the other and verifies they are cancelled.
+        """
+        self.LogMessage(f"Processing cancel orders of {activeStockItem.Symbol} - {cancelOrders}", False, True)
+        cancelledOrderIds:List[int] = []
+        for cancelOrder in cancelOrders:
+            cancelOrderResponse:CancelOrderResponse = self.MoneyMakerInput.Order.CancelOrder(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    orderId = cancelOrder.OrderId, accessToken = accessToken, accessTokenSecret=accessTokenSecret)
+            if self.ProcessCancelOrderResponse(cancelOrder, cancelOrderResponse) is True:
+                cancelledOrderIds.append(cancelOrder.OrderId)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(cancelOrderResponse, accessToken, accessTokenSecret)
+
+        # Get the orders of the symbol again to verify if they are cancelled or not, only the symbols with
+        # cancelled orders are fetched again. The cancel responses are enough with the OrderBookMirror.
+        ordersResponse:OrdersResponse = None
+        if self.MoneyMakerInput.Settings.UseOrderBookMirror is False:
+            ordersResponse = self.MoneyMakerInput.Order.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                accessToken= accessToken,
+                accessTokenSecret= accessTokenSecret,
+                filteringAndPagingParams= self.GetOpenOrdersParams(activeStockItem.Symbol.upper()))
+        self.VerifyCancels(activeStockItem, cancelOrders, cancelledOrderIds, ordersResponse)
+
+    async def CancelStockItemOrdersAsync(self, activeStockItem:ActiveStockItem, cancelOrders:List[OrderInfo],
+                                            accessToken:str, accessTokenSecret:str):
+        """ asyncio version of CancelStockItemOrders.
+        """
+        self.LogMessage(f"Processing cancel orders of {activeStockItem.Symbol} - {cancelOrders}", False, True)
+        cancelledOrderIds:List[int] = []
+        for cancelOrder in cancelOrders:
+            cancelOrderResponse:CancelOrderResponse = await self.MoneyMakerInput.AsyncOrder.CancelOrder(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    orderId = cancelOrder.OrderId, accessToken = accessToken, accessTokenSecret=accessTokenSecret)
+            if self.ProcessCancelOrderResponse(cancelOrder, cancelOrderResponse) is True:
+                cancelledOrderIds.append(cancelOrder.OrderId)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(cancelOrderResponse, accessToken, accessTokenSecret)
+
+        ordersResponse:OrdersResponse = None
+        if self.MoneyMakerInput.Settings.UseOrderBookMirror is False:
+            ordersResponse = await self.MoneyMakerInput.AsyncOrder.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                accessToken= accessToken,
+                accessTokenSecret= accessTokenSecret,
+                filteringAndPagingParams= self.GetOpenOrdersParams(activeStockItem.Symbol.upper()))
+        self.VerifyCancels(activeStockItem, cancelOrders, cancelledOrderIds, ordersResponse)
+
+    def PlaceStockItemOrders(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo],
+                                accessToken:str, accessTokenSecret:str):
+        """ Places the new orders of the stock item, using the order pipeline if Settings.UseOrderPipeline is True.
+            Orders with an unknown place outcome are looked up instead.
+        """
+        self.LogMessage(f"Processing place limit orders of {activeStockItem.Symbol} - {limitOrders}", False, True)
+
+        if self.IsClientOrderLookupRequired(activeStockItem, limitOrders) is True:
+            ordersResponse = self.MoneyMakerInput.Order.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                accessToken= accessToken,
+                accessTokenSecret= accessTokenSecret,
+                filteringAndPagingParams= self.GetClientOrderLookupParams(activeStockItem.Symbol))
+            self.ProcessClientOrderLookup(activeStockItem.Symbol, ordersResponse)
+            return
+
+        # Previewed and placed concurrently, the outcomes of the orders are logged once.
+        if(self.MoneyMakerInput.Settings.UseOrderPipeline is True):
+            self.ProcessOrderBatchResult(self.PlaceOrdersPipeline(activeStockItem, limitOrders, accessToken, accessTokenSecret))
+            return
+
+        # Preview and Place orders one after the other.
         for limitOrder in limitOrders:
-            found = False
-            for openLimitOrder in openLimitOrders:
-                if limitOrder.LimitPrice == openLimitOrder.LimitPrice and \
-                    limitOrder.IsSell == openLimitOrder.IsSell:
-                    finalLimitOrders.append(openLimitOrder)
-                    found = True
-                    break
-            if found == False:
-                finalLimitOrders.append(limitOrder)
-
-        cancelOrders:List[OrderStatusInfo] = []
-        for openLimitOrder in openLimitOrders:
-            found = False
-            for finalLimitOrder in finalLimitOrders:
-                if finalLimitOrder.OrderId == openLimitOrder.OrderId:
-                    found = True
-                    break
-            if found == False:
-                cancelOrders.append(openLimitOrder)
+            # If existing order.
+            if(limitOrder.OrderId > 0):
+                continue
+            self.LogMessage(f"Processing place limit order - {limitOrder}", False, True)
+            orderData, orderAction, totalValue = self.GetLimitOrderInput(limitOrder)
+
+            previewOrderResponse = self.PreviewLimitOrder(orderData, accessToken, accessTokenSecret)
+            status = self.ProcessPreviewOrderResponse(limitOrder, orderAction, totalValue, previewOrderResponse)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(previewOrderResponse, accessToken, accessTokenSecret)
+
+            # Place the order using the input from preview and previewIds.
+            if status is None:
+                placeOrderResponse = self.PlaceLimitOrder(limitOrder, orderData, previewOrderResponse.PreviewOrderResponseData.PreviewIds,
+                                        accessToken, accessTokenSecret)
+                status, placedOrderId = self.ProcessPlaceOrderResponse(limitOrder, orderData.ClientOrderId, orderAction, totalValue,
+                                            placeOrderResponse)
+            self.LogPlaceOrderOutcome(limitOrder, orderAction, status)
+
+    async def PlaceStockItemOrdersAsync(self, activeStockItem:ActiveStockItem, limitOrders:List[OrderInfo],
+                                        accessToken:str, accessTokenSecret:str):
+        """ asyncio version of PlaceStockItemOrders.
+        """
+        self.LogMessage(f"Processing place limit orders of {activeStockItem.Symbol} - {limitOrders}", False, True)
+
+        if self.IsClientOrderLookupRequired(activeStockItem, limitOrders) is True:
+            ordersResponse = await self.MoneyMakerInput.AsyncOrder.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                accessToken= accessToken,
+                accessTokenSecret= accessTokenSecret,
+                filteringAndPagingParams= self.GetClientOrderLookupParams(activeStockItem.Symbol))
+            self.ProcessClientOrderLookup(activeStockItem.Symbol, ordersResponse)
+            return
 
-        finalLimitOrders.sort(key= lambda x:x.LimitPrice, reverse=True)
-        cancelOrders.sort(key= lambda x:x.LimitPrice)
-        return finalLimitOrders, cancelOrders
+        if(self.MoneyMakerInput.Settings.UseOrderPipeline is True):
+            self.ProcessOrderBatchResult(await self.PlaceOrdersPipelineAsync(activeStockItem, limitOrders, accessToken, accessTokenSecret))
+            return
+
+        for limitOrder in limitOrders:
+            if(limitOrder.OrderId > 0):
+                continue
+            self.LogMessage(f"Processing place limit order - {limitOrder}", False, True)
+            orderData, orderAction, totalValue = self.GetLimitOrderInput(limitOrder)
+
+            previewOrderResponse = await self.PreviewLimitOrderAsync(orderData, accessToken, accessTokenSecret)
+            status = self.ProcessPreviewOrderResponse(limitOrder, orderAction, totalValue, previewOrderResponse)
+            accessToken, accessTokenSecret = self.GetAccessKeysAfter(previewOrderResponse, accessToken, accessTokenSecret)
+
+            if status is None:
+                placeOrderResponse = await self.PlaceLimitOrderAsync(limitOrder, orderData, previewOrderResponse.PreviewOrderResponseData.PreviewIds,
+                                        accessToken, accessTokenSecret)
+                status, placedOrderId = self.ProcessPlaceOrderResponse(limitOrder, orderData.ClientOrderId, orderAction, totalValue,
+                                            placeOrderResponse)
+            self.LogPlaceOrderOutcome(limitOrder, orderAction, status)
+
+    def UpdateAccessKeys(self) -> Tuple[str, str]:
+        """ Gets the latest Access Keys and updates the Input with the latest keys.
+            We can move the updation part to the EntryInput itself, but it's ok.
+
+            The shared session pool is updated in place.
+
+            Returns:
+
+            Access token and access token secret.
+        """
+        accessToken, accessTokenSecret, dateTimeObj = self.GetLatestAccessKeyDetails()
+        self.MoneyMakerInput.InputModel.AccessToken = accessToken
+        self.MoneyMakerInput.InputModel.AccessTokenSecret = accessTokenSecret
+        self.MoneyMakerInput.InputModel.AccessTokenDateTime = dateTimeObj
+        self.MoneyMakerInput.SessionPool.UpdateAccessKeys(accessToken, accessTokenSecret)
+        self.MoneyMakerInput.Auth.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.Account.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.Order.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.AsyncAccount.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.AsyncOrder.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.Market.inputModel = self.MoneyMakerInput.InputModel
+        self.MoneyMakerInput.AsyncMarket.inputModel = self.MoneyMakerInput.InputModel
+        return accessToken, accessTokenSecret
+
+    def GetPortfolioPositionsBySymbol(self, portfolioResponse:PortfolioResponse) -> Dict[str, PortfolioPosition]:
+        """ Portfolio positions by Symbol(upper case), first position of the symbol is used.
+        """
+        portfolioPositionsBySymbol:Dict[str, PortfolioPosition] = {}
+        if portfolioResponse.AccountPortfolios is not None and len(portfolioResponse.AccountPortfolios) != 0 and \
+            portfolioResponse.AccountPortfolios[0].PortfolioPositions is not None:
+            for item in portfolioResponse.AccountPortfolios[0].PortfolioPositions:
+                portfolioPositionsBySymbol.setdefault(item.Symbol.upper(), item)
+        return portfolioPositionsBySymbol
+
+    def GetAllPossibleLimitOrders(self, portfolioPositionsBySymbol:Dict[str, PortfolioPosition],
+                                    activeStockItems:List[ActiveStockItem] = None) -> LimitOrdersBatch:
+        """ Generates the possible limit orders of the stock items at once. All the active stock items if
+            activeStockItems is None.
         """
+        if activeStockItems is None:
+            activeStockItems = self.MoneyMakerInput.ActiveStockItems
+        return self.ManageOrdersHelpers.GenerateAllPossibleLimitOrders(activeStockItems,
+                    {activeStockItem.Symbol: self.GetPortfolioQuantity(activeStockItem, portfolioPositionsBySymbol)
+                        for activeStockItem in activeStockItems})
+
+    def GetPortfolioQuantity(self, activeStockItem:ActiveStockItem, portfolioPositionsBySymbol:Dict[str, PortfolioPosition]) -> int:
+        """ Portfolio quantity of the stock item, 0 without a position.
+        """
+        portfolioPosition = portfolioPositionsBySymbol.get(activeStockItem.Symbol.upper())
+        return portfolioPosition.Quantity if portfolioPosition is not None else 0
+
+    def GetCycleStockItems(self) -> List[ActiveStockItem]:
+        """ Gets the stock items to process in the cycle. All the active stock items, or only the due stock
+            items if Settings.UseAdaptivePolling is True.
+        """
+        activeStockItems = self.MoneyMakerInput.ActiveStockItems
+        if activeStockItems is None or self.MoneyMakerInput.Settings.UseAdaptivePolling is False:
+            return activeStockItems
+
+        now = time.monotonic()
+        self.PollingScheduler.SetSymbols([activeStockItem.Symbol for activeStockItem in activeStockItems], now)
+        dueSymbols = set(self.PollingScheduler.GetDueSymbols(now))
+        return [activeStockItem for activeStockItem in activeStockItems if activeStockItem.Symbol.upper() in dueSymbols]
+
+    def GetQuoteSymbols(self, activeStockItems:List[ActiveStockItem], 
+                            portfolioPositionsBySymbol:Dict[str, PortfolioPosition]) -> List[str]:
+        """ Symbols of the stock items whose last price is taken from the Quotes. All the stock items if
+            Settings.UseQuoteBands is True, otherwise the stock items without the last price in the portfolio.
+        """
+        if self.MoneyMakerInput.Settings.UseQuoteBands is True:
+            return [activeStockItem.Symbol.upper() for activeStockItem in activeStockItems]
+        if self.MoneyMakerInput.Settings.UseAdaptivePolling is False:
+            return []
+        quoteSymbols:List[str] = []
+        for activeStockItem in activeStockItems:
+            portfolioPosition = portfolioPositionsBySymbol.get(activeStockItem.Symbol.upper())
+            if portfolioPosition is None or not portfolioPosition.LastPrice:
+                quoteSymbols.append(activeStockItem.Symbol.upper())
+        return quoteSymbols
+
+    def GetLastPrices(self, portfolioPositionsBySymbol:Dict[str, PortfolioPosition], 
+                            quoteResponse:QuoteResponse = None) -> Dict[str, Price]:
+        """ Last traded prices by Symbol(upper case) from the portfolio positions and the quotes. The quotes
+            are more recent and replace the portfolio prices.
+        """
+        lastPrices:Dict[str, Price] = {}
+        for symbol, portfolioPosition in portfolioPositionsBySymbol.items():
+            if portfolioPosition.LastPrice:
+                lastPrices[symbol] = Price.From(portfolioPosition.LastPrice)
+        if quoteResponse is not None and (quoteResponse.Error is None or quoteResponse.Error.ResponseStatusCode == ""):
+            for quoteData in quoteResponse.QuoteData:
+                try:
+                    if quoteData.LastTradedPrice:
+                        lastPrices[quoteData.Symbol.upper()] = Price.From(quoteData.LastTradedPrice)
+                except ValueError:
+                    pass
+        return lastPrices
+
+    def GetStockItemsToReconcile(self, activeStockItems:List[ActiveStockItem],
+                                    portfolioPositionsBySymbol:Dict[str, PortfolioPosition],
+                                    lastPrices:Dict[str, Price]) -> List[ActiveStockItem]:
+        """ Gets the stock items whose open orders are fetched and compared with the possible limit orders.
+            All the stock items, or if Settings.UseQuoteBands is True only the stock items whose last price left
+            their band or whose portfolio quantity changed. All of them every Settings.FullReconciliationIntervalInSeconds.
+        """
+        if self.MoneyMakerInput.Settings.UseQuoteBands is False:
+            return activeStockItems
+        portfolioQuantities = {symbol: portfolioPosition.Quantity for symbol, portfolioPosition in portfolioPositionsBySymbol.items()}
+        symbolsToReconcile = set(self.ReconciliationBands.GetSymbolsToReconcile(
+            [activeStockItem.Symbol.upper() for activeStockItem in activeStockItems], lastPrices, portfolioQuantities, time.monotonic()))
+        reconcileStockItems = [activeStockItem for activeStockItem in activeStockItems if activeStockItem.Symbol.upper() in symbolsToReconcile]
+        self.LogMessage(f"Reconciling {len(reconcileStockItems)} of {len(activeStockItems)} stock items.")
+        return reconcileStockItems
+
+    def UpdateReconciliationBands(self, reconcileStockItems:List[ActiveStockItem], possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                    stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]],
+                                    portfolioPositionsBySymbol:Dict[str, PortfolioPosition]):
+        """ Sets the bands of the reconciled stock items with nothing to cancel or place. The other stock items are
+            reconciled again in the next cycle.
+        """
+        if self.MoneyMakerInput.Settings.UseQuoteBands is False:
+            return
+        for activeStockItem in reconcileStockItems:
+            placeOrders, cancelOrders = stockItemOrders[activeStockItem.Symbol]
+            if len(placeOrders) == 0 and len(cancelOrders) == 0:
+                self.ReconciliationBands.SetBand(activeStockItem.Symbol, possibleLimitOrders[activeStockItem.Symbol],
+                    self.GetPortfolioQuantity(activeStockItem, portfolioPositionsBySymbol))
+            else:
+                self.ReconciliationBands.ClearBand(activeStockItem.Symbol)
+
+    def UpdatePortfolioSnapshot(self, portfolioPositionsBySymbol:Dict[str, PortfolioPosition]):
+        """ Sets the portfolio of the cycle in the PortfolioSnapshot and logs the changed quantities.
+        """
+        quantityDeltas = self.PortfolioSnapshot.Update(portfolioPositionsBySymbol)
+        if len(quantityDeltas) != 0:
+            self.LogMessage(f"Portfolio quantity changes -> {quantityDeltas}")
+
+    def SkipUnchangedStockItems(self, reconcileStockItems:List[ActiveStockItem], openOrdersBySymbol:Dict[str, List[Order]],
+                                    portfolioPositionsBySymbol:Dict[str, PortfolioPosition],
+                                    possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                    stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]]) -> Tuple[List[ActiveStockItem], dict]:
+        """ Finds the stock items with the same portfolio quantity and open orders as their last reconciliation
+            with nothing to cancel or place. Their possible limit orders are taken from the PortfolioSnapshot and
+            they have no orders to cancel or place, so GenerateAllPossibleLimitOrders and CalculateStockItemOrders
+            are not run for them.
+
+            Parameters:
+
+            reconcileStockItems:List[ActiveStockItem] - Stock items reconciled in the cycle.
+
+            openOrdersBySymbol:Dict[str, List[Order]] - Open orders by Symbol(upper case).
+
+            portfolioPositionsBySymbol:Dict[str, PortfolioPosition] - Portfolio positions by Symbol(upper case).
+
+            possibleLimitOrders:Dict[str, List[OrderInfo]] - Updated with the possible limit orders of the skipped stock items.
+
+            stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]] - Updated with no orders for the
+            skipped stock items.
+
+            Returns:
+
+            Tuple[List[ActiveStockItem], dict] - Stock items to process, fingerprints of the open orders by Symbol.
+
+        """
+        processStockItems:List[ActiveStockItem] = []
+        fingerprints = {}
+        for activeStockItem in reconcileStockItems:
+            fingerprint = self.PortfolioSnapshot.GetOrdersFingerprint(openOrdersBySymbol.get(activeStockItem.Symbol.upper(), []))
+            fingerprints[activeStockItem.Symbol] = fingerprint
+            limitOrders = None
+            if self.MoneyMakerInput.Settings.SkipUnchangedStockItems is True:
+                limitOrders = self.PortfolioSnapshot.GetUnchangedLimitOrders(activeStockItem.Symbol,
+                                self.GetPortfolioQuantity(activeStockItem, portfolioPositionsBySymbol), fingerprint)
+            if limitOrders is None:
+                processStockItems.append(activeStockItem)
+            else:
+                possibleLimitOrders[activeStockItem.Symbol] = limitOrders
+                stockItemOrders[activeStockItem.Symbol] = ([], [])
+        if len(processStockItems) != len(reconcileStockItems):
+            self.LogMessage(f"Skipping {len(reconcileStockItems) - len(processStockItems)} unchanged stock items.")
+        return processStockItems, fingerprints
+
+    def UpdatePortfolioMarkers(self, processStockItems:List[ActiveStockItem], fingerprints:dict,
+                                possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]],
+                                portfolioPositionsBySymbol:Dict[str, PortfolioPosition]):
+        """ Sets the markers of the processed stock items with nothing to cancel or place. The other stock items
+            are processed again in their next reconciliation.
+        """
+        for activeStockItem in processStockItems:
+            placeOrders, cancelOrders = stockItemOrders[activeStockItem.Symbol]
+            if len(placeOrders) == 0 and len(cancelOrders) == 0:
+                self.PortfolioSnapshot.SetMarker(activeStockItem.Symbol, self.GetPortfolioQuantity(activeStockItem, portfolioPositionsBySymbol),
+                    fingerprints[activeStockItem.Symbol], possibleLimitOrders[activeStockItem.Symbol])
+            else:
+                self.PortfolioSnapshot.ClearMarker(activeStockItem.Symbol)
+
+    def IsOrdersFetchRequired(self) -> bool:
+        """ Are the open orders fetched from the API in the cycle? Always, or if Settings.UseOrderBookMirror is True
+            only when the OrderBookMirror reconciliation is due or a portfolio quantity changed(an order was filled).
+        """
+        if self.MoneyMakerInput.Settings.UseOrderBookMirror is False:
+            return True
+        if len(self.PortfolioSnapshot.QuantityDeltas) != 0:
+            self.OrderBookMirror.MarkMismatch(f"Portfolio quantity changed for {list(self.PortfolioSnapshot.QuantityDeltas)}.")
+        return self.OrderBookMirror.IsReconciliationDue(time.monotonic())
+
+    def ReconcileOrderBookMirror(self, orders:List[Order]):
+        """ Reconciles the OrderBookMirror with the open orders of the API and logs the drift, if Settings.UseOrderBookMirror is True.
+        """
+        if self.MoneyMakerInput.Settings.UseOrderBookMirror is False:
+            return
+        mismatch = self.OrderBookMirror.Mismatch
+        drift = self.OrderBookMirror.Reconcile(orders, time.monotonic())
+        if drift != 0 or mismatch is not None:
+            self.LogMessage(f"Order book reconciled({mismatch}) - drift {drift}. {self.OrderBookMirror.Drift}")
+
+    def RescheduleStockItems(self, activeStockItems:List[ActiveStockItem], possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]], lastPrices:Dict[str, Price]):
+        """ Schedules the processed stock items again. Stock items with cancelled or placed orders and stock
+            items close to one of their limit orders are processed again soon.
+
+            Parameters:
+
+            activeStockItems:List[ActiveStockItem] - Processed stock items.
+
+            possibleLimitOrders:Dict[str, List[OrderInfo]] - Possible limit orders by Symbol of the reconciled
+            stock items. The band edges(ReconciliationBands) are used for the other stock items.
+
+            stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]] - [Orders to Place, Orders to Cancel]
+            by Symbol of the reconciled stock items(ProcessStockItem).
+
+            lastPrices:Dict[str, Price] - Last traded prices by Symbol(upper case).
+
+        """
+        if self.MoneyMakerInput.Settings.UseAdaptivePolling is False:
+            return
+        now = time.monotonic()
+        for activeStockItem in activeStockItems:
+            if activeStockItem.Symbol in possibleLimitOrders:
+                limitPrices = [limitOrder.LimitPrice for limitOrder in possibleLimitOrders[activeStockItem.Symbol]]
+            else:
+                limitPrices = self.ReconciliationBands.GetLimitPrices(activeStockItem.Symbol)
+            placeOrders, cancelOrders = stockItemOrders.get(activeStockItem.Symbol, ([], []))
+            interval = self.PollingScheduler.Reschedule(activeStockItem.Symbol, now, lastPrices.get(activeStockItem.Symbol.upper()),
+                            limitPrices, len(placeOrders) == 0 and len(cancelOrders) == 0)
+            self.LogMessage(f"Next visit of {activeStockItem.Symbol} in {interval:.0f} seconds.")
+
+    def GetRequestCount(self) -> int:
+        """ Number of requests sent so far by the sync and async services.
+        """
+        return self.MoneyMakerInput.SessionPool.Counters.Requests + \
+                sum(service.session.Requests for service in [self.MoneyMakerInput.AsyncAccount, 
+                        self.MoneyMakerInput.AsyncOrder, self.MoneyMakerInput.AsyncMarket])
+
+    def GetCycleWaitTime(self) -> float:
+        """ Seconds to wait before the next cycle. Settings.CycleWaitTimeInSeconds, or the time until the
+            next stock item is due within the requests budget if Settings.UseAdaptivePolling is True.
+        """
+        if self.MoneyMakerInput.Settings.UseAdaptivePolling is False:
+            return self.MoneyMakerInput.Settings.CycleWaitTimeInSeconds
+        return self.PollingScheduler.GetWaitTime(time.monotonic())
+
+    def GetMarketWaitTime(self, extendedHours:bool = False) -> float:
+        """ Seconds to wait till Settings.MarketWarmUpInSeconds before the next session opens. 0 if the session is
+            open or Settings.UseMarketCalendar is False.
+        """
+        if self.MoneyMakerInput.Settings.UseMarketCalendar is False:
+            return 0.0
+        now = datetime.now(timezone.utc)
+        waitTime = self.MoneyMakerInput.MarketCalendar.GetWaitTime(now, extendedHours, self.MoneyMakerInput.Settings.MarketWarmUpInSeconds)
+        if waitTime > 0:
+            nextOpen = self.MoneyMakerInput.MarketCalendar.GetNextOpen(now, extendedHours)
+            self.LogMessage(f"Market is closed. Waiting {waitTime:.0f} seconds, session opens at {nextOpen:%d-%b-%Y %H:%M %Z}.", False, True)
+        return waitTime
+
+    def ProcessCycleError(self, error:BaseException) -> bool:
+        """ Logs the error which stopped the cycle.
+
+            Returns:
+
+            True if the next cycle can be started. False if something blocking happened.
+        """
+        if isinstance(error, MessageError):
+            self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(error.Message.Type.name), True, True)
+            self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(error.Message.Code), True, True)
+            self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(error.Message.Description), True, True)
+            return False
+        if isinstance(error, ResponseError):
+            self.LogMessage(f"Error status code - {error.Error.ResponseStatusCode}", True, True)
+            self.LogMessage(f"Error code - {error.Error.Code}", True, True)
+            self.LogMessage(f"Error message - {error.Error.Message}", True, True)
+            return False
+        if isinstance(error, TransientErrors):
+            # Internet connection error or timeout of the sync or async session, we can try again.
+            self.LogMessage(f"Looks like internet connection issue - {error}", True, True)
+            return True
+        self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format((type(error), error, error.__traceback__)), True, True)
+        return False
+
+    def IsCycleIdle(self, activeStockItems:List[ActiveStockItem]) -> bool:
+        """ Is there nothing to do in the cycle until the next stock item is due(Settings.UseAdaptivePolling)?
+        """
+        return activeStockItems is not None and len(activeStockItems) == 0 and len(self.MoneyMakerInput.ActiveStockItems) != 0
+
+    def GetPortfolioParams(self) -> PortfolioFilteringAndPagingParams:
+        """ Params of the Portfolio request of the cycle, all the pages.
+        """
+        portfolioFilteringAndPagingParams = PortfolioFilteringAndPagingParams(pageSize=100, pageNumber=1)
+        portfolioFilteringAndPagingParams.ApplyFilterAndReturnAll = True
+        return portfolioFilteringAndPagingParams
+
+    def ProcessCyclePortfolio(self, portfolioResponse:PortfolioResponse) -> Tuple[bool, Dict[str, PortfolioPosition]]:
+        """ Handles the portfolio response of the cycle and sets the portfolio of the cycle in the PortfolioSnapshot.
+
+            Returns:
+
+            Tuple[bool, Dict[str, PortfolioPosition]] - Return value of the cycle and the portfolio positions by
+            Symbol(upper case). Portfolio positions are None if the cycle ends here.
+
+        """
+        # Handle portfolio response error if any.
+        if(portfolioResponse.Error is not None and portfolioResponse.Error.ResponseStatusCode != ""):
+            # Process error, get latest tokens and continue.
+            self.MoneyMakerProcessResponseError(portfolioResponse.Error)
+            return False, None
+
+        if self.MoneyMakerInput.ActiveStockItems is None or len(self.MoneyMakerInput.ActiveStockItems) == 0:
+            return True, None
+
+        portfolioPositionsBySymbol = self.GetPortfolioPositionsBySymbol(portfolioResponse)
+        self.UpdatePortfolioSnapshot(portfolioPositionsBySymbol)
+        return True, portfolioPositionsBySymbol
+
+    def GetCycleOpenOrders(self, ordersResponse:OrdersResponse) -> Dict[str, List[Order]]:
+        """ Open orders of the cycle by Symbol. From the Orders response, or from the OrderBookMirror if the
+            open orders were not fetched(ordersResponse is None).
+
+            Returns:
+
+            Dict[str, List[Order]] - Open orders by Symbol. None if the cycle should be started again.
+
+        """
+        if ordersResponse is None:
+            # Open orders known from the place and cancel responses.
+            return self.OrderBookMirror.GetOrdersBySymbol()
+
+        # Handle orders response error.
+        if(ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != ""):
+            self.MoneyMakerProcessResponseError(ordersResponse.Error)
+            return None
+
+        # Handle response messages.
+        if(ordersResponse.Messages is not None and len(ordersResponse.Messages) != 0):
+            if(self.MoneyMakerProcessMessageError(ordersResponse.Messages) is False):
+                return None
+
+        openOrdersBySymbol:Dict[str, List[Order]] = self.ManageOrdersHelpers.IndexOrdersBySymbol(ordersResponse.Orders)
+        self.ReconcileOrderBookMirror(ordersResponse.Orders)
+        return openOrdersBySymbol
+
+    def GetCycleStockItemsToProcess(self, reconcileStockItems:List[ActiveStockItem], openOrdersBySymbol:Dict[str, List[Order]],
+                                        portfolioPositionsBySymbol:Dict[str, PortfolioPosition],
+                                        possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                        stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]]) -> Tuple[List[ActiveStockItem], dict]:
+        """ Skips the unchanged stock items(SkipUnchangedStockItems) and generates the possible limit orders of the
+            stock items to process.
+
+            Returns:
+
+            Tuple[List[ActiveStockItem], dict] - Stock items to process and the open orders fingerprints by Symbol.
+
+        """
+        processStockItems, fingerprints = self.SkipUnchangedStockItems(reconcileStockItems, openOrdersBySymbol,
+                                                portfolioPositionsBySymbol, possibleLimitOrders, stockItemOrders)
+        if len(processStockItems) != 0:
+            allLimitOrders = self.GetAllPossibleLimitOrders(portfolioPositionsBySymbol, processStockItems)
+            possibleLimitOrders.update({activeStockItem.Symbol: allLimitOrders.GetOrderInfos(activeStockItem.Symbol)
+                                        for activeStockItem in processStockItems})
+        return processStockItems, fingerprints
+
+    def ProcessStockItems(self, processStockItems:List[ActiveStockItem], openOrdersBySymbol:Dict[str, List[Order]],
+                            portfolioPositionsBySymbol:Dict[str, PortfolioPosition], possibleLimitOrders:Dict[str, List[OrderInfo]],
+                            accessToken:str, accessTokenSecret:str) -> Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]]:
+        """ Processes the stock items of the cycle(ProcessStockItem). Concurrently on a bounded pool of threads if
+            Settings.ProcessStockItemsConcurrently is True, the first error is raised after all the stock items
+            are processed.
+
+            Returns:
+
+            Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]] - [Orders to Place, Orders to Cancel] by Symbol.
+
+        """
+        def Process(activeStockItem:ActiveStockItem):
+            return self.ProcessStockItem(activeStockItem, openOrdersBySymbol.get(activeStockItem.Symbol.upper(), []),
+                        portfolioPositionsBySymbol, possibleLimitOrders[activeStockItem.Symbol], accessToken, accessTokenSecret)
+
+        if self.MoneyMakerInput.Settings.ProcessStockItemsConcurrently is True and len(processStockItems) > 1:
+            maxWorkers = max(1, min(self.MoneyMakerInput.Settings.MaxConcurrentStockItems, len(processStockItems)))
+            with ThreadPoolExecutor(max_workers= maxWorkers, thread_name_prefix= "MoneyMaker") as executor:
+                futures = {activeStockItem.Symbol: executor.submit(Process, activeStockItem) for activeStockItem in processStockItems}
+            # All the stock items are processed, raise the first error if any.
+            return {symbol: future.result() for symbol, future in futures.items()}
+
+        # For each active stock item in the system.
+        return {activeStockItem.Symbol: Process(activeStockItem) for activeStockItem in processStockItems}
+
+    async def ProcessStockItemsAsync(self, processStockItems:List[ActiveStockItem], openOrdersBySymbol:Dict[str, List[Order]],
+                                        portfolioPositionsBySymbol:Dict[str, PortfolioPosition], possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                        accessToken:str, accessTokenSecret:str) -> Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]]:
+        """ asyncio version of ProcessStockItems. The stock items are processed concurrently using asyncio.gather,
+            at most Settings.MaxConcurrentStockItems at a time.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.MoneyMakerInput.Settings.MaxConcurrentStockItems))
+
+        async def ProcessBounded(activeStockItem:ActiveStockItem):
+            async with semaphore:
+                return await self.ProcessStockItemAsync(activeStockItem, openOrdersBySymbol.get(activeStockItem.Symbol.upper(), []),
+                    portfolioPositionsBySymbol, possibleLimitOrders[activeStockItem.Symbol], accessToken, accessTokenSecret)
+
+        # All the stock items are processed, raise the first error if any.
+        results = await asyncio.gather(*[ProcessBounded(activeStockItem) for activeStockItem in processStockItems],
+                        return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return {activeStockItem.Symbol: result for activeStockItem, result in zip(processStockItems, results)}
+
+    def UpdateCycleStockItems(self, reconcileStockItems:List[ActiveStockItem], processStockItems:List[ActiveStockItem], fingerprints:dict,
+                                possibleLimitOrders:Dict[str, List[OrderInfo]],
+                                stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]],
+                                portfolioPositionsBySymbol:Dict[str, PortfolioPosition]):
+        """ Updates the markers(UpdatePortfolioMarkers) and the bands(UpdateReconciliationBands) of the stock items
+            reconciled in the cycle.
+        """
+        self.UpdatePortfolioMarkers(processStockItems, fingerprints, possibleLimitOrders, stockItemOrders, portfolioPositionsBySymbol)
+        self.UpdateReconciliationBands(reconcileStockItems, possibleLimitOrders, stockItemOrders, portfolioPositionsBySymbol)
+
+    def MakeMoneyCycle(self, accessToken:str, accessTokenSecret:str) -> bool:
+        """ One cycle of DoMakeMoney.
+
+            Returns:
+
+            True if the cycle is completed. False if the cycle should be started again right away
+            (for example after the access tokens are renewed).
+        """
+        # Nothing to do until the next stock item is due.
+        activeStockItems = self.GetCycleStockItems()
+        if self.IsCycleIdle(activeStockItems):
+            return True
+
+        # Get the portfolio items.
+        portfolioResponse = self.MoneyMakerInput.Account.Portfolio(self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                                            accessToken = accessToken,
+                                            accessTokenSecret = accessTokenSecret,
+                                            filteringAndPagingParams= self.GetPortfolioParams()
+                                            )
+        cycleResult, portfolioPositionsBySymbol = self.ProcessCyclePortfolio(portfolioResponse)
+        if portfolioPositionsBySymbol is None:
+            return cycleResult
+
+        # Last prices of the stock items in one Quotes call, before the orders. Stock items whose price didn't
+        # cross a limit order are not reconciled.
+        quoteResponse:QuoteResponse = None
+        quoteSymbols = self.GetQuoteSymbols(activeStockItems, portfolioPositionsBySymbol)
+        if len(quoteSymbols) != 0:
+            quoteResponse = self.MoneyMakerInput.QuoteCache.GetQuotes(quoteSymbols, accessToken = accessToken, accessTokenSecret = accessTokenSecret)
+        lastPrices = self.GetLastPrices(portfolioPositionsBySymbol, quoteResponse)
+        reconcileStockItems = self.GetStockItemsToReconcile(activeStockItems, portfolioPositionsBySymbol, lastPrices)
+
+        possibleLimitOrders:Dict[str, List[OrderInfo]] = {}
+        stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]] = {}
+        if len(reconcileStockItems) != 0:
+            ordersResponse:OrdersResponse = None
+            if self.IsOrdersFetchRequired():
+                # Get the OPEN Orders of all the symbols in one call and index them by Symbol.
+                ordersResponse = self.MoneyMakerInput.Order.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    accessToken= accessToken,
+                    accessTokenSecret= accessTokenSecret,
+                    filteringAndPagingParams= self.GetOpenOrdersParams())
+            openOrdersBySymbol = self.GetCycleOpenOrders(ordersResponse)
+            if openOrdersBySymbol is None:
+                return False
+
+            processStockItems, fingerprints = self.GetCycleStockItemsToProcess(reconcileStockItems, openOrdersBySymbol,
+                                                    portfolioPositionsBySymbol, possibleLimitOrders, stockItemOrders)
+            stockItemOrders.update(self.ProcessStockItems(processStockItems, openOrdersBySymbol, portfolioPositionsBySymbol,
+                                        possibleLimitOrders, accessToken, accessTokenSecret))
+            self.UpdateCycleStockItems(reconcileStockItems, processStockItems, fingerprints, possibleLimitOrders,
+                                        stockItemOrders, portfolioPositionsBySymbol)
+
+        self.RescheduleStockItems(activeStockItems, possibleLimitOrders, stockItemOrders, lastPrices)
+
+        return True
+
+    async def GetCycleQuotesAsync(self, quoteSymbols:List[str], accessToken:str, accessTokenSecret:str) -> QuoteResponse:
+        """ Quotes of the cycle from the QuoteCache using the async Market. None without symbols.
+        """
+        if len(quoteSymbols) == 0:
+            return None
+        return await self.MoneyMakerInput.QuoteCache.GetQuotesAsync(quoteSymbols, accessToken = accessToken, accessTokenSecret = accessTokenSecret)
+
+    async def MakeMoneyCycleAsync(self, accessToken:str, accessTokenSecret:str) -> bool:
+        """ asyncio version of MakeMoneyCycle. The independent requests are sent at the same time and the stock
+            items are processed concurrently(ProcessStockItemsAsync).
+        """
+        activeStockItems = self.GetCycleStockItems()
+        if self.IsCycleIdle(activeStockItems):
+            return True
+
+        portfolioRequest = self.MoneyMakerInput.AsyncAccount.Portfolio(self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                                accessToken = accessToken,
+                                accessTokenSecret = accessTokenSecret,
+                                filteringAndPagingParams= self.GetPortfolioParams())
+
+        # Portfolio and the Quotes(Settings.UseQuoteBands) or the OPEN orders are independent, get them at the same time.
+        quoteResponse:QuoteResponse = None
+        ordersResponse:OrdersResponse = None
+        if self.MoneyMakerInput.Settings.UseQuoteBands is True and activeStockItems is not None:
+            portfolioResponse, quoteResponse = await asyncio.gather(portfolioRequest,
+                self.GetCycleQuotesAsync(self.GetQuoteSymbols(activeStockItems, {}), accessToken, accessTokenSecret))
+        elif self.MoneyMakerInput.Settings.UseOrderBookMirror is True:
+            # The open orders may not be required, decided after the portfolio.
+            portfolioResponse = await portfolioRequest
+        else:
+            portfolioResponse, ordersResponse = await asyncio.gather(portfolioRequest,
+                self.MoneyMakerInput.AsyncOrder.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    accessToken= accessToken,
+                    accessTokenSecret= accessTokenSecret,
+                    filteringAndPagingParams= self.GetOpenOrdersParams()))
+
+        cycleResult, portfolioPositionsBySymbol = self.ProcessCyclePortfolio(portfolioResponse)
+        if portfolioPositionsBySymbol is None:
+            return cycleResult
+
+        if quoteResponse is None:
+            quoteResponse = await self.GetCycleQuotesAsync(self.GetQuoteSymbols(activeStockItems, portfolioPositionsBySymbol),
+                                    accessToken, accessTokenSecret)
+        lastPrices = self.GetLastPrices(portfolioPositionsBySymbol, quoteResponse)
+        reconcileStockItems = self.GetStockItemsToReconcile(activeStockItems, portfolioPositionsBySymbol, lastPrices)
+
+        possibleLimitOrders:Dict[str, List[OrderInfo]] = {}
+        stockItemOrders:Dict[str, Tuple[List[OrderInfo], List[OrderInfo]]] = {}
+        if len(reconcileStockItems) != 0:
+            if ordersResponse is None and self.IsOrdersFetchRequired():
+                ordersResponse = await self.MoneyMakerInput.AsyncOrder.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey,
+                    accessToken= accessToken,
+                    accessTokenSecret= accessTokenSecret,
+                    filteringAndPagingParams= self.GetOpenOrdersParams())
+            openOrdersBySymbol = self.GetCycleOpenOrders(ordersResponse)
+            if openOrdersBySymbol is None:
+                return False
+
+            processStockItems, fingerprints = self.GetCycleStockItemsToProcess(reconcileStockItems, openOrdersBySymbol,
+                                                    portfolioPositionsBySymbol, possibleLimitOrders, stockItemOrders)
+            stockItemOrders.update(await self.ProcessStockItemsAsync(processStockItems, openOrdersBySymbol, portfolioPositionsBySymbol,
+                                        possibleLimitOrders, accessToken, accessTokenSecret))
+            self.UpdateCycleStockItems(reconcileStockItems, processStockItems, fingerprints, possibleLimitOrders,
+                                        stockItemOrders, portfolioPositionsBySymbol)
+
+        self.RescheduleStockItems(activeStockItems, possibleLimitOrders, stockItemOrders, lastPrices)
+
+        return True
 
     def DoMakeMoney(self):
         """ Tries to make money following the below process.
@@ -368,424 +1991,91 @@ class MoneyMaker:
                 - Calculate possible orders using the portfolio quantity and algorithm.
                 - Compare available orders with calculated possible orders.
                     - If both orders are same then move to next stock item.
-                    - If orders are different. Cancel all existing orders and place the possible caculated orders.
+                    - If orders are different. Cancel the stale open orders and place the missing caculated orders.
                     - Thats it - Sweet and Simple.
                 - Move to next stock item.
             Repeat the above process after a fixed interval.
         """
         proceed = True
         while True:
-                    
-            # Get the latest Access Keys and update the Input with the latest keys.
-            # We can move the updation part to the EntryInput itself, but it's ok.
-            accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-            self.MoneyMakerInput.InputModel.AccessToken = accessToken
-            self.MoneyMakerInput.InputModel.AccessTokenSecret = accessTokenSecret
-            self.MoneyMakerInput.InputModel.AccessTokenDateTime = dateTimeObj
-            self.MoneyMakerInput.Auth.inputModel = self.MoneyMakerInput.InputModel
-            self.MoneyMakerInput.Account.inputModel = self.MoneyMakerInput.InputModel
-            self.MoneyMakerInput.Order.inputModel = self.MoneyMakerInput.InputModel
 
+            # Sleep while the market is closed, nothing changes and the tokens are not used.
+            marketWaitTime = self.GetMarketWaitTime()
+            if marketWaitTime > 0:
+                time.sleep(marketWaitTime)
+
+            accessToken, accessTokenSecret = self.UpdateAccessKeys()
+
+            requestCount = self.GetRequestCount()
             try:
-                
-                # Get the portfolio items.
-                portfolioFilteringAndPagingParams = PortfolioFilteringAndPagingParams(pageSize=100, pageNumber=1)
-                portfolioFilteringAndPagingParams.ApplyFilterAndReturnAll = True
-                portfolioResponse = self.MoneyMakerInput.Account.Portfolio(self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                                                    accessToken = accessToken, 
-                                                    accessTokenSecret = accessTokenSecret,
-                                                    filteringAndPagingParams= portfolioFilteringAndPagingParams
-                                                    )
-
-                # Handle portfolio response error if any.
-                if(portfolioResponse.Error is not None and portfolioResponse.Error.ResponseStatusCode != ""):
-                    # Process error, get latest tokens and continue.
-                    self.MoneyMakerProcessResponseError(portfolioResponse.Error)
-                    accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-                    continue                
-
-                if self.MoneyMakerInput.ActiveStockItems is not None and len(self.MoneyMakerInput.ActiveStockItems) != 0:
-                    # For each active stock item in the system.
-                    for activeStockIndex in range(len(self.MoneyMakerInput.ActiveStockItems)):                
-                        orderFilteringAndPagingParams = OrdersFilteringAndPagingParams()
-                        orderFilteringAndPagingParams.PageSize = 100
-                        # orderFilteringAndPagingParams.Params["fromDate"] = "09012020"
-                        # orderFilteringAndPagingParams.Params["toDate"] = "09012020"
-                        orderFilteringAndPagingParams.Params["symbol"] = self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol
-                        orderFilteringAndPagingParams.Params["status"] = "OPEN"
-                        orderFilteringAndPagingParams.Params["securityType"] = "EQ"
-                        orderFilteringAndPagingParams.ApplyFilterAndReturnAll = True
-
-                        # Get the OPEN Orders.
-                        ordersResponse = self.MoneyMakerInput.Order.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                            accessToken= accessToken, 
-                            accessTokenSecret= accessTokenSecret, 
-                            filteringAndPagingParams= orderFilteringAndPagingParams)
-                    
-                        # Handle orders response error.
-                        if(ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != ""):
-                            self.MoneyMakerProcessResponseError(ordersResponse.Error)
-                            accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-                            continue
-
-                        # Handle response messages.
-                        if(ordersResponse.Messages is not None and len(ordersResponse.Messages) != 0):
-                            if(self.MoneyMakerProcessMessageError(ordersResponse.Messages) is False):
-                                continue
-    
-                        # Get the portfolio position for the given active stock.
-                        # It may not be present in the portfolio.
-                        dummySymbol = "XXXXABCD"
-                        portfolioPosition:PortfolioPosition = PortfolioPosition(symbol=dummySymbol)
-                        if portfolioResponse.AccountPortfolios is not None and \
-                            len(portfolioResponse.AccountPortfolios) != 0 and \
-                            portfolioResponse.AccountPortfolios[0].PortfolioPositions is not None and \
-                            len(portfolioResponse.AccountPortfolios[0].PortfolioPositions) != 0:
-                            portfolioPosition = next((item for item in portfolioResponse.AccountPortfolios[0].PortfolioPositions if item.Symbol.upper() == self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol.upper()), portfolioPosition)
-
-                        # If not present.
-                        if(portfolioPosition.Symbol == dummySymbol):
-                            # Set the Symbol
-                            portfolioPosition.Symbol = self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol
-                            # Set the Quantity to 0 because quantity is initialized to Settings.UnfilledValue in the constructor.
-                            portfolioPosition.Quantity = 0
-                        # If present in the portfolio. Make sure quantity is set by the API.
-                        elif(portfolioPosition.Quantity == self.MoneyMakerInput.Settings.UnfilledValue) or (portfolioPosition.Quantity <= 0):
-                            self.LogMessage(f"Something changed - Portfolio Quantity for {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol} received from API is not suppossed to be {portfolioPosition.Quantity}", True, True)
-                            self.LogMessage("Aborting the application.", True, True)
-                            raise Exception("Fatal Error.")
-                                        
-                        limitOrders:List[OrderInfo]
-                        cancelOrders:List[OrderInfo]
-
-                        # Get the orders to Place and orders to Cancel.
-                        limitOrders, cancelOrders = self.CalculateStockItemOrders(self.MoneyMakerInput.ActiveStockItems[activeStockIndex], ordersResponse.Orders, 
-                                                        portfolioPosition)
-
-                        # Sort the LimitOrders. High price orders are placed first.
-                        limitOrders.sort(key= lambda x:x.LimitPrice, reverse=True)
-
-                        # Low price orders are cancelled first.
-                        cancelOrders.sort(key= lambda x:x.LimitPrice)
-
-                        self.LogMessage(f"StartPrice -> {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].StartPrice}", False, False)
-                        self.LogMessage(f"Limit Orders -> {limitOrders}", False, False)
-                        self.LogMessage(f"Cancel Orders -> {cancelOrders}", False, False)
-
-                        # In one cycle cancel the orders and in the next cycle place the orders.
-                        # Reason for this approach is, there is a delay when orders are cancelled.
-                        if(len(cancelOrders) != 0):
-                            logMessage = f"Processing cancel orders of {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol} - {cancelOrders}" 
-                            self.LogMessage(logMessage, False, True)
-                            for cancelOrder in cancelOrders:
-                                # Cancel order.
-                                cancelOrderResponse:CancelOrderResponse = self.MoneyMakerInput.Order.CancelOrder(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                                        orderId = cancelOrder.OrderId, accessToken = accessToken, accessTokenSecret=accessTokenSecret)
-                                
-                                # Process cancel response error.
-                                if(cancelOrderResponse.Error is not None and cancelOrderResponse.Error.ResponseStatusCode != ""):
-                                    self.MoneyMakerProcessResponseError(cancelOrderResponse.Error)
-                                    accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-                                    continue
-
-                                # Process cancel response message.
-                                if(cancelOrderResponse.Messages is not None and len(cancelOrderResponse.Messages) != 0):
-                                    if(self.MoneyMakerProcessMessageError(cancelOrderResponse.Messages) is False):
-                                        continue
-
-                            # Get the orders again to verify if they are cancelled or not.
-                            ordersResponse = self.MoneyMakerInput.Order.Orders(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                                accessToken= accessToken, 
-                                accessTokenSecret= accessTokenSecret, 
-                                filteringAndPagingParams= orderFilteringAndPagingParams) 
-
-                            # Process orders response error.
-                            if(ordersResponse.Error is not None and ordersResponse.Error.ResponseStatusCode != ""):
-                                self.MoneyMakerProcessResponseError(ordersResponse.Error)
-                                accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-                                continue
-
-                            # Process orders response messages.
-                            if(ordersResponse.Messages is not None and len(ordersResponse.Messages) != 0):
-                                if(self.MoneyMakerProcessMessageError(ordersResponse.Messages) is False):
-                                    continue
-
-                            # Are all orders cancelled?                
-                            if(ordersResponse.Orders is not None and len(ordersResponse.Orders) == 0):
-                                logMessage = f"All existing orders of {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol} are cancelled successfully."
-                                self.LogMessage(logMessage, False, True)
-                            else:
-                                logMessage = f"Unable to cancel all the existing orders of {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol}."
-                                self.LogMessage(logMessage, True, True)
-                                continue                                                
-                        
-                            # In either case we will place orders in the next cycle.
-                            # We are not in a hurry :)
-                        else:
-                            logMessage = f"Processing place limit orders of {self.MoneyMakerInput.ActiveStockItems[activeStockIndex].Symbol} - {limitOrders}"
-                            self.LogMessage(logMessage, False, True)
-
-                            # Preview and Place orders.
-                            for limitOrder in limitOrders:
-                                # If existing order.
-                                if(limitOrder.OrderId > 0):
-                                    continue
-                                logMessage = f"Processing place limit order - {limitOrder}"
-                                self.LogMessage(logMessage, False, True)
-                                orderAction:str = "BUY"
-                                if(limitOrder.IsSell):
-                                    orderAction = "SELL"
-                                
-                                # Generate order input.
-                                orderData = self.OrderInput(limitOrder.Symbol,
-                                                    orderAction, limitOrder.LimitPrice, limitOrder.Quantity)
-                                
-                                # Preview order.
-                                previewOrderResponse = self.MoneyMakerInput.Order.PreviewOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                                                        previewOrderInput = orderData,
-                                                        accessToken= accessToken, 
-                                                        accessTokenSecret= accessTokenSecret, 
-                                                    )
-
-                                # Handle preview response error.
-                                if(previewOrderResponse.Error is not None and previewOrderResponse.Error.ResponseStatusCode != ""):
-                                    self.MoneyMakerProcessResponseError(previewOrderResponse.Error)
-                                    accessToken, accessTokenSecret, dateTimeObj = self.MoneyMakerInput.Configuration.GetLatestETradeAccessKeyDetails()
-                                    continue
-                                    
-                                # Handle preview response messages.
-                                if(previewOrderResponse.Messages is not None and len(previewOrderResponse.Messages) != 0):
-                                    if(self.MoneyMakerProcessMessageError(previewOrderResponse.Messages) is False):
-                                        continue
-
-                                # The process to validate the Preview and Place order responses is, there are some
-                                # data fields which should to be populated by the API. I am verifying if these
-                                # fields are populated by the API or not.
-                                # I am also verifying some values like total order value.
-                                # Commission should not be more than maxCommission.
-                                # In future if something changes with the API we have to change the validations done on
-                                # the Preview and Place responses.
-                                # The reason, I am doing it this way is to make sure that nothing goes wrong.
-                                # It is OK if we are not able to place the Order. I am trying to avoid placing a bad order.                                
-
-                                isValid = False
-
-                                # Calculate total value of the Order.
-                                totalValue = round(limitOrder.LimitPrice * limitOrder.Quantity, self.MoneyMakerInput.Settings.FloatRoundPrecision)
-                                unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
-                                unfilledValue = self.MoneyMakerInput.Settings.UnfilledValue        
-                                maxCommission = self.MoneyMakerInput.Settings.MaxCommission
-
-                                if previewOrderResponse is not None and previewOrderResponse.PreviewOrderResponseData is not None:
-                                    self.LogMessage(f"Total Commission -> {previewOrderResponse.PreviewOrderResponseData.TotalCommission}", False, False)
-                                    self.LogMessage(f"Total Order Value -> {previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}", False, False)
-                                    # TotalCommission is not suppossed to be filled by the API.
-                                    if previewOrderResponse.PreviewOrderResponseData.TotalCommission != unfilledCommissionFee:
-                                        logMessage = f"Something changed - TotalCommission is suppossed to be {unfilledCommissionFee}"
-                                        self.LogMessage(logMessage, True, True)
-                                        logMessage = f"Aborting place order."
-                                        self.LogMessage(logMessage, True, True)                                
-                                        raise Exception("Fatal Error.")
-                                    # TotalOrderValue should be same as totalValue.
-                                    if orderAction == "BUY" and \
-                                        (totalValue - previewOrderResponse.PreviewOrderResponseData.TotalOrderValue != 0):
-                                        self.LogMessage(f"Something changed - TotalOrderValue is suppossed to be {totalValue}, received value is {previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}", True, True)
-                                        self.LogMessage("Aborting place order.", True, True)
-                                        raise Exception("Fatal Error.")
-                                    # In case of SELL TotalOrderValue is negative. Commision charged should not be greater than maxCommission.
-                                    if orderAction == "SELL" and \
-                                        (totalValue + previewOrderResponse.PreviewOrderResponseData.TotalOrderValue > maxCommission):
-                                        self.LogMessage(f"Something changed - Too much commission - {totalValue + previewOrderResponse.PreviewOrderResponseData.TotalOrderValue}.", True, True)
-                                        self.LogMessage(f"Aborting place order.", True, True)
-                                        raise Exception("Fatal Error.")
-                                    orderDetails:List[OrderDetail] = previewOrderResponse.PreviewOrderResponseData.OrderDetails
-                                    for orderDetail in orderDetails:
-                                        self.LogMessage(f"Estimated commission -> {orderDetail.EstimatedCommission}")
-                                        self.LogMessage(f"Estimated Fees -> {orderDetail.EstimatedFees}")
-                                        self.LogMessage(f"Estimated Total Amount -> {orderDetail.EstimatedTotalAmount}")
-                                        # EstimatedCommission should be 0. This may change in future.
-                                        if(orderDetail.EstimatedCommission != 0):
-                                            self.LogMessage(f"Something changed, commission is suppossed to be 0, received commission {orderDetail.EstimatedCommission}", True, True)
-                                            self.LogMessage(f"Aborting place order.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # EstimatedFees is not supposed to be set by the API.
-                                        if(orderDetail.EstimatedFees != unfilledCommissionFee):
-                                            self.LogMessage(f"Something changed, fees is suppossed to be {unfilledCommissionFee}, received fees value is {orderDetail.EstimatedFees}", True, True)
-                                            self.LogMessage(f"Aborting place order.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # When BUY EstimatedTotalAmount should be same as totalValue.
-                                        if orderAction == "BUY" and \
-                                            (totalValue - orderDetail.EstimatedTotalAmount != 0):
-                                            self.LogMessage(f"Something changed - EstimatedTotalAmount is suppossed to be {totalValue}, received total amount is {orderDetail.EstimatedTotalAmount}", True, True)
-                                            self.LogMessage(f"Aborting place order.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # When SELL EstimatedTotalAmount is negative. Commission charged cannot be more than maxCommission.
-                                        if orderAction == "SELL" and \
-                                            (totalValue + orderDetail.EstimatedTotalAmount > maxCommission):
-                                            self.LogMessage(f"Something changed - Too much commission - {totalValue + orderDetail.EstimatedTotalAmount}", True, True)
-                                            self.LogMessage(f"Aborting place order.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        instruments:List[Instrument] = orderDetail.Instruments
-                                        for instrument in instruments:
-                                            self.LogMessage(f"Symbol - Quantity -> {instrument.Symbol}, {instrument.Quantity}")
-                                            self.LogMessage(f"EstimatedCommission -> {instrument.EstimatedCommission}")
-                                            self.LogMessage(f"EstimatedFees -> {instrument.EstimatedFees}")
-                                            # EstimatedCommission is not suppossed to be set by the API.
-                                            if(instrument.EstimatedCommission != unfilledCommissionFee):
-                                                self.LogMessage(f"Something changed, estimated commission is suppossed to be {unfilledCommissionFee}, received commission is {instrument.EstimatedCommission}", True, True)
-                                                self.LogMessage(f"Aborting place order.", True, True)
-                                                raise Exception("Fatal Error.")
-                                            # EstimatedFees is not suppossed to be set by the API.
-                                            if(instrument.EstimatedFees != unfilledCommissionFee):
-                                                self.LogMessage(f"Something changed, estimated fees is suppossed to be {unfilledCommissionFee}, received fees is {instrument.EstimatedFees}", True, True)
-                                                self.LogMessage(f"Aborting place order.", True, True)
-                                                raise Exception("Fatal Error.")
-
-                                        # Handle orderDetail messages.
-                                        if(orderDetail.Messages is not None and len(orderDetail.Messages) != 0):
-                                            if(self.MoneyMakerProcessMessageError(orderDetail.Messages) is False):
-                                                continue
-                                        isValid = True
-
-                                # If isValid is false. Something went wrong.
-                                if isValid is False:
-                                    self.LogMessage(f"Failed to place {orderAction} Order {limitOrder.Symbol} at {limitOrder.LimitPrice}", True, True)  
-                                    continue
-
-                                # Place the order using the input from preview and previewIds.
-                                placeOrderResponse = self.MoneyMakerInput.Order.PlaceOrderEQ(accountIdKey= self.MoneyMakerInput.ETradeSettings.AccountIdKey, 
-                                                    previewOrderInput = orderData,
-                                                    previewIds = previewOrderResponse.PreviewOrderResponseData.PreviewIds,
-                                                    accessToken= accessToken, 
-                                                    accessTokenSecret= accessTokenSecret
-                                                    )      
-
-                                # Handle place order response errors.
-                                if(placeOrderResponse.Error is not None and placeOrderResponse.Error.ResponseStatusCode != ""):
-                                    self.MoneyMakerProcessResponseError(placeOrderResponse.Error)
-                                    continue
-
-                                # Handle place order message errors.
-                                if(placeOrderResponse.Messages is not None and len(placeOrderResponse.Messages) != 0):
-                                    if(self.MoneyMakerProcessMessageError(placeOrderResponse.Messages) is False):
-                                        continue
-
-                                isValid = False
-                                if placeOrderResponse is not None and placeOrderResponse.PlaceOrderResponseData is not None:  
-                                    self.LogMessage(f"Total Commission -> {placeOrderResponse.PlaceOrderResponseData.TotalCommission}")
-                                    self.LogMessage(f"Total Order Value -> {placeOrderResponse.PlaceOrderResponseData.TotalOrderValue}")
-
-                                    # Get the OrderId of the placed Order.
-                                    placedOrderId = placeOrderResponse.PlaceOrderResponseData.OrderId
-                                    if placeOrderResponse.PlaceOrderResponseData.OrderId == 0 and \
-                                            placeOrderResponse.PlaceOrderResponseData.OrderIds is not None and \
-                                            len(placeOrderResponse.PlaceOrderResponseData.OrderIds) != 0:
-                                        placedOrderId = placeOrderResponse.PlaceOrderResponseData.OrderIds[0].OrderId
-                                    
-                                    # TotalCommission is not suppossed to be filled by API.
-                                    if placeOrderResponse.PlaceOrderResponseData.TotalCommission != unfilledCommissionFee:
-                                        self.LogMessage(f"Something changed - TotalCommission is suppossed to be {unfilledCommissionFee}, received commission is {placeOrderResponse.PlaceOrderResponseData.TotalCommission}", True, True)
-                                        self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                        raise Exception("Fatal Error.")
-                                    # TotalOrderValue is not suppossed to be filled by API.
-                                    if placeOrderResponse.PlaceOrderResponseData.TotalOrderValue != unfilledValue:
-                                        self.LogMessage(f"Something changed - TotalOrderValue is suppossed to be {unfilledValue}, received value is {placeOrderResponse.PlaceOrderResponseData.TotalOrderValue}", True, True)
-                                        self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                        raise Exception("Fatal Error.")
-                                    orderDetails:List[OrderDetail] = placeOrderResponse.PlaceOrderResponseData.OrderDetails
-                                    for orderDetail in orderDetails:
-                                        self.LogMessage(f"Estimated commission -> {orderDetail.EstimatedCommission}")
-                                        self.LogMessage(f"Estimated Fees -> {orderDetail.EstimatedFees}")
-                                        self.LogMessage(f"Estimated Total Amount -> {orderDetail.EstimatedTotalAmount}")
-                                        # EstimatedCommission is suppossed to be zero.
-                                        if(orderDetail.EstimatedCommission != 0):
-                                            self.LogMessage(f"Something changed, commission is suppossed to be 0, received value is {orderDetail.EstimatedCommission}", True, True)
-                                            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # EstimatedFees is not suppossed to be filled by the API.
-                                        if(orderDetail.EstimatedFees != unfilledCommissionFee):
-                                            self.LogMessage(f"Something changed, fees is suppossed to be {unfilledCommissionFee}, received value is {orderDetail.EstimatedFees}", True, True)
-                                            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # If BUY totalValue should be same as EstimatedTotalAmount.
-                                        if orderAction == "BUY" and \
-                                            (totalValue - orderDetail.EstimatedTotalAmount != 0):
-                                            self.LogMessage(f"Something changed - EstimatedTotalAmount is suppossed to be {totalValue}, received value is {orderDetail.EstimatedTotalAmount}", True, True)
-                                            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                            raise Exception("Fatal Error.")
-                                        # If SELL EstimatedTotalAmount is negative. Commission charged cannot be more than maxCommission.
-                                        if orderAction == "SELL" and \
-                                            (totalValue + orderDetail.EstimatedTotalAmount > maxCommission):
-                                            self.LogMessage(f"Something changed - Too much commission - {totalValue + orderDetail.EstimatedTotalAmount}", True, True)
-                                            self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.",True, True)
-                                            raise Exception("Fatal Error.")
-                                        instruments:List[Instrument] = orderDetail.Instruments
-                                        for instrument in instruments:
-                                            self.LogMessage(f"Symbol - Quantity -> {instrument.Symbol}, {instrument.Quantity}")
-                                            self.LogMessage(f"EstimatedCommission -> {instrument.EstimatedCommission}")
-                                            self.LogMessage(f"EstimatedFees -> {instrument.EstimatedFees}")
-                                            # EstimatedCommission is not suppossed to be filled by the API.
-                                            if(instrument.EstimatedCommission != unfilledCommissionFee):
-                                                self.LogMessage(f"Something changed, estimated commission is suppossed to be {unfilledCommissionFee}, received value is {instrument.EstimatedCommission}", True, True)
-                                                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                                raise Exception("Fatal Error.")
-                                            # EstimatedFees is not suppossed to be filled by the API.
-                                            if(instrument.EstimatedFees != unfilledCommissionFee):
-                                                self.LogMessage(f"Something changed, estimated fees is suppossed to be {unfilledCommissionFee}, received value is {instrument.EstimatedFees}", True, True)
-                                                self.LogMessage(f"Critical - Order is already placed. Order Id is  {placedOrderId}.", True, True)
-                                                raise Exception("Fatal Error.")
-
-                                        # Handle orderDetail messages.
-                                        if(orderDetail.Messages is not None and len(orderDetail.Messages) != 0):
-                                            if(self.MoneyMakerProcessMessageError(orderDetail.Messages) is False):
-                                                continue
-
-                                        isValid = True
-
-                                # isValid is false meaning something went wrong.
-                                if isValid is False:
-                                    self.LogMessage(f"Failed to place {orderAction} Order {limitOrder.Symbol} at {limitOrder.LimitPrice}", True, True)  
-                                    continue
-
-                                # We are here, all is well.
-                                self.LogMessage(f"Placed {orderAction} Order {limitOrder.Symbol} at {limitOrder.LimitPrice}", True, True)  
-                                        
-            except MessageError as message:        
-                self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(message.Message.Type.name), True, True)
-                self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(message.Message.Code), True, True)
-                self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(message.Message.Description), True, True)
-                proceed = False
-            except ResponseError as error:
-                self.LogMessage(f"Error status code - {error.Error.ResponseStatusCode}", True, True)
-                self.LogMessage(f"Error code - {error.Error.Code}", True, True)
-                self.LogMessage(f"Error message - {error.Error.Message}", True, True)
-                proceed = False            
-            except ConnectionError as connectionError:
-                # Internet connection error, we can try again.
-                self.LogMessage(f"Looks like internet connection issue - {connectionError}", True, True)
-                proceed = True        
-            except:
-                self.LogMessage(self.MoneyMakerInput.Strings.UnexpectedError.format(sys.exc_info()), True, True)
-                proceed = False
-
-            # If proceed is False, something blocking happened, so we cannot continue.         
+                if self.MakeMoneyCycle(accessToken, accessTokenSecret) is False:
+                    continue
+            except BaseException as error:
+                proceed = self.ProcessCycleError(error)
+            finally:
+                self.PollingScheduler.RecordRequests(time.monotonic(), self.GetRequestCount() - requestCount)
+
+            # If proceed is False, something blocking happened, so we cannot continue.
             if proceed is False:
                 break
-            
+
+            self.LogMessage(f"Connections - {self.MoneyMakerInput.SessionPool.Counters}")
+            self.LogMessage(f"Quote cache - {self.MoneyMakerInput.QuoteCache.Counters}")
+            self.LogMessage(f"Rate limiter - {self.MoneyMakerInput.SessionPool.RateLimiter}")
+            self.LogMessage(f"Retries - {self.MoneyMakerInput.SessionPool.RetryPolicy.Counters}")
+
             # Get the current date and time for display.
             currentDateTime = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
-            print(f"{currentDateTime} - Waiting {self.MoneyMakerInput.Settings.CycleWaitTimeInSeconds} seconds before starting next cycle...")
+            waitTime = self.GetCycleWaitTime()
+            print(f"{currentDateTime} - Waiting {waitTime:.0f} seconds before starting next cycle...")
 
-            # Wait for time set in the Settings.
-            time.sleep(self.MoneyMakerInput.Settings.CycleWaitTimeInSeconds)
+            # Wait for time set in the Settings, or till the next stock item is due.
+            time.sleep(waitTime)
 
             """
             exit = input("Please enter q to exit: ")
             if exit == 'q':
                 break
             """
-        
-    
+
+    async def DoMakeMoneyAsync(self):
+        """ asyncio version of DoMakeMoney. All the requests of a cycle are sent from one thread using the
+            async ETrade services. Run using asyncio.run.
+        """
+        proceed = True
+        try:
+            while True:
+
+                marketWaitTime = self.GetMarketWaitTime()
+                if marketWaitTime > 0:
+                    await asyncio.sleep(marketWaitTime)
+
+                accessToken, accessTokenSecret = self.UpdateAccessKeys()
+
+                requestCount = self.GetRequestCount()
+                try:
+                    if await self.MakeMoneyCycleAsync(accessToken, accessTokenSecret) is False:
+                        continue
+                except BaseException as error:
+                    proceed = self.ProcessCycleError(error)
+                finally:
+                    self.PollingScheduler.RecordRequests(time.monotonic(), self.GetRequestCount() - requestCount)
+
+                # If proceed is False, something blocking happened, so we cannot continue.
+                if proceed is False:
+                    break
+
+                currentDateTime = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
+                waitTime = self.GetCycleWaitTime()
+                print(f"{currentDateTime} - Waiting {waitTime:.0f} seconds before starting next cycle...")
+
+                await asyncio.sleep(waitTime)
+        finally:
+            await self.MoneyMakerInput.AsyncOrder.Close()
+            await self.MoneyMakerInput.AsyncAccount.Close()
+            await self.MoneyMakerInput.AsyncMarket.Close()
+
+
 if __name__ == "__main__":
     """ Main driver program which tries to make money.
     """
@@ -793,6 +2083,10 @@ if __name__ == "__main__":
     manageOrdersHelpers:ManageOrdersHelpers = ManageOrdersHelpers(Settings())
 
     entryInput = EntryMoneyMakerInput()
-    
+
     # Call DoMakeMoney on the MoneyMaker object.
-    MoneyMaker(entryInput, manageOrdersHelpers).DoMakeMoney()
+    moneyMaker = MoneyMaker(entryInput, manageOrdersHelpers)
+    if Settings.UseAsyncClient is True:
+        asyncio.run(moneyMaker.DoMakeMoneyAsync())
+    else:
+        moneyMaker.DoMakeMoney()
@@ -3,7 +3,7 @@
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Tuple
 
@@ -14,6 +14,7 @@ sys.path.append(str(Path(os.getcwd()).parent))
 from BusinessModels.ActiveStockItem import ActiveStockItem
 from BusinessModels.CancelOrderResponse import CancelOrderResponse
 from BusinessModels.Error import Error
+from BusinessModels.ErrorAction import ErrorAction
 from BusinessModels.FilteringAndPagingParams import (
     OrdersFilteringAndPagingParams, PortfolioFilteringAndPagingParams)
 from BusinessModels.Message import Message
@@ -22,16 +23,19 @@ from BusinessModels.OrderInfo import OrderInfo
 from BusinessModels.OrdersResponse import Order
 from BusinessModels.PortfolioResponse import PortfolioPosition
 from BusinessModels.PreviewOrderInput import PreviewOrderInput
+from BusinessModels.Price import Price
 from Exceptions.MessageError import MessageError
 from Exceptions.ResponseError import ResponseError
 from requests.exceptions import ConnectionError
 
+from Entries.EntryHelpers.ClientOrderRegistry import ClientOrderIdGenerator
 from Entries.EntryHelpers.ErrorHandlingHelpers import \
     ProcessMessageError as ProcessMessageError
 from Entries.EntryHelpers.ErrorHandlingHelpers import \
     ProcessResponseError as ProcessResponseError
 from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
 from Entries.EntryInputs.EntryMoneyMakerInput import EntryMoneyMakerInput
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
 
 
 class MoneyMaker:
@@ -45,6 +49,8 @@ class MoneyMaker:
         ManageOrdersHelpers:ManageOrdersHelpers - Methods related to the trading algorithm are available
         in this class.
 
+        ClientOrderIds:ClientOrderIdGenerator - Generates the ClientOrderIds of the orders.
+
         Methods:
 
         LogMessage - Logs the message passed using the Logger present in the Entry input.
@@ -59,6 +65,8 @@ class MoneyMaker:
 
         CalculateStockItemOrders - Calculates and generates the final orders to place.
 
+        GetMarketWaitTime - Gets the time to wait till the next session(including the extended hours) opens.
+
         DoMakeMoney - Tries to make money following the below process.
             General steps are:
             - Gets the portfolio items.
@@ -78,6 +86,7 @@ class MoneyMaker:
     def __init__(self, entryInput:EntryMoneyMakerInput, manageOrdersHelpers:ManageOrdersHelpers):
         self.MoneyMakerInput = entryInput
         self.ManageOrdersHelpers = manageOrdersHelpers
+        self.ClientOrderIds = ClientOrderIdGenerator()
 
     def LogMessage(self, message:str, isError:bool = False, isUser:bool = False): 
         """ Logs and/or prints the message using the MoneyMakerInput.LogMessage method.
@@ -108,13 +117,17 @@ class MoneyMaker:
             Uses the ProcessMessageError method to process the Error.
 
             messages:List[Message] - List of response messages.
+
+            Returns:
+
+            False if the order should be skipped, True otherwise.
         """
         for message in messages:   
-            if(message.Code in self.MoneyMakerInput.ETradeSettings.DangerErrorCodes):
+            if(ETradeRetryPolicy.GetErrorAction(self.MoneyMakerInput.ETradeSettings, message.Code) is ErrorAction.ABORT):
                 self.LogMessage(f"Message type - {message.Type.name}", True, True)
                 self.LogMessage(f"Message Code - {message.Code}", True, True)
                 self.LogMessage(f"Message Description - {message.Description}", True, True)
-        ProcessMessageError(messages, self.MoneyMakerInput)
+        return ProcessMessageError(messages, self.MoneyMakerInput)
 
     def OrderInput(self, symbol:str, orderAction:str, limitPrice:float, quantity:int) -> PreviewOrderInput:
         """ Creates the input for the preview order.
@@ -137,8 +150,8 @@ class MoneyMaker:
         """
         previewOrderInput = PreviewOrderInput()
 
-        # Unique ClientOrderId
-        previewOrderInput.ClientOrderId = "O" + str(time.time()).replace(".", "") 
+        # Unique ClientOrderId across the threads and processes.
+        previewOrderInput.ClientOrderId = self.ClientOrderIds.Next()
         previewOrderInput.OrderType = "EQ"
         previewOrderInput.Order = []
 
@@ -154,7 +167,7 @@ class MoneyMaker:
         # EXTENDED
         orderDetail.MarketSession = "EXTENDED"
         orderDetail.StopPrice = ""
-        orderDetail.LimitPrice = limitPrice
+        orderDetail.LimitPrice = Price.From(limitPrice)
         orderDetail.Instruments = []
 
         # Build the Instrument.
@@ -360,6 +373,19 @@ class MoneyMaker:
         return finalLimitOrders, cancelOrders
         """
 
+    def GetMarketWaitTime(self) -> float:
+        """ Seconds to wait till Settings.MarketWarmUpInSeconds before the next session(including the extended hours)
+            opens. 0 if a session is open or Settings.UseMarketCalendar is False.
+        """
+        if self.MoneyMakerInput.Settings.UseMarketCalendar is False:
+            return 0.0
+        now = datetime.now(timezone.utc)
+        waitTime = self.MoneyMakerInput.MarketCalendar.GetWaitTime(now, True, self.MoneyMakerInput.Settings.MarketWarmUpInSeconds)
+        if waitTime > 0:
+            nextOpen = self.MoneyMakerInput.MarketCalendar.GetNextOpen(now, True)
+            self.LogMessage(f"Market is closed. Waiting {waitTime:.0f} seconds, session opens at {nextOpen:%d-%b-%Y %H:%M %Z}.", False, True)
+        return waitTime
+
     def DoMakeMoney(self):
         """ Tries to make money following the below process.
             General steps are:
@@ -377,6 +403,12 @@ class MoneyMaker:
         """
         proceed = True
         while True:
+
+            # Sleep while the market is closed. Orders are placed in the EXTENDED session, so the pre-market
+            # and after hours sessions are included.
+            marketWaitTime = self.GetMarketWaitTime()
+            if marketWaitTime > 0:
+                time.sleep(marketWaitTime)
                     
             # Get the latest Access Keys and update the Input with the latest keys.
             # We can move the updation part to the EntryInput itself, but it's ok.
@@ -573,7 +605,7 @@ class MoneyMaker:
                                 isValid = False
 
                                 # Calculate total value of the Order.
-                                totalValue = round(limitOrder.LimitPrice * limitOrder.Quantity, self.MoneyMakerInput.Settings.FloatRoundPrecision)
+                                totalValue:Price = (limitOrder.LimitPrice * int(limitOrder.Quantity)).Round(self.MoneyMakerInput.Settings.FloatRoundPrecision)
                                 unfilledCommissionFee = self.MoneyMakerInput.Settings.UnfilledCommissionOrFee
                                 unfilledValue = self.MoneyMakerInput.Settings.UnfilledValue        
                                 maxCommission = self.MoneyMakerInput.Settings.MaxCommission
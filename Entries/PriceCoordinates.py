@@ -26,6 +26,9 @@ from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
     - Make sure that the start prices don't overlap.
     - Make sure that fixedBuyDelta > 0 when buyDeltaType is BuyDeltaType.FIXED.
 
+    The rules are validated when the stock item is built by the GetActiveStockItem. The lists here
+    are shared by the stock items, they are compiled to CompiledPriceCoordinates and never modified.
+
 """
 
 PriceCoordinates0:List[PriceCoordinate] = []
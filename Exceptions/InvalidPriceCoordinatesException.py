@@ -0,0 +1,21 @@
+from typing import List
+
+from BusinessModels.PriceCoordinate import PriceCoordinate
+
+from Exceptions.ErrorException import Error
+
+
+class InvalidPriceCoordinatesError(Error):
+    """ Exception used to represent when the price coordinates of a stock item are invalid.
+        For example overlapping coordinates or FixedBuyDelta which doesn't move the price backwards.
+
+        Attributes:
+
+        PriceCoordinates:List[PriceCoordinate] - Price coordinates which failed the validation.
+
+        Message:str - text message.
+
+    """
+    def __init__(self, message:str, priceCoordinates:List[PriceCoordinate]):
+        self.PriceCoordinates = priceCoordinates
+        self.Message = message
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import parse
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeAccount import \
+    AsyncETradeAccount
+from ETrade.ETradeBusinessServices.AsyncETradeOrder import AsyncETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInETradeHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade API. Orders are returned in two pages, second page is requested using the marker.
+    """
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        url = parse.urlsplit(self.path)
+        query = dict(parse.parse_qsl(url.query))
+        StandInETradeHandler.requests.append(("GET", url.path, query, self.headers.get("Authorization", "")))
+        if url.path == "/v1/accounts/KEY/orders.json" and "marker" not in query:
+            self.Reply(200, {"OrdersResponse": {"marker": "M1", "next": "http://host/v1/accounts/KEY/orders.json?marker=M1&count=2",
+                "Order": [{"orderId": 1, "orderType": "EQ", "OrderDetail": [{"status": "OPEN", "limitPrice": 22.55,
+                    "Instrument": [{"Product": {"symbol": "AAA", "securityType": "EQ"}, "orderAction": "BUY", "orderedQuantity": 2, "filledQuantity": 0}]}]}]}})
+        elif url.path == "/v1/accounts/KEY/orders.json":
+            self.Reply(200, {"OrdersResponse": {"Order": [{"orderId": 2, "orderType": "EQ", "OrderDetail": [{"status": "OPEN", "limitPrice": 21.55,
+                "Instrument": [{"Product": {"symbol": "BBB", "securityType": "EQ"}, "orderAction": "SELL", "orderedQuantity": 1, "filledQuantity": 0}]}]}]}})
+        elif url.path == "/v1/accounts/KEY/portfolio.json":
+            self.Reply(200, {"PortfolioResponse": {"AccountPortfolio": [{"accountId": "1", "totalNoOfPages": 1,
+                "Position": [{"symbolDescription": "AAA", "quantity": 9}]}]}})
+        else:
+            self.Reply(401, {"Error": {"code": 10, "message": "token_rejected"}})
+
+    def do_PUT(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StandInETradeHandler.requests.append(("PUT", self.path, body, self.headers.get("Authorization", "")))
+        self.Reply(200, {"CancelOrderResponse": {"orderId": body["CancelOrderRequest"]["orderId"]}})
+
+
+class tests_AsyncETradeOrder_Orders(unittest.TestCase):
+    """ Tests related to the async ETrade services using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInETradeHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInETradeHandler.requests = []
+
+        self.settings = ETradeSettings()
+        self.settings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.settings.UseRateLimiter = False
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_AsyncETradeOrder.log"), "AsyncETradeOrderTestLogger"))
+        self.strings = FormatStringsBase()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_Orders_All_Pages(self):
+        """ Orders
+
+            Both the pages are returned, second page is requested with the marker. Requests are signed.
+        """
+        async def GetOrders():
+            async with AsyncETradeOrder(self.inputModel, self.settings, self.context, self.strings) as order:
+                return await order.Orders("KEY")
+
+        ordersResponse = asyncio.run(GetOrders())
+
+        self.assertIsNone(ordersResponse.Error)
+        self.assertEqual([1, 2], [orderData.OrderId for orderData in ordersResponse.Orders])
+        self.assertEqual(22.55, ordersResponse.Orders[0].OrderDetails[0].LimitPrice)
+        self.assertEqual("BBB", ordersResponse.Orders[1].OrderDetails[0].Instruments[0].Symbol)
+        self.assertEqual("M1", StandInETradeHandler.requests[1][2]["marker"])
+        for request in StandInETradeHandler.requests:
+            self.assertIn('oauth_token="token"', request[3])
+            self.assertIn("oauth_signature=", request[3])
+
+    def test_Concurrent_Requests(self):
+        """ CancelOrder, Portfolio and an unauthorized request sent at the same time on one event loop.
+        """
+        async def SendRequests():
+            async with AsyncETradeOrder(self.inputModel, self.settings, self.context, self.strings) as order, \
+                    AsyncETradeAccount(self.inputModel, self.settings, self.context, self.strings) as account:
+                return await asyncio.gather(*[order.CancelOrder("KEY", orderId) for orderId in range(1, 21)],
+                            account.Portfolio("KEY"), order.Orders("UNKNOWN"))
+
+        responses = asyncio.run(SendRequests())
+
+        self.assertEqual(list(range(1, 21)), [cancelOrderResponse.OrderId for cancelOrderResponse in responses[:20]])
+        portfolioResponse = responses[20]
+        self.assertEqual(["AAA"], [position.Symbol for position in portfolioResponse.AccountPortfolios[0].PortfolioPositions])
+        self.assertEqual(9, portfolioResponse.AccountPortfolios[0].PortfolioPositions[0].Quantity)
+        self.assertEqual(401, responses[21].Error.ResponseStatusCode)
+        self.assertEqual("token_rejected", responses[21].Error.Message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ClientOrderRegistry import (ClientOrderIdGenerator,
+                                                     ClientOrderRegistry)
+
+
+class tests_ClientOrderRegistry_Resolve(unittest.TestCase):
+    """ Tests related to the ClientOrderIds and the lookup of the orders with an unknown place outcome.
+    """
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.settings = Settings()
+        self.settings.UseClientOrderRegistryFile = True
+        self.settings.ClientOrderRegistryFilePathWithName = os.path.join(self.temporaryDirectory.name, "client_orders.jsonl")
+        self.settings.ClientOrderRegistryRetentionInDays = 7
+        self.settings.ClientOrderLookupTimeoutInSeconds = 300
+        self.now = 1700000000.0
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def ApiOrder(self, orderId:int, symbol:str, orderAction:str, limitPrice:str, quantity:int, placedTime:float) -> Order:
+        instrument = Instrument()
+        instrument.Symbol = symbol
+        instrument.OrderAction = orderAction
+        instrument.OrderedQuantity = quantity
+        orderDetail = OrderDetail()
+        orderDetail.LimitPrice = Price.From(limitPrice)
+        orderDetail.PlacedTime = int(placedTime * 1000)
+        orderDetail.Instruments = [instrument]
+        return Order(orderId= orderId, orderDetails= [orderDetail])
+
+    def test_ClientOrderIdGenerator_Unique(self):
+        """ ClientOrderIdGenerator
+
+            Ids generated by many threads at the same time are unique, alphanumeric and at most 20 characters.
+        """
+        generator = ClientOrderIdGenerator()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clientOrderIds = list(executor.map(lambda _: generator.Next(), range(5000)))
+
+        self.assertEqual(5000, len(set(clientOrderIds)))
+        self.assertTrue(all(len(clientOrderId) <= 20 and clientOrderId.isalnum() for clientOrderId in clientOrderIds))
+        self.assertNotEqual(ClientOrderIdGenerator("OA").Next(), ClientOrderIdGenerator("OB").Next())
+        with self.assertRaises(ValueError):
+            ClientOrderIdGenerator("O" * 15)
+
+    def test_Resolve(self):
+        """ Resolve
+
+            An UNKNOWN order is PLACED with the matching order of the API, an order is claimed only once and
+            an order not found is NOT_PLACED after the lookup timeout.
+        """
+        registry = ClientOrderRegistry(self.settings)
+        registry.Register("O1", OrderInfo(0, "abc", "10.50", 5, False, False), self.now)
+        registry.Register("O2", OrderInfo(0, "abc", "10.50", 5, False, False), self.now)
+        registry.Register("O3", OrderInfo(0, "abc", "11.00", 5, False, True), self.now)
+        for clientOrderId in ("O1", "O2", "O3"):
+            registry.SetState(clientOrderId, ClientOrderRegistry.Unknown, now= self.now)
+        self.assertEqual(["O1", "O2", "O3"], [entry.ClientOrderId for entry in registry.GetUnknown("ABC")])
+
+        orders = [self.ApiOrder(7, "ABC", "BUY", "10.5", 5, self.now + 1),
+                    self.ApiOrder(8, "ABC", "BUY", "10.50", 6, self.now + 1),
+                    self.ApiOrder(9, "ABC", "SELL", "11", 5, self.now - 3600)]
+        resolved = registry.Resolve("abc", orders, self.now + 10)
+
+        self.assertEqual([("O1", ClientOrderRegistry.Placed, 7)], [(entry.ClientOrderId, entry.State, entry.OrderId) for entry in resolved])
+        self.assertEqual(["O2", "O3"], [entry.ClientOrderId for entry in registry.GetUnknown("ABC")])
+
+        # Not found for ClientOrderLookupTimeoutInSeconds, can be placed again.
+        resolved = registry.Resolve("ABC", orders, self.now + 301)
+        self.assertEqual([("O2", ClientOrderRegistry.NotPlaced), ("O3", ClientOrderRegistry.NotPlaced)],
+                            [(entry.ClientOrderId, entry.State) for entry in resolved])
+        self.assertEqual([], registry.GetUnknown("ABC"))
+
+    def test_Prune(self):
+        """ Prune
+
+            Resolved orders older than the lookup window are dropped, UNKNOWN orders are kept.
+        """
+        self.settings.UseClientOrderRegistryFile = False
+        registry = ClientOrderRegistry(self.settings)
+        registry.Register("O1", OrderInfo(0, "ABC", "10.50", 5, False, False), self.now)
+        registry.SetState("O1", ClientOrderRegistry.Placed, 7, self.now)
+        registry.Register("O2", OrderInfo(0, "ABC", "10.25", 5, False, False), self.now)
+        registry.SetState("O2", ClientOrderRegistry.Rejected, now= self.now)
+        registry.Register("O3", OrderInfo(0, "ABC", "10.00", 5, False, False), self.now)
+        registry.SetState("O3", ClientOrderRegistry.Unknown, now= self.now)
+
+        # Within the window, still claimed.
+        registry.Register("O4", OrderInfo(0, "ABC", "9.75", 5, False, False), self.now + 300)
+        self.assertEqual(["O1", "O2", "O3", "O4"], sorted(registry.Entries))
+
+        registry.Resolve("XYZ", [], self.now + 361)
+        self.assertEqual(["O3", "O4"], sorted(registry.Entries))
+
+    def test_Load_Replay(self):
+        """ Load
+
+            The registry file is replayed, PENDING orders are UNKNOWN and resolved orders older than the
+            retention are dropped.
+        """
+        registry = ClientOrderRegistry(self.settings)
+        registry.Register("O1", OrderInfo(0, "ABC", "10.50", 5, False, False))
+        registry.Register("O2", OrderInfo(0, "ABC", "10.25", 5, False, False))
+        registry.SetState("O2", ClientOrderRegistry.Placed, 42)
+        registry.Register("O3", OrderInfo(0, "XYZ", "3", 1, False, False), self.now)
+        registry.SetState("O3", ClientOrderRegistry.Rejected, now= self.now)
+        with self.assertRaises(ValueError):
+            registry.Register("O1", OrderInfo(0, "ABC", "10.50", 5, False, False))
+
+        registry = ClientOrderRegistry(self.settings)
+
+        self.assertEqual(["O1", "O2"], sorted(registry.Entries))
+        self.assertEqual(ClientOrderRegistry.Unknown, registry.Entries["O1"].State)
+        self.assertEqual((ClientOrderRegistry.Placed, 42, Price.From("10.25")),
+                            (registry.Entries["O2"].State, registry.Entries["O2"].OrderId, registry.Entries["O2"].LimitPrice))
+        with open(self.settings.ClientOrderRegistryFilePathWithName, "r") as registryFile:
+            self.assertEqual(2, len(registryFile.readlines()))
+
+        # Not persisted.
+        self.settings.UseClientOrderRegistryFile = False
+        self.assertEqual({}, ClientOrderRegistry(self.settings).Entries)
+
+
+if __name__ == '__main__':
+    unittest.main()
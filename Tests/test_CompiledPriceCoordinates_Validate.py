@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.CompiledPriceCoordinates import CompiledPriceCoordinates
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from Exceptions.InvalidPriceCoordinatesException import \
+    InvalidPriceCoordinatesError
+
+from Tests.test_Data import PriceCoordinates1001
+
+
+class tests_CompiledPriceCoordinates_Validate(unittest.TestCase):
+    """ Tests related to the validation and compilation of the price coordinates.
+    """
+
+    def test_Validate_Overlapping_StartPrice(self):
+        """ Two price coordinates with the same StartPrice are rejected.
+        """
+        priceCoordinates:List[PriceCoordinate] = []
+        priceCoordinates.append(PriceCoordinate(startPrice=10, quantity=1, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=1))
+        priceCoordinates.append(PriceCoordinate(startPrice=10, quantity=2, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=0.5))
+
+        with self.assertRaises(InvalidPriceCoordinatesError):
+            CompiledPriceCoordinates.Compile(priceCoordinates)
+
+    def test_Validate_FixedBuyDelta_Not_Positive(self):
+        """ FIXED price coordinate with zero or negative FixedBuyDelta is rejected.
+        """
+        for fixedBuyDelta in [0, -0.5]:
+            priceCoordinates = [PriceCoordinate(startPrice=0, quantity=1, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=fixedBuyDelta)]
+            with self.assertRaises(InvalidPriceCoordinatesError):
+                CompiledPriceCoordinates.Compile(priceCoordinates)
+
+    def test_Compile_Sorted_And_Immutable(self):
+        """ Compiled price coordinates are sorted by StartPrice, immutable and the source list is not modified.
+        """
+        startPrices = [coordinate.StartPrice for coordinate in PriceCoordinates1001]
+        compiledPriceCoordinates = CompiledPriceCoordinates.Compile(PriceCoordinates1001)
+
+        self.assertEqual((0, 7, 25, 50), compiledPriceCoordinates.StartPrices)
+        self.assertEqual(startPrices, [coordinate.StartPrice for coordinate in PriceCoordinates1001])
+        self.assertIs(compiledPriceCoordinates, CompiledPriceCoordinates.Compile(compiledPriceCoordinates))
+        self.assertEqual(4, compiledPriceCoordinates.GetQuantity(24.5))
+        self.assertEqual(10, compiledPriceCoordinates.GetQuantity(0))
+
+        with self.assertRaises(AttributeError):
+            compiledPriceCoordinates.StartPrices = ()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import parse
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessModels.FilteringAndPagingParams import \
+    PortfolioFilteringAndPagingParams
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeAccount import \
+    AsyncETradeAccount
+from ETrade.ETradeBusinessServices.ETradeAccount import ETradeAccount
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInPortfolioHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade Portfolio API. Four pages of one position each, the pages after the first are
+        slow and the requests in progress at the same time are counted.
+    """
+    totalNoOfPages = 4
+    requests = []
+    inProgress = 0
+    maxInProgress = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        query = dict(parse.parse_qsl(parse.urlsplit(self.path).query))
+        pageNumber = int(query["pageNumber"])
+        with StandInPortfolioHandler.lock:
+            StandInPortfolioHandler.requests.append(pageNumber)
+            StandInPortfolioHandler.inProgress += 1
+            StandInPortfolioHandler.maxInProgress = max(StandInPortfolioHandler.maxInProgress, StandInPortfolioHandler.inProgress)
+        if pageNumber > 1:
+            time.sleep(0.1)
+        with StandInPortfolioHandler.lock:
+            StandInPortfolioHandler.inProgress -= 1
+
+        accountPortfolio = {"accountId": "1", "Position": [{"symbolDescription": f"S{pageNumber}", "quantity": pageNumber}]}
+        if StandInPortfolioHandler.totalNoOfPages is not None:
+            accountPortfolio["totalNoOfPages"] = StandInPortfolioHandler.totalNoOfPages
+        if pageNumber < 4:
+            accountPortfolio["nextPageNo"] = pageNumber + 1
+            accountPortfolio["next"] = f"http://host/v1/accounts/KEY/portfolio.json?count=1&pageNumber={pageNumber + 1}"
+        self.Reply(200, {"PortfolioResponse": {"AccountPortfolio": [accountPortfolio]}})
+
+
+class tests_ETradeAccount_Portfolio(unittest.TestCase):
+    """ Tests related to the Portfolio pages using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInPortfolioHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInPortfolioHandler.totalNoOfPages = 4
+        StandInPortfolioHandler.requests = []
+        StandInPortfolioHandler.maxInProgress = 0
+
+        self.settings = ETradeSettings()
+        self.settings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.settings.PortfolioMaxConcurrentPages = 4
+        # Pages are not paced by the rate limiter, only by PortfolioMaxConcurrentPages.
+        self.settings.RateLimitAccountRequestsPerSecond = 0
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeAccount.log"), "ETradeAccountTestLogger"))
+        self.strings = FormatStringsBase()
+        self.filteringAndPagingParams = PortfolioFilteringAndPagingParams(pageSize=1, pageNumber=1, applyFilterAndReturnAll=True)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_Portfolio_Concurrent_Pages(self):
+        """ Portfolio
+
+            Pages 2..4 are requested at the same time after the first page, positions are in page order.
+        """
+        account = ETradeAccount(self.inputModel, self.settings, self.context, self.strings)
+        portfolioResponse = account.Portfolio("KEY", filteringAndPagingParams= self.filteringAndPagingParams)
+
+        self.assertIsNone(portfolioResponse.Error)
+        self.assertEqual(["S1", "S2", "S3", "S4"], [position.Symbol for position in portfolioResponse.AccountPortfolios[0].PortfolioPositions])
+        self.assertEqual([1, 2, 3, 4], sorted(StandInPortfolioHandler.requests))
+        self.assertEqual(3, StandInPortfolioHandler.maxInProgress)
+
+    def test_Portfolio_Concurrent_Pages_Async(self):
+        """ Portfolio
+
+            Same as the sync client.
+        """
+        async def GetPortfolio():
+            async with AsyncETradeAccount(self.inputModel, self.settings, self.context, self.strings) as account:
+                return await account.Portfolio("KEY", filteringAndPagingParams= self.filteringAndPagingParams)
+
+        portfolioResponse = asyncio.run(GetPortfolio())
+
+        self.assertIsNone(portfolioResponse.Error)
+        self.assertEqual(["S1", "S2", "S3", "S4"], [position.Symbol for position in portfolioResponse.AccountPortfolios[0].PortfolioPositions])
+        self.assertEqual(3, StandInPortfolioHandler.maxInProgress)
+
+    def test_Portfolio_Unknown_Total(self):
+        """ Portfolio
+
+            Without the total number of pages, the next links are followed one after another.
+        """
+        StandInPortfolioHandler.totalNoOfPages = None
+        account = ETradeAccount(self.inputModel, self.settings, self.context, self.strings)
+        portfolioResponse = account.Portfolio("KEY", filteringAndPagingParams= self.filteringAndPagingParams)
+
+        self.assertEqual(["S1", "S2", "S3", "S4"], [position.Symbol for position in portfolioResponse.AccountPortfolios[0].PortfolioPositions])
+        self.assertEqual([1, 2, 3, 4], StandInPortfolioHandler.requests)
+        self.assertEqual(1, StandInPortfolioHandler.maxInProgress)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices import ETradeBusinessService
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class tests_ETradeBusinessService_ParseResponse(unittest.TestCase):
+    """ Tests related to the response decoding shared by the ETrade services.
+    """
+
+    def setUp(self):
+        self.appLogger = AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeBusinessService.log"), "ETradeBusinessServiceTestLogger")
+        self.order = ETradeOrder(ETradeInputModel("token", "tokenSecret", datetime.now()), ETradeSettings(),
+                        Context(self.appLogger), FormatStringsBase())
+
+    def tearDown(self):
+        pass
+
+    def GetResponse(self, statusCode:int, body) -> requests.Response:
+        response = requests.Response()
+        response.status_code = statusCode
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        response.request = requests.Request("GET", "http://host/").prepare()
+        return response
+
+    def test_ParseResponse_Json_And_Orjson_Same(self):
+        """ ParseResponse
+
+            Body is decoded the same with or without orjson, floats are exact prices.
+        """
+        response = self.GetResponse(200, b'{"CancelOrderResponse": {"orderId": 5, "limitPrice": 22.55}}')
+        data = self.order.ParseResponse(response)
+        with mock.patch.object(ETradeBusinessService, "orjson", None):
+            self.assertEqual(data, self.order.ParseResponse(response))
+        self.assertEqual(5, self.order.ProcessCancelOrderResponse(response).OrderId)
+
+    def test_ParseResponse_Pretty_Print_Only_When_Debug(self):
+        """ ParseResponse
+
+            Body is pretty printed only when the debug messages are logged.
+        """
+        response = self.GetResponse(200, {"CancelOrderResponse": {"orderId": 5}})
+        with mock.patch.object(ETradeBusinessService.json, "dumps", wraps=json.dumps) as dumps:
+            self.appLogger.Logger.setLevel("INFO")
+            self.order.ProcessCancelOrderResponse(response)
+            self.assertEqual(0, dumps.call_count)
+
+            self.appLogger.Logger.setLevel("DEBUG")
+            self.order.ProcessCancelOrderResponse(response)
+            self.assertEqual(1, dumps.call_count)
+
+    def test_ParseResponseError(self):
+        """ ParseResponseError
+
+            Message and code from the JSON error body. Response text if the body is not JSON.
+        """
+        error = self.order.ProcessCancelOrderResponse(self.GetResponse(401, {"Error": {"code": 10, "message": "token_rejected"}})).Error
+        self.assertEqual((401, 10, "token_rejected"), (error.ResponseStatusCode, error.Code, error.Message))
+
+        error = self.order.ProcessCancelOrderResponse(self.GetResponse(500, b"<html>Server Error</html>")).Error
+        self.assertEqual((500, "", "<html>Server Error</html>"), (error.ResponseStatusCode, error.Code, error.Message))
+
+
+if __name__ == '__main__':
+    unittest.main()
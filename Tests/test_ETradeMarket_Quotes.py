@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import parse
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessModels.Price import Price
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeMarket import AsyncETradeMarket
+from ETrade.ETradeBusinessServices.ETradeMarket import ETradeMarket
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInQuotesHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade Quotes API. Rejects the requests above the symbol limit of the request.
+    """
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        url = parse.urlsplit(self.path)
+        query = dict(parse.parse_qsl(url.query))
+        symbols = url.path[len("/v1/market/quote/"):-len(".json")].split(",")
+        override = query.get("overrideSymbolCount") == "true"
+        StandInQuotesHandler.requests.append((symbols, override))
+        if len(symbols) > (50 if override is True else 25):
+            self.Reply(400, {"Error": {"code": 1023, "message": "Too many symbols"}})
+            return
+        self.Reply(200, {"QuoteResponse": {"QuoteData": [{"dateTime": "15:59:59 EDT 10-16-2026", "dateTimeUTC": 1792180799,
+            "Product": {"symbol": symbol, "securityType": "EQ"},
+            "All": {"lastTrade": 20.55, "bid": 20.54, "ask": 20.56, "totalVolume": 1000 + index}}
+            for index, symbol in enumerate(symbols)]}})
+
+
+class tests_ETradeMarket_Quotes(unittest.TestCase):
+    """ Tests related to the chunked Quotes requests using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInQuotesHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInQuotesHandler.requests = []
+
+        self.settings = ETradeSettings()
+        self.settings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeMarket.log"), "ETradeMarketTestLogger"))
+        self.strings = FormatStringsBase()
+        self.symbols = [f"S{index:03}" for index in range(120)]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def AssertQuotes(self, quoteResponse):
+        self.assertIsNone(quoteResponse.Error)
+        self.assertEqual(self.symbols, list(quoteResponse.QuoteDataBySymbol))
+        quoteData = quoteResponse.QuoteDataBySymbol["S051"]
+        self.assertEqual(Price.From("20.54"), quoteData.Bid)
+        self.assertEqual(Price.From("20.56"), quoteData.Ask)
+        self.assertEqual(1001, quoteData.Volume)
+        self.assertEqual(1792180799, quoteData.TimeStamp)
+        self.assertEqual("20.55", quoteData.LastTradedPrice)
+
+    def test_Quotes_Chunks(self):
+        """ Quotes
+
+            120 symbols are requested in chunks of 50 with overrideSymbolCount, duplicates are removed.
+        """
+        market = ETradeMarket(self.inputModel, self.settings, self.context, self.strings)
+
+        quoteResponse = market.Quotes(self.symbols + ["s000"])
+
+        self.AssertQuotes(quoteResponse)
+        self.assertEqual([50, 50, 20], sorted([len(symbols) for symbols, override in StandInQuotesHandler.requests], reverse=True))
+        self.assertEqual({50: True, 20: False}, {len(symbols): override for symbols, override in StandInQuotesHandler.requests})
+
+    def test_Quotes_Chunks_Without_Override(self):
+        """ Quotes
+
+            Chunks of 25 symbols without overrideSymbolCount.
+        """
+        self.settings.QuotesOverrideSymbolCount = False
+        market = ETradeMarket(self.inputModel, self.settings, self.context, self.strings)
+
+        quoteResponse = market.Quotes(self.symbols)
+
+        self.AssertQuotes(quoteResponse)
+        self.assertEqual(5, len(StandInQuotesHandler.requests))
+        self.assertEqual([False] * 5, [override for symbols, override in StandInQuotesHandler.requests])
+
+    def test_Quotes_Async_Error(self):
+        """ Quotes
+
+            Async chunks are merged, an error of one chunk is returned with the quotes of the other chunks.
+        """
+        self.settings.QuotesOverrideMaxSymbols = 100
+
+        async def GetQuotes():
+            async with AsyncETradeMarket(self.inputModel, self.settings, self.context, self.strings) as market:
+                return await market.Quotes(self.symbols)
+
+        quoteResponse = asyncio.run(GetQuotes())
+
+        self.assertEqual(400, quoteResponse.Error.ResponseStatusCode)
+        self.assertEqual(self.symbols[100:], list(quoteResponse.QuoteDataBySymbol))
+
+        self.settings.QuotesOverrideMaxSymbols = 50
+        self.AssertQuotes(asyncio.run(GetQuotes()))
+
+
+if __name__ == '__main__':
+    unittest.main()
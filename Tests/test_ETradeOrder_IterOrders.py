@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import parse
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeOrder import AsyncETradeOrder
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInOrdersHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade Orders API. Three pages of one order each, linked by markers.
+    """
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        query = dict(parse.parse_qsl(parse.urlsplit(self.path).query))
+        pageNumber = int(query.get("marker", "0")) + 1
+        StandInOrdersHandler.requests.append(pageNumber)
+        ordersResponse = {"Order": [{"orderId": pageNumber, "orderType": "EQ", "OrderDetail": [{"status": "OPEN", "limitPrice": 20.55,
+            "Instrument": [{"Product": {"symbol": "AAA", "securityType": "EQ"}, "orderAction": "BUY", "orderedQuantity": 1, "filledQuantity": 0}]}]}]}
+        if pageNumber < 3:
+            ordersResponse["marker"] = str(pageNumber)
+            ordersResponse["next"] = f"http://host/v1/accounts/KEY/orders.json?marker={pageNumber}&count=1"
+        self.Reply(200, {"OrdersResponse": ordersResponse})
+
+
+class tests_ETradeOrder_IterOrders(unittest.TestCase):
+    """ Tests related to the Orders returned page by page using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInOrdersHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInOrdersHandler.requests = []
+
+        self.settings = ETradeSettings()
+        self.settings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeOrder.log"), "ETradeOrderTestLogger"))
+        self.strings = FormatStringsBase()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_IterOrders_All_Pages(self):
+        """ IterOrders
+
+            One OrdersResponse per page, same orders as Orders.
+        """
+        order = ETradeOrder(self.inputModel, self.settings, self.context, self.strings)
+
+        pages = list(order.IterOrders("KEY"))
+
+        self.assertEqual([[1], [2], [3]], [[orderData.OrderId for orderData in page.Orders] for page in pages])
+        self.assertEqual([1, 2, 3], [orderData.OrderId for orderData in order.Orders("KEY").Orders])
+
+    def test_IterOrders_Stop_Early(self):
+        """ IterOrders
+
+            The second page is downloaded while the first page is processed, stopping after the first page
+            the third page is not requested.
+        """
+        order = ETradeOrder(self.inputModel, self.settings, self.context, self.strings)
+
+        for page in order.IterOrders("KEY"):
+            self.assertEqual([1], [orderData.OrderId for orderData in page.Orders])
+            time.sleep(0.2)
+            self.assertEqual([1, 2], StandInOrdersHandler.requests)
+            break
+        time.sleep(0.2)
+
+        self.assertEqual([1, 2], StandInOrdersHandler.requests)
+
+    def test_IterOrders_Async(self):
+        """ IterOrders
+
+            Same as the sync client.
+        """
+        async def GetPages():
+            async with AsyncETradeOrder(self.inputModel, self.settings, self.context, self.strings) as order:
+                return [[orderData.OrderId for orderData in page.Orders] async for page in order.IterOrders("KEY")]
+
+        self.assertEqual([[1], [2], [3]], asyncio.run(GetPages()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessModels.Message import MessageType
+from BusinessModels.OrdersResponse import OrdersResponse
+from BusinessModels.Price import Price
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class tests_ETradeOrder_ProcessOrdersPage(unittest.TestCase):
+    """ Tests related to the mapping of the Orders and PreviewOrder responses to the models.
+    """
+
+    def setUp(self):
+        appLogger = AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeOrder.log"), "ETradeOrderTestLogger")
+        self.order = ETradeOrder(ETradeInputModel("token", "tokenSecret", datetime.now()), ETradeSettings(),
+                        Context(appLogger), FormatStringsBase())
+
+    def tearDown(self):
+        pass
+
+    def GetResponse(self, body:dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        response.request = requests.Request("GET", "http://host/").prepare()
+        return response
+
+    def test_ProcessOrdersPage_Order_Details_And_Events(self):
+        """ ProcessOrdersPage
+
+            Order, order details, instruments and events are mapped. Next page params from next.
+        """
+        body = {"OrdersResponse": {"marker": "M1", "next": "http://host/orders.json?marker=M1&count=2", "Order": [{
+            "orderId": 7, "orderType": "EQ", "totalOrderValue": 45.1,
+            "OrderDetail": [{"orderNumber": 1, "status": "OPEN", "limitPrice": 22.55, "allOrNone": False,
+                "Instrument": [{"Product": {"symbol": "AAA", "securityType": "EQ"}, "orderAction": "BUY",
+                    "orderedQuantity": 2, "filledQuantity": 0, "estimatedCommission": 0},
+                    {"orderAction": "BUY"}]}],
+            "Events": {"Event": [{"name": "ORDER_PLACED", "dateTime": 1600000000000, "orderNumber": 1,
+                "instrument": [{"Product": {"symbol": "AAA", "securityType": "EQ"}, "orderAction": "BUY"}]}]}}]}}
+
+        ordersResponse = OrdersResponse()
+        ordersResponse.Orders = []
+        ordersResponse.Messages = []
+        params = self.order.ProcessOrdersPage(self.GetResponse(body), ordersResponse)
+
+        self.assertEqual({"marker": "M1", "count": "2"}, params)
+        self.assertEqual("M1", ordersResponse.Marker)
+        self.assertEqual(0, len(ordersResponse.Messages))
+        order = ordersResponse.Orders[0]
+        self.assertEqual((7, "EQ", Price.From("45.1")), (order.OrderId, order.OrderType, order.TotalOrderValue))
+        orderDetail = order.OrderDetails[0]
+        self.assertEqual((1, "OPEN", Price.From("22.55"), False), (orderDetail.OrderNumber, orderDetail.Status, orderDetail.LimitPrice, orderDetail.AllOrNone))
+        # Instrument without Product is skipped.
+        self.assertEqual(1, len(orderDetail.Instruments))
+        instrument = orderDetail.Instruments[0]
+        self.assertEqual(("AAA", "EQ", "BUY", 2.0, 0.0, Price(0)), (instrument.Symbol, instrument.SecurityType, instrument.OrderAction,
+                            instrument.OrderedQuantity, instrument.FilledQuantity, instrument.EstimatedCommission))
+        self.assertEqual(1, len(order.Events))
+        self.assertEqual(("ORDER_PLACED", 1600000000000, 1), (order.Events[0].Name, order.Events[0].DateTime, order.Events[0].OrderNumber))
+        self.assertEqual(["AAA"], [eventInstrument.Symbol for eventInstrument in order.Events[0].Instruments])
+
+    def test_ProcessPreviewOrderResponse_Messages(self):
+        """ ProcessPreviewOrderResponse
+
+            Preview data and the MessageList messages are mapped.
+        """
+        body = {"PreviewOrderResponse": {"PreviewIds": [{"previewId": 11, "cashMargin": "CASH"}], "totalOrderValue": 45.1,
+            "totalCommission": 0, "Order": [{"limitPrice": 22.55, "Instrument": [{"Product": {"symbol": "AAA"}}]}],
+            "MessageList": {"Message": [{"code": 1042, "description": "Price adjusted", "type": "WARNING"}]}}}
+
+        previewOrderResponse = self.order.ProcessPreviewOrderResponse(self.GetResponse(body))
+
+        previewOrderResponseData = previewOrderResponse.PreviewOrderResponseData
+        self.assertEqual([(11, "CASH")], [(previewId.PreviewId, previewId.CashMargin) for previewId in previewOrderResponseData.PreviewIds])
+        self.assertEqual(Price(0), previewOrderResponseData.TotalCommission)
+        self.assertEqual("AAA", previewOrderResponseData.OrderDetails[0].Instruments[0].Symbol)
+        self.assertEqual([(1042, MessageType.WARNING)], [(message.Code, message.Type) for message in previewOrderResponse.Messages])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.QuoteResponse import QuoteData, QuoteResponse
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessUtils.ETradeQuoteCache import ETradeQuoteCache
+
+
+class StandInMarket:
+    """ Stand-in for ETradeMarket. Quotes requests are slow and counted, the last price is the request number.
+    """
+    def __init__(self):
+        self.settings = ETradeSettings()
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def Quotes(self, symbols:list, accessToken:str = None, accessTokenSecret:str = None) -> QuoteResponse:
+        with self.lock:
+            self.requests.append(list(symbols))
+            requestNumber = len(self.requests)
+        time.sleep(0.05)
+        return QuoteResponse(quoteData=[QuoteData(symbol=symbol, lastTradedPrice=str(requestNumber)) for symbol in symbols])
+
+
+class StandInAsyncMarket(StandInMarket):
+    """ Stand-in for AsyncETradeMarket, shares the requests with the sync stand-in.
+    """
+    async def Quotes(self, symbols:list, accessToken:str = None, accessTokenSecret:str = None) -> QuoteResponse:
+        self.requests.append(list(symbols))
+        requestNumber = len(self.requests)
+        await asyncio.sleep(0.05)
+        return QuoteResponse(quoteData=[QuoteData(symbol=symbol, lastTradedPrice=str(requestNumber)) for symbol in symbols])
+
+
+class tests_ETradeQuoteCache_GetQuotes(unittest.TestCase):
+    """ Tests related to the quote cache.
+    """
+
+    def setUp(self):
+        self.market = StandInMarket()
+        self.asyncMarket = StandInAsyncMarket()
+        self.asyncMarket.requests = self.market.requests
+        self.cache = ETradeQuoteCache(self.market, ttlInSeconds=60, maxSymbols=3, asyncMarket=self.asyncMarket)
+
+    def tearDown(self):
+        pass
+
+    def test_GetQuotes_TTL_And_Staleness(self):
+        """ GetQuotes
+
+            Cached quotes are returned within the staleness, only the missing symbols are requested.
+        """
+        self.assertEqual(["AAA", "BBB"], list(self.cache.GetQuotes(["AAA", "bbb"]).QuoteDataBySymbol))
+
+        quoteResponse = self.cache.GetQuotes(["BBB", "CCC", "AAA"])
+        self.assertEqual(["BBB", "CCC", "AAA"], [quoteData.Symbol for quoteData in quoteResponse.QuoteData])
+        self.assertEqual(["1", "2", "1"], [quoteData.LastTradedPrice for quoteData in quoteResponse.QuoteData])
+        self.assertEqual([["AAA", "BBB"], ["CCC"]], self.market.requests)
+
+        # Fresh quote demanded.
+        self.assertEqual("3", self.cache.GetQuotes(["AAA"], maxStalenessInSeconds=0).QuoteData[0].LastTradedPrice)
+        self.assertEqual((2, 4, 0), (self.cache.Counters.Hits, self.cache.Counters.Misses, self.cache.Counters.Coalesced))
+
+    def test_GetQuotes_LRU(self):
+        """ GetQuotes
+
+            Least recently used quote is evicted above MaxSymbols.
+        """
+        self.cache.GetQuotes(["AAA", "BBB", "CCC"])
+        self.cache.GetQuotes(["AAA"])
+        self.cache.GetQuotes(["DDD"])
+        self.assertEqual(["CCC", "AAA", "DDD"], list(self.cache.Quotes))
+
+    def test_GetQuotes_Coalesced(self):
+        """ GetQuotes
+
+            Concurrent requests of the same symbol share one Quotes request.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            quoteResponses = list(executor.map(lambda _: self.cache.GetQuotes(["AAA"]), range(8)))
+
+        self.assertEqual([["AAA"]], self.market.requests)
+        self.assertEqual(["1"] * 8, [quoteResponse.QuoteData[0].LastTradedPrice for quoteResponse in quoteResponses])
+        self.assertEqual(1, self.cache.Counters.Misses)
+        self.assertEqual(7, self.cache.Counters.Hits + self.cache.Counters.Coalesced)
+        self.assertEqual({}, self.cache.InFlight)
+
+    def test_GetQuotesAsync(self):
+        """ GetQuotesAsync
+
+            Concurrent tasks share one Quotes request, the cache is shared with GetQuotes.
+        """
+        async def GetQuotes():
+            return await asyncio.gather(*[self.cache.GetQuotesAsync(["AAA", "BBB"]) for _ in range(4)])
+
+        quoteResponses = asyncio.run(GetQuotes())
+
+        self.assertEqual([["AAA", "BBB"]], self.market.requests)
+        self.assertEqual([["1", "1"]] * 4, [[quoteData.LastTradedPrice for quoteData in quoteResponse.QuoteData] for quoteResponse in quoteResponses])
+        self.assertEqual({}, self.cache.InFlight)
+        self.assertEqual("1", self.cache.GetQuotes(["BBB"]).QuoteData[0].LastTradedPrice)
+        self.assertEqual((1, 2, 6), (self.cache.Counters.Hits, self.cache.Counters.Misses, self.cache.Counters.Coalesced))
+
+
+if __name__ == '__main__':
+    unittest.main()
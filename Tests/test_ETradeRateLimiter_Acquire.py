@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessUtils.ETradeRateLimiter import ETradeRateLimiter
+
+
+class tests_ETradeRateLimiter_Acquire(unittest.TestCase):
+    """ Tests related to the token buckets of the ETrade endpoint classes.
+    """
+
+    def setUp(self):
+        self.settings = ETradeSettings()
+        self.settings.UseRateLimiter = True
+        self.settings.RateLimitMarketRequestsPerSecond = 20
+        self.settings.RateLimitAccountRequestsPerSecond = 0
+        self.settings.RateLimitOrderRequestsPerSecond = 10
+        self.settings.RateLimitThrottleFactor = 0.5
+        self.settings.RateLimitMinimumFactor = 0.25
+        self.settings.RateLimitRecoveryFactor = 0.05
+        self.rateLimiter = ETradeRateLimiter(self.settings)
+        self.marketUrl = "https://api.etrade.com/v1/market/quote/AAA.json"
+        self.orderUrl = "https://api.etrade.com/v1/accounts/KEY/orders/place.json"
+
+    def tearDown(self):
+        pass
+
+    def Response(self, statusCode:int, text:str = "") -> requests.Response:
+        response = requests.Response()
+        response.status_code = statusCode
+        response._content = text.encode()
+        return response
+
+    def test_GetEndpointClass(self):
+        """ GetEndpointClass
+        """
+        self.assertEqual("Market", ETradeRateLimiter.GetEndpointClass(self.marketUrl))
+        self.assertEqual("Order", ETradeRateLimiter.GetEndpointClass(self.orderUrl))
+        self.assertEqual("Order", ETradeRateLimiter.GetEndpointClass("https://api.etrade.com/v1/accounts/KEY/orders.json"))
+        self.assertEqual("Account", ETradeRateLimiter.GetEndpointClass("https://api.etrade.com/v1/accounts/KEY/portfolio.json"))
+        self.assertIsNone(ETradeRateLimiter.GetEndpointClass("https://api.etrade.com/oauth/request_token"))
+
+    def test_Acquire_Paced(self):
+        """ Acquire
+
+            The burst is taken right away, the next requests wait for their tokens. Buckets are separate.
+        """
+        start = time.monotonic()
+        waits = [self.rateLimiter.Acquire(self.orderUrl) for _ in range(15)]
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([0.0] * 10, waits[:10])
+        self.assertTrue(all(wait > 0 for wait in waits[10:]))
+        self.assertGreaterEqual(elapsed, 0.45)
+        counters = self.rateLimiter.Buckets["Order"].Counters
+        self.assertEqual((15, 5), (counters.Requests, counters.Waits))
+        self.assertAlmostEqual(sum(waits), counters.WaitTimeInSeconds)
+
+        # Other buckets are not affected, account requests are not limited.
+        self.assertEqual(0.0, self.rateLimiter.Acquire(self.marketUrl))
+        self.assertEqual([0.0] * 50, [self.rateLimiter.Acquire("https://api.etrade.com/v1/accounts/KEY/portfolio.json") for _ in range(50)])
+
+    def test_AcquireAsync_Paced(self):
+        """ AcquireAsync
+
+            Concurrent requests on one event loop are paced the same as the sync ones.
+        """
+        async def AcquireAll():
+            return await asyncio.gather(*[self.rateLimiter.AcquireAsync(self.marketUrl) for _ in range(30)])
+
+        start = time.monotonic()
+        waits = asyncio.run(AcquireAll())
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(20, waits.count(0.0))
+        self.assertGreaterEqual(elapsed, 0.45)
+        self.assertEqual(10, self.rateLimiter.Buckets["Market"].Counters.Waits)
+
+    def test_Update_Throttled(self):
+        """ Update
+
+            HTTP 429 and throttling messages lower the rate down to the minimum, successful responses raise it back.
+        """
+        bucket = self.rateLimiter.Buckets["Order"]
+        self.rateLimiter.Update(self.orderUrl, self.Response(429))
+        self.assertEqual(5, bucket.Rate)
+        self.rateLimiter.Update(self.orderUrl, self.Response(400, '{"Error": {"code": 100, "message": "Throttling limit reached"}}'))
+        self.assertEqual(2.5, bucket.Rate)
+        self.rateLimiter.Update(self.orderUrl, self.Response(429))
+        self.assertEqual(2.5, bucket.Rate)
+        self.assertEqual(3, bucket.Counters.Throttles)
+
+        # Other errors don't change the rate.
+        self.rateLimiter.Update(self.orderUrl, self.Response(400, '{"Error": {"code": 1023, "message": "Invalid symbol"}}'))
+        self.assertEqual(2.5, bucket.Rate)
+
+        for _ in range(20):
+            self.rateLimiter.Update(self.orderUrl, self.Response(200))
+        self.assertEqual(10, bucket.Rate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ErrorAction import ErrorAction
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessUtils.AsyncOAuth1Session import AsyncOAuth1Session
+from ETrade.ETradeBusinessUtils.ETradeRetryPolicy import ETradeRetryPolicy
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+
+
+class StandInFlakyHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade API. Each path fails with the configured responses first, then succeeds.
+    """
+    failures = {}
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def Handle(self):
+        path = self.path.split("?")[0]
+        StandInFlakyHandler.requests.append((self.command, path))
+        failures = StandInFlakyHandler.failures.get(path, [])
+        if len(failures) != 0:
+            self.Reply(*failures.pop(0))
+        else:
+            self.Reply(200, {"ok": True})
+
+    def do_GET(self):
+        self.Handle()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.Handle()
+
+
+class tests_ETradeRetryPolicy_Send(unittest.TestCase):
+    """ Tests related to the retry of the transient failures using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInFlakyHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInFlakyHandler.requests = []
+        StandInFlakyHandler.failures = {
+            "/v1/accounts/KEY/portfolio.json": [(503, None), (400, {"Error": {"code": 163, "message": "Try again"}})],
+            "/v1/accounts/KEY/orders/preview.json": [(502, None)],
+            "/v1/accounts/KEY/orders/place.json": [(503, None)],
+            "/v1/market/quote/AAA.json": [(400, {"Error": {"code": 1023, "message": "Invalid symbol"}})]}
+
+        self.settings = ETradeSettings()
+        self.settings.RetryMaxAttempts = 3
+        self.settings.RetryBaseDelayInSeconds = 0.01
+        self.settings.RetryMaxDelayInSeconds = 0.05
+        self.baseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_GetErrorAction(self):
+        """ GetErrorAction
+        """
+        self.assertIs(ErrorAction.RETRY, ETradeRetryPolicy.GetErrorAction(self.settings, 163))
+        self.assertIs(ErrorAction.SKIP, ETradeRetryPolicy.GetErrorAction(self.settings, "8400"))
+        self.assertIs(ErrorAction.ABORT, ETradeRetryPolicy.GetErrorAction(self.settings, 9010))
+        self.assertIs(ErrorAction.RETRY, ETradeRetryPolicy.GetErrorAction(self.settings, "", 503))
+        self.assertIsNone(ETradeRetryPolicy.GetErrorAction(self.settings, "", 400))
+
+    def test_Send_Sync(self):
+        """ Send
+
+            Idempotent requests are retried until they succeed, place order and the other errors are not retried.
+        """
+        retryPolicy = ETradeRetryPolicy(self.settings)
+        sessionPool = ETradeSessionPool("key", "secret", "token", "tokenSecret", retryPolicy = retryPolicy)
+
+        self.assertEqual(200, sessionPool.Session.get(self.baseUrl + "/v1/accounts/KEY/portfolio.json").status_code)
+        self.assertEqual(200, sessionPool.Session.post(self.baseUrl + "/v1/accounts/KEY/orders/preview.json", data="{}").status_code)
+        self.assertEqual(503, sessionPool.Session.post(self.baseUrl + "/v1/accounts/KEY/orders/place.json", data="{}").status_code)
+        self.assertEqual(400, sessionPool.Session.get(self.baseUrl + "/v1/market/quote/AAA.json").status_code)
+
+        self.assertEqual(3, StandInFlakyHandler.requests.count(("GET", "/v1/accounts/KEY/portfolio.json")))
+        self.assertEqual(2, StandInFlakyHandler.requests.count(("POST", "/v1/accounts/KEY/orders/preview.json")))
+        self.assertEqual(1, StandInFlakyHandler.requests.count(("POST", "/v1/accounts/KEY/orders/place.json")))
+        self.assertEqual(1, StandInFlakyHandler.requests.count(("GET", "/v1/market/quote/AAA.json")))
+        self.assertEqual((3, 2, 0), (retryPolicy.Counters.Retries, retryPolicy.Counters.Recovered, retryPolicy.Counters.GaveUp))
+        sessionPool.Close()
+
+    def test_Send_Async_Gave_Up(self):
+        """ SendAsync
+
+            The last response is returned after RetryMaxAttempts, connection errors are raised after RetryMaxAttempts.
+        """
+        StandInFlakyHandler.failures["/v1/accounts/KEY/portfolio.json"] = [(503, None)] * 5
+        retryPolicy = ETradeRetryPolicy(self.settings)
+
+        async def Send():
+            async with AsyncOAuth1Session("key", "secret", "token", "tokenSecret", retryPolicy = retryPolicy) as session:
+                response = await session.Get(self.baseUrl + "/v1/accounts/KEY/portfolio.json")
+                with self.assertRaises(ConnectionError):
+                    await session.Get("http://127.0.0.1:1/v1/accounts/KEY/portfolio.json")
+                return response
+
+        self.assertEqual(503, asyncio.run(Send()).status_code)
+        self.assertEqual(3, StandInFlakyHandler.requests.count(("GET", "/v1/accounts/KEY/portfolio.json")))
+        self.assertEqual((4, 0, 2), (retryPolicy.Counters.Retries, retryPolicy.Counters.Recovered, retryPolicy.Counters.GaveUp))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Context import Context
+from BusinessUtils.AppLogger import AppLogger
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeAccount import ETradeAccount
+from ETrade.ETradeBusinessServices.ETradeMarket import ETradeMarket
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from ETrade.ETradeBusinessUtils.ETradeSessionPool import ETradeSessionPool
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade API which keeps the connections alive.
+    """
+    protocol_version = "HTTP/1.1"
+    authorizations = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, body:dict):
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        KeepAliveHandler.authorizations.append(self.headers.get("Authorization", ""))
+        if self.path.startswith("/v1/market/quote/"):
+            self.Reply({"QuoteResponse": {"QuoteData": [{"Product": {"symbol": "AAA"}, "All": {"lastTrade": 10.5}}]}})
+        else:
+            self.Reply({"PortfolioResponse": {"AccountPortfolio": [{"accountId": "1", "totalNoOfPages": 1,
+                "Position": [{"symbolDescription": "AAA", "quantity": 9}]}]}})
+
+    def do_PUT(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        KeepAliveHandler.authorizations.append(self.headers.get("Authorization", ""))
+        self.Reply({"CancelOrderResponse": {"orderId": body["CancelOrderRequest"]["orderId"]}})
+
+
+class tests_ETradeSessionPool_Counters(unittest.TestCase):
+    """ Tests related to the session shared by the ETrade services.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        KeepAliveHandler.authorizations = []
+
+        self.settings = ETradeSettings()
+        self.settings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_ETradeSessionPool.log"), "ETradeSessionPoolTestLogger"))
+        self.strings = FormatStringsBase()
+        self.sessionPool = ETradeSessionPool(self.settings.ConsumerKey, self.settings.ConsumerSecret, "token", "tokenSecret", 2)
+
+    def tearDown(self):
+        self.sessionPool.Close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_Connection_Reused_Across_Services(self):
+        """ Order, Account and Market share one keep-alive connection.
+        """
+        order = ETradeOrder(self.inputModel, self.settings, self.context, self.strings, self.sessionPool)
+        account = ETradeAccount(self.inputModel, self.settings, self.context, self.strings, self.sessionPool)
+        market = ETradeMarket(self.inputModel, self.settings, self.context, self.strings, self.sessionPool)
+
+        self.assertEqual(1, order.CancelOrder("KEY", 1).OrderId)
+        self.assertEqual(9, account.Portfolio("KEY").AccountPortfolios[0].PortfolioPositions[0].Quantity)
+        self.assertEqual("10.5", market.Quotes(["AAA"]).QuoteData[0].LastTradedPrice)
+        self.assertEqual(2, order.CancelOrder("KEY", 2).OrderId)
+
+        self.assertEqual(4, self.sessionPool.Counters.Requests)
+        self.assertEqual(1, self.sessionPool.Counters.NewConnections)
+        self.assertEqual(3, self.sessionPool.Counters.ReusedConnections)
+
+    def test_UpdateAccessKeys_In_Place(self):
+        """ Rotated token is used by the next request, on the same connection.
+        """
+        order = ETradeOrder(self.inputModel, self.settings, self.context, self.strings, self.sessionPool)
+        order.CancelOrder("KEY", 1)
+        self.sessionPool.UpdateAccessKeys("newToken", "newTokenSecret")
+        order.CancelOrder("KEY", 2)
+
+        self.assertIn('oauth_token="token"', KeepAliveHandler.authorizations[0])
+        self.assertIn('oauth_token="newToken"', KeepAliveHandler.authorizations[1])
+        self.assertIs(self.sessionPool.Session, order.session)
+        self.assertEqual(1, self.sessionPool.Counters.NewConnections)
+
+
+if __name__ == '__main__':
+    unittest.main()
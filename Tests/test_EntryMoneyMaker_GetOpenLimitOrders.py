@@ -0,0 +1,100 @@
+import os
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.PortfolioResponse import PortfolioPosition
+from BusinessModels.Price import Price
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryMoneyMaker import MoneyMaker
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class tests_EntryMoneyMaker_GetOpenLimitOrders(unittest.TestCase):
+    """ Tests related to GetOpenLimitOrders and CalculateStockItemOrders methods of MoneyMaker class, with the
+        open orders as received from the API.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.UseClientOrderRegistryFile = False
+        moneyMakerInput = types.SimpleNamespace(Settings= self.settings, ETradeSettings= ETradeSettings(), Strings= FormatStringsBase(),
+            Order= None, AsyncOrder= None,
+            Configuration= types.SimpleNamespace(GetLatestETradeAccessKeyDetails= lambda: ("token", "tokenSecret", datetime.now())),
+            MoneyMakerLogger= None, Logger= None,
+            LogMessage= lambda logger, message, isError = False, isUser = False: None)
+        self.moneyMaker = MoneyMaker(moneyMakerInput, ManageOrdersHelpers(self.settings))
+        # FLAT Buy pricing with quantity 3, portfolio quantity 4. Possible orders are SELL 21(3), partial SELL 20(1)
+        # and partial BUY 19(2).
+        self.activeStockItem = ActiveStockItem(symbol= "AAA", startPrice= 20, maxActiveBuy= 1,
+            priceCoordinates= [PriceCoordinate(startPrice=0, quantity=3, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=1)])
+        self.portfolioPosition = PortfolioPosition(symbol= "AAA")
+        self.portfolioPosition.Quantity = 4
+
+    def tearDown(self):
+        pass
+
+    def ApiOrder(self, orderId:int, orderAction:str, limitPrice:str, orderedQuantity:int, filledQuantity:int = 0) -> Order:
+        instrument = Instrument()
+        instrument.Symbol = "AAA"
+        instrument.OrderAction = orderAction
+        instrument.OrderedQuantity = orderedQuantity
+        instrument.FilledQuantity = filledQuantity
+        orderDetail = OrderDetail()
+        orderDetail.Status = "OPEN"
+        orderDetail.LimitPrice = Price.From(limitPrice)
+        orderDetail.Instruments = [instrument]
+        return Order(orderId= orderId, orderDetails= [orderDetail])
+
+    def test_GetOpenLimitOrders(self):
+        """ GetOpenLimitOrders
+
+            Quantity of an open order is the remaining quantity, partial if filled in part.
+        """
+        openOrders:List[Order] = [self.ApiOrder(1, "SELL", "21", 3), self.ApiOrder(2, "BUY", "19", 3, 1)]
+
+        openLimitOrders = self.moneyMaker.GetOpenLimitOrders("AAA", openOrders)
+
+        self.assertSequenceEqual([OrderInfo(1, "AAA", "21", 3, False, True), OrderInfo(2, "AAA", "19", 2, True, False)], openLimitOrders)
+
+    def test_CalculateStockItemOrders_Placed_Partial_Orders(self):
+        """ CalculateStockItemOrders
+
+            Partial SELL 20(1) and BUY 19(2) placed by the application are open, not filled yet. Nothing to
+            place or cancel.
+        """
+        openOrders:List[Order] = [self.ApiOrder(1, "SELL", "21", 3), self.ApiOrder(2, "SELL", "20", 1), self.ApiOrder(3, "BUY", "19", 2)]
+
+        placeOrders, cancelOrders = self.moneyMaker.CalculateStockItemOrders(self.activeStockItem, openOrders, self.portfolioPosition)
+
+        self.assertSequenceEqual([], placeOrders)
+        self.assertSequenceEqual([], cancelOrders)
+
+    def test_CalculateStockItemOrders_Partially_Filled(self):
+        """ CalculateStockItemOrders
+
+            BUY 19 ordered 3 and filled 1, portfolio quantity is 4. Remaining quantity 2 is same as the partial
+            BUY 19(2). Nothing to place or cancel.
+        """
+        openOrders:List[Order] = [self.ApiOrder(1, "SELL", "21", 3), self.ApiOrder(2, "SELL", "20", 1), self.ApiOrder(3, "BUY", "19", 3, 1)]
+
+        placeOrders, cancelOrders = self.moneyMaker.CalculateStockItemOrders(self.activeStockItem, openOrders, self.portfolioPosition)
+
+        self.assertSequenceEqual([], placeOrders)
+        self.assertSequenceEqual([], cancelOrders)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.PlaceOrderResponse import PlaceOrderResponse
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryMoneyMaker import MoneyMaker
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class tests_EntryMoneyMaker_GetPlacedOrderId(unittest.TestCase):
+    """ Tests related to GetPlacedOrderId and AddPlacedOrderToMirror methods of MoneyMaker class.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.UseClientOrderRegistryFile = False
+        moneyMakerInput = types.SimpleNamespace(Settings= self.settings, ETradeSettings= ETradeSettings(), Strings= FormatStringsBase(),
+            Order= None, AsyncOrder= None,
+            Configuration= types.SimpleNamespace(GetLatestETradeAccessKeyDetails= lambda: ("token", "tokenSecret", datetime.now())),
+            MoneyMakerLogger= None, Logger= None,
+            LogMessage= lambda logger, message, isError = False, isUser = False: None)
+        self.moneyMaker = MoneyMaker(moneyMakerInput, ManageOrdersHelpers(self.settings))
+
+    def tearDown(self):
+        pass
+
+    def GetPlaceOrderResponse(self, data:dict) -> PlaceOrderResponse:
+        return PlaceOrderResponse(placeOrderResponseData= ETradeOrder.PlaceOrderResponseDataLoader.Load(data))
+
+    def test_GetPlacedOrderId(self):
+        """ GetPlacedOrderId
+
+            OrderId is an int from the top level orderId or the first of the OrderIds, 0 if not present.
+        """
+        self.assertEqual(123, self.moneyMaker.GetPlacedOrderId(self.GetPlaceOrderResponse({"orderId": 123})))
+        self.assertIsInstance(self.moneyMaker.GetPlacedOrderId(self.GetPlaceOrderResponse({"orderId": "123"})), int)
+        self.assertEqual(124, self.moneyMaker.GetPlacedOrderId(self.GetPlaceOrderResponse({"OrderIds": [{"orderId": 124}]})))
+        self.assertEqual(0, self.moneyMaker.GetPlacedOrderId(self.GetPlaceOrderResponse({})))
+        self.assertEqual(0, self.moneyMaker.GetPlacedOrderId(PlaceOrderResponse()))
+
+    def test_AddPlacedOrderToMirror(self):
+        """ AddPlacedOrderToMirror
+
+            Order placed with a top level orderId is removed from the OrderBookMirror by the int OrderId.
+        """
+        self.moneyMaker.AddPlacedOrderToMirror(self.GetPlaceOrderResponse({"orderId": 123}), OrderInfo(0, "AAA", "10.50", 2, False))
+        self.assertEqual([123], [order.OrderId for order in self.moneyMaker.OrderBookMirror.GetOrders("AAA", "BUY")])
+
+        self.moneyMaker.OrderBookMirror.RemoveOrder(123)
+
+        self.assertEqual([], self.moneyMaker.OrderBookMirror.GetOrders("AAA", "BUY"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.Context import Context
+from BusinessModels.Price import Price
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from BusinessModels.QuoteResponse import QuoteData, QuoteResponse
+from BusinessModels.SellDeltaType import SellDeltaType
+from BusinessModels.Settings import Settings
+from BusinessUtils.AppLogger import AppLogger
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryMoneyMaker import MoneyMaker
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeAccount import \
+    AsyncETradeAccount
+from ETrade.ETradeBusinessServices.AsyncETradeOrder import AsyncETradeOrder
+from ETrade.ETradeBusinessServices.ETradeAccount import ETradeAccount
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from ETrade.ETradeBusinessUtils.ETradeQuoteCache import ETradeQuoteCache
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInMoneyMakerHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade portfolio, orders, preview order and place order APIs. Every symbol has 2 stocks in
+        the portfolio and no open orders. The requests in progress at the same time are counted.
+    """
+    Symbols = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]
+    requests = []
+    inProgress = 0
+    maxInProgress = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def Track(self, request:tuple) -> int:
+        """ Slow response, counts the requests in progress. Returns the number of the request.
+        """
+        with StandInMoneyMakerHandler.lock:
+            StandInMoneyMakerHandler.inProgress += 1
+            StandInMoneyMakerHandler.maxInProgress = max(StandInMoneyMakerHandler.maxInProgress, StandInMoneyMakerHandler.inProgress)
+        time.sleep(0.02)
+        with StandInMoneyMakerHandler.lock:
+            StandInMoneyMakerHandler.inProgress -= 1
+            StandInMoneyMakerHandler.requests.append(request)
+            return len(StandInMoneyMakerHandler.requests)
+
+    def do_GET(self):
+        if self.path.startswith("/v1/accounts/KEY/portfolio.json"):
+            self.Reply(200, {"PortfolioResponse": {"AccountPortfolio": [{"accountId": "1", "totalNoOfPages": 1,
+                "Position": [{"symbolDescription": symbol, "quantity": 2} for symbol in StandInMoneyMakerHandler.Symbols]}]}})
+        elif self.path.startswith("/v1/accounts/KEY/orders.json"):
+            self.Reply(200, {"OrdersResponse": {"Order": [{"orderId": 1, "orderType": "EQ", "OrderDetail": [{"status": "OPEN", "limitPrice": 5.55,
+                "Instrument": [{"Product": {"symbol": "ZZZ", "securityType": "EQ"}, "orderAction": "BUY", "orderedQuantity": 1, "filledQuantity": 0}]}]}]}})
+        else:
+            self.Reply(401, {"Error": {"code": 10, "message": "token_rejected"}})
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        isPreview = self.path.endswith("/preview.json")
+        order = request["PreviewOrderRequest" if isPreview else "PlaceOrderRequest"]["Order"][0]
+        instrument = order["Instrument"][0]
+        orderId = self.Track(("PREVIEW" if isPreview else "PLACE", instrument["Product"]["symbol"], instrument["orderAction"],
+                                order["limitPrice"], int(instrument["quantity"])))
+
+        totalValue = float(Price.From(order["limitPrice"]) * int(instrument["quantity"]))
+        if instrument["orderAction"] == "SELL":
+            totalValue = -totalValue
+        orderDetail = {"estimatedCommission": 0, "estimatedTotalAmount": totalValue, "limitPrice": order["limitPrice"],
+                        "Instrument": [{"Product": {"symbol": instrument["Product"]["symbol"], "securityType": "EQ"},
+                            "orderAction": instrument["orderAction"], "quantity": instrument["quantity"]}]}
+        if isPreview:
+            self.Reply(200, {"PreviewOrderResponse": {"PreviewIds": [{"previewId": orderId}], "totalOrderValue": totalValue,
+                                "Order": [orderDetail]}})
+        else:
+            self.Reply(200, {"PlaceOrderResponse": {"OrderIds": [{"orderId": orderId}], "Order": [orderDetail]}})
+
+
+class StandInMarket:
+    """ Stand-in for ETradeMarket and AsyncETradeMarket of the ETradeQuoteCache. Last price of every symbol is 20.55.
+    """
+    def __init__(self, settings:ETradeSettings):
+        self.settings = settings
+        self.requests = []
+
+    def GetQuoteResponse(self, symbols:list) -> QuoteResponse:
+        self.requests.append(list(symbols))
+        return QuoteResponse(quoteData=[QuoteData(symbol=symbol, lastTradedPrice="20.55") for symbol in symbols])
+
+    def Quotes(self, symbols:list, accessToken:str = None, accessTokenSecret:str = None) -> QuoteResponse:
+        return self.GetQuoteResponse(symbols)
+
+
+class StandInAsyncMarket(StandInMarket):
+    async def Quotes(self, symbols:list, accessToken:str = None, accessTokenSecret:str = None) -> QuoteResponse:
+        return self.GetQuoteResponse(symbols)
+
+
+class tests_EntryMoneyMaker_MakeMoneyCycle(unittest.TestCase):
+    """ Tests related to MakeMoneyCycle method of MoneyMaker class using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInMoneyMakerHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInMoneyMakerHandler.requests = []
+        StandInMoneyMakerHandler.maxInProgress = 0
+
+        self.etradeSettings = ETradeSettings()
+        self.etradeSettings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.etradeSettings.AccountIdKey = "KEY"
+        self.etradeSettings.UseRateLimiter = False
+        self.settings = Settings()
+        self.settings.MaxConcurrentStockItems = 2
+        self.settings.UseClientOrderRegistryFile = False
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_MakeMoneyCycle.log"), "MakeMoneyCycleTestLogger"))
+        self.strings = FormatStringsBase()
+        self.logMessages = []
+
+        activeStockItems = []
+        for symbol in StandInMoneyMakerHandler.Symbols:
+            activeStockItem = ActiveStockItem(symbol=symbol, startPrice=20.55, sellStepSize=2, sellStepType=SellDeltaType.FIXED, maxActiveBuy=2)
+            activeStockItem.PriceCoordinates = [PriceCoordinate(startPrice=0, quantity=2, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=1)]
+            activeStockItems.append(activeStockItem)
+
+        self.market = StandInMarket(self.etradeSettings)
+        self.asyncMarket = StandInAsyncMarket(self.etradeSettings)
+
+        self.moneyMakerInput = types.SimpleNamespace(Settings= self.settings, ETradeSettings= self.etradeSettings, Strings= self.strings,
+            ActiveStockItems= activeStockItems,
+            Account= ETradeAccount(self.inputModel, self.etradeSettings, self.context, self.strings),
+            Order= ETradeOrder(self.inputModel, self.etradeSettings, self.context, self.strings), AsyncOrder= None, AsyncAccount= None,
+            QuoteCache= ETradeQuoteCache(self.market, ttlInSeconds= 0, asyncMarket= self.asyncMarket),
+            Configuration= types.SimpleNamespace(GetLatestETradeAccessKeyDetails= lambda: ("token", "tokenSecret", datetime.now())),
+            MoneyMakerLogger= None, Logger= None,
+            LogMessage= lambda logger, message, isError = False, isUser = False: self.logMessages.append(message))
+        self.moneyMaker = MoneyMaker(self.moneyMakerInput, ManageOrdersHelpers(self.settings))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def GetPlacedOrders(self) -> list:
+        return sorted(request[1:] for request in StandInMoneyMakerHandler.requests if request[0] == "PLACE")
+
+    def test_MakeMoneyCycle_Concurrent_Same_As_Sequential(self):
+        """ MakeMoneyCycle
+
+            Same orders are placed with Settings.ProcessStockItemsConcurrently on and off. Concurrently at most
+            Settings.MaxConcurrentStockItems stock items are processed at a time.
+        """
+        self.settings.ProcessStockItemsConcurrently = False
+        self.assertTrue(self.moneyMaker.MakeMoneyCycle("token", "tokenSecret"))
+        sequentialOrders = self.GetPlacedOrders()
+        self.assertEqual(1, StandInMoneyMakerHandler.maxInProgress)
+
+        StandInMoneyMakerHandler.requests = []
+        StandInMoneyMakerHandler.maxInProgress = 0
+        self.settings.ProcessStockItemsConcurrently = True
+        self.assertTrue(self.moneyMaker.MakeMoneyCycle("token", "tokenSecret"))
+
+        self.assertEqual(sequentialOrders, self.GetPlacedOrders())
+        self.assertEqual(set(StandInMoneyMakerHandler.Symbols), {order[0] for order in sequentialOrders})
+        self.assertEqual(self.settings.MaxConcurrentStockItems, StandInMoneyMakerHandler.maxInProgress)
+
+    def test_MakeMoneyCycle_Concurrent_Error(self):
+        """ MakeMoneyCycle
+
+            Exception of a stock item is raised after all the other stock items are processed.
+        """
+        self.settings.ProcessStockItemsConcurrently = True
+        processStockItem = self.moneyMaker.ProcessStockItem
+        processedSymbols = []
+
+        def ProcessStockItem(activeStockItem, *args):
+            if activeStockItem.Symbol == "AAA":
+                raise ValueError("AAA failed")
+            stockItemOrders = processStockItem(activeStockItem, *args)
+            processedSymbols.append(activeStockItem.Symbol)
+            return stockItemOrders
+
+        self.moneyMaker.ProcessStockItem = ProcessStockItem
+        with self.assertRaises(ValueError):
+            self.moneyMaker.MakeMoneyCycle("token", "tokenSecret")
+
+        self.assertEqual(StandInMoneyMakerHandler.Symbols[1:], sorted(processedSymbols))
+        self.assertEqual(set(StandInMoneyMakerHandler.Symbols[1:]), {order[0] for order in self.GetPlacedOrders()})
+
+    def test_MakeMoneyCycleAsync_Same_As_Sync(self):
+        """ MakeMoneyCycleAsync
+
+            Same orders are placed as the sync cycle, the last prices are taken from the QuoteCache(Settings.UseQuoteBands).
+        """
+        async def MakeMoneyCycle():
+            async with AsyncETradeOrder(self.inputModel, self.etradeSettings, self.context, self.strings) as order, \
+                    AsyncETradeAccount(self.inputModel, self.etradeSettings, self.context, self.strings) as account:
+                self.moneyMakerInput.AsyncOrder = order
+                self.moneyMakerInput.AsyncAccount = account
+                return await self.moneyMaker.MakeMoneyCycleAsync("token", "tokenSecret")
+
+        self.settings.UseQuoteBands = True
+        self.assertTrue(self.moneyMaker.MakeMoneyCycle("token", "tokenSecret"))
+        syncOrders = self.GetPlacedOrders()
+
+        StandInMoneyMakerHandler.requests = []
+        StandInMoneyMakerHandler.maxInProgress = 0
+        self.assertTrue(asyncio.run(MakeMoneyCycle()))
+
+        self.assertEqual(syncOrders, self.GetPlacedOrders())
+        self.assertEqual(set(StandInMoneyMakerHandler.Symbols), {order[0] for order in syncOrders})
+        self.assertLessEqual(StandInMoneyMakerHandler.maxInProgress, self.settings.MaxConcurrentStockItems)
+        self.assertEqual([StandInMoneyMakerHandler.Symbols], self.market.requests)
+        self.assertEqual([StandInMoneyMakerHandler.Symbols], self.asyncMarket.requests)
+        self.assertEqual(12, self.moneyMakerInput.QuoteCache.Counters.Misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.Context import Context
+from BusinessModels.OrderBatchResult import OrderOutcomeStatus
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+from BusinessUtils.AppLogger import AppLogger
+from Entries.EntryHelpers.ClientOrderRegistry import ClientOrderRegistry
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryMoneyMaker import MoneyMaker
+from ETrade.ETradeBusinessModels.ETradeInputModel import ETradeInputModel
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from ETrade.ETradeBusinessServices.AsyncETradeOrder import AsyncETradeOrder
+from ETrade.ETradeBusinessServices.ETradeOrder import ETradeOrder
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class StandInOrderHandler(BaseHTTPRequestHandler):
+    """ Stand-in for the ETrade preview and place order APIs. The responses are slow, the requests in progress
+        at the same time are counted and the start and end times of the requests are recorded.
+        Preview of the FailPrice orders fails with a SKIP error code.
+    """
+    FailPrice = "18.55"
+    requests = []
+    inProgress = 0
+    maxInProgress = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def Reply(self, statusCode:int, body:dict = None):
+        content = b"" if body is None else json.dumps(body).encode()
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        isPreview = self.path.endswith("/preview.json")
+        order = request["PreviewOrderRequest" if isPreview else "PlaceOrderRequest"]["Order"][0]
+        instrument = order["Instrument"][0]
+        start = time.monotonic()
+        with StandInOrderHandler.lock:
+            StandInOrderHandler.inProgress += 1
+            StandInOrderHandler.maxInProgress = max(StandInOrderHandler.maxInProgress, StandInOrderHandler.inProgress)
+        time.sleep(0.1)
+        with StandInOrderHandler.lock:
+            StandInOrderHandler.inProgress -= 1
+            StandInOrderHandler.requests.append(("PREVIEW" if isPreview else "PLACE", instrument["orderAction"],
+                                                    order["limitPrice"], start, time.monotonic()))
+            orderId = len(StandInOrderHandler.requests)
+
+        if isPreview and order["limitPrice"] == StandInOrderHandler.FailPrice:
+            self.Reply(400, {"Error": {"code": 8400, "message": "Not enough buying power"}})
+            return
+        totalValue = float(Price.From(order["limitPrice"]) * int(instrument["quantity"]))
+        if instrument["orderAction"] == "SELL":
+            totalValue = -totalValue
+        orderDetail = {"estimatedCommission": 0, "estimatedTotalAmount": totalValue, "limitPrice": order["limitPrice"],
+                        "Instrument": [{"Product": {"symbol": instrument["Product"]["symbol"], "securityType": "EQ"},
+                            "orderAction": instrument["orderAction"], "quantity": instrument["quantity"]}]}
+        if isPreview:
+            self.Reply(200, {"PreviewOrderResponse": {"PreviewIds": [{"previewId": orderId}], "totalOrderValue": totalValue,
+                                "Order": [orderDetail]}})
+        else:
+            self.Reply(200, {"PlaceOrderResponse": {"OrderIds": [{"orderId": orderId}], "Order": [orderDetail]}})
+
+
+class tests_EntryMoneyMaker_PlaceOrdersPipeline(unittest.TestCase):
+    """ Tests related to the order pipeline using a local stand-in HTTP server.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInOrderHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        StandInOrderHandler.requests = []
+        StandInOrderHandler.maxInProgress = 0
+
+        self.etradeSettings = ETradeSettings()
+        self.etradeSettings.BaseUrl = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.etradeSettings.AccountIdKey = "KEY"
+        self.etradeSettings.UseRateLimiter = False
+        self.settings = Settings()
+        self.settings.UseOrderPipeline = True
+        self.settings.OrderPipelineMaxConcurrentOrders = 4
+        self.settings.UseClientOrderRegistryFile = False
+        self.inputModel = ETradeInputModel("token", "tokenSecret", datetime.now())
+        self.context = Context(AppLogger(os.path.join(tempfile.gettempdir(), "test_PlaceOrdersPipeline.log"), "PlaceOrdersPipelineTestLogger"))
+        self.strings = FormatStringsBase()
+        self.logMessages = []
+        self.moneyMakerInput = types.SimpleNamespace(Settings= self.settings, ETradeSettings= self.etradeSettings, Strings= self.strings,
+            Order= ETradeOrder(self.inputModel, self.etradeSettings, self.context, self.strings), AsyncOrder= None,
+            Configuration= types.SimpleNamespace(GetLatestETradeAccessKeyDetails= lambda: ("token", "tokenSecret", datetime.now())),
+            MoneyMakerLogger= None, Logger= None,
+            LogMessage= lambda logger, message, isError = False, isUser = False: self.logMessages.append(message))
+        self.moneyMaker = MoneyMaker(self.moneyMakerInput, ManageOrdersHelpers(self.settings))
+        self.activeStockItem = ActiveStockItem(symbol= "AAA")
+        self.limitOrders = [OrderInfo(1, "AAA", "24.55", 1, False, True),
+                            OrderInfo(Settings.NewOrderId, "AAA", "23.55", 1, False, True),
+                            OrderInfo(Settings.NewOrderId, "AAA", "22.55", 1, False, True),
+                            OrderInfo(Settings.NewOrderId, "AAA", "20.55", 2, False),
+                            OrderInfo(Settings.NewOrderId, "AAA", "19.55", 2, False),
+                            OrderInfo(Settings.NewOrderId, "AAA", StandInOrderHandler.FailPrice, 2, False)]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def AssertBatchResult(self, batchResult):
+        self.assertIsNone(batchResult.Error)
+        self.assertEqual(["22.55", "23.55", "20.55", "19.55", "18.55"], [str(outcome.LimitOrder.LimitPrice) for outcome in batchResult.Outcomes])
+        self.assertEqual([OrderOutcomeStatus.PLACED] * 4 + [OrderOutcomeStatus.PREVIEW_FAILED], [outcome.Status for outcome in batchResult.Outcomes])
+        self.assertEqual(4, batchResult.GetPlacedCount())
+
+        # Previews are sent at the same time, all the SELL orders are placed before the BUY orders.
+        previews = [request for request in StandInOrderHandler.requests if request[0] == "PREVIEW"]
+        places = [request for request in StandInOrderHandler.requests if request[0] == "PLACE"]
+        self.assertEqual(5, len(previews))
+        self.assertGreaterEqual(StandInOrderHandler.maxInProgress, 4)
+        self.assertEqual(["SELL", "SELL", "BUY", "BUY"], [request[1] for request in sorted(places, key= lambda x:x[3])])
+        self.assertLessEqual(max(request[4] for request in places if request[1] == "SELL"),
+                                min(request[3] for request in places if request[1] == "BUY"))
+
+        # Placed orders are in the ClientOrderRegistry and the OrderBookMirror.
+        for outcome in batchResult.Outcomes[:4]:
+            entry = self.moneyMaker.ClientOrderRegistry.Entries[outcome.ClientOrderId]
+            self.assertEqual((ClientOrderRegistry.Placed, outcome.OrderId), (entry.State, entry.OrderId))
+        self.assertEqual(4, len(self.moneyMaker.OrderBookMirror.GetOrdersBySymbol()["AAA"]))
+        self.assertNotIn(batchResult.Outcomes[4].ClientOrderId, self.moneyMaker.ClientOrderRegistry.Entries)
+
+    def test_GetPipelineOrders(self):
+        """ GetPipelineOrders
+
+            New orders only, SELL orders before BUY orders, each side closest to the market price first.
+        """
+        pipelineOrders = self.moneyMaker.GetPipelineOrders(self.limitOrders)
+
+        self.assertEqual([("22.55", True), ("23.55", True), ("20.55", False), ("19.55", False), ("18.55", False)],
+                            [(str(limitOrder.LimitPrice), limitOrder.IsSell) for limitOrder in pipelineOrders])
+
+    def test_PlaceOrdersPipeline(self):
+        """ PlaceOrdersPipeline
+        """
+        start = time.monotonic()
+        batchResult = self.moneyMaker.PlaceOrdersPipeline(self.activeStockItem, self.limitOrders, "token", "tokenSecret")
+
+        self.AssertBatchResult(batchResult)
+        # Serial preview and place would take 9 round trips.
+        self.assertLess(time.monotonic() - start, 0.8)
+
+    def test_PlaceOrdersPipelineAsync(self):
+        """ PlaceOrdersPipelineAsync
+
+            Same as the sync pipeline.
+        """
+        async def PlaceOrders():
+            async with AsyncETradeOrder(self.inputModel, self.etradeSettings, self.context, self.strings) as order:
+                self.moneyMakerInput.AsyncOrder = order
+                return await self.moneyMaker.PlaceOrdersPipelineAsync(self.activeStockItem, self.limitOrders, "token", "tokenSecret")
+
+        self.AssertBatchResult(asyncio.run(PlaceOrders()))
+
+    def GetStockItemsOrders(self) -> list:
+        """ Stock items and orders of the AAA, BBB and CCC symbols, same prices as the AAA orders.
+        """
+        return [(ActiveStockItem(symbol= symbol), [OrderInfo(limitOrder.OrderId, symbol, str(limitOrder.LimitPrice), limitOrder.Quantity,
+                    False, limitOrder.IsSell) for limitOrder in self.limitOrders]) for symbol in ["AAA", "BBB", "CCC"]]
+
+    def test_PlaceOrdersPipeline_Shared_Limit(self):
+        """ PlaceOrdersPipeline
+
+            Stock items processed at the same time share OrderPipelineMaxConcurrentOrders.
+        """
+        with ThreadPoolExecutor(max_workers= 3) as executor:
+            batchResults = list(executor.map(lambda x: self.moneyMaker.PlaceOrdersPipeline(x[0], x[1], "token", "tokenSecret"),
+                                    self.GetStockItemsOrders()))
+
+        self.assertEqual([4, 4, 4], [batchResult.GetPlacedCount() for batchResult in batchResults])
+        self.assertEqual(self.settings.OrderPipelineMaxConcurrentOrders, StandInOrderHandler.maxInProgress)
+
+    def test_PlaceOrdersPipelineAsync_Shared_Limit(self):
+        """ PlaceOrdersPipelineAsync
+
+            Same as the sync pipeline.
+        """
+        async def PlaceOrders():
+            async with AsyncETradeOrder(self.inputModel, self.etradeSettings, self.context, self.strings) as order:
+                self.moneyMakerInput.AsyncOrder = order
+                return await asyncio.gather(*[self.moneyMaker.PlaceOrdersPipelineAsync(activeStockItem, limitOrders, "token", "tokenSecret")
+                                                for activeStockItem, limitOrders in self.GetStockItemsOrders()])
+
+        batchResults = asyncio.run(PlaceOrders())
+
+        self.assertEqual([4, 4, 4], [batchResult.GetPlacedCount() for batchResult in batchResults])
+        self.assertEqual(self.settings.OrderPipelineMaxConcurrentOrders, StandInOrderHandler.maxInProgress)
+
+
+if __name__ == '__main__':
+    unittest.main()
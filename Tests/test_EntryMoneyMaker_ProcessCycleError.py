@@ -0,0 +1,56 @@
+import asyncio
+import os
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Error import Error
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.EntryMoneyMaker import MoneyMaker
+from ETrade.ETradeBusinessModels.ETradeSettings import ETradeSettings
+from Exceptions.ResponseError import ResponseError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout as RequestsTimeout
+from Strings.FormatStringsBase import FormatStringsBase
+
+
+class tests_EntryMoneyMaker_ProcessCycleError(unittest.TestCase):
+    """ Tests related to ProcessCycleError method of MoneyMaker class.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.UseClientOrderRegistryFile = False
+        self.logMessages = []
+        moneyMakerInput = types.SimpleNamespace(Settings= self.settings, ETradeSettings= ETradeSettings(), Strings= FormatStringsBase(),
+            Order= None, AsyncOrder= None,
+            Configuration= types.SimpleNamespace(GetLatestETradeAccessKeyDetails= lambda: ("token", "tokenSecret", datetime.now())),
+            MoneyMakerLogger= None, Logger= None,
+            LogMessage= lambda logger, message, isError = False, isUser = False: self.logMessages.append(message))
+        self.moneyMaker = MoneyMaker(moneyMakerInput, ManageOrdersHelpers(self.settings))
+
+    def test_ProcessCycleError_Transient(self):
+        """ ProcessCycleError
+
+            Connection errors and timeouts of the sync(requests) and async sessions, the next cycle can be started.
+        """
+        for error in [RequestsConnectionError("reset"), RequestsTimeout("timed out"), ConnectionError("reset"),
+                        ConnectionResetError("reset"), asyncio.TimeoutError()]:
+            self.assertTrue(self.moneyMaker.ProcessCycleError(error), type(error).__name__)
+
+    def test_ProcessCycleError_Blocking(self):
+        """ ProcessCycleError
+
+            API errors and unexpected exceptions stop the cycles.
+        """
+        for error in [ResponseError(Error(401, "", "Unauthorized")), ValueError("unexpected"), KeyboardInterrupt()]:
+            self.assertFalse(self.moneyMaker.ProcessCycleError(error), type(error).__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
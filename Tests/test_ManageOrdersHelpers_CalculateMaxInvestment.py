@@ -0,0 +1,83 @@
+import os
+import sys
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+from Entries.PriceCoordinates import PriceCoordinates0
+
+from Tests.test_Data import PriceCoordinates1001
+
+
+class tests_ManageOrdersHelpers_CalculateMaxInvestment(unittest.TestCase):
+    """ Tests related to CalculateMaxInvestment method of ManagerOrdersHelpers class.
+    """
+
+    def setUp(self):
+        # Initialize the object.
+        self.manageOrdersHelpers = ManageOrdersHelpers(Settings())
+
+    def tearDown(self):
+        pass
+
+    def test_CalculateMaxInvestment_FLAT(self):
+        """ CalculateMaxInvestment
+
+            FLAT Buy pricing.
+
+            StartPrice = 5, quantity = 2, BuyStepSize = 1, QuantityMultiplier = 3
+
+            BUY prices are 5, 4, 3, 2, 1. Expected max investment is (5 + 4 + 3 + 2 + 1) * 2 * 3 = 90
+        """
+        priceCoordinates:List[PriceCoordinate] = []
+        priceCoordinates.append(PriceCoordinate(startPrice=0, quantity=2, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=1))
+
+        maxInvestment = self.manageOrdersHelpers.CalculateMaxInvestment(5, priceCoordinates, 3)
+
+        self.assertEqual(Decimal(90), maxInvestment)
+
+    def test_CalculateMaxInvestment_Same_As_Ladder_Sum(self):
+        """ CalculateMaxInvestment
+
+            PROGRESSIVE Buy pricing.
+
+            Max investment is same as the sum of price * quantity of each BUY price in the ladder.
+        """
+        for startPrice in [56, 162.55, 17.05, 50, 0.3]:
+            for priceCoordinates in [PriceCoordinates0, PriceCoordinates1001]:
+                priceLadder = self.manageOrdersHelpers.GetPriceLadderFor(startPrice, priceCoordinates)
+                expectedMaxInvestment = sum(Decimal(str(price)) * quantity * 2 
+                                            for price, quantity in zip(priceLadder.Prices, priceLadder.Quantities))
+
+                maxInvestment = self.manageOrdersHelpers.CalculateMaxInvestment(startPrice, priceCoordinates, 2)
+
+                self.assertEqual(expectedMaxInvestment, maxInvestment)
+
+    def test_CalculateMaxInvestment_Sub_Cent_Delta(self):
+        """ CalculateMaxInvestment
+
+            FLAT Buy pricing with a delta smaller than the smallest price.
+
+            BUY prices are rounded half up at each step, same as the prices in the ladder.
+        """
+        priceCoordinates:List[PriceCoordinate] = []
+        priceCoordinates.append(PriceCoordinate(startPrice=0, quantity=3, buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=0.125))
+
+        for startPrice in [10, 10.01, 0.37, 2.005]:
+            priceLadder = self.manageOrdersHelpers.GetPriceLadderFor(startPrice, priceCoordinates)
+            expectedMaxInvestment = sum(Decimal(str(price)) * quantity
+                                        for price, quantity in zip(priceLadder.Prices, priceLadder.Quantities))
+
+            maxInvestment = self.manageOrdersHelpers.CalculateMaxInvestment(startPrice, priceCoordinates, 1)
+
+            self.assertEqual(expectedMaxInvestment, maxInvestment)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+
+
+class tests_ManageOrdersHelpers_DiffLimitOrders(unittest.TestCase):
+    """ Tests related to DiffLimitOrders method of ManagerOrdersHelpers class.
+    """
+
+    def setUp(self):
+        # Initialize the object.
+        self.manageOrdersHelpers = ManageOrdersHelpers(Settings())
+        self.symbol = "XXXX"
+        # Possible orders of the FLAT Buy pricing with portfolio quantity 9.
+        self.limitOrders:List[OrderInfo] = [
+            OrderInfo(Settings.NewOrderId, self.symbol, 22.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 21.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 20.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 19.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 18.55, 1, True, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 16.55, 1, True, False),
+            OrderInfo(Settings.NewOrderId, self.symbol, 15.55, 2, False, False)
+        ]
+
+    def tearDown(self):
+        pass
+
+    def GetOpenOrders(self, limitOrders:List[OrderInfo]) -> List[OrderInfo]:
+        """ Open orders(with OrderIds) for the given orders, as received from the API. Orders placed for the
+            partial orders are not filled yet, so they are not partial(FilledQuantity is 0).
+        """
+        return [OrderInfo(index + 1, limitOrder.Symbol.lower(), float(limitOrder.LimitPrice), float(limitOrder.Quantity),
+                    False, limitOrder.IsSell) for index, limitOrder in enumerate(limitOrders)]
+
+    def test_DiffLimitOrders_Same(self):
+        """ DiffLimitOrders
+
+            Open orders are same as the possible orders(symbol case, float quantity and partial flag differ). Nothing to place
+            or cancel.
+        """
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders(self.limitOrders, self.GetOpenOrders(self.limitOrders))
+
+        self.assertSequenceEqual([], placeOrders)
+        self.assertSequenceEqual([], cancelOrders)
+
+    def test_DiffLimitOrders_Buy_Filled(self):
+        """ DiffLimitOrders
+
+            Partial BUY at 16.55 filled, portfolio quantity is 10. Possible orders are SELL 18.55(2) and BUY 15.55, 14.55.
+
+            Only SELL 18.55(2) and BUY 14.55 are placed. Only partial SELL 18.55(1) is cancelled, all other
+            orders are left open.
+        """
+        openOrders = self.GetOpenOrders(self.limitOrders[:5] + self.limitOrders[6:])
+        limitOrders = self.limitOrders[:4] + [
+            OrderInfo(Settings.NewOrderId, self.symbol, 18.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, self.symbol, 15.55, 2, False, False),
+            OrderInfo(Settings.NewOrderId, self.symbol, 14.55, 2, False, False)
+        ]
+
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders(limitOrders, openOrders)
+
+        self.assertSequenceEqual([limitOrders[4], limitOrders[6]], placeOrders)
+        self.assertSequenceEqual([openOrders[4]], cancelOrders)
+        self.assertEqual(5, cancelOrders[0].OrderId)
+
+    def test_DiffLimitOrders_Duplicates(self):
+        """ DiffLimitOrders
+
+            Same order open twice but possible once. Only one of them is cancelled.
+            Same order possible twice but open once. Only one of them is placed.
+        """
+        openOrders = self.GetOpenOrders([self.limitOrders[0], self.limitOrders[0]])
+
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders(self.limitOrders[:1], openOrders)
+        self.assertSequenceEqual([], placeOrders)
+        self.assertEqual([2], [cancelOrder.OrderId for cancelOrder in cancelOrders])
+
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders([self.limitOrders[0], self.limitOrders[0]], openOrders[:1])
+        self.assertSequenceEqual([self.limitOrders[0]], placeOrders)
+        self.assertSequenceEqual([], cancelOrders)
+
+    def test_DiffLimitOrders_Partially_Filled(self):
+        """ DiffLimitOrders
+
+            BUY 15.55 ordered 3 and filled 1, remaining quantity 2 is same as the possible order. Left open.
+            BUY 16.55 ordered 2 and filled 1, remaining quantity 1 is same as the partial possible order. Left open.
+        """
+        openOrders = self.GetOpenOrders(self.limitOrders[:5])
+        openOrders.append(OrderInfo(6, self.symbol, 16.55, 1, True, False))
+        openOrders.append(OrderInfo(7, self.symbol, 15.55, 2, True, False))
+
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders(self.limitOrders, openOrders)
+
+        self.assertSequenceEqual([], placeOrders)
+        self.assertSequenceEqual([], cancelOrders)
+
+    def test_DiffLimitOrders_Remaining_Quantity_Differs(self):
+        """ DiffLimitOrders
+
+            BUY 15.55 ordered 3 and filled 2, remaining quantity 1 is not same as the possible order. Open order
+            is cancelled and the possible order is placed.
+        """
+        openOrders = self.GetOpenOrders(self.limitOrders[:6])
+        openOrders.append(OrderInfo(7, self.symbol, 15.55, 1, True, False))
+
+        placeOrders, cancelOrders = self.manageOrdersHelpers.DiffLimitOrders(self.limitOrders, openOrders)
+
+        self.assertSequenceEqual([self.limitOrders[6]], placeOrders)
+        self.assertSequenceEqual([openOrders[6]], cancelOrders)
+
+
+if __name__ == '__main__':
+    unittest.main()
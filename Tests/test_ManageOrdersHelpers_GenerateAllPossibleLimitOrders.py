@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.PriceCoordinate import BuyDeltaType, PriceCoordinate
+from BusinessModels.SellDeltaType import SellDeltaType
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+
+from Tests.test_Data import PriceCoordinates1001
+
+
+class tests_ManageOrdersHelpers_GenerateAllPossibleLimitOrders(unittest.TestCase):
+    """ Tests related to GenerateAllPossibleLimitOrders method of ManagerOrdersHelpers class.
+    """
+
+    def setUp(self):
+        # Initialize the object.
+        self.manageOrdersHelpers = ManageOrdersHelpers(Settings())
+
+    def tearDown(self):
+        pass
+
+    def test_GenerateAllPossibleLimitOrders_BuyType_FLAT_SellType_FIXED(self):
+        """ GenerateAllPossibleLimitOrders
+
+            FLAT Buy pricing, same as test_GeneratePossibleLimitOrders_BuyType_FLAT_SellType_FIXED.
+
+            StartPrice = 20.55, quantity = 2, BuyStepSize = 1, SellStepSize = 2, MaxActiveBuy = 2
+
+            Portfolio quantity = 9
+        """
+        symbol = "XXXX"
+        activeStockItem = ActiveStockItem(symbol=symbol, startPrice=20.55, sellStepSize=2,
+                                sellStepType=SellDeltaType.FIXED, maxActiveBuy=2)
+        activeStockItem.PriceCoordinates = [PriceCoordinate(startPrice=0, quantity=2,
+                                buyDeltaType=BuyDeltaType.FIXED, fixedBuyDelta=1)]
+
+        expectedLimitOrders:List[OrderInfo] = [
+            OrderInfo(Settings.NewOrderId, symbol, 22.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, symbol, 21.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, symbol, 20.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, symbol, 19.55, 2, False, True),
+            OrderInfo(Settings.NewOrderId, symbol, 18.55, 1, True, True),
+            OrderInfo(Settings.NewOrderId, symbol, 16.55, 1, True, False),
+            OrderInfo(Settings.NewOrderId, symbol, 15.55, 2, False, False)
+        ]
+
+        limitOrdersBatch = self.manageOrdersHelpers.GenerateAllPossibleLimitOrders([activeStockItem], {symbol: 9})
+
+        self.assertSequenceEqual(expectedLimitOrders, limitOrdersBatch.GetOrderInfos(symbol))
+
+    def test_GenerateAllPossibleLimitOrders_Same_As_GeneratePossibleLimitOrders(self):
+        """ GenerateAllPossibleLimitOrders
+
+            Orders of each stock item are same as GeneratePossibleLimitOrders for all the SellStepTypes,
+            with and without partial orders, no portfolio quantity and portfolio quantity larger than the ladder.
+        """
+        activeStockItems:List[ActiveStockItem] = []
+        portfolioQuantities = {}
+        for sellStepType, sellStepSize, portfolioQuantity in [(SellDeltaType.FIXED, 2, 9), (SellDeltaType.NEXTBUYPRICE, 0, 13),
+                                                                (SellDeltaType.PERCENTAGE, 3.3, 12), (SellDeltaType.NEXTBUYPRICE, 0, 0),
+                                                                (SellDeltaType.FIXED, 1, 100000)]:
+            symbol = f"X{len(activeStockItems)}"
+            activeStockItems.append(ActiveStockItem(symbol=symbol, startPrice=56, priceCoordinates=PriceCoordinates1001,
+                                sellStepType=sellStepType, sellStepSize=sellStepSize, quantityMultiplier=2, maxActiveBuy=3))
+            portfolioQuantities[symbol] = portfolioQuantity
+
+        limitOrdersBatch = self.manageOrdersHelpers.GenerateAllPossibleLimitOrders(activeStockItems, portfolioQuantities)
+
+        for activeStockItem in activeStockItems:
+            self.assertSequenceEqual(self.manageOrdersHelpers.GeneratePossibleLimitOrders(activeStockItem, portfolioQuantities[activeStockItem.Symbol]),
+                                        limitOrdersBatch.GetOrderInfos(activeStockItem.Symbol))
+
+    def test_GenerateAllPossibleLimitOrders_No_StockItems(self):
+        """ GenerateAllPossibleLimitOrders
+
+            No stock items, no orders.
+        """
+        limitOrdersBatch = self.manageOrdersHelpers.GenerateAllPossibleLimitOrders([], {})
+
+        self.assertEqual(0, len(limitOrdersBatch))
+        self.assertSequenceEqual([], limitOrdersBatch.GetOrderInfos("XXXX"))
+
+
+if __name__ == '__main__':
+    unittest.main()
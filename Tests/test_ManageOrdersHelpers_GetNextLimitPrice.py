@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.ActiveStockItem import ActiveStockItem
+from BusinessModels.SellDeltaType import SellDeltaType
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+
+from Tests.test_Data import PriceCoordinates1001
+
+
+class tests_ManageOrdersHelpers_GetNextLimitPrice(unittest.TestCase):
+    """ Tests related to GetNextLimitPrice method of ManagerOrdersHelpers class.
+    """
+
+    def setUp(self):
+        # Initialize the object.
+        self.manageOrdersHelpers = ManageOrdersHelpers(Settings())
+
+    def tearDown(self):
+        pass
+
+    def test_GetNextLimitPrice_Previous_PriceCoordinate1001(self):
+        """ GetNextLimitPrice
+
+            StartPrice = 56
+
+            Previous prices of 56, 50, 26, 8 and 7 are 54, 48, 24, 7 and 6.
+        """
+        for currentPrice, expectedPrice in [(56, 54), (50, 48), (26, 24), (8, 7), (7, 6)]:
+            returnedPrice = self.manageOrdersHelpers.GetNextLimitPrice(56, currentPrice, PriceCoordinates1001, True)
+            self.assertEqual(expectedPrice, returnedPrice)
+
+    def test_GetNextLimitPrice_Next_PriceCoordinate1001(self):
+        """ GetNextLimitPrice
+
+            StartPrice = 56
+
+            Next prices of 54, 48, 24, 7 and 6 are 56, 50, 26, 8 and 7.
+            Next price of the StartPrice is 58.
+        """
+        for currentPrice, expectedPrice in [(54, 56), (48, 50), (24, 26), (7, 8), (6, 7), (56, 58)]:
+            returnedPrice = self.manageOrdersHelpers.GetNextLimitPrice(56, currentPrice, PriceCoordinates1001, False)
+            self.assertEqual(expectedPrice, returnedPrice)
+
+    def test_GetNextLimitPrice_Next_PriceNotOnLadder(self):
+        """ GetNextLimitPrice
+
+            StartPrice = 56
+
+            Current price 24.7 is not a BUY price. Next price is the next higher BUY price 26.
+
+            Current price 23.999999 is within the tolerance of BUY price 24. Next price is 26.
+        """
+        returnedPrice = self.manageOrdersHelpers.GetNextLimitPrice(56, 24.7, PriceCoordinates1001, False)
+        self.assertEqual(26, returnedPrice)
+
+        returnedPrice = self.manageOrdersHelpers.GetNextLimitPrice(56, 23.999999, PriceCoordinates1001, False)
+        self.assertEqual(26, returnedPrice)
+
+    def test_GetPriceLadder_Rebuilt_On_StartPrice_Change(self):
+        """ GetPriceLadder
+
+            Ladder is reused till the StartPrice changes.
+        """
+        activeStockItem = ActiveStockItem(symbol="XXXX", startPrice=56, priceCoordinates=PriceCoordinates1001,
+                                sellStepType=SellDeltaType.NEXTBUYPRICE)
+
+        priceLadder = self.manageOrdersHelpers.GetPriceLadder(activeStockItem)
+        self.assertIs(priceLadder, self.manageOrdersHelpers.GetPriceLadder(activeStockItem))
+        self.assertEqual(56, priceLadder.Prices[-1])
+
+        activeStockItem.StartPrice = 60
+        priceLadder = self.manageOrdersHelpers.GetPriceLadder(activeStockItem)
+        self.assertEqual(60, priceLadder.Prices[-1])
+        self.assertEqual(58, self.manageOrdersHelpers.GetBuyPriceFromSellPrice(activeStockItem, 60))
+
+
+if __name__ == '__main__':
+    unittest.main()
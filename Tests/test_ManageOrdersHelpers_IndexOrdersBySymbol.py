@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ManageOrdersHelpers import ManageOrdersHelpers
+
+
+class tests_ManageOrdersHelpers_IndexOrdersBySymbol(unittest.TestCase):
+    """ Tests related to IndexOrdersBySymbol method of ManagerOrdersHelpers class.
+    """
+
+    def setUp(self):
+        # Initialize the object.
+        self.manageOrdersHelpers = ManageOrdersHelpers(Settings())
+
+    def tearDown(self):
+        pass
+
+    def CreateOrder(self, orderId:int, *symbols:str) -> Order:
+        """ Order with one order detail and an instrument for each symbol.
+        """
+        orderDetail = OrderDetail()
+        orderDetail.Instruments = []
+        for symbol in symbols:
+            instrument = Instrument()
+            instrument.Symbol = symbol
+            orderDetail.Instruments.append(instrument)
+        return Order(orderId=orderId, orderDetails=[orderDetail], events=[])
+
+    def test_IndexOrdersBySymbol(self):
+        """ IndexOrdersBySymbol
+
+            Orders of "aaa", "AAA" and "Bbb" are indexed under "AAA" and "BBB". Instrument symbols are upper case.
+            Order with both the symbols is present under both.
+        """
+        orders = [self.CreateOrder(1, "aaa"), self.CreateOrder(2, "Bbb"), self.CreateOrder(3, "AAA"),
+                    self.CreateOrder(4, "aaa", "bbb")]
+
+        ordersBySymbol = self.manageOrdersHelpers.IndexOrdersBySymbol(orders)
+
+        self.assertEqual(["AAA", "BBB"], sorted(ordersBySymbol))
+        self.assertEqual([1, 3, 4], [order.OrderId for order in ordersBySymbol["AAA"]])
+        self.assertEqual([2, 4], [order.OrderId for order in ordersBySymbol["BBB"]])
+        self.assertEqual("BBB", orders[1].OrderDetails[0].Instruments[0].Symbol)
+
+    def test_IndexOrdersBySymbol_No_Orders(self):
+        """ IndexOrdersBySymbol
+
+            No orders, empty index.
+        """
+        self.assertEqual({}, self.manageOrdersHelpers.IndexOrdersBySymbol(None))
+        self.assertEqual({}, self.manageOrdersHelpers.IndexOrdersBySymbol([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
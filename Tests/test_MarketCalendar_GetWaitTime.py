@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.MarketSession import MarketSession
+from BusinessUtils.MarketCalendar import MarketCalendar
+
+
+class tests_MarketCalendar_GetWaitTime(unittest.TestCase):
+    """ Tests related to the market sessions, holidays and the wait till the next session.
+    """
+
+    def setUp(self):
+        self.calendar = MarketCalendar(str(Path(__file__).parent.parent / "Entries" / "MarketCalendar.ini"))
+
+    def tearDown(self):
+        pass
+
+    def NewYorkTime(self, year:int, month:int, day:int, hour:int, minute:int) -> datetime:
+        return self.calendar.Localize(date(year, month, day), time(hour, minute))
+
+    def test_GetSession(self):
+        """ GetSession
+
+            Sessions of a trading day in New York time, closed on the weekends and the holidays.
+        """
+        self.assertEqual(MarketSession.CLOSED, self.calendar.GetSession(self.NewYorkTime(2026, 10, 19, 6, 59)))
+        self.assertEqual(MarketSession.PREMARKET, self.calendar.GetSession(self.NewYorkTime(2026, 10, 19, 7, 0)))
+        self.assertEqual(MarketSession.REGULAR, self.calendar.GetSession(self.NewYorkTime(2026, 10, 19, 9, 30)))
+        self.assertEqual(MarketSession.AFTERHOURS, self.calendar.GetSession(self.NewYorkTime(2026, 10, 19, 16, 0)))
+        self.assertEqual(MarketSession.CLOSED, self.calendar.GetSession(self.NewYorkTime(2026, 10, 19, 20, 0)))
+        # Same time in UTC.
+        self.assertEqual(MarketSession.REGULAR, self.calendar.GetSession(datetime(2026, 10, 19, 13, 30, tzinfo=timezone.utc)))
+        # Saturday and Thanksgiving Day.
+        self.assertEqual([], self.calendar.GetSessions(date(2026, 10, 17)))
+        self.assertEqual([], self.calendar.GetSessions(date(2026, 11, 26)))
+        # Early close, after hours ends 4 hours later.
+        self.assertEqual(MarketSession.AFTERHOURS, self.calendar.GetSession(self.NewYorkTime(2026, 11, 27, 13, 0)))
+        self.assertEqual(MarketSession.CLOSED, self.calendar.GetSession(self.NewYorkTime(2026, 11, 27, 17, 0)))
+
+    def test_GetWaitTime(self):
+        """ GetWaitTime
+
+            Friday after the close waits till Monday open less the warm up, nothing to wait during a session.
+        """
+        friday = self.NewYorkTime(2026, 10, 16, 16, 30)
+        self.assertEqual(self.NewYorkTime(2026, 10, 19, 9, 30), self.calendar.GetNextOpen(friday))
+        self.assertEqual((2 * 24 + 17) * 3600 - 300, self.calendar.GetWaitTime(friday, False, 300))
+
+        # After hours is open for the extended hours.
+        self.assertEqual(0, self.calendar.GetWaitTime(friday, True, 300))
+        self.assertEqual(0, self.calendar.GetWaitTime(self.NewYorkTime(2026, 10, 19, 9, 26), False, 300))
+
+        # Day before Thanksgiving after the close, next open is Friday.
+        self.assertEqual(self.NewYorkTime(2026, 11, 27, 9, 30), self.calendar.GetNextOpen(self.NewYorkTime(2026, 11, 25, 17, 0)))
+
+    def test_Defaults_Without_File(self):
+        """ __init__
+
+            Without the file the default hours are used and only the weekends are closed.
+        """
+        calendar = MarketCalendar(None)
+        self.assertEqual(MarketSession.REGULAR, calendar.GetSession(self.NewYorkTime(2026, 11, 26, 10, 0)))
+        self.assertEqual(MarketSession.CLOSED, calendar.GetSession(self.NewYorkTime(2026, 10, 18, 10, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
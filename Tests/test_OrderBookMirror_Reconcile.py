@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.OrderBookMirror import OrderBookMirror
+
+
+class tests_OrderBookMirror_Reconcile(unittest.TestCase):
+    """ Tests related to the open order mirror and its reconciliation with the API.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.OrderBookReconciliationIntervalInSeconds = 300
+        self.mirror = OrderBookMirror(self.settings)
+
+        self.apiOrders = self.ApiOrders([(1, OrderInfo(0, "aaa", "20.00", 2, False)), (2, OrderInfo(0, "AAA", "21.00", 2, False, True)),
+                                            (3, OrderInfo(0, "BBB", "10.00", 5, False))])
+
+    def tearDown(self):
+        pass
+
+    def ApiOrders(self, orderInfos):
+        """ Open orders of the API, built the same way as the placed orders.
+        """
+        api = OrderBookMirror(self.settings)
+        for orderId, orderInfo in orderInfos:
+            api.AddOrder(orderId, orderInfo)
+        return list(api.Orders.values())
+
+    def test_Reconcile_Drift(self):
+        """ Reconcile
+
+            No drift for the first reconciliation, then the missing, stale and changed orders are counted.
+        """
+        self.assertTrue(self.mirror.IsReconciliationDue(0))
+        self.assertEqual(0, self.mirror.Reconcile(self.apiOrders, 0))
+        self.assertFalse(self.mirror.IsReconciliationDue(299))
+        self.assertTrue(self.mirror.IsReconciliationDue(300))
+
+        # Order 3 filled, order 1 partially filled and order 4 placed outside the MoneyMaker.
+        apiOrders = self.ApiOrders([(1, OrderInfo(0, "AAA", "20.00", 2, False)), (2, OrderInfo(0, "AAA", "21.00", 2, False, True)),
+                                    (4, OrderInfo(0, "CCC", "5.00", 1, False))])
+        apiOrders[0].OrderDetails[0].Instruments[0].FilledQuantity = 1
+        self.assertEqual(3, self.mirror.Reconcile(apiOrders, 10))
+        self.assertEqual((2, 1, 1, 1, 3), (self.mirror.Drift.Reconciliations, self.mirror.Drift.Missing,
+                            self.mirror.Drift.Stale, self.mirror.Drift.Changed, self.mirror.Drift.LastDrift))
+        self.assertEqual([], self.mirror.GetOrders("BBB", "BUY"))
+
+    def test_Place_Cancel_And_Mismatch(self):
+        """ AddOrder, RemoveOrder, MarkMismatch
+
+            Place and cancel responses update the mirror right away, a mismatch makes the reconciliation due.
+        """
+        self.mirror.Reconcile(self.apiOrders, 0)
+        self.mirror.RemoveOrder(1)
+        self.mirror.AddOrder(5, OrderInfo(0, "AAA", "19.00", 2, False))
+
+        self.assertEqual([5], [order.OrderId for order in self.mirror.GetOrders("aaa", "BUY")])
+        self.assertEqual([2], [order.OrderId for order in self.mirror.GetOrders("AAA", "SELL")])
+        self.assertEqual({"AAA": [2, 5], "BBB": [3]},
+                            {symbol: sorted(order.OrderId for order in orders) for symbol, orders in self.mirror.GetOrdersBySymbol().items()})
+
+        self.mirror.MarkMismatch("Cancel failed for AAA.")
+        self.assertTrue(self.mirror.IsReconciliationDue(1))
+        self.mirror.Reconcile(self.apiOrders, 1)
+        self.assertIsNone(self.mirror.Mismatch)
+        self.assertFalse(self.mirror.IsReconciliationDue(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
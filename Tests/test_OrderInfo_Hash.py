@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderDetails import Instrument
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order, OrdersResponse
+from BusinessModels.PortfolioResponse import AccountPortfolio, PortfolioResponse
+from BusinessModels.Price import Price
+from BusinessModels.QuoteResponse import QuoteResponse
+from BusinessModels.Settings import Settings
+
+
+class tests_OrderInfo_Hash(unittest.TestCase):
+    """ Tests related to the slotted models used in every cycle.
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_Hash_Equal_Orders(self):
+        """ __hash__
+
+            Equal orders(same OrderId) have the same hash, set difference gives the missing orders.
+        """
+        order = OrderInfo(12, "AAA", 22.55, 2, False, True)
+        sameOrder = OrderInfo(12, "AAA", Price.From("22.55"), 2, False, True)
+        self.assertEqual(order, sameOrder)
+        self.assertEqual(hash(order), hash(sameOrder))
+
+        orders = {order, OrderInfo(13, "AAA", "22.60", 2, False, True)}
+        otherOrders = {sameOrder, OrderInfo(12, "AAA", "22.50", 2, False, True)}
+        self.assertEqual([OrderInfo(12, "AAA", "22.50", 2, False, True)], list(otherOrders - orders))
+        self.assertEqual([OrderInfo(13, "AAA", "22.60", 2, False, True)], list(orders - otherOrders))
+
+    def test_GetKey_Api_Order(self):
+        """ GetKey
+
+            Open order from the API(placed for a partial rung, not filled yet) and the possible limit order of the
+            same rung calculated from the ladder are not equal, they have the same key.
+        """
+        apiOrder = OrderInfo(12, "aaa", 22.55, 1.0, False, True)
+        calculatedOrder = OrderInfo(Settings.NewOrderId, "AAA", Price.From("22.55"), 1, True, True)
+        self.assertNotEqual(apiOrder, calculatedOrder)
+        self.assertEqual(apiOrder.GetKey(), calculatedOrder.GetKey())
+
+        openKeys = {apiOrder.GetKey(), OrderInfo(13, "AAA", "22.60", 2, False, True).GetKey()}
+        limitOrders = [calculatedOrder, OrderInfo(Settings.NewOrderId, "AAA", "22.50", 2, False, True)]
+        self.assertEqual([limitOrders[1]], [limitOrder for limitOrder in limitOrders if limitOrder.GetKey() not in openKeys])
+
+    def test_Slots(self):
+        """ __slots__
+
+            Models have no instance dictionary, unknown attributes are not accepted.
+        """
+        for model in [OrderInfo(1, "AAA", 1, 1, False), Instrument(), Order()]:
+            self.assertFalse(hasattr(model, "__dict__"))
+            with self.assertRaises(AttributeError):
+                model.Symbl = "AAA"
+
+    def test_Default_Lists_Not_Shared(self):
+        """ __init__
+
+            Each response gets its own lists.
+        """
+        OrdersResponse().Orders.append(Order())
+        Order().Events.append(None)
+        QuoteResponse().QuoteData.append(None)
+        AccountPortfolio().PortfolioPositions.append(None)
+        PortfolioResponse().AccountPortfolios.append(None)
+
+        self.assertEqual([], OrdersResponse().Orders)
+        self.assertEqual([], Order().Events)
+        self.assertEqual([], QuoteResponse().QuoteData)
+        self.assertEqual([], AccountPortfolio().PortfolioPositions)
+        self.assertEqual([], PortfolioResponse().AccountPortfolios)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.PollingScheduler import PollingScheduler
+
+
+class tests_PollingScheduler_Reschedule(unittest.TestCase):
+    """ Tests related to the adaptive scheduling of the stock items.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.PollingMinIntervalInSeconds = 10
+        self.settings.PollingMaxIntervalInSeconds = 300
+        self.settings.PollingNearTicks = 3
+        self.settings.PollingIntervalGrowthFactor = 2
+        self.settings.MaxRequestsPerMinute = 60
+        self.settings.FloatRoundPrecision = 2
+        self.scheduler = PollingScheduler(self.settings)
+
+    def tearDown(self):
+        pass
+
+    def test_Reschedule_Near_And_Far(self):
+        """ Reschedule
+
+            Near a limit price the interval is the minimum, far from all the limit prices it grows up to the maximum.
+        """
+        limitPrices = [Price.From("20.00"), Price.From("21.00")]
+        self.assertEqual(10, self.scheduler.Reschedule("AAA", 0, Price.From("20.03"), limitPrices))
+
+        # 50 ticks away. Doubles every visit, limited by the distance and the maximum.
+        intervals = [self.scheduler.Reschedule("AAA", 0, Price.From("20.50"), limitPrices) for _ in range(5)]
+        self.assertEqual([20, 40, 80, 160, 10 * 50 / 3], intervals)
+
+        self.assertEqual(300, self.scheduler.GetInterval(300, Price.From("100"), limitPrices))
+        # Unknown price or no limit orders, the interval grows.
+        self.assertEqual(20, self.scheduler.GetInterval(10, None, limitPrices))
+        self.assertEqual(20, self.scheduler.GetInterval(10, Price.From("20.01"), []))
+
+        # Orders cancelled or placed, back to the minimum.
+        self.assertEqual(10, self.scheduler.Reschedule("AAA", 0, Price.From("20.50"), limitPrices, isSettled=False))
+
+    def test_GetDueSymbols(self):
+        """ GetDueSymbols
+
+            New symbols are due right away. Due symbols in the order of their due time, each symbol once.
+        """
+        self.scheduler.SetSymbols(["aaa", "BBB", "CCC"], 0)
+        self.assertEqual(["AAA", "BBB", "CCC"], sorted(self.scheduler.GetDueSymbols(0)))
+        self.assertEqual([], self.scheduler.GetDueSymbols(5))
+
+        self.scheduler.Reschedule("AAA", 0, None, [])
+        self.scheduler.Reschedule("BBB", 0, Price.From("20.01"), [Price.From("20.00")])
+        self.scheduler.Reschedule("CCC", 0, None, [], isSettled=False)
+        self.assertEqual(["BBB", "CCC"], self.scheduler.GetDueSymbols(10))
+        self.assertEqual(10, self.scheduler.GetWaitTime(10))
+        self.assertEqual(["AAA", "BBB", "CCC"], self.scheduler.GetDueSymbols(20))
+
+        # Removed symbols are not due anymore.
+        self.scheduler.SetSymbols(["AAA"], 20)
+        self.assertEqual(["AAA"], self.scheduler.GetDueSymbols(100))
+
+    def test_GetWaitTime_Requests_Budget(self):
+        """ GetWaitTime
+
+            Next cycle is delayed till the requests of the last minute and the next cycle are within the budget.
+        """
+        self.scheduler.SetSymbols(["AAA"], 0)
+        self.scheduler.RecordRequests(0, 20)
+        self.scheduler.RecordRequests(5, 20)
+        self.assertEqual(0, self.scheduler.GetWaitTime(5))
+
+        self.scheduler.RecordRequests(10, 20)
+        self.assertEqual(50, self.scheduler.GetWaitTime(10))
+        self.assertEqual(0, self.scheduler.GetWaitTime(60))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderDetails import Instrument, OrderDetail
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.OrdersResponse import Order
+from BusinessModels.PortfolioResponse import PortfolioPosition
+from BusinessModels.Price import Price
+from Entries.EntryHelpers.PortfolioSnapshot import PortfolioSnapshot
+
+
+class tests_PortfolioSnapshot_GetUnchangedLimitOrders(unittest.TestCase):
+    """ Tests related to the portfolio snapshot and the markers of the stock items.
+    """
+
+    def setUp(self):
+        self.snapshot = PortfolioSnapshot()
+
+    def tearDown(self):
+        pass
+
+    def OpenOrder(self, orderId:int, limitPrice:str, orderAction:str, filledQuantity:int = 0) -> Order:
+        instrument = Instrument()
+        instrument.Symbol = "AAA"
+        instrument.OrderAction = orderAction
+        instrument.OrderedQuantity = 2
+        instrument.FilledQuantity = filledQuantity
+        orderDetail = OrderDetail()
+        orderDetail.Status = "OPEN"
+        orderDetail.LimitPrice = Price.From(limitPrice)
+        orderDetail.Instruments = [instrument]
+        return Order(orderId, "EQ", [orderDetail])
+
+    def Position(self, symbol:str, quantity:int) -> PortfolioPosition:
+        portfolioPosition = PortfolioPosition(symbol)
+        portfolioPosition.Quantity = quantity
+        return portfolioPosition
+
+    def test_Update(self):
+        """ Update
+
+            Quantity deltas against the previous cycle, symbols leaving the portfolio included.
+        """
+        self.assertEqual({"AAA": 10, "BBB": 5}, self.snapshot.Update({"AAA": self.Position("AAA", 10), "BBB": self.Position("BBB", 5)}))
+        self.assertEqual({}, self.snapshot.Update({"AAA": self.Position("AAA", 10), "BBB": self.Position("BBB", 5)}))
+        self.assertEqual({"AAA": -2, "BBB": -5}, self.snapshot.Update({"AAA": self.Position("AAA", 8)}))
+        self.assertEqual({"AAA": -2, "BBB": -5}, self.snapshot.QuantityDeltas)
+
+    def test_GetUnchangedLimitOrders(self):
+        """ GetUnchangedLimitOrders
+
+            Limit orders of the marker while the quantity and the open orders stay the same.
+        """
+        openOrders = [self.OpenOrder(1, "20.00", "BUY"), self.OpenOrder(2, "21.00", "SELL")]
+        limitOrders = [OrderInfo(0, "AAA", "20.00", 2, False), OrderInfo(0, "AAA", "21.00", 2, False, True)]
+        self.snapshot.SetMarker("aaa", 10, PortfolioSnapshot.GetOrdersFingerprint(openOrders), limitOrders)
+
+        # Same orders in another order.
+        fingerprint = PortfolioSnapshot.GetOrdersFingerprint(list(reversed(openOrders)))
+        self.assertIs(limitOrders, self.snapshot.GetUnchangedLimitOrders("AAA", 10, fingerprint))
+
+        # Quantity changed, order partially filled or replaced.
+        self.assertIsNone(self.snapshot.GetUnchangedLimitOrders("AAA", 12, fingerprint))
+        partialFilled = PortfolioSnapshot.GetOrdersFingerprint([self.OpenOrder(1, "20.00", "BUY", 1), self.OpenOrder(2, "21.00", "SELL")])
+        self.assertIsNone(self.snapshot.GetUnchangedLimitOrders("AAA", 10, partialFilled))
+        replaced = PortfolioSnapshot.GetOrdersFingerprint([self.OpenOrder(3, "20.00", "BUY"), self.OpenOrder(2, "21.00", "SELL")])
+        self.assertIsNone(self.snapshot.GetUnchangedLimitOrders("AAA", 10, replaced))
+
+        self.snapshot.ClearMarker("AAA")
+        self.assertIsNone(self.snapshot.GetUnchangedLimitOrders("AAA", 10, fingerprint))
+
+
+if __name__ == '__main__':
+    unittest.main()
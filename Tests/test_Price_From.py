@@ -0,0 +1,106 @@
+import os
+import sys
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+
+
+class tests_Price_From(unittest.TestCase):
+    """ Tests related to From method and the arithmetic of Price class.
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_From_String_Float_Decimal_Same(self):
+        """ From
+
+            "22.55", 22.55, Decimal("22.55") are 225500 units.
+        """
+        for value in ["22.55", " 22.55", 22.55, Decimal("22.55"), Decimal("22.550")]:
+            self.assertEqual(225500, Price.From(value).Units)
+        self.assertEqual(Price(2900000), Price.From("290"))
+        self.assertEqual(Price(2900000), Price.From(290))
+
+    def test_From_Float_Representation(self):
+        """ From
+
+            0.1 + 0.2 is 0.30000000000000004 as float and same as 0.3 as Price.
+            1.1 + 2.2 is not 3.3 as float and same as 3.3 as Price.
+        """
+        self.assertEqual(Price.From("0.3"), Price.From(0.1 + 0.2))
+        self.assertNotEqual(3.3, 1.1 + 2.2)
+        self.assertEqual(3.3, Price.From(1.1) + 2.2)
+
+    def test_From_Float_Half_Unit(self):
+        """ From
+
+            Floats at half a unit are rounded half up like their string representation.
+        """
+        for value in [1.00005, -1.00005, 18.55555, 0.00015]:
+            self.assertEqual(Price.From(repr(value)), Price.From(value))
+        self.assertEqual(10001, Price.From(1.00005).Units)
+
+    def test_From_Invalid(self):
+        """ From
+
+            Invalid values raise ValueError.
+        """
+        for value in ["abc", None, True, [1]]:
+            with self.assertRaises(ValueError):
+                Price.From(value)
+
+    def test_Round(self):
+        """ Round
+
+            Half is rounded away from zero. 18.555 -> 18.56, 18.554 -> 18.55, -18.555 -> -18.56.
+        """
+        self.assertEqual(Price.From("18.56"), Price.From("18.555").Round(2))
+        self.assertEqual(Price.From("18.55"), Price.From("18.554").Round(2))
+        self.assertEqual(Price.From("-18.56"), Price.From("-18.555").Round(2))
+        self.assertEqual(Price.From("18.56"), round(Price.From("18.555"), 2))
+
+    def test_Arithmetic(self):
+        """ Arithmetic and string representation.
+        """
+        price = Price.From("20.55")
+        self.assertEqual(Price.From("41.10"), price * 2)
+        self.assertEqual(Price.From("21.2282"), price * 1.033)
+        self.assertEqual(Price.From("10.275"), price / 2)
+        self.assertEqual(Decimal("0.5"), Price.From("10.275") / price)
+        self.assertEqual("20.55", str(price))
+        self.assertEqual("290", str(Price.From(290)))
+        self.assertTrue(Price.From("20.56") > price > 20.54)
+
+    def test_OrderInfo_Equal_API_Price(self):
+        """ OrderInfo
+
+            Calculated price 1.1 + 2.2 and price 3.3 received from the API are the same order.
+        """
+        calculatedOrder = OrderInfo(Settings.NewOrderId, "XXXX", 1.1 + 2.2, 2, False, True)
+        apiOrder = OrderInfo(Settings.NewOrderId, "XXXX", Decimal("3.3"), 2, False, True)
+        self.assertEqual(apiOrder, calculatedOrder)
+
+    def test_Hash_Equal_Values(self):
+        """ __hash__
+
+            Equal int, Decimal and exactly representable float values have the same hash.
+        """
+        self.assertIn(1.5, {Price.From(1.5)})
+        self.assertIn(Decimal("22.55"), {Price.From("22.55")})
+        self.assertIn(3, {Price.From(3)})
+        self.assertEqual(hash(Decimal("-0.0125")), hash(Price.From("-0.0125")))
+        self.assertEqual(1, len({Price.From("22.55"), Price.From(22.55), Price(225500)}))
+
+
+if __name__ == '__main__':
+    unittest.main()
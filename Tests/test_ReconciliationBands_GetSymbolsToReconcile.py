@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(os.getcwd()).parent))
+
+from BusinessModels.OrderInfo import OrderInfo
+from BusinessModels.Price import Price
+from BusinessModels.Settings import Settings
+from Entries.EntryHelpers.ReconciliationBands import ReconciliationBands
+
+
+class tests_ReconciliationBands_GetSymbolsToReconcile(unittest.TestCase):
+    """ Tests related to the stock items reconciled in a cycle.
+    """
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings.FullReconciliationIntervalInSeconds = 600
+        self.bands = ReconciliationBands(self.settings)
+        limitOrders = [OrderInfo(1, "AAA", "19.50", 10, False), OrderInfo(2, "AAA", "20.00", 10, False),
+                       OrderInfo(3, "AAA", "21.00", 10, False, True), OrderInfo(4, "AAA", "21.50", 10, False, True)]
+        self.bands.SetBand("AAA", limitOrders, 100)
+
+    def tearDown(self):
+        pass
+
+    def test_GetSymbolsToReconcile(self):
+        """ GetSymbolsToReconcile
+
+            All the symbols in the first cycle, then only the symbols outside their band or with a changed quantity.
+        """
+        symbols = ["AAA", "BBB"]
+        self.assertEqual(symbols, self.bands.GetSymbolsToReconcile(symbols, {}, {}, 0))
+
+        # BBB has no band.
+        self.assertEqual(["BBB"], self.bands.GetSymbolsToReconcile(symbols, {"AAA": Price.From("20.50")}, {"AAA": 100}, 10))
+
+        # Price on the highest BUY or the lowest SELL, or the quantity changed.
+        self.assertEqual(["AAA"], self.bands.GetSymbolsToReconcile(["AAA"], {"AAA": Price.From("20.00")}, {"AAA": 100}, 20))
+        self.assertEqual(["AAA"], self.bands.GetSymbolsToReconcile(["AAA"], {"AAA": Price.From("21.00")}, {"AAA": 100}, 30))
+        self.assertEqual(["AAA"], self.bands.GetSymbolsToReconcile(["AAA"], {"AAA": Price.From("20.50")}, {"AAA": 90}, 40))
+        self.assertEqual(["AAA"], self.bands.GetSymbolsToReconcile(["AAA"], {}, {"AAA": 100}, 50))
+
+        # Full reconciliation is due.
+        self.assertEqual(["AAA"], self.bands.GetSymbolsToReconcile(["AAA"], {"AAA": Price.From("20.50")}, {"AAA": 100}, 600))
+        self.assertEqual([], self.bands.GetSymbolsToReconcile(["AAA"], {"AAA": Price.From("20.50")}, {"AAA": 100}, 610))
+
+    def test_ClearBand(self):
+        """ SetBand, ClearBand, GetLimitPrices
+
+            The band is the highest BUY and the lowest SELL, a cleared band is reconciled again.
+        """
+        self.assertEqual([Price.From("20.00"), Price.From("21.00")], self.bands.GetLimitPrices("aaa"))
+        self.assertFalse(self.bands.NeedsReconciliation("AAA", Price.From("20.01"), 100))
+
+        self.bands.ClearBand("AAA")
+        self.assertEqual([], self.bands.GetLimitPrices("AAA"))
+        self.assertTrue(self.bands.NeedsReconciliation("AAA", Price.From("20.01"), 100))
+
+
+if __name__ == '__main__':
+    unittest.main()